@@ -0,0 +1,38 @@
+"""
+Add Data Generations Table
+
+Creates the table of persistent change counters. Transactions that change
+rendered traceability data advance the "rendered" generation, which keys
+cached RTM reports consistently across worker processes and restarts, and
+transactions that change epic dependencies advance "epic_dependencies",
+which tells the in-memory dependency graph whether it missed a change.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "add_data_generations"
+down_revision = "add_epic_persona_metrics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the data_generations table."""
+    print("Creating data_generations table...")
+    op.create_table(
+        "data_generations",
+        sa.Column("scope", sa.String(50), primary_key=True),
+        sa.Column("generation", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime, nullable=False),
+    )
+
+
+def downgrade():
+    """Drop the data_generations table."""
+    print("Dropping data_generations table...")
+    op.drop_table("data_generations")
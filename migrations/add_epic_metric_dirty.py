@@ -0,0 +1,45 @@
+"""
+Add Epic Metric Dirty Marks Table
+
+Introduces the table in which changes to user stories, tests, defects,
+dependencies and epics record which epic metric families need to be
+recalculated by the background refresher.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "add_epic_metric_dirty"
+down_revision = "add_epic_metrics_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the epic_metric_dirty table."""
+    print("Creating epic_metric_dirty table...")
+    op.create_table(
+        "epic_metric_dirty",
+        sa.Column(
+            "epic_id",
+            sa.Integer,
+            sa.ForeignKey("epics.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("metric_family", sa.String(30), primary_key=True),
+        sa.Column("marked_at", sa.DateTime, nullable=False),
+    )
+    op.create_index(
+        "ix_epic_metric_dirty_marked_at", "epic_metric_dirty", ["marked_at"]
+    )
+
+
+def downgrade():
+    """Drop the epic_metric_dirty table."""
+    print("Dropping epic_metric_dirty table...")
+    op.drop_index("ix_epic_metric_dirty_marked_at", table_name="epic_metric_dirty")
+    op.drop_table("epic_metric_dirty")
@@ -0,0 +1,163 @@
+"""
+Delta-Encoded Epic Metric History
+
+Adds the typed epic_metric_values table holding the metric values that
+changed at each epic_metric_history capture, flags full-snapshot captures
+as keyframes and makes the legacy JSON snapshot column optional. Existing
+rows keep their JSON snapshot and are read as keyframes. Downgrading writes
+the full JSON snapshot of every delta-encoded capture back into ``metrics``
+before dropping the values table.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+import json
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers
+revision = "add_epic_metric_values"
+down_revision = "add_epic_metric_dirty"
+branch_labels = None
+depends_on = None
+
+
+def _decode_value(value_type, value_num, value_text):
+    """Decode a typed epic_metric_values row into its metric value."""
+    if value_type == "bool":
+        return bool(value_num)
+    if value_type == "int":
+        return int(value_num)
+    if value_type == "float":
+        return value_num
+    if value_type == "json":
+        return json.loads(value_text)
+    return None
+
+
+def _flatten(metrics, prefix=""):
+    flat = {}
+    for key, value in metrics.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _unflatten(flat):
+    metrics = {}
+    for path, value in flat.items():
+        node = metrics
+        *parents, leaf = path.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return metrics
+
+
+def _rebuild_metric_snapshots(connection):
+    """Write the full JSON snapshot of every delta-encoded capture."""
+    values = defaultdict(list)
+    rows = connection.execute(
+        text("""
+        SELECT history_id, metric_key, value_type, value_num, value_text
+        FROM epic_metric_values
+        ORDER BY history_id, id
+    """)
+    )
+    for history_id, *value in rows:
+        values[history_id].append(value)
+
+    states = defaultdict(dict)
+    updates = []
+    captures = connection.execute(
+        text("""
+        SELECT id, epic_id, metrics, is_keyframe
+        FROM epic_metric_history
+        ORDER BY epic_id, id
+    """)
+    ).fetchall()
+    for history_id, epic_id, metrics, is_keyframe in captures:
+        state = states[epic_id]
+        if metrics:
+            state.clear()
+            try:
+                state.update(_flatten(json.loads(metrics)))
+            except json.JSONDecodeError:
+                pass
+            continue
+        if is_keyframe:
+            state.clear()
+        for metric_key, value_type, value_num, value_text in values.get(history_id, ()):
+            if value_type == "deleted":
+                state.pop(metric_key, None)
+            else:
+                state[metric_key] = _decode_value(value_type, value_num, value_text)
+        updates.append({"id": history_id, "metrics": json.dumps(_unflatten(state))})
+
+    if updates:
+        connection.execute(
+            text("UPDATE epic_metric_history SET metrics = :metrics WHERE id = :id"),
+            updates,
+        )
+    return len(updates)
+
+
+def upgrade():
+    """Apply delta-encoded metric history changes."""
+    print("Adding is_keyframe to epic_metric_history...")
+    with op.batch_alter_table("epic_metric_history") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "is_keyframe", sa.Boolean, nullable=False, server_default=sa.false()
+            )
+        )
+        batch_op.alter_column("metrics", existing_type=sa.Text, nullable=True)
+
+    print("Creating epic_metric_values table...")
+    op.create_table(
+        "epic_metric_values",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column(
+            "history_id",
+            sa.Integer,
+            sa.ForeignKey("epic_metric_history.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("epic_id", sa.Integer, nullable=False),
+        sa.Column("metric_key", sa.String(120), nullable=False),
+        sa.Column("value_type", sa.String(8), nullable=False),
+        sa.Column("value_num", sa.Float, nullable=True),
+        sa.Column("value_text", sa.Text, nullable=True),
+    )
+    op.create_index(
+        "ix_epic_metric_values_history_id", "epic_metric_values", ["history_id"]
+    )
+    op.create_index(
+        "idx_epic_metric_values_trend",
+        "epic_metric_values",
+        ["epic_id", "metric_key", "history_id"],
+    )
+
+
+def downgrade():
+    """Revert delta-encoded metric history changes."""
+    print("Rebuilding JSON snapshots of delta-encoded captures...")
+    rebuilt = _rebuild_metric_snapshots(op.get_bind())
+    print(f"Rebuilt {rebuilt} metric snapshots")
+
+    print("Dropping epic_metric_values table...")
+    op.drop_index("idx_epic_metric_values_trend", table_name="epic_metric_values")
+    op.drop_index("ix_epic_metric_values_history_id", table_name="epic_metric_values")
+    op.drop_table("epic_metric_values")
+
+    print("Removing is_keyframe from epic_metric_history...")
+    with op.batch_alter_table("epic_metric_history") as batch_op:
+        batch_op.drop_column("is_keyframe")
+        batch_op.alter_column("metrics", existing_type=sa.Text, nullable=False)
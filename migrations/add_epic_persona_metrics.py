@@ -0,0 +1,59 @@
+"""
+Add Epic Persona Metrics Table
+
+Creates the table holding materialized PM / PO / QA dashboard projections
+of each epic's cached metrics, with threshold status and typed summary
+inputs.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = "add_epic_persona_metrics"
+down_revision = "add_epic_metric_values"
+branch_labels = None
+depends_on = None
+
+SUMMARY_COLUMNS = (
+    "risk_score",
+    "success_probability",
+    "velocity",
+    "velocity_per_member",
+    "schedule_variance_days",
+    "satisfaction_score",
+    "scope_creep_percentage",
+    "roi_percentage",
+    "adoption_rate",
+    "test_coverage",
+    "defect_density",
+    "technical_debt_hours",
+)
+
+
+def upgrade():
+    """Create the epic_persona_metrics table."""
+    print("Creating epic_persona_metrics table...")
+    op.create_table(
+        "epic_persona_metrics",
+        sa.Column(
+            "epic_id",
+            sa.Integer,
+            sa.ForeignKey("epics.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("persona", sa.String(8), primary_key=True),
+        sa.Column("payload", sa.Text, nullable=False),
+        sa.Column("metrics_cached_at", sa.DateTime, nullable=True),
+        sa.Column("materialized_at", sa.DateTime, nullable=False),
+        *(sa.Column(column, sa.Float, nullable=True) for column in SUMMARY_COLUMNS),
+    )
+
+
+def downgrade():
+    """Drop the epic_persona_metrics table."""
+    print("Dropping epic_persona_metrics table...")
+    op.drop_table("epic_persona_metrics")
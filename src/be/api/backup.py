@@ -8,6 +8,10 @@ management.
 Related Issue: US-00036 - Comprehensive Database Backup Strategy
 Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 Integration: FastAPI backend architecture
+
+Backup, restore, integrity checks and checksumming are blocking SQLite and
+filesystem work; every handler runs it on the bounded blocking executor so
+a long validation never stalls the event loop.
 """
 
 import logging
@@ -20,6 +24,7 @@ from pydantic import BaseModel, Field
 
 from ..services.backup_monitor import BackupMonitor
 from ..services.backup_service import BackupError, BackupService
+from ..services.blocking_io import run_blocking
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -143,7 +148,7 @@ async def create_backup(
         background_tasks.add_task(monitor.monitor_backup_operation, backup_service)
 
         # Create backup
-        result = backup_service.create_daily_backup()
+        result = await run_blocking(backup_service.create_daily_backup)
 
         # Prepare response
         file_paths = []
@@ -199,7 +204,7 @@ async def restore_database(
 
         # Verify backup file exists
         backup_path = Path(request.backup_file)
-        if not backup_path.exists():
+        if not await run_blocking(backup_path.exists):
             raise HTTPException(
                 status_code=404,
                 detail=f"Backup file not found: {request.backup_file}",
@@ -208,7 +213,9 @@ async def restore_database(
         # Verify only mode
         if request.verify_only:
             try:
-                backup_service._validate_backup_integrity(request.backup_file)
+                await run_blocking(
+                    backup_service._validate_backup_integrity, request.backup_file
+                )
                 return RestoreResponse(
                     restored_at=datetime.now(UTC).isoformat(),
                     duration_seconds=0,
@@ -225,7 +232,8 @@ async def restore_database(
                 )
 
         # Perform restoration
-        result = backup_service.restore_from_backup(
+        result = await run_blocking(
+            backup_service.restore_from_backup,
             backup_path=request.backup_file,
             target_db_path=request.target_database,
         )
@@ -273,14 +281,14 @@ async def get_backup_status(
         logger.debug("API status request received")
 
         # Get backup status
-        status = backup_service.get_backup_status()
+        status = await run_blocking(backup_service.get_backup_status)
 
         # Add database health if requested
         system_health = None
         if include_health:
             from ..database import check_database_health
 
-            system_health = check_database_health()
+            system_health = await run_blocking(check_database_health)
 
         # Get recent backups info
         recent_backups = []
@@ -323,7 +331,7 @@ async def get_monitoring_dashboard(
     try:
         logger.debug("API monitoring dashboard request received")
 
-        dashboard_data = monitor.get_monitoring_dashboard()
+        dashboard_data = await run_blocking(monitor.get_monitoring_dashboard)
         return MonitoringDashboardResponse(**dashboard_data)
 
     except Exception as e:
@@ -348,7 +356,7 @@ async def get_health_check(
     try:
         logger.debug("API health check request received")
 
-        health_results = monitor.run_health_check(backup_service)
+        health_results = await run_blocking(monitor.run_health_check, backup_service)
         return health_results
 
     except Exception as e:
@@ -356,6 +364,55 @@ async def get_health_check(
         raise HTTPException(status_code=500, detail=f"Health check failed: {e}")
 
 
+def _validate_backup_files(
+    backup_service: BackupService, backup_id: str, deep_check: bool
+) -> tuple:
+    """Validate every copy of ``backup_id``; returns (found, results)."""
+    backup_found = False
+    validation_results = []
+
+    for destination in backup_service.backup_destinations:
+        backup_file = destination / f"gonogo_backup_{backup_id}.db"
+        if backup_file.exists():
+            backup_found = True
+
+            try:
+                # Basic integrity validation
+                backup_service._validate_backup_integrity(str(backup_file))
+
+                # Calculate checksum
+                checksum = backup_service._calculate_checksum(backup_file)
+
+                result = {
+                    "destination": str(destination),
+                    "file_path": str(backup_file),
+                    "integrity_valid": True,
+                    "checksum": checksum,
+                    "file_size": backup_file.stat().st_size,
+                    "validation_time": datetime.now(UTC).isoformat(),
+                }
+
+                # Deep validation if requested
+                if deep_check:
+                    metadata = backup_service._verify_restored_data(str(backup_file))
+                    result["entity_counts"] = metadata
+
+                validation_results.append(result)
+
+            except BackupError as e:
+                validation_results.append(
+                    {
+                        "destination": str(destination),
+                        "file_path": str(backup_file),
+                        "integrity_valid": False,
+                        "error": str(e),
+                        "validation_time": datetime.now(UTC).isoformat(),
+                    }
+                )
+
+    return backup_found, validation_results
+
+
 @router.post("/validate/{backup_id}")
 async def validate_backup(
     backup_id: str,
@@ -372,49 +429,9 @@ async def validate_backup(
         logger.info("API validation request for backup: %s", backup_id)
 
         # Find backup file by ID
-        backup_found = False
-        validation_results = []
-
-        for destination in backup_service.backup_destinations:
-            backup_file = destination / f"gonogo_backup_{backup_id}.db"
-            if backup_file.exists():
-                backup_found = True
-
-                try:
-                    # Basic integrity validation
-                    backup_service._validate_backup_integrity(str(backup_file))
-
-                    # Calculate checksum
-                    checksum = backup_service._calculate_checksum(backup_file)
-
-                    result = {
-                        "destination": str(destination),
-                        "file_path": str(backup_file),
-                        "integrity_valid": True,
-                        "checksum": checksum,
-                        "file_size": backup_file.stat().st_size,
-                        "validation_time": datetime.now(UTC).isoformat(),
-                    }
-
-                    # Deep validation if requested
-                    if deep_check:
-                        metadata = backup_service._verify_restored_data(
-                            str(backup_file)
-                        )
-                        result["entity_counts"] = metadata
-
-                    validation_results.append(result)
-
-                except BackupError as e:
-                    validation_results.append(
-                        {
-                            "destination": str(destination),
-                            "file_path": str(backup_file),
-                            "integrity_valid": False,
-                            "error": str(e),
-                            "validation_time": datetime.now(UTC).isoformat(),
-                        }
-                    )
+        backup_found, validation_results = await run_blocking(
+            _validate_backup_files, backup_service, backup_id, deep_check
+        )
 
         if not backup_found:
             raise HTTPException(
@@ -439,6 +456,89 @@ async def validate_backup(
         raise HTTPException(status_code=500, detail=f"Validation failed: {e}")
 
 
+def _cleanup_backups(backup_service: BackupService, days: int, dry_run: bool) -> Dict:
+    """Find (and unless ``dry_run`` delete) backups older than ``days``."""
+    from datetime import timedelta
+
+    # Set retention policy
+    backup_service.retention_days = days
+
+    # Find old backups
+    cutoff_date = datetime.now(UTC) - timedelta(days=days)
+    cleanup_summary = {
+        "cutoff_date": cutoff_date.isoformat(),
+        "retention_days": days,
+        "dry_run": dry_run,
+        "destinations": [],
+    }
+
+    total_files = 0
+    total_size_mb = 0
+
+    for destination in backup_service.backup_destinations:
+        dest_summary = {
+            "path": str(destination),
+            "old_backups": [],
+            "files_to_delete": 0,
+            "size_to_free_mb": 0,
+        }
+
+        for backup_file in destination.glob("gonogo_backup_*.db"):
+            file_time = datetime.fromtimestamp(backup_file.stat().st_mtime, UTC)
+            if file_time < cutoff_date:
+                age_days = (datetime.now(UTC) - file_time).days
+                size_mb = backup_file.stat().st_size / (1024 * 1024)
+
+                backup_info = {
+                    "file": backup_file.name,
+                    "age_days": age_days,
+                    "size_mb": round(size_mb, 2),
+                    "created": file_time.isoformat(),
+                }
+
+                dest_summary["old_backups"].append(backup_info)
+                dest_summary["files_to_delete"] += 1
+                dest_summary["size_to_free_mb"] += size_mb
+
+                total_files += 1
+                total_size_mb += size_mb
+
+                # Actually delete if not dry run
+                if not dry_run:
+                    try:
+                        backup_file.unlink()
+
+                        # Remove associated files
+                        metadata_file = backup_file.with_suffix(".metadata.json")
+                        if metadata_file.exists():
+                            metadata_file.unlink()
+
+                        encrypted_file = backup_file.with_suffix(".encrypted")
+                        if encrypted_file.exists():
+                            encrypted_file.unlink()
+
+                        backup_info["deleted"] = True
+
+                    except Exception as e:
+                        backup_info["deleted"] = False
+                        backup_info["error"] = str(e)
+
+        cleanup_summary["destinations"].append(dest_summary)
+
+    cleanup_summary.update(
+        {
+            "total_files_identified": total_files,
+            "total_size_mb": round(total_size_mb, 2),
+            "cleanup_time": datetime.now(UTC).isoformat(),
+            "message": (
+                f"{'Would delete' if dry_run else 'Deleted'} {total_files} backup files ({total_size_mb:.1f} MB)"
+            ),
+        }
+    )
+
+    return cleanup_summary
+
+
 @router.delete("/cleanup")
 async def cleanup_old_backups(
     days: int = Query(30, description="Retention period in days"),
@@ -457,83 +557,11 @@ async def cleanup_old_backups(
     try:
         logger.info("API cleanup request: %d days, dry_run=%s", days, dry_run)
 
-        from datetime import timedelta
-
-        # Set retention policy
-        backup_service.retention_days = days
-
-        # Find old backups
-        cutoff_date = datetime.now(UTC) - timedelta(days=days)
-        cleanup_summary = {
-            "cutoff_date": cutoff_date.isoformat(),
-            "retention_days": days,
-            "dry_run": dry_run,
-            "destinations": [],
-        }
-
-        total_files = 0
-        total_size_mb = 0
-
-        for destination in backup_service.backup_destinations:
-            dest_summary = {
-                "path": str(destination),
-                "old_backups": [],
-                "files_to_delete": 0,
-                "size_to_free_mb": 0,
-            }
-
-            for backup_file in destination.glob("gonogo_backup_*.db"):
-                file_time = datetime.fromtimestamp(backup_file.stat().st_mtime, UTC)
-                if file_time < cutoff_date:
-                    age_days = (datetime.now(UTC) - file_time).days
-                    size_mb = backup_file.stat().st_size / (1024 * 1024)
-
-                    backup_info = {
-                        "file": backup_file.name,
-                        "age_days": age_days,
-                        "size_mb": round(size_mb, 2),
-                        "created": file_time.isoformat(),
-                    }
-
-                    dest_summary["old_backups"].append(backup_info)
-                    dest_summary["files_to_delete"] += 1
-                    dest_summary["size_to_free_mb"] += size_mb
-
-                    total_files += 1
-                    total_size_mb += size_mb
-
-                    # Actually delete if not dry run
-                    if not dry_run:
-                        try:
-                            backup_file.unlink()
-
-                            # Remove associated files
-                            metadata_file = backup_file.with_suffix(".metadata.json")
-                            if metadata_file.exists():
-                                metadata_file.unlink()
-
-                            encrypted_file = backup_file.with_suffix(".encrypted")
-                            if encrypted_file.exists():
-                                encrypted_file.unlink()
-
-                            backup_info["deleted"] = True
-
-                        except Exception as e:
-                            backup_info["deleted"] = False
-                            backup_info["error"] = str(e)
-
-            cleanup_summary["destinations"].append(dest_summary)
-
-        cleanup_summary.update(
-            {
-                "total_files_identified": total_files,
-                "total_size_mb": round(total_size_mb, 2),
-                "cleanup_time": datetime.now(UTC).isoformat(),
-                "message": (
-                    f"{'Would delete' if dry_run else 'Deleted'} {total_files} backup files ({total_size_mb:.1f} MB)"
-                ),
-            }
+        cleanup_summary = await run_blocking(
+            _cleanup_backups, backup_service, days, dry_run
         )
+        total_files = cleanup_summary["total_files_identified"]
+        total_size_mb = cleanup_summary["total_size_mb"]
 
         logger.info(
             "API cleanup completed: %d files, %.1f MB",
@@ -547,6 +575,50 @@ async def cleanup_old_backups(
         raise HTTPException(status_code=500, detail=f"Cleanup operation failed: {e}")
 
 
+def _describe_destinations(backup_service: BackupService) -> List[Dict]:
+    """Accessibility, backup count and latest backup of each destination."""
+    destinations_info = []
+
+    for destination in backup_service.backup_destinations:
+        # Count backups in destination
+        backup_files = list(destination.glob("gonogo_backup_*.db"))
+        backup_count = len(backup_files)
+
+        # Find latest backup
+        latest_backup = None
+        if backup_files:
+            latest_file = max(backup_files, key=lambda x: x.stat().st_mtime)
+            latest_backup = {
+                "file": latest_file.name,
+                "created": datetime.fromtimestamp(
+                    latest_file.stat().st_mtime, UTC
+                ).isoformat(),
+                "size_mb": round(latest_file.stat().st_size / (1024 * 1024), 2),
+            }
+
+        dest_info = {
+            "path": str(destination),
+            "accessible": destination.exists() and destination.is_dir(),
+            "backup_count": backup_count,
+            "latest_backup": latest_backup,
+            "free_space_mb": None,  # shutil.disk_usage
+        }
+
+        # Calculate free space if accessible
+        if dest_info["accessible"]:
+            try:
+                import shutil
+
+                total, used, free = shutil.disk_usage(destination)
+                dest_info["free_space_mb"] = round(free / (1024 * 1024), 2)
+            except Exception:
+                pass
+
+        destinations_info.append(dest_info)
+
+    return destinations_info
+
+
 @router.get("/destinations")
 async def list_backup_destinations(
     backup_service: BackupService = Depends(get_backup_service),
@@ -560,44 +632,7 @@ async def list_backup_destinations(
     try:
         logger.debug("API destinations list request received")
 
-        destinations_info = []
-
-        for destination in backup_service.backup_destinations:
-            # Count backups in destination
-            backup_files = list(destination.glob("gonogo_backup_*.db"))
-            backup_count = len(backup_files)
-
-            # Find latest backup
-            latest_backup = None
-            if backup_files:
-                latest_file = max(backup_files, key=lambda x: x.stat().st_mtime)
-                latest_backup = {
-                    "file": latest_file.name,
-                    "created": datetime.fromtimestamp(
-                        latest_file.stat().st_mtime, UTC
-                    ).isoformat(),
-                    "size_mb": round(latest_file.stat().st_size / (1024 * 1024), 2),
-                }
-
-            dest_info = {
-                "path": str(destination),
-                "accessible": destination.exists() and destination.is_dir(),
-                "backup_count": backup_count,
-                "latest_backup": latest_backup,
-                "free_space_mb": None,  # shutil.disk_usage
-            }
-
-            # Calculate free space if accessible
-            if dest_info["accessible"]:
-                try:
-                    import shutil
-
-                    total, used, free = shutil.disk_usage(destination)
-                    dest_info["free_space_mb"] = round(free / (1024 * 1024), 2)
-                except Exception:
-                    pass
-
-            destinations_info.append(dest_info)
+        destinations_info = await run_blocking(_describe_destinations, backup_service)
 
         return {
             "destinations": destinations_info,
@@ -613,14 +648,6 @@ async def list_backup_destinations(
         raise HTTPException(status_code=500, detail=f"Failed to list destinations: {e}")
 
 
-# Error handlers
-@router.exception_handler(BackupError)
-async def backup_error_handler(request, exc) -> dict[str, str]:
-    """Handle backup-specific errors."""
-    logger.error("Backup error in API: %s", exc)
-    return HTTPException(status_code=500, detail=str(exc))
-
-
 # Health check endpoint for the backup API itself
 @router.get("/api-health")
 async def api_health_check() -> dict[str, str]:
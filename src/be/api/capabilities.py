@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models.traceability.capability import Capability
 from ..models.traceability.epic import Epic
+from ..services.rtm_projections import EpicProjection
 
 router = APIRouter(prefix="/api/capabilities", tags=["capabilities"])
 
@@ -204,7 +205,13 @@ def get_capability_epics(capability_id: str, db: Session = Depends(get_db)):
     if not capability:
         raise HTTPException(status_code=404, detail="Capability not found")
 
-    epics = [epic.to_dict() for epic in capability.epics]
+    projection = EpicProjection(db)
+    epics = projection.serialize(
+        projection.query()
+        .filter(Epic.capability_id == capability.id)
+        .order_by(Epic.id)
+        .all()
+    )
     return {
         "capability_id": capability_id,
         "capability_name": capability.name,
@@ -4,22 +4,30 @@ Epic Dependencies API
 FastAPI endpoints for managing Epic dependencies in the dashboard system.
 Provides CRUD operations, cycle detection, and critical path calculation.
 
+Handlers use an AsyncSession so database round-trips never block the event
+loop. Graph analysis reuses the shared in-memory dependency graph through a
+synchronous session on the bounded blocking executor.
+
 Related Issue: US-00070 - Modèle dépendances fonctionnelles Epic
 Parent Epic: EP-00010 - Dashboard de Traçabilité Multi-Persona
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, List, Optional, Dict, TypeVar
 from pydantic import BaseModel, Field, ConfigDict
 
-from ..database import get_db_session
+from ..database import get_async_db, get_db_session
 from ..models.traceability.epic import Epic
 from ..models.traceability.epic_dependency import (
     EpicDependency,
     DependencyGraph,
     DependencyType,
 )
+from ..services.blocking_io import run_blocking
+
+T = TypeVar("T")
 
 
 # Pydantic models pour les requêtes/réponses API
@@ -118,39 +126,81 @@ class DependencyAnalysis(BaseModel):
     blocking_epics: List[int]
     blocked_by_epics: List[int]
     critical_dependencies: List[DependencyResponse]
+    downstream_epics: List[int] = []
     risk_score: int
 
 
 router = APIRouter(prefix="/api/epic-dependencies", tags=["Epic Dependencies"])
 
 
-def get_db():
-    """Dependency injection pour la session DB."""
+def _with_graph(analysis: Callable[[DependencyGraph], T]) -> T:
+    """Run ``analysis`` on the shared dependency graph with its own session."""
     db = get_db_session()
     try:
-        yield db
+        return analysis(DependencyGraph(db))
     finally:
         db.close()
 
 
+async def run_graph_analysis(analysis: Callable[[DependencyGraph], T]) -> T:
+    """Run a (CPU-bound, synchronous) graph analysis off the event loop."""
+    return await run_blocking(_with_graph, analysis)
+
+
+def _to_response(dependency: EpicDependency) -> DependencyResponse:
+    """Convert to response format with computed fields."""
+    return DependencyResponse(
+        id=dependency.id,
+        parent_epic_id=dependency.parent_epic_id,
+        dependent_epic_id=dependency.dependent_epic_id,
+        dependency_type=dependency.dependency_type,
+        priority=dependency.priority,
+        reason=dependency.reason,
+        estimated_impact_days=dependency.estimated_impact_days,
+        is_active=dependency.is_active,
+        is_resolved=dependency.is_resolved,
+        resolution_date=(
+            dependency.resolution_date.isoformat()
+            if dependency.resolution_date
+            else None
+        ),
+        resolution_notes=dependency.resolution_notes,
+        created_by_system=dependency.created_by_system,
+        validation_status=dependency.validation_status,
+        created_at=dependency.created_at.isoformat(),
+        updated_at=dependency.updated_at.isoformat(),
+        criticality_score=dependency.get_criticality_score(),
+        is_blocking=dependency.is_blocking(),
+    )
+
+
+async def _get_dependency_or_404(
+    db: AsyncSession, dependency_id: int
+) -> EpicDependency:
+    dependency = await db.get(EpicDependency, dependency_id)
+    if not dependency:
+        raise HTTPException(
+            status_code=404, detail=f"Dependency {dependency_id} not found"
+        )
+    return dependency
+
+
 @router.post(
     "/", response_model=DependencyResponse, status_code=status.HTTP_201_CREATED
 )
 async def create_dependency(
-    dependency: DependencyCreate, db: Session = Depends(get_db)
+    dependency: DependencyCreate, db: AsyncSession = Depends(get_async_db)
 ):
     """Créer une nouvelle dépendance Epic avec validation anti-cycle."""
 
     # Vérifier que les Epics existent
-    parent_epic = db.query(Epic).filter(Epic.id == dependency.parent_epic_id).first()
+    parent_epic = await db.get(Epic, dependency.parent_epic_id)
     if not parent_epic:
         raise HTTPException(
             status_code=404, detail=f"Parent Epic {dependency.parent_epic_id} not found"
         )
 
-    dependent_epic = (
-        db.query(Epic).filter(Epic.id == dependency.dependent_epic_id).first()
-    )
+    dependent_epic = await db.get(Epic, dependency.dependent_epic_id)
     if not dependent_epic:
         raise HTTPException(
             status_code=404,
@@ -161,27 +211,15 @@ async def create_dependency(
     if dependency.parent_epic_id == dependency.dependent_epic_id:
         raise HTTPException(status_code=400, detail="Epic cannot depend on itself")
 
-    # Créer la dépendance temporairement pour tester les cycles
-    test_dependency = EpicDependency(
-        parent_epic_id=dependency.parent_epic_id,
-        dependent_epic_id=dependency.dependent_epic_id,
-        dependency_type=dependency.dependency_type,
-        priority=dependency.priority,
-        reason=dependency.reason,
-        estimated_impact_days=dependency.estimated_impact_days,
-    )
-
-    # Tester la détection de cycles
-    existing_dependencies = (
-        db.query(EpicDependency).filter(EpicDependency.is_active == True).all()
+    # Tester si la nouvelle arête fermerait un cycle
+    cycle = await run_graph_analysis(
+        lambda graph: graph.find_cycle_with(
+            dependency.parent_epic_id, dependency.dependent_epic_id
+        )
     )
-    test_dependencies = existing_dependencies + [test_dependency]
 
-    graph = DependencyGraph(db)
-    cycles = graph.detect_cycles(test_dependencies)
-
-    if cycles:
-        cycle_description = " -> ".join([str(epic_id) for epic_id in cycles[0]])
+    if cycle:
+        cycle_description = " -> ".join([str(epic_id) for epic_id in cycle])
         raise HTTPException(
             status_code=400,
             detail=(
@@ -190,14 +228,12 @@ async def create_dependency(
         )
 
     # Vérifier les doublons
-    existing = (
-        db.query(EpicDependency)
-        .filter(
+    existing = await db.scalar(
+        select(EpicDependency.id).where(
             EpicDependency.parent_epic_id == dependency.parent_epic_id,
             EpicDependency.dependent_epic_id == dependency.dependent_epic_id,
             EpicDependency.dependency_type == dependency.dependency_type,
         )
-        .first()
     )
 
     if existing:
@@ -212,36 +248,15 @@ async def create_dependency(
         )
 
     # Créer la dépendance
-    db_dependency = EpicDependency(**dependency.dict())
+    db_dependency = EpicDependency(
+        title=f"{parent_epic.epic_id} -> {dependent_epic.epic_id}",
+        **dependency.model_dump(),
+    )
     db.add(db_dependency)
-    db.commit()
-    db.refresh(db_dependency)
-
-    # Convert to response format with computed fields
-    dep_dict = {
-        "id": db_dependency.id,
-        "parent_epic_id": db_dependency.parent_epic_id,
-        "dependent_epic_id": db_dependency.dependent_epic_id,
-        "dependency_type": db_dependency.dependency_type,
-        "priority": db_dependency.priority,
-        "reason": db_dependency.reason,
-        "estimated_impact_days": db_dependency.estimated_impact_days,
-        "is_active": db_dependency.is_active,
-        "is_resolved": db_dependency.is_resolved,
-        "resolution_date": (
-            db_dependency.resolution_date.isoformat()
-            if db_dependency.resolution_date
-            else None
-        ),
-        "resolution_notes": db_dependency.resolution_notes,
-        "created_by_system": db_dependency.created_by_system,
-        "validation_status": db_dependency.validation_status,
-        "created_at": db_dependency.created_at.isoformat(),
-        "updated_at": db_dependency.updated_at.isoformat(),
-        "criticality_score": db_dependency.get_criticality_score(),
-        "is_blocking": db_dependency.is_blocking(),
-    }
-    return DependencyResponse(**dep_dict)
+    await db.commit()
+    await db.refresh(db_dependency)
+
+    return _to_response(db_dependency)
 
 
 @router.get("/", response_model=List[DependencyResponse])
@@ -256,181 +271,87 @@ async def list_dependencies(
     priority: Optional[str] = Query(None, description="Filtrer par priorité"),
     is_active: Optional[bool] = Query(None, description="Filtrer par statut actif"),
     is_resolved: Optional[bool] = Query(None, description="Filtrer par statut résolu"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Lister les dépendances Epic avec filtres optionnels."""
 
-    query = db.query(EpicDependency)
+    query = select(EpicDependency)
 
     if parent_epic_id is not None:
-        query = query.filter(EpicDependency.parent_epic_id == parent_epic_id)
+        query = query.where(EpicDependency.parent_epic_id == parent_epic_id)
 
     if dependent_epic_id is not None:
-        query = query.filter(EpicDependency.dependent_epic_id == dependent_epic_id)
+        query = query.where(EpicDependency.dependent_epic_id == dependent_epic_id)
 
     if dependency_type is not None:
-        query = query.filter(EpicDependency.dependency_type == dependency_type)
+        query = query.where(EpicDependency.dependency_type == dependency_type)
 
     if priority is not None:
-        query = query.filter(EpicDependency.priority == priority)
+        query = query.where(EpicDependency.priority == priority)
 
     if is_active is not None:
-        query = query.filter(EpicDependency.is_active == is_active)
+        query = query.where(EpicDependency.is_active == is_active)
 
     if is_resolved is not None:
-        query = query.filter(EpicDependency.is_resolved == is_resolved)
-
-    dependencies = query.order_by(EpicDependency.created_at.desc()).all()
-
-    # Convert to response format with computed fields
-    result = []
-    for dep in dependencies:
-        dep_dict = {
-            "id": dep.id,
-            "parent_epic_id": dep.parent_epic_id,
-            "dependent_epic_id": dep.dependent_epic_id,
-            "dependency_type": dep.dependency_type,
-            "priority": dep.priority,
-            "reason": dep.reason,
-            "estimated_impact_days": dep.estimated_impact_days,
-            "is_active": dep.is_active,
-            "is_resolved": dep.is_resolved,
-            "resolution_date": (
-                dep.resolution_date.isoformat() if dep.resolution_date else None
-            ),
-            "resolution_notes": dep.resolution_notes,
-            "created_by_system": dep.created_by_system,
-            "validation_status": dep.validation_status,
-            "created_at": dep.created_at.isoformat(),
-            "updated_at": dep.updated_at.isoformat(),
-            "criticality_score": dep.get_criticality_score(),
-            "is_blocking": dep.is_blocking(),
-        }
-        result.append(DependencyResponse(**dep_dict))
+        query = query.where(EpicDependency.is_resolved == is_resolved)
+
+    dependencies = await db.scalars(query.order_by(EpicDependency.created_at.desc()))
 
-    return result
+    return [_to_response(dep) for dep in dependencies]
 
 
 @router.get("/{dependency_id}", response_model=DependencyResponse)
-async def get_dependency(dependency_id: int, db: Session = Depends(get_db)):
+async def get_dependency(dependency_id: int, db: AsyncSession = Depends(get_async_db)):
     """Récupérer une dépendance Epic par ID."""
 
-    dependency = (
-        db.query(EpicDependency).filter(EpicDependency.id == dependency_id).first()
-    )
-    if not dependency:
-        raise HTTPException(
-            status_code=404, detail=f"Dependency {dependency_id} not found"
-        )
-
-    # Convert to response format with computed fields
-    dep_dict = {
-        "id": dependency.id,
-        "parent_epic_id": dependency.parent_epic_id,
-        "dependent_epic_id": dependency.dependent_epic_id,
-        "dependency_type": dependency.dependency_type,
-        "priority": dependency.priority,
-        "reason": dependency.reason,
-        "estimated_impact_days": dependency.estimated_impact_days,
-        "is_active": dependency.is_active,
-        "is_resolved": dependency.is_resolved,
-        "resolution_date": (
-            dependency.resolution_date.isoformat()
-            if dependency.resolution_date
-            else None
-        ),
-        "resolution_notes": dependency.resolution_notes,
-        "created_by_system": dependency.created_by_system,
-        "validation_status": dependency.validation_status,
-        "created_at": dependency.created_at.isoformat(),
-        "updated_at": dependency.updated_at.isoformat(),
-        "criticality_score": dependency.get_criticality_score(),
-        "is_blocking": dependency.is_blocking(),
-    }
-    return DependencyResponse(**dep_dict)
+    return _to_response(await _get_dependency_or_404(db, dependency_id))
 
 
 @router.put("/{dependency_id}", response_model=DependencyResponse)
 async def update_dependency(
-    dependency_id: int, update: DependencyUpdate, db: Session = Depends(get_db)
+    dependency_id: int,
+    update: DependencyUpdate,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Mettre à jour une dépendance Epic."""
 
-    dependency = (
-        db.query(EpicDependency).filter(EpicDependency.id == dependency_id).first()
-    )
-    if not dependency:
-        raise HTTPException(
-            status_code=404, detail=f"Dependency {dependency_id} not found"
-        )
+    dependency = await _get_dependency_or_404(db, dependency_id)
 
     # Appliquer les mises à jour
-    for field, value in update.dict(exclude_unset=True).items():
+    for field, value in update.model_dump(exclude_unset=True).items():
         if hasattr(dependency, field):
             setattr(dependency, field, value)
 
-    db.commit()
-    db.refresh(dependency)
-
-    # Convert to response format with computed fields
-    dep_dict = {
-        "id": dependency.id,
-        "parent_epic_id": dependency.parent_epic_id,
-        "dependent_epic_id": dependency.dependent_epic_id,
-        "dependency_type": dependency.dependency_type,
-        "priority": dependency.priority,
-        "reason": dependency.reason,
-        "estimated_impact_days": dependency.estimated_impact_days,
-        "is_active": dependency.is_active,
-        "is_resolved": dependency.is_resolved,
-        "resolution_date": (
-            dependency.resolution_date.isoformat()
-            if dependency.resolution_date
-            else None
-        ),
-        "resolution_notes": dependency.resolution_notes,
-        "created_by_system": dependency.created_by_system,
-        "validation_status": dependency.validation_status,
-        "created_at": dependency.created_at.isoformat(),
-        "updated_at": dependency.updated_at.isoformat(),
-        "criticality_score": dependency.get_criticality_score(),
-        "is_blocking": dependency.is_blocking(),
-    }
-    return DependencyResponse(**dep_dict)
+    await db.commit()
+    await db.refresh(dependency)
+
+    return _to_response(dependency)
 
 
 @router.delete("/{dependency_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_dependency(dependency_id: int, db: Session = Depends(get_db)):
+async def delete_dependency(
+    dependency_id: int, db: AsyncSession = Depends(get_async_db)
+):
     """Supprimer une dépendance Epic."""
 
-    dependency = (
-        db.query(EpicDependency).filter(EpicDependency.id == dependency_id).first()
-    )
-    if not dependency:
-        raise HTTPException(
-            status_code=404, detail=f"Dependency {dependency_id} not found"
-        )
+    dependency = await _get_dependency_or_404(db, dependency_id)
 
-    db.delete(dependency)
-    db.commit()
+    await db.delete(dependency)
+    await db.commit()
 
 
 @router.post("/{dependency_id}/resolve")
 async def resolve_dependency(
-    dependency_id: int, notes: Optional[str] = None, db: Session = Depends(get_db)
+    dependency_id: int,
+    notes: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Marquer une dépendance comme résolue."""
 
-    dependency = (
-        db.query(EpicDependency).filter(EpicDependency.id == dependency_id).first()
-    )
-    if not dependency:
-        raise HTTPException(
-            status_code=404, detail=f"Dependency {dependency_id} not found"
-        )
+    dependency = await _get_dependency_or_404(db, dependency_id)
 
     dependency.mark_resolved(notes)
-    db.commit()
+    await db.commit()
 
     return {
         "message": "Dependency resolved successfully",
@@ -440,20 +361,16 @@ async def resolve_dependency(
 
 @router.post("/{dependency_id}/reactivate")
 async def reactivate_dependency(
-    dependency_id: int, reason: Optional[str] = None, db: Session = Depends(get_db)
+    dependency_id: int,
+    reason: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Réactiver une dépendance."""
 
-    dependency = (
-        db.query(EpicDependency).filter(EpicDependency.id == dependency_id).first()
-    )
-    if not dependency:
-        raise HTTPException(
-            status_code=404, detail=f"Dependency {dependency_id} not found"
-        )
+    dependency = await _get_dependency_or_404(db, dependency_id)
 
     dependency.reactivate(reason)
-    db.commit()
+    await db.commit()
 
     return {
         "message": "Dependency reactivated successfully",
@@ -462,11 +379,10 @@ async def reactivate_dependency(
 
 
 @router.get("/analysis/cycles")
-async def detect_cycles(db: Session = Depends(get_db)):
+async def detect_cycles():
     """Détecter les cycles dans les dépendances Epic."""
 
-    graph = DependencyGraph(db)
-    cycles = graph.detect_cycles()
+    cycles = await run_graph_analysis(lambda graph: graph.detect_cycles())
 
     return {
         "cycles_detected": len(cycles) > 0,
@@ -480,7 +396,6 @@ async def calculate_critical_path(
     epic_ids: Optional[str] = Query(
         None, description="IDs des Epics séparés par virgule"
     ),
-    db: Session = Depends(get_db),
 ):
     """Calculer le chemin critique pour les Epics donnés."""
 
@@ -489,8 +404,9 @@ async def calculate_critical_path(
     else:
         epic_id_list = None
 
-    graph = DependencyGraph(db)
-    result = graph.calculate_critical_path(epic_id_list)
+    result = await run_graph_analysis(
+        lambda graph: graph.calculate_critical_path(epic_id_list)
+    )
 
     # Convertir les clés de distances en string pour JSON
     result["distances"] = {str(k): v for k, v in result["distances"].items()}
@@ -499,76 +415,72 @@ async def calculate_critical_path(
 
 
 @router.get("/analysis/impact/{epic_id}", response_model=DependencyAnalysis)
-async def analyze_epic_impact(epic_id: int, db: Session = Depends(get_db)):
+async def analyze_epic_impact(epic_id: int, db: AsyncSession = Depends(get_async_db)):
     """Analyser l'impact des dépendances pour un Epic."""
 
-    epic = db.query(Epic).filter(Epic.id == epic_id).first()
+    epic = await db.get(Epic, epic_id)
     if not epic:
         raise HTTPException(status_code=404, detail=f"Epic {epic_id} not found")
 
-    graph = DependencyGraph(db)
-    analysis = graph.get_dependency_impact(epic_id)
+    analysis = await run_graph_analysis(
+        lambda graph: graph.get_dependency_impact(epic_id)
+    )
 
     # Convertir les critical_dependencies en DependencyResponse
-    critical_deps = []
-    for dep_dict in analysis["critical_dependencies"]:
-        # Récupérer l'objet dependency complet pour la conversion
-        dep_obj = (
-            db.query(EpicDependency).filter(EpicDependency.id == dep_dict["id"]).first()
-        )
-        if dep_obj:
-            critical_deps.append(DependencyResponse.from_orm(dep_obj))
-
-    analysis["critical_dependencies"] = critical_deps
+    analysis["critical_dependencies"] = [
+        DependencyResponse(**dep_dict) for dep_dict in analysis["critical_dependencies"]
+    ]
 
     return DependencyAnalysis(**analysis)
 
 
 @router.get("/statistics/summary")
-async def get_dependency_statistics(db: Session = Depends(get_db)):
+async def get_dependency_statistics(db: AsyncSession = Depends(get_async_db)):
     """Obtenir des statistiques générales sur les dépendances."""
 
-    total_dependencies = db.query(EpicDependency).count()
-    active_dependencies = (
-        db.query(EpicDependency).filter(EpicDependency.is_active == True).count()
-    )
-    resolved_dependencies = (
-        db.query(EpicDependency).filter(EpicDependency.is_resolved == True).count()
-    )
-    blocking_dependencies = (
-        db.query(EpicDependency)
-        .filter(
-            EpicDependency.dependency_type == DependencyType.BLOCKING.value,
-            EpicDependency.is_active == True,
-            EpicDependency.is_resolved == False,
-        )
-        .count()
-    )
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    active = EpicDependency.is_active == True  # noqa: E712
+
+    # Une seule requête pour tous les compteurs
+    columns = [
+        func.count(EpicDependency.id),
+        count_if(active),
+        count_if(EpicDependency.is_resolved == True),  # noqa: E712
+        count_if(
+            (EpicDependency.dependency_type == DependencyType.BLOCKING.value)
+            & active
+            & (EpicDependency.is_resolved == False)  # noqa: E712
+        ),
+    ]
+    columns += [
+        count_if((EpicDependency.dependency_type == dep_type.value) & active)
+        for dep_type in DependencyType
+    ]
+    priorities = ["critical", "high", "medium", "low"]
+    columns += [
+        count_if((EpicDependency.priority == priority) & active)
+        for priority in priorities
+    ]
+
+    counts = list((await db.execute(select(*columns))).one())
+    (
+        total_dependencies,
+        active_dependencies,
+        resolved_dependencies,
+        blocking_dependencies,
+    ) = counts[:4]
+    type_counts = counts[4 : 4 + len(DependencyType)]
+    priority_counts = counts[4 + len(DependencyType) :]
 
     # Statistiques par type
-    type_stats = {}
-    for dep_type in DependencyType:
-        count = (
-            db.query(EpicDependency)
-            .filter(
-                EpicDependency.dependency_type == dep_type.value,
-                EpicDependency.is_active == True,
-            )
-            .count()
-        )
-        type_stats[dep_type.value] = count
+    type_stats = {
+        dep_type.value: count for dep_type, count in zip(DependencyType, type_counts)
+    }
 
     # Statistiques par priorité
-    priority_stats = {}
-    for priority in ["critical", "high", "medium", "low"]:
-        count = (
-            db.query(EpicDependency)
-            .filter(
-                EpicDependency.priority == priority, EpicDependency.is_active == True
-            )
-            .count()
-        )
-        priority_stats[priority] = count
+    priority_stats = dict(zip(priorities, priority_counts))
 
     return {
         "total_dependencies": total_dependencies,
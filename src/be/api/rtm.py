@@ -10,19 +10,37 @@ Architecture Decision: ADR-003 - Hybrid GitHub + Database RTM Architecture
 """
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from ..database import get_db
-from ..models.traceability import Defect, Epic, Test, UserStory
+from ..models.traceability import Capability, Defect, Epic, Test, UserStory
+from ..models.traceability.epic_persona_metrics import PERSONAS
+from ..services.dependency_graph_service import get_dependency_graph
+from ..services.keyset_pagination import (
+    InvalidCursorError,
+    KeysetPaginator,
+    count_rows,
+)
+from ..services.persona_metrics_projector import PersonaMetricsProjector
+from ..services.render_cache import (
+    data_fingerprint,
+    data_generation,
+    get_render_cache,
+    render_key,
+)
+from ..services.rtm_aggregations import RTMAggregator
+from ..services.rtm_projections import EpicProjection, UserStoryProjection
 from ..services.rtm_report_generator import RTMReportGenerator
+from ..services.svg_graph_generator import SVGGraphGenerator
 from ...shared.metrics.thresholds import get_threshold_service
 
 router = APIRouter(prefix="/api/rtm", tags=["RTM"])
@@ -80,6 +98,68 @@ def filter_demo_epics(
     return filtered
 
 
+def paginate_list(
+    response: Optional[Response],
+    paginator: KeysetPaginator,
+    query,
+    filters: dict,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+) -> list:
+    """Return one page of ``query`` and expose the next cursor as a header."""
+    if cursor and offset:
+        raise HTTPException(
+            status_code=400, detail="Use either cursor or offset, not both"
+        )
+    try:
+        page = paginator.page(query, limit, filters, cursor=cursor, offset=offset)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor and response is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.rows
+
+
+def report_total(
+    response: Optional[Response], db: Session, model, criteria: list, total
+) -> None:
+    """Set X-Total-Count when the client asked for the filtered total."""
+    if not total or response is None:
+        return
+    count, is_estimate = count_rows(db, model, criteria, estimate=total == "estimate")
+    response.headers["X-Total-Count"] = str(count)
+    response.headers["X-Total-Count-Estimated"] = "true" if is_estimate else "false"
+
+
+def cached_render(
+    request: Request, key: str, media_type: str, render, stream: bool = False
+) -> Response:
+    """Serve a render from the render cache, honouring If-None-Match.
+
+    With ``stream``, ``render`` returns an iterable of chunks; on a miss
+    they are streamed to the client and cached once the body is complete.
+    """
+    etag = f'"{key}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    cache = get_render_cache()
+    if stream:
+        body = cache.get(key)
+        if body is None:
+            headers["X-Render-Cache"] = "miss"
+            return StreamingResponse(
+                cache.tee(key, render()), media_type=media_type, headers=headers
+            )
+        hit = True
+    else:
+        body, hit = cache.get_or_render(key, render)
+    headers["X-Render-Cache"] = "hit" if hit else "miss"
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
 # Dashboard and Web Interface
 @router.get("/dashboard", response_class=HTMLResponse)
 def rtm_dashboard(request: Request):
@@ -160,17 +240,29 @@ def list_epics(
     exclude_component: Optional[str] = Query(
         None, description="Exclude components (supports comma-separated values)"
     ),
-    limit: int = Query(50, le=100, description="Limit results"),
+    limit: int = Query(50, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Continuation token from the X-Next-Cursor header"
+    ),
+    total: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate)$",
+        description="Report the filtered total in X-Total-Count",
+    ),
+    response: Response = None,
     db: Session = Depends(get_db),
 ):
-    """List all Epics with optional filtering."""
-    query = db.query(Epic)
+    """List Epics with optional filtering, ordered by epic_id.
 
+    Pages continue from the ``cursor`` returned in X-Next-Cursor; ``offset``
+    is still accepted for clients that have not moved to cursors.
+    """
+    criteria = []
     if status:
-        query = query.filter(Epic.status == status)
+        criteria.append(Epic.status == status)
     if priority:
-        query = query.filter(Epic.priority == priority)
+        criteria.append(Epic.priority == priority)
 
     # Component filtering
     if component:
@@ -181,15 +273,31 @@ def list_epics(
         component_filters = []
         for comp in components:
             component_filters.append(Epic.component.like(f"%{comp}%"))
-        query = query.filter(or_(*component_filters))
+        criteria.append(or_(*component_filters))
 
     if exclude_component:
         exclude_components = [c.strip() for c in exclude_component.split(",")]
         for comp in exclude_components:
-            query = query.filter(~Epic.component.like(f"%{comp}%"))
+            criteria.append(~Epic.component.like(f"%{comp}%"))
 
-    epics = query.offset(offset).limit(limit).all()
-    return [epic.to_dict() for epic in epics]
+    filters = {
+        "status": status,
+        "priority": priority,
+        "component": component,
+        "exclude_component": exclude_component,
+    }
+    projection = EpicProjection(db)
+    rows = paginate_list(
+        response,
+        KeysetPaginator(Epic.epic_id, lambda row: row[0].epic_id),
+        projection.query().filter(*criteria),
+        filters,
+        limit,
+        offset,
+        cursor,
+    )
+    report_total(response, db, Epic, criteria, total)
+    return projection.serialize(rows)
 
 
 @router.get("/epics/{epic_id}", response_model=dict)
@@ -282,30 +390,54 @@ def list_user_stories(
     exclude_component: Optional[str] = Query(
         None, description="Exclude components (supports comma-separated values)"
     ),
-    limit: int = Query(50, le=100, description="Limit results"),
+    limit: int = Query(50, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Continuation token from the X-Next-Cursor header"
+    ),
+    total: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate)$",
+        description="Report the filtered total in X-Total-Count",
+    ),
+    response: Response = None,
     db: Session = Depends(get_db),
 ):
-    """List all User Stories with optional filtering."""
-    query = db.query(UserStory)
-
+    """List User Stories with optional filtering, ordered by user_story_id."""
+    criteria = []
     if epic_id:
-        query = query.filter(UserStory.epic_id == epic_id)
+        criteria.append(UserStory.epic_id == epic_id)
     if status:
-        query = query.filter(UserStory.implementation_status == status)
+        criteria.append(UserStory.implementation_status == status)
 
     # Component filtering
     if component:
         components = [c.strip() for c in component.split(",")]
         # For user stories, component is a single value field
-        query = query.filter(UserStory.component.in_(components))
+        criteria.append(UserStory.component.in_(components))
 
     if exclude_component:
         exclude_components = [c.strip() for c in exclude_component.split(",")]
-        query = query.filter(~UserStory.component.in_(exclude_components))
+        criteria.append(~UserStory.component.in_(exclude_components))
 
-    user_stories = query.offset(offset).limit(limit).all()
-    return [us.to_dict() for us in user_stories]
+    filters = {
+        "epic_id": epic_id,
+        "status": status,
+        "component": component,
+        "exclude_component": exclude_component,
+    }
+    projection = UserStoryProjection(db)
+    rows = paginate_list(
+        response,
+        KeysetPaginator(UserStory.user_story_id, lambda row: row[0].user_story_id),
+        projection.query().filter(*criteria),
+        filters,
+        limit,
+        offset,
+        cursor,
+    )
+    report_total(response, db, UserStory, criteria, total)
+    return projection.serialize(rows)
 
 
 @router.get("/user-stories/{user_story_id}", response_model=dict)
@@ -360,30 +492,54 @@ def list_tests(
     exclude_component: Optional[str] = Query(
         None, description="Exclude components (supports comma-separated values)"
     ),
-    limit: int = Query(50, le=100, description="Limit results"),
+    limit: int = Query(50, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Continuation token from the X-Next-Cursor header"
+    ),
+    total: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate)$",
+        description="Report the filtered total in X-Total-Count",
+    ),
+    response: Response = None,
     db: Session = Depends(get_db),
 ):
-    """List all Tests with optional filtering."""
-    query = db.query(Test)
-
+    """List Tests with optional filtering, ordered by id."""
+    criteria = []
     if test_type:
-        query = query.filter(Test.test_type == test_type)
+        criteria.append(Test.test_type == test_type)
     if epic_id:
-        query = query.filter(Test.epic_id == epic_id)
+        criteria.append(Test.epic_id == epic_id)
     if execution_status:
-        query = query.filter(Test.last_execution_status == execution_status)
+        criteria.append(Test.last_execution_status == execution_status)
 
     # Component filtering
     if component:
         components = [c.strip() for c in component.split(",")]
-        query = query.filter(Test.component.in_(components))
+        criteria.append(Test.component.in_(components))
 
     if exclude_component:
         exclude_components = [c.strip() for c in exclude_component.split(",")]
-        query = query.filter(~Test.component.in_(exclude_components))
+        criteria.append(~Test.component.in_(exclude_components))
 
-    tests = query.offset(offset).limit(limit).all()
+    filters = {
+        "test_type": test_type,
+        "epic_id": epic_id,
+        "execution_status": execution_status,
+        "component": component,
+        "exclude_component": exclude_component,
+    }
+    tests = paginate_list(
+        response,
+        KeysetPaginator(Test.id, lambda test: test.id),
+        db.query(Test).filter(*criteria),
+        filters,
+        limit,
+        offset,
+        cursor,
+    )
+    report_total(response, db, Test, criteria, total)
     return [test.to_dict() for test in tests]
 
 
@@ -447,30 +603,54 @@ def list_defects(
     exclude_component: Optional[str] = Query(
         None, description="Exclude components (supports comma-separated values)"
     ),
-    limit: int = Query(50, le=100, description="Limit results"),
+    limit: int = Query(50, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Continuation token from the X-Next-Cursor header"
+    ),
+    total: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimate)$",
+        description="Report the filtered total in X-Total-Count",
+    ),
+    response: Response = None,
     db: Session = Depends(get_db),
 ):
-    """List all Defects with optional filtering."""
-    query = db.query(Defect)
-
+    """List Defects with optional filtering, ordered by id."""
+    criteria = []
     if severity:
-        query = query.filter(Defect.severity == severity)
+        criteria.append(Defect.severity == severity)
     if status:
-        query = query.filter(Defect.status == status)
+        criteria.append(Defect.status == status)
     if is_security_issue is not None:
-        query = query.filter(Defect.is_security_issue == is_security_issue)
+        criteria.append(Defect.is_security_issue == is_security_issue)
 
     # Component filtering
     if component:
         components = [c.strip() for c in component.split(",")]
-        query = query.filter(Defect.component.in_(components))
+        criteria.append(Defect.component.in_(components))
 
     if exclude_component:
         exclude_components = [c.strip() for c in exclude_component.split(",")]
-        query = query.filter(~Defect.component.in_(exclude_components))
+        criteria.append(~Defect.component.in_(exclude_components))
 
-    defects = query.offset(offset).limit(limit).all()
+    filters = {
+        "severity": severity,
+        "status": status,
+        "is_security_issue": is_security_issue,
+        "component": component,
+        "exclude_component": exclude_component,
+    }
+    defects = paginate_list(
+        response,
+        KeysetPaginator(Defect.id, lambda defect: defect.id),
+        db.query(Defect).filter(*criteria),
+        filters,
+        limit,
+        offset,
+        cursor,
+    )
+    report_total(response, db, Defect, criteria, total)
     return [defect.to_dict() for defect in defects]
 
 
@@ -511,62 +691,7 @@ def list_components(db: Session = Depends(get_db)):
 @router.get("/components/statistics", response_model=dict)
 def get_component_statistics(db: Session = Depends(get_db)):
     """Get comprehensive statistics for each component."""
-    components = list_components(db)
-
-    stats = {}
-    for component in components:
-        # Epic count (need to check for component in comma-separated values)
-        epic_count = (
-            db.query(Epic).filter(Epic.component.like(f"%{component}%")).count()
-        )
-
-        # User story count
-        us_count = db.query(UserStory).filter(UserStory.component == component).count()
-
-        # Test count
-        test_count = db.query(Test).filter(Test.component == component).count()
-
-        # Defect count
-        defect_count = db.query(Defect).filter(Defect.component == component).count()
-
-        # Test pass rate for this component
-        total_tests = db.query(Test).filter(Test.component == component).count()
-        passed_tests = (
-            db.query(Test)
-            .filter(Test.component == component, Test.last_execution_status == "passed")
-            .count()
-        )
-        pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-
-        # Critical defects for this component
-        critical_defects = (
-            db.query(Defect)
-            .filter(Defect.component == component, Defect.severity == "critical")
-            .count()
-        )
-
-        stats[component] = {
-            "epic_count": epic_count,
-            "user_story_count": us_count,
-            "test_count": test_count,
-            "defect_count": defect_count,
-            "test_pass_rate": round(pass_rate, 2),
-            "critical_defects": critical_defects,
-            "total_items": (epic_count + us_count + test_count + defect_count),
-        }
-
-    return {
-        "components": stats,
-        "summary": {
-            "total_components": len(components),
-            "total_epics": sum(stat["epic_count"] for stat in stats.values()),
-            "total_user_stories": sum(
-                stat["user_story_count"] for stat in stats.values()
-            ),
-            "total_tests": sum(stat["test_count"] for stat in stats.values()),
-            "total_defects": sum(stat["defect_count"] for stat in stats.values()),
-        },
-    }
+    return RTMAggregator(db).component_statistics()
 
 
 @router.get("/components/{component_name}/items", response_model=dict)
@@ -594,22 +719,24 @@ def get_component_items(
     }
 
     if include_epics:
-        epics = (
-            db.query(Epic)
+        projection = EpicProjection(db)
+        rows = (
+            projection.query()
             .filter(Epic.component.like(f"%{component_name}%"))
             .limit(limit)
             .all()
         )
-        result["epics"] = [epic.to_dict() for epic in epics]
+        result["epics"] = projection.serialize(rows)
 
     if include_user_stories:
-        user_stories = (
-            db.query(UserStory)
+        projection = UserStoryProjection(db)
+        rows = (
+            projection.query()
             .filter(UserStory.component == component_name)
             .limit(limit)
             .all()
         )
-        result["user_stories"] = [us.to_dict() for us in user_stories]
+        result["user_stories"] = projection.serialize(rows)
 
     if include_tests:
         tests = (
@@ -722,68 +849,13 @@ def get_epic_progress(epic_id: str, db: Session = Depends(get_db)):
 @router.get("/analytics/overview", response_model=dict)
 def get_rtm_overview(db: Session = Depends(get_db)):
     """Get overall RTM analytics and metrics."""
-    epics = db.query(Epic).all()
-    user_stories = db.query(UserStory).all()
-    tests = db.query(Test).all()
-    defects = db.query(Defect).all()
-
-    # Overall metrics
-    total_epics = len(epics)
-    completed_epics = sum(1 for epic in epics if epic.status == "completed")
-
-    total_story_points = sum(us.story_points for us in user_stories)
-    completed_story_points = sum(
-        us.story_points
-        for us in user_stories
-        if us.implementation_status in ["done", "completed"]
-    )
-
-    total_tests = len(tests)
-    passed_tests = sum(1 for test in tests if test.last_execution_status == "passed")
-
-    critical_defects = sum(1 for defect in defects if defect.severity == "critical")
-    security_issues = sum(1 for defect in defects if defect.is_security_issue)
-
-    return {
-        "summary": {
-            "epics": {
-                "total": total_epics,
-                "completed": completed_epics,
-                "completion_rate": (
-                    (completed_epics / total_epics * 100) if total_epics > 0 else 0
-                ),
-            },
-            "user_stories": {
-                "total": len(user_stories),
-                "story_points": {
-                    "total": total_story_points,
-                    "completed": completed_story_points,
-                    "completion_rate": (
-                        (completed_story_points / total_story_points * 100)
-                        if total_story_points > 0
-                        else 0
-                    ),
-                },
-            },
-            "tests": {
-                "total": total_tests,
-                "passed": passed_tests,
-                "pass_rate": (
-                    (passed_tests / total_tests * 100) if total_tests > 0 else 0
-                ),
-            },
-            "defects": {
-                "total": len(defects),
-                "critical": critical_defects,
-                "security_issues": security_issues,
-            },
-        }
-    }
+    return RTMAggregator(db).overview()
 
 
 # Dynamic Report Generation Endpoints
 @router.get("/reports/matrix", response_model=dict)
 def generate_dynamic_rtm_matrix(
+    request: Request,
     format: str = Query("json", description="Output format: json, markdown, html"),
     epic_filter: Optional[str] = Query(None, description="Filter by epic ID"),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
@@ -829,11 +901,24 @@ def generate_dynamic_rtm_matrix(
     }
 
     if format == "html":
-        content = generator.generate_html_matrix(filters)
-        return HTMLResponse(content=content)
+        key = render_key(
+            "rtm_matrix_html",
+            RTMReportGenerator.RENDER_VERSION,
+            filters,
+            data_generation(db),
+            data_fingerprint(db),
+        )
+        return cached_render(
+            request,
+            key,
+            "text/html; charset=utf-8",
+            lambda: generator.iter_html_matrix(filters),
+            stream=True,
+        )
     elif format == "markdown":
-        content = generator.generate_markdown_matrix(filters)
-        return Response(content=content, media_type="text/markdown")
+        return StreamingResponse(
+            generator.iter_markdown_matrix(filters), media_type="text/markdown"
+        )
     else:  # json
         return generator.generate_json_matrix(filters)
 
@@ -972,14 +1057,27 @@ def get_dashboard_data(db: Session = Depends(get_db)):
 @router.get("/reports/export/{report_type}")
 def export_report(
     report_type: str,
-    format: str = Query("pdf", description="Export format: pdf, csv, xlsx"),
+    format: str = Query(
+        "pdf",
+        description="Export format: pdf, csv, csv-zip (ZIP of CSV files), xlsx",
+    ),
     db: Session = Depends(get_db),
 ):
     """Export reports in various formats for external use."""
     generator = RTMReportGenerator(db)
 
     if report_type == "full-matrix":
-        content, media_type, filename = generator.export_full_matrix(format)
+        try:
+            chunks, media_type, filename = generator.export_full_matrix(format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except RuntimeError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
     elif report_type == "epic-progress":
         content, media_type, filename = generator.export_epic_progress(format)
     elif report_type == "test-summary":
@@ -1190,9 +1288,55 @@ def get_dashboard_metrics(
     component_filter: Optional[str] = Query(None, description="Filter by component"),
     db: Session = Depends(get_db),
 ):
-    """Get aggregated metrics for the multi-persona dashboard."""
+    """Get aggregated metrics for the multi-persona dashboard.
+
+    PM, PO and QA entries are served from the projections materialized by
+    the metrics refresher; the epic ``metrics`` objects are emitted as stored
+    JSON without being parsed again.
+    """
+    filters_applied = {
+        "epic_filter": epic_filter,
+        "status_filter": status_filter,
+        "component_filter": component_filter,
+    }
+
+    if persona.lower() not in PERSONAS:
+        return _get_dashboard_metrics_per_epic(
+            persona, epic_filter, status_filter, component_filter, db
+        )
+
+    projector = PersonaMetricsProjector(db, thresholds=get_threshold_service())
+    projections = projector.load(persona, epic_filter, status_filter, component_filter)
+
+    if not projections:
+        return {
+            "persona": persona.upper(),
+            "message": "No epics found matching the criteria",
+            "epics": [],
+            "summary": {},
+        }
 
-    # Build query with filters
+    summary = calculate_dashboard_summary(
+        [{"metrics": projection.summary_metrics} for projection in projections],
+        persona,
+    )
+    epics_json = ", ".join(projection.to_json() for projection in projections)
+    content = (
+        f'{{"persona": {json.dumps(persona.upper())}, "epics": [{epics_json}], '
+        f'"summary": {json.dumps(summary)}, '
+        f'"filters_applied": {json.dumps(filters_applied)}}}'
+    )
+    return Response(content=content, media_type="application/json")
+
+
+def _get_dashboard_metrics_per_epic(
+    persona: str,
+    epic_filter: Optional[str],
+    status_filter: Optional[str],
+    component_filter: Optional[str],
+    db: Session,
+) -> dict:
+    """Build dashboard metrics epic by epic for personas without projections."""
     query = db.query(Epic)
 
     if epic_filter:
@@ -1525,77 +1669,107 @@ def get_dependencies(db: Session = Depends(get_db)):
         return []
 
 
-@router.get("/dependencies/analysis/critical-path")
-def get_critical_path(db: Session = Depends(get_db)):
-    """Get critical path analysis for dependencies."""
-    try:
-        from ..models.traceability.epic_dependency import DependencyGraph
-
-        epics = db.query(Epic).all()
-        graph = DependencyGraph()
-
-        # Add epics to graph
-        for epic in epics:
-            graph.add_epic(epic.id, epic.epic_id, epic.title)
-
-        # Add dependencies
-        from ..models.traceability.epic_dependency import EpicDependency
-
-        dependencies = (
-            db.query(EpicDependency).filter(EpicDependency.is_active == True).all()
+@router.get("/dependencies/graph.svg")
+def get_dependency_graph_svg(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter epics by status"),
+    component: Optional[str] = Query(None, description="Filter epics by component"),
+    capability: Optional[str] = Query(
+        None, description="Filter epics by capability ID"
+    ),
+    db: Session = Depends(get_db),
+):
+    """Render the epic dependency graph as a server-side SVG."""
+    from ..models.traceability.epic_dependency import EpicDependency
+
+    epics = [
+        dict(row._mapping)
+        for row in db.query(
+            Epic.id,
+            Epic.epic_id,
+            Epic.title,
+            Epic.status,
+            Epic.component,
+            Epic.completion_percentage,
+            Epic.priority,
+            Capability.capability_id.label("capability_capability_id"),
         )
-        for dep in dependencies:
-            graph.add_dependency(
-                dep.parent_epic_id,
-                dep.dependent_epic_id,
-                dep.dependency_type,
-                dep.priority,
-            )
+        .outerjoin(Capability, Epic.capability_id == Capability.id)
+        .order_by(Epic.id)
+    ]
+    dependencies = [
+        dict(row._mapping)
+        for row in db.query(
+            EpicDependency.parent_epic_id,
+            EpicDependency.dependent_epic_id,
+            EpicDependency.dependency_type,
+            EpicDependency.priority,
+            EpicDependency.reason,
+        )
+        .filter(EpicDependency.is_active == True)  # noqa: E712
+        .order_by(EpicDependency.id)
+    ]
+    capabilities = [
+        dict(row._mapping)
+        for row in db.query(Capability.capability_id, Capability.name).order_by(
+            Capability.id
+        )
+    ]
+    filters = {"status": status, "component": component, "capability": capability}
+
+    generator = SVGGraphGenerator()
+    key = render_key(
+        "dependency_svg",
+        SVGGraphGenerator.RENDER_VERSION,
+        asdict(generator.layout),
+        filters,
+        epics,
+        dependencies,
+        capabilities,
+    )
+    return cached_render(
+        request,
+        key,
+        "image/svg+xml",
+        lambda: generator.generate_svg(epics, dependencies, capabilities, filters),
+    )
 
-        critical_path = graph.find_critical_path()
 
-        return {
-            "critical_path": critical_path,
-            "path_length": len(critical_path),
-            "total_impact": sum(dep.get("impact_days", 0) for dep in critical_path),
+@router.get("/dependencies/analysis/critical-path")
+def get_critical_path(db: Session = Depends(get_db)):
+    """Get critical path analysis for dependencies."""
+    graph = get_dependency_graph(db)
+    epics = {
+        row.id: row for row in db.query(Epic.id, Epic.epic_id, Epic.title).all()
+    }
+    path_ids = graph.critical_path(sorted(epics))["critical_path"]
+
+    critical_path = [
+        {
+            "id": epic_id,
+            "epic_id": epics[epic_id].epic_id,
+            "title": epics[epic_id].title,
+            "impact_days": graph.edge_weight(path_ids[index - 1], epic_id)
+            if index
+            else 0,
         }
-    except Exception:
-        return {"critical_path": [], "path_length": 0, "total_impact": 0}
+        for index, epic_id in enumerate(path_ids)
+    ]
+
+    return {
+        "critical_path": critical_path,
+        "path_length": len(critical_path),
+        "total_impact": sum(step["impact_days"] for step in critical_path),
+    }
 
 
 @router.get("/dependencies/analysis/cycles")
 def detect_cycles(db: Session = Depends(get_db)):
     """Detect circular dependencies."""
-    try:
-        from ..models.traceability.epic_dependency import DependencyGraph
-
-        epics = db.query(Epic).all()
-        graph = DependencyGraph()
-
-        # Add epics to graph
-        for epic in epics:
-            graph.add_epic(epic.id, epic.epic_id, epic.title)
-
-        # Add dependencies
-        from ..models.traceability.epic_dependency import EpicDependency
+    cycles = get_dependency_graph(db).detect_cycles()
 
-        dependencies = (
-            db.query(EpicDependency).filter(EpicDependency.is_active == True).all()
-        )
-        for dep in dependencies:
-            graph.add_dependency(
-                dep.parent_epic_id,
-                dep.dependent_epic_id,
-                dep.dependency_type,
-                dep.priority,
-            )
-
-        cycles = graph.detect_cycles()
-
-        return {
-            "has_cycles": len(cycles) > 0,
-            "cycles": cycles,
-            "cycle_count": len(cycles),
-        }
-    except Exception:
-        return {"has_cycles": False, "cycles": [], "cycle_count": 0}
+    return {
+        "has_cycles": len(cycles) > 0,
+        "cycles": cycles,
+        "cycle_count": len(cycles),
+    }
@@ -9,11 +9,19 @@ Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 """
 
 import os
-from typing import Generator
+import threading
+from typing import AsyncGenerator, Generator, Optional
 
-from sqlalchemy import MetaData, create_engine, text
+from sqlalchemy import MetaData, create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
 from .models.traceability.base import Base
 
@@ -23,19 +31,123 @@ DATABASE_URL = os.getenv(
     "sqlite:///./gonogo.db",  # Default to SQLite for development
 )
 
-# SQLite-specific configuration for development
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=os.getenv("SQL_DEBUG", "false").lower() == "true",
-    )
-else:
+# Engine configuration (environment):
+#   DB_POOL_SIZE             - persistent connections per process (default 5)
+#   DB_MAX_OVERFLOW          - extra connections under burst load (default 10)
+#   DB_POOL_TIMEOUT          - seconds to wait for a free connection (default 30)
+#   DB_POOL_RECYCLE          - seconds before a connection is replaced (default 1800)
+#   DB_POOL_PRE_PING         - test connections on checkout (default true)
+#   DB_STATEMENT_TIMEOUT_MS  - PostgreSQL statement_timeout (default 30000, 0 = off)
+#   SQLITE_BUSY_TIMEOUT_MS   - wait on a locked SQLite database (default 5000)
+#   SQLITE_MMAP_SIZE         - SQLite mmap_size in bytes (default 256 MiB)
+#   SQLITE_CACHE_SIZE_KB     - SQLite page cache size (default 64 MiB)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+def _pool_options(poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": _env_int("DB_POOL_SIZE", 5),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+    }
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    path = url.partition("://")[2]
+    return path in ("", "/:memory:") or "mode=memory" in path
+
+
+def _apply_sqlite_pragmas(engine: Engine) -> None:
+    """Tune every new file-backed SQLite connection for concurrent readers.
+
+    WAL lets dashboard readers proceed while the metrics refresher writes;
+    synchronous=NORMAL is durable across application crashes under WAL.
+    """
+    mmap_size = _env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+    cache_size_kb = _env_int("SQLITE_CACHE_SIZE_KB", 64 * 1024)
+    busy_timeout_ms = _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={mmap_size}")
+            # Negative values are in KiB rather than pages
+            cursor.execute(f"PRAGMA cache_size=-{cache_size_kb}")
+            cursor.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_url: Optional[str] = None) -> Engine:
+    """Create the application engine for ``database_url`` (default DATABASE_URL).
+
+    In-memory SQLite keeps a single shared connection (StaticPool), since
+    every new connection would otherwise see an empty database. File-backed
+    SQLite and PostgreSQL use a sized QueuePool configured from the
+    environment.
+    """
+    url = database_url or DATABASE_URL
+    echo = os.getenv("SQL_DEBUG", "false").lower() == "true"
+
+    if url.startswith("sqlite") and _is_memory_sqlite(url):
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=echo,
+        )
+
+    pool_options = _pool_options(QueuePool)
+
+    # SQLite-specific configuration for development
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            echo=echo,
+            **pool_options,
+        )
+        _apply_sqlite_pragmas(engine)
+        return engine
+
     # PostgreSQL configuration for production
-    engine = create_engine(
-        DATABASE_URL, echo=os.getenv("SQL_DEBUG", "false").lower() == "true"
-    )
+    connect_args = {}
+    statement_timeout_ms = _env_int("DB_STATEMENT_TIMEOUT_MS", 30000)
+    if statement_timeout_ms and url.startswith("postgresql"):
+        connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    return create_engine(url, connect_args=connect_args, echo=echo, **pool_options)
+
+
+def get_pool_stats(db_engine: Optional[Engine] = None) -> dict:
+    """Connection pool usage of ``db_engine`` (default: the application engine)."""
+    pool = (db_engine or engine).pool
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+    return stats
+
+
+engine = create_db_engine()
 
 # Session configuration
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -70,6 +182,89 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def async_database_url(database_url: str) -> str:
+    """Map a sync DATABASE_URL onto its async driver (aiosqlite / asyncpg)."""
+    scheme, _, rest = database_url.partition("://")
+    driver = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    base = scheme.split("+")[0]
+    if base in driver:
+        return f"{driver[base]}://{rest}"
+    return database_url
+
+
+def create_async_db_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """Async counterpart of create_db_engine(), with the same pool settings.
+
+    An in-memory SQLite database is private to its engine, so async and sync
+    sessions only share data when the database is file-backed or PostgreSQL.
+    """
+    url = async_database_url(database_url or DATABASE_URL)
+    echo = os.getenv("SQL_DEBUG", "false").lower() == "true"
+
+    if url.startswith("sqlite") and _is_memory_sqlite(url):
+        return create_async_engine(url, poolclass=StaticPool, echo=echo)
+
+    pool_options = _pool_options(AsyncAdaptedQueuePool)
+
+    if url.startswith("sqlite"):
+        async_engine = create_async_engine(url, echo=echo, **pool_options)
+        _apply_sqlite_pragmas(async_engine.sync_engine)
+        return async_engine
+
+    connect_args = {}
+    statement_timeout_ms = _env_int("DB_STATEMENT_TIMEOUT_MS", 30000)
+    if statement_timeout_ms and url.startswith("postgresql+asyncpg"):
+        connect_args["server_settings"] = {
+            "statement_timeout": str(statement_timeout_ms)
+        }
+    return create_async_engine(
+        url, connect_args=connect_args, echo=echo, **pool_options
+    )
+
+
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_session_lock = threading.Lock()
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Return the process-wide AsyncSession factory, creating its engine lazily.
+
+    Sessions keep attribute values after commit so responses can be built
+    from committed objects without an implicit (blocking) refresh.
+    """
+    global _async_session_factory
+    with _async_session_lock:
+        if _async_session_factory is None:
+            _async_session_factory = async_sessionmaker(
+                create_async_db_engine(),
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections (application shutdown)."""
+    global _async_session_factory
+    with _async_session_lock:
+        factory, _async_session_factory = _async_session_factory, None
+    if factory is not None:
+        await factory.kw["bind"].dispose()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session for ``async def`` routes.
+
+    Usage in FastAPI routes:
+        @app.get("/dependencies/")
+        async def list_dependencies(db: AsyncSession = Depends(get_async_db)):
+            return (await db.scalars(select(EpicDependency))).all()
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
 def get_db_session() -> Session:
     """
     Get a database session for use outside of FastAPI dependency injection.
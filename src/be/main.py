@@ -13,9 +13,11 @@ from fastapi.templating import Jinja2Templates
 from .api.capabilities import router as capabilities_router
 from .api.epic_dependencies import router as epic_dependencies_router
 from .api.rtm import router as rtm_router
-from .database import check_database_health
+from .database import check_database_health, dispose_async_engine, get_pool_stats
+from .services.blocking_io import shutdown_blocking_executor
 from .services.epic_metrics_refresher import (
     get_refresh_interval,
+    get_refresh_stats,
     metrics_refresh_loop,
     should_enable_background_refresh,
 )
@@ -30,6 +32,14 @@ async def lifespan(app: FastAPI):
     lifespan context manager approach recommended by FastAPI.
     """
     # Startup
+    # Compile report templates and load the asset manifest before the first
+    # request instead of during it. Imported from the same top-level
+    # ``fe`` package as the report generator so both share one instance.
+    from fe.services import get_asset_service, get_template_service
+
+    await asyncio.to_thread(get_template_service().warm_up)
+    get_asset_service()
+
     if should_enable_background_refresh():
         interval = get_refresh_interval()
         app.state.metric_refresh_task = asyncio.create_task(
@@ -46,6 +56,9 @@ async def lifespan(app: FastAPI):
             with suppress(asyncio.CancelledError):
                 await task
 
+    await dispose_async_engine()
+    await asyncio.to_thread(shutdown_blocking_executor)
+
 
 app = FastAPI(
     title="GoNoGo Blog & RTM System",
@@ -73,13 +86,19 @@ async def home() -> dict[str, str]:
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str | dict]:
-    """Health check endpoint with database status."""
+def health_check() -> dict[str, str | dict]:
+    """Health check endpoint with database status.
+
+    Declared sync so FastAPI runs the blocking database probe in its
+    threadpool instead of on the event loop.
+    """
     db_health = check_database_health()
     return {
         "status": "healthy",
         "service": "gonogo-blog-rtm",
         "database": db_health,
+        "database_pool": get_pool_stats(),
+        "metrics_refresh": get_refresh_stats(),
     }
 
 
@@ -11,20 +11,29 @@ Architecture Decision: ADR-003 - Hybrid GitHub + Database RTM Architecture
 
 from .base import Base, TraceabilityBase
 from .capability import Capability, CapabilityDependency
+from .data_generation import DataGeneration
 from .defect import Defect
 from .epic import Epic
 from .epic_dependency import EpicDependency
-from .epic_metric_history import EpicMetricHistory
+from .epic_metric_dirty import EpicMetricDirty
+from .epic_metric_history import EpicMetricHistory, EpicMetricValue
+from .epic_persona_metrics import EpicPersonaMetrics
 from .github_sync import GitHubSync
 from .test import Test
 from .user_story import UserStory
 
+# Registers the flush hook that marks epic metrics dirty on related changes
+from . import metric_change_tracking  # noqa: E402,F401
+
 # Export all models for database migrations and imports
 __all__ = [
     "TraceabilityBase",
     "Base",
     "Epic",
     "EpicMetricHistory",
+    "EpicMetricValue",
+    "EpicMetricDirty",
+    "EpicPersonaMetrics",
     "EpicDependency",
     "UserStory",
     "Defect",
@@ -32,4 +41,5 @@ __all__ = [
     "GitHubSync",
     "Capability",
     "CapabilityDependency",
+    "DataGeneration",
 ]
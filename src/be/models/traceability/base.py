@@ -8,13 +8,35 @@ Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 Architecture Decision: ADR-003 - Hybrid GitHub + Database RTM Architecture
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from typing import Any, Dict
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, inspect
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
 
+def insert_values(instance) -> Dict[str, Any]:
+    """Column values set by an ORM constructor, as a bulk INSERT row.
+
+    Unset columns that have a default are left out so the default applies,
+    which keeps every row of one model on the same set of keys.
+    """
+    values = {}
+    for attr in inspect(type(instance)).column_attrs:
+        value = getattr(instance, attr.key)
+        column = attr.columns[0]
+        if value is None and (
+            column.primary_key
+            or column.default is not None
+            or column.server_default is not None
+        ):
+            continue
+        values[attr.key] = value
+    return values
+
+
 class TraceabilityBase(Base):
     """Base class for all traceability entities with common audit fields."""
 
@@ -0,0 +1,119 @@
+"""
+Data Generations
+
+Persistent counters that advance in the same transaction as every committed
+change to a scope of data. Caches shared by several worker processes key
+their entries on the generation read from the database, so a change
+committed by any process is seen by all of them, and a restart never brings
+an old generation back.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import logging
+import weakref
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, inspect, select
+from sqlalchemy.orm import Session
+
+from .base import Base
+
+logger = logging.getLogger(__name__)
+
+# Engines known to have the generations table, and engines already warned
+# about missing it (databases created before the table was introduced)
+_engines_with_table = weakref.WeakSet()
+_engines_warned = weakref.WeakSet()
+
+
+class DataGeneration(Base):
+    """Change counter of one scope of data."""
+
+    __tablename__ = "data_generations"
+
+    scope = Column(String(50), primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    def to_dict(self):
+        return {
+            "scope": self.scope,
+            "generation": self.generation,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def _has_generation_table(connection) -> bool:
+    """Return True if the bound database has the generations table."""
+    engine = connection.engine
+    if engine in _engines_with_table:
+        return True
+    if inspect(connection).has_table(DataGeneration.__tablename__):
+        _engines_with_table.add(engine)
+        return True
+    if engine not in _engines_warned:
+        _engines_warned.add(engine)
+        logger.warning(
+            "Table %s is missing; caches fall back to table fingerprints " "until migrations are applied",
+            DataGeneration.__tablename__,
+        )
+    return False
+
+
+def advance_data_generation(connection, scope: str) -> bool:
+    """Advance the generation of ``scope`` in the current transaction.
+
+    Args:
+        connection: Connection (or Session) of the transaction making changes
+        scope: Name of the data scope that changed
+
+    Returns:
+        False if the database has no generations table yet
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+    if not _has_generation_table(connection):
+        return False
+
+    table = DataGeneration.__table__
+    now = datetime.now()
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        connection.execute(
+            insert(table)
+            .values(scope=scope, generation=1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[table.c.scope],
+                set_={"generation": table.c.generation + 1, "updated_at": now},
+            )
+        )
+    else:
+        result = connection.execute(
+            table.update().where(table.c.scope == scope).values(generation=table.c.generation + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(scope=scope, generation=1, updated_at=now))
+    return True
+
+
+def get_data_generation(connection, scope: str) -> Optional[int]:
+    """Return the committed generation of ``scope``.
+
+    Returns 0 for a scope that never changed and None if the database has
+    no generations table yet.
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+    if not _has_generation_table(connection):
+        return None
+
+    table = DataGeneration.__table__
+    generation = connection.execute(select(table.c.generation).where(table.c.scope == scope)).scalar()
+    return generation or 0
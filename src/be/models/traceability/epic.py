@@ -22,13 +22,20 @@ from sqlalchemy import (
     String,
     Text,
     ForeignKey,
+    func,
+    inspect,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 
 from .base import TraceabilityBase
-from .epic_metric_history import EpicMetricHistory
+from .epic_metric_dirty import METRIC_FAMILIES, get_dirty_metric_families
+from .epic_metric_history import (
+    load_metric_history,
+    load_metric_trend,
+    record_metric_snapshot,
+)
 
 
 class Epic(TraceabilityBase):
@@ -152,6 +159,18 @@ class Epic(TraceabilityBase):
         order_by="EpicMetricHistory.captured_at.desc()",
     )
 
+    metric_dirty_marks = relationship(
+        "EpicMetricDirty",
+        back_populates="epic",
+        cascade="all, delete-orphan",
+    )
+
+    persona_metrics = relationship(
+        "EpicPersonaMetrics",
+        back_populates="epic",
+        cascade="all, delete-orphan",
+    )
+
     # Dependencies - Epic dependency relationships (US-00070)
     dependencies_as_parent = relationship(
         "EpicDependency",
@@ -394,14 +413,31 @@ class Epic(TraceabilityBase):
 
     # Advanced Metrics Methods (US-00071) - Multi-persona dashboard calculations
 
-    def is_metrics_cache_stale(self, max_age_minutes: int = 15) -> bool:
-        """Return True if the cached metrics are older than allowed."""
+    def is_metrics_cache_stale(
+        self, max_age_minutes: Optional[int] = None, session=None
+    ) -> bool:
+        """Return True if the cached metrics need recalculation.
+
+        The cache is stale when it was never filled, when a related change
+        marked one of its metric families dirty (checked when ``session`` is
+        given) or, if ``max_age_minutes`` is set, when it is older than that.
+        """
         if not self.metrics_cache_updated_at:
             return True
+        if session is not None and self.get_dirty_metric_families(session):
+            return True
+        if max_age_minutes is None:
+            return False
         return datetime.now() - self.metrics_cache_updated_at > timedelta(
             minutes=max_age_minutes
         )
 
+    def get_dirty_metric_families(self, session) -> set:
+        """Return the metric families marked dirty by related changes."""
+        if self.id is None:
+            return set()
+        return get_dirty_metric_families(session, [self.id]).get(self.id, set())
+
     def cache_metrics(
         self, metrics: Dict, session=None, record_history: bool = True
     ) -> None:
@@ -411,21 +447,24 @@ class Epic(TraceabilityBase):
         self.metrics_cache_updated_at = datetime.now()
 
         if record_history and session is not None and self.id is not None:
-            history_entry = EpicMetricHistory(
-                epic_id=self.id,
-                metrics=metrics_json,
-                captured_at=self.metrics_cache_updated_at,
+            # Stores only the values that changed since the last snapshot
+            record_metric_snapshot(
+                session, self.id, metrics, captured_at=self.metrics_cache_updated_at
             )
-            session.add(history_entry)
 
     def get_cached_metrics(
         self,
         session=None,
         refresh: bool = False,
         record_history: bool = False,
-        max_age_minutes: int = 15,
+        max_age_minutes: Optional[int] = None,
     ) -> Dict:
-        """Return cached metrics, refreshing if the cache is stale."""
+        """Return cached metrics, recalculating them only when needed.
+
+        Related changes mark metric families dirty and the background
+        refresher recalculates them, so a filled cache is served as is unless
+        ``refresh`` is set or it is older than ``max_age_minutes``.
+        """
         if (
             refresh
             or not self.metrics_cache
@@ -442,14 +481,48 @@ class Epic(TraceabilityBase):
 
     def calculate_all_metrics(self) -> Dict:
         """Calculate all advanced metrics for dashboard views."""
+        return self.calculate_metric_families(METRIC_FAMILIES)
+
+    def calculate_metric_families(self, families) -> Dict:
+        """Calculate only the given metric families (see METRIC_FAMILIES)."""
+        calculators = {
+            "timeline_metrics": self.calculate_timeline_metrics,
+            "velocity_metrics": self.calculate_velocity_metrics,
+            "quality_metrics": self.calculate_quality_metrics,
+            "business_metrics": self.calculate_business_metrics,
+            "predictive_metrics": self.calculate_predictive_metrics,
+        }
         return {
-            "timeline_metrics": self.calculate_timeline_metrics(),
-            "velocity_metrics": self.calculate_velocity_metrics(),
-            "quality_metrics": self.calculate_quality_metrics(),
-            "business_metrics": self.calculate_business_metrics(),
-            "predictive_metrics": self.calculate_predictive_metrics(),
+            family: calculators[family]()
+            for family in METRIC_FAMILIES
+            if family in families
         }
 
+    def get_defect_count(self) -> int:
+        """Return the number of defects, counting in SQL if not yet loaded."""
+        from .defect import Defect
+
+        return self._count_children("defects", Defect)
+
+    def get_test_count(self) -> int:
+        """Return the number of tests, counting in SQL if not yet loaded."""
+        from .test import Test
+
+        return self._count_children("tests", Test)
+
+    def _count_children(self, attribute: str, model) -> int:
+        state = inspect(self)
+        if state.session is None or attribute not in state.unloaded:
+            children = getattr(self, attribute)
+            return len(children) if children else 0
+
+        return (
+            state.session.query(func.count(model.id))
+            .filter(model.epic_id == self.id)
+            .scalar()
+            or 0
+        )
+
     def calculate_timeline_metrics(self) -> Dict:
         """Calculate timeline and planning metrics."""
         metrics = {}
@@ -536,7 +609,7 @@ class Epic(TraceabilityBase):
         metrics["technical_debt_hours"] = self.technical_debt_hours
 
         # Quality assessment
-        defect_count = len(self.defects) if self.defects else 0
+        defect_count = self.get_defect_count()
         if self.completed_story_points > 0:
             metrics["actual_defect_density"] = (
                 defect_count / self.completed_story_points
@@ -668,8 +741,13 @@ class Epic(TraceabilityBase):
         force_recalculate: bool = False,
         session=None,
         record_history: bool = False,
+        families=None,
     ) -> Dict:
-        """Update all metrics and return calculated values."""
+        """Update metrics and return the calculated values.
+
+        When ``families`` is given and a cache exists, only those metric
+        families are recalculated and merged into the cached snapshot.
+        """
         now = datetime.now()
 
         # Check if update is needed
@@ -685,30 +763,36 @@ class Epic(TraceabilityBase):
             ):
                 return self.calculate_all_metrics()
 
+        cached = self.get_cached_metrics_only() if families else None
+        families = set(families) if cached else set(METRIC_FAMILIES)
+
         # Update calculated fields
-        self.scope_creep_percentage = (
-            (
-                (self.total_story_points - self.initial_scope_estimate)
-                / self.initial_scope_estimate
-                * 100
+        if families & {"velocity_metrics", "predictive_metrics"}:
+            self.scope_creep_percentage = (
+                (
+                    (self.total_story_points - self.initial_scope_estimate)
+                    / self.initial_scope_estimate
+                    * 100
+                )
+                if self.initial_scope_estimate > 0
+                else 0
             )
-            if self.initial_scope_estimate > 0
-            else 0
-        )
 
         # Calculate defect density
-        defect_count = len(self.defects) if self.defects else 0
-        self.defect_density = (
-            defect_count / self.completed_story_points
-            if self.completed_story_points > 0
-            else 0
-        )
+        if families & {"quality_metrics", "predictive_metrics"}:
+            defect_count = self.get_defect_count()
+            self.defect_density = (
+                defect_count / self.completed_story_points
+                if self.completed_story_points > 0
+                else 0
+            )
 
         # Update last calculation time
         self.last_metrics_update = now
 
         # Calculate and cache the metrics
-        metrics = self.calculate_all_metrics()
+        metrics = dict(cached or {})
+        metrics.update(self.calculate_metric_families(families))
         self.cache_metrics(metrics, session=session, record_history=record_history)
 
         return metrics
@@ -721,7 +805,12 @@ class Epic(TraceabilityBase):
         all_metrics = self.get_cached_metrics(
             session=session, refresh=False, record_history=False
         )
+        return self.build_persona_metrics(persona, all_metrics, thresholds)
 
+    def build_persona_metrics(
+        self, persona: str, all_metrics: Dict, thresholds=None
+    ) -> Dict:
+        """Project already calculated metrics onto a dashboard persona."""
         timeline_metrics = all_metrics.get("timeline_metrics", {})
         velocity_metrics = all_metrics.get("velocity_metrics", {})
         business_metrics = all_metrics.get("business_metrics", {})
@@ -773,12 +862,12 @@ class Epic(TraceabilityBase):
             metrics = {
                 "quality": quality_metrics,
                 "defects": {
-                    "defect_count": len(self.defects) if self.defects else 0,
+                    "defect_count": self.get_defect_count(),
                     "defect_density": self.defect_density or 0,
                 },
                 "testing": {
                     "test_coverage": self.test_coverage_percentage or 0,
-                    "test_count": len(self.tests) if self.tests else 0,
+                    "test_count": self.get_test_count(),
                 },
                 "technical_debt": {
                     "debt_hours": self.technical_debt_hours or 0,
@@ -835,37 +924,58 @@ class Epic(TraceabilityBase):
         """Get historical metric snapshots for trend analysis."""
         if session is None or self.id is None:
             return []
-
-        history_entries = (
-            session.query(EpicMetricHistory)
-            .filter(EpicMetricHistory.epic_id == self.id)
-            .order_by(EpicMetricHistory.captured_at.desc())
-            .limit(limit)
-            .all()
-        )
-
-        result = []
-        for entry in history_entries:
-            try:
-                metrics_data = json.loads(entry.metrics)
-                result.append(
-                    {
-                        "captured_at": entry.captured_at.isoformat(),
-                        "metrics": metrics_data,
-                    }
-                )
-            except json.JSONDecodeError:
-                continue
-
-        return result
+        return load_metric_history(session, self.id, limit=limit)
+
+    def get_metric_trend(
+        self, metric_key: str, session=None, since: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get the change points of one metric, e.g.
+        ``"velocity_metrics.velocity_points_per_sprint"``.
+        """
+        if session is None or self.id is None:
+            return []
+        return load_metric_trend(session, self.id, metric_key, since=since)
 
     def clear_metrics_cache(self):
         """Clear the cached metrics and force recalculation on next access."""
         self.metrics_cache = None
         self.metrics_cache_updated_at = None
 
-    def to_dict(self):
-        """Convert to dictionary with Epic-specific fields."""
+    def get_relationship_fields(self) -> Dict:
+        """Fields of to_dict() that are derived from related rows.
+
+        Reading these lazy-loads children, dependencies and the capability;
+        list serializers compute them with aggregate queries instead (see
+        services.rtm_projections).
+        """
+        return {
+            "inherited_components": self.get_inherited_components(),
+            "test_count": len(self.tests) if self.tests else 0,
+            "user_story_count": len(self.user_stories) if self.user_stories else 0,
+            "defect_count": len(self.defects) if self.defects else 0,
+            "is_blocked": self.is_blocked(),
+            "can_start": self.can_start(),
+            "dependency_risk_score": self.get_dependency_risk_score(),
+            "blocking_dependencies_count": len(self.get_blocking_dependencies()),
+            "blocked_epics_count": len(self.get_blocked_epics()),
+            "capability_name": self.capability.name if self.capability else None,
+            "capability_capability_id": (
+                self.capability.capability_id if self.capability else None
+            ),
+            "capability_strategic_priority": (
+                self.capability.strategic_priority if self.capability else None
+            ),
+        }
+
+    def to_dict(self, related: Optional[Dict] = None):
+        """Convert to dictionary with Epic-specific fields.
+
+        Args:
+            related: Precomputed get_relationship_fields() values; when
+                omitted they are read through the relationships
+        """
+        if related is None:
+            related = self.get_relationship_fields()
         base_dict = super().to_dict()
         base_dict.update(
             {
@@ -881,19 +991,19 @@ class Epic(TraceabilityBase):
                 "gdpr_considerations": self.gdpr_considerations,
                 "component": self.component,
                 "component_label": self.get_component_label(),
-                "inherited_components": self.get_inherited_components(),
+                "inherited_components": related["inherited_components"],
                 "epic_label_name": self.epic_label_name,
                 "github_epic_label": self.github_epic_label,
                 "last_github_sync": self.last_github_sync,
-                "test_count": len(self.tests) if self.tests else 0,
-                "user_story_count": len(self.user_stories) if self.user_stories else 0,
-                "defect_count": len(self.defects) if self.defects else 0,
+                "test_count": related["test_count"],
+                "user_story_count": related["user_story_count"],
+                "defect_count": related["defect_count"],
                 # Dependency information (US-00070)
-                "is_blocked": self.is_blocked(),
-                "can_start": self.can_start(),
-                "dependency_risk_score": self.get_dependency_risk_score(),
-                "blocking_dependencies_count": len(self.get_blocking_dependencies()),
-                "blocked_epics_count": len(self.get_blocked_epics()),
+                "is_blocked": related["is_blocked"],
+                "can_start": related["can_start"],
+                "dependency_risk_score": related["dependency_risk_score"],
+                "blocking_dependencies_count": related["blocking_dependencies_count"],
+                "blocked_epics_count": related["blocked_epics_count"],
                 # Advanced metrics (US-00071) - Timeline metrics
                 "estimated_duration_days": self.estimated_duration_days,
                 "actual_duration_days": self.actual_duration_days,
@@ -937,13 +1047,11 @@ class Epic(TraceabilityBase):
                 "metrics_calculation_frequency": self.metrics_calculation_frequency,
                 # Program Areas/Capabilities (US-00062)
                 "capability_id": self.capability_id,
-                "capability_name": self.capability.name if self.capability else None,
-                "capability_capability_id": (
-                    self.capability.capability_id if self.capability else None
-                ),
-                "capability_strategic_priority": (
-                    self.capability.strategic_priority if self.capability else None
-                ),
+                "capability_name": related["capability_name"],
+                "capability_capability_id": related["capability_capability_id"],
+                "capability_strategic_priority": related[
+                    "capability_strategic_priority"
+                ],
             }
         )
         return base_dict
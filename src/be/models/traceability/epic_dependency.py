@@ -248,195 +248,58 @@ class EpicDependency(TraceabilityBase):
 
 
 class DependencyGraph:
-    """Utilitaire pour analyser le graphe de dépendances Epic."""
+    """Utilitaire pour analyser le graphe de dépendances Epic.
+
+    Façade sur le graphe partagé en mémoire
+    (``services.dependency_graph_service``), mis à jour de façon incrémentale
+    à chaque commit de dépendances.
+    """
 
     def __init__(self, session):
         self.session = session
 
+    def _graph(self, dependencies: List[EpicDependency] = None):
+        from ...services.dependency_graph_service import (
+            EpicDependencyGraph,
+            get_dependency_graph,
+        )
+
+        if dependencies is not None:
+            return EpicDependencyGraph.from_dependencies(dependencies)
+        return get_dependency_graph(self.session)
+
     def detect_cycles(
         self, dependencies: List[EpicDependency] = None
     ) -> List[List[int]]:
         """Détecte les cycles dans le graphe de dépendances."""
-        if dependencies is None:
-            dependencies = (
-                self.session.query(EpicDependency)
-                .filter(EpicDependency.is_active == True)
-                .all()
-            )
-
-        # Construire le graphe
-        graph = {}
-        for dep in dependencies:
-            if dep.parent_epic_id not in graph:
-                graph[dep.parent_epic_id] = []
-            graph[dep.parent_epic_id].append(dep.dependent_epic_id)
-
-        # Détection de cycles avec DFS
-        visited = set()
-        rec_stack = set()
-        cycles = []
+        return self._graph(dependencies).detect_cycles()
 
-        def dfs_cycle_detect(node, path):
-            if node in rec_stack:
-                # Cycle détecté - extraire le cycle
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return True
-
-            if node in visited:
-                return False
-
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if dfs_cycle_detect(neighbor, path):
-                    return True
-
-            rec_stack.remove(node)
-            path.pop()
-            return False
-
-        for node in graph:
-            if node not in visited:
-                dfs_cycle_detect(node, [])
-
-        return cycles
+    def find_cycle_with(self, parent_epic_id: int, dependent_epic_id: int) -> List[int]:
+        """Retourne le cycle que créerait la dépendance parent -> dépendant."""
+        return self._graph().cycle_if_added(parent_epic_id, dependent_epic_id)
 
     def calculate_critical_path(self, epic_ids: List[int] = None) -> Dict[str, any]:
         """Calcule le chemin critique pour les Epics donnés."""
         if epic_ids is None:
             from .epic import Epic
 
-            epics = self.session.query(Epic).all()
-            epic_ids = [e.id for e in epics]
+            epic_ids = [
+                epic_id for (epic_id,) in self.session.query(Epic.id).order_by(Epic.id)
+            ]
 
-        dependencies = (
-            self.session.query(EpicDependency)
-            .filter(
-                EpicDependency.is_active == True,
-                EpicDependency.dependency_type.in_(
-                    [DependencyType.BLOCKING.value, DependencyType.PREREQUISITE.value]
-                ),
-            )
-            .all()
-        )
-
-        # Construire le graphe avec poids
-        graph = {}
-        weights = {}
-
-        for dep in dependencies:
-            if dep.parent_epic_id not in graph:
-                graph[dep.parent_epic_id] = []
-            graph[dep.parent_epic_id].append(dep.dependent_epic_id)
-
-            # Poids basé sur impact estimé ou criticité
-            weight = dep.estimated_impact_days or dep.get_criticality_score()
-            weights[(dep.parent_epic_id, dep.dependent_epic_id)] = weight
-
-        # Algorithme de chemin critique (adaptation topologique)
-        in_degree = {epic_id: 0 for epic_id in epic_ids}
-        for parent in graph:
-            for dependent in graph[parent]:
-                if dependent in in_degree:
-                    in_degree[dependent] += 1
-
-        # Distance la plus longue (chemin critique)
-        distances = {epic_id: 0 for epic_id in epic_ids}
-        queue = [epic_id for epic_id in epic_ids if in_degree[epic_id] == 0]
-
-        critical_path = []
-        max_distance = 0
-        critical_end = None
-
-        while queue:
-            current = queue.pop(0)
-
-            for neighbor in graph.get(current, []):
-                if neighbor in distances:
-                    weight = weights.get((current, neighbor), 1)
-                    new_distance = distances[current] + weight
-
-                    if new_distance > distances[neighbor]:
-                        distances[neighbor] = new_distance
-
-                        if new_distance > max_distance:
-                            max_distance = new_distance
-                            critical_end = neighbor
-
-                    in_degree[neighbor] -= 1
-                    if in_degree[neighbor] == 0:
-                        queue.append(neighbor)
-
-        # Reconstruire le chemin critique
-        if critical_end:
-            path = [critical_end]
-            current = critical_end
-
-            while distances[current] > 0:
-                for parent in graph:
-                    if current in graph.get(parent, []):
-                        parent_distance = distances[parent]
-                        edge_weight = weights.get((parent, current), 1)
-
-                        if parent_distance + edge_weight == distances[current]:
-                            path.append(parent)
-                            current = parent
-                            break
-
-            critical_path = list(reversed(path))
-
-        return {
-            "critical_path": critical_path,
-            "total_duration": max_distance,
-            "distances": distances,
-            "bottlenecks": [
-                epic_id for epic_id, dist in distances.items() if dist == max_distance
-            ],
-        }
+        return self._graph().critical_path(epic_ids)
 
     def get_dependency_impact(self, epic_id: int) -> Dict[str, any]:
         """Analyse l'impact des dépendances pour un Epic donné."""
-        # Dépendances où l'Epic est parent (bloque d'autres)
-        blocking = (
-            self.session.query(EpicDependency)
-            .filter(
-                EpicDependency.parent_epic_id == epic_id,
-                EpicDependency.is_active == True,
-            )
-            .all()
-        )
+        analysis = self._graph().impact(epic_id)
 
-        # Dépendances où l'Epic est dépendant (bloqué par d'autres)
-        blocked_by = (
+        critical_ids = analysis.pop("critical_dependency_ids")
+        critical = (
             self.session.query(EpicDependency)
-            .filter(
-                EpicDependency.dependent_epic_id == epic_id,
-                EpicDependency.is_active == True,
-            )
+            .filter(EpicDependency.id.in_(critical_ids))
             .all()
+            if critical_ids
+            else []
         )
-
-        return {
-            "epic_id": epic_id,
-            "blocks_count": len(blocking),
-            "blocked_by_count": len(blocked_by),
-            "blocking_epics": [
-                dep.dependent_epic_id for dep in blocking if dep.is_blocking()
-            ],
-            "blocked_by_epics": [
-                dep.parent_epic_id for dep in blocked_by if dep.is_blocking()
-            ],
-            "critical_dependencies": [
-                dep.to_dict()
-                for dep in blocked_by
-                if dep.priority in ["critical", "high"] and not dep.is_resolved
-            ],
-            "risk_score": (
-                len([dep for dep in blocked_by if dep.is_blocking()]) * 2
-                + len([dep for dep in blocked_by if dep.priority == "critical"])
-            ),
-        }
+        analysis["critical_dependencies"] = [dep.to_dict() for dep in critical]
+        return analysis
@@ -0,0 +1,172 @@
+"""
+Epic Metric Dirty Marks
+
+Records which metric families of an Epic are out of date because related
+traceability data (user stories, tests, defects, dependencies or the epic
+itself) changed since the metrics cache was last filled. The background
+refresher recalculates only the marked epics and families and then clears
+the marks, so idle epics are never recomputed.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+import logging
+import weakref
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, inspect
+from sqlalchemy.orm import Session, relationship
+
+from .base import Base
+
+logger = logging.getLogger(__name__)
+
+# Metric families cached in Epic.metrics_cache, keyed as in calculate_all_metrics
+METRIC_FAMILIES = (
+    "timeline_metrics",
+    "velocity_metrics",
+    "quality_metrics",
+    "business_metrics",
+    "predictive_metrics",
+)
+
+# Engines known to have the dirty table, and engines already warned about
+# missing it (databases created before the table was introduced)
+_engines_with_table = weakref.WeakSet()
+_engines_warned = weakref.WeakSet()
+
+
+class EpicMetricDirty(Base):
+    """Pending recalculation of one metric family of an Epic."""
+
+    __tablename__ = "epic_metric_dirty"
+
+    epic_id = Column(
+        Integer,
+        ForeignKey("epics.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric_family = Column(String(30), primary_key=True)
+    marked_at = Column(DateTime, nullable=False, default=datetime.now, index=True)
+
+    epic = relationship("Epic", back_populates="metric_dirty_marks")
+
+    def to_dict(self):
+        return {
+            "epic_id": self.epic_id,
+            "metric_family": self.metric_family,
+            "marked_at": self.marked_at.isoformat() if self.marked_at else None,
+        }
+
+
+def _has_dirty_table(connection) -> bool:
+    """Return True if the bound database has the dirty-marks table."""
+    engine = connection.engine
+    if engine in _engines_with_table:
+        return True
+    if inspect(connection).has_table(EpicMetricDirty.__tablename__):
+        _engines_with_table.add(engine)
+        return True
+    if engine not in _engines_warned:
+        _engines_warned.add(engine)
+        logger.warning(
+            "Table %s is missing; related changes are not tracked and epic "
+            "metrics are only recalculated by the periodic full refresh pass "
+            "until migrations are applied",
+            EpicMetricDirty.__tablename__,
+        )
+    return False
+
+
+def mark_epic_metrics_dirty(connection, dirty: Dict[int, Iterable[str]], marked_at: Optional[datetime] = None) -> int:
+    """Mark metric families of epics as needing recalculation.
+
+    Args:
+        connection: Connection (or Session) of the current transaction
+        dirty: Mapping of ``Epic.id`` to the metric families to mark
+        marked_at: Mark timestamp, defaults to now
+
+    Returns:
+        Number of (epic, family) marks written
+    """
+    if isinstance(connection, Session):
+        connection = connection.connection()
+
+    marked_at = marked_at or datetime.now()
+    rows = [
+        {"epic_id": epic_id, "metric_family": family, "marked_at": marked_at}
+        for epic_id, families in dirty.items()
+        if epic_id is not None
+        for family in sorted(set(families))
+    ]
+    if not rows or not _has_dirty_table(connection):
+        return 0
+
+    table = EpicMetricDirty.__table__
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(table)
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.epic_id, table.c.metric_family],
+                set_={"marked_at": statement.excluded.marked_at},
+            ),
+            rows,
+        )
+    else:
+        epic_ids = {row["epic_id"] for row in rows}
+        connection.execute(
+            table.delete().where(
+                table.c.epic_id.in_(epic_ids),
+                table.c.metric_family.in_({row["metric_family"] for row in rows}),
+            )
+        )
+        connection.execute(table.insert(), rows)
+    return len(rows)
+
+
+def get_dirty_metric_families(session, epic_ids: Optional[Iterable[int]] = None) -> Dict[int, Set[str]]:
+    """Return pending dirty families grouped by ``Epic.id``.
+
+    Args:
+        session: Database session
+        epic_ids: Restrict the lookup to these epics (all epics if None)
+    """
+    if not _has_dirty_table(session.connection()):
+        return {}
+
+    query = session.query(EpicMetricDirty.epic_id, EpicMetricDirty.metric_family)
+    if epic_ids is not None:
+        epic_ids = list(epic_ids)
+        if not epic_ids:
+            return {}
+        query = query.filter(EpicMetricDirty.epic_id.in_(epic_ids))
+
+    dirty: Dict[int, Set[str]] = {}
+    for epic_id, family in query.all():
+        dirty.setdefault(epic_id, set()).add(family)
+    return dirty
+
+
+def clear_epic_metrics_dirty(session, epic_ids: List[int], marked_before: datetime) -> int:
+    """Remove dirty marks of ``epic_ids`` recorded up to ``marked_before``.
+
+    Marks written after ``marked_before`` (changes that happened while the
+    metrics were being recalculated) are kept for the next refresh.
+    """
+    if not epic_ids or not _has_dirty_table(session.connection()):
+        return 0
+    return (
+        session.query(EpicMetricDirty)
+        .filter(
+            EpicMetricDirty.epic_id.in_(epic_ids),
+            EpicMetricDirty.marked_at <= marked_before,
+        )
+        .delete(synchronize_session=False)
+    )
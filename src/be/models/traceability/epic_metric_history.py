@@ -4,18 +4,49 @@ Epic Metric History Model
 Stores historical metric snapshots for an Epic so dashboards can display
 trends without recalculating data each time.
 
+Snapshots are delta encoded: each capture stores one typed row per metric
+value that changed since the previous capture (``EpicMetricValue``), and only
+every ``KEYFRAME_INTERVAL``-th capture stores the full set of values. Captures
+that change nothing are not written at all. Old captures are downsampled to
+one point per bucket by ``downsample_metric_history``. Rows written before
+delta encoding keep their full JSON snapshot in ``metrics`` and are read as
+keyframes.
+
 Related Issue: US-00071 - Extend Epic model for metrics
 Parent Epic: EP-00010 - Multi-persona traceability dashboard
 """
 
+import json
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
+# A full snapshot is stored every KEYFRAME_INTERVAL captures so that
+# reconstructing a snapshot never folds more than this many deltas.
+KEYFRAME_INTERVAL = 20
+
+# Maximum number of ids bound into one IN (...) clause
+_IN_CHUNK_SIZE = 500
+
+# Encoded metric value: (value_type, value_num, value_text)
+EncodedValue = Tuple[str, Optional[float], Optional[str]]
+_DELETED: EncodedValue = ("deleted", None, None)
+
 
 class EpicMetricHistory(Base):
     """Historical snapshot of Epic metrics."""
@@ -30,25 +61,356 @@ class EpicMetricHistory(Base):
         index=True,
     )
     captured_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    metrics = Column(Text, nullable=False)
+    # Full JSON snapshot of captures recorded before delta encoding
+    metrics = Column(Text, nullable=True)
+    is_keyframe = Column(Boolean, nullable=False, default=False)
 
     epic = relationship("Epic", back_populates="metric_history")
+    values = relationship(
+        "EpicMetricValue",
+        back_populates="history",
+        cascade="all, delete-orphan",
+    )
 
     def __init__(
         self,
         epic_id: int,
-        metrics: str,
+        metrics: Optional[str] = None,
         captured_at: Optional[datetime] = None,
+        is_keyframe: bool = False,
         **kwargs,
     ):
         self.epic_id = epic_id
         self.metrics = metrics
         self.captured_at = captured_at or datetime.utcnow()
+        self.is_keyframe = is_keyframe
+
+    @property
+    def is_full_snapshot(self) -> bool:
+        """Return True if this capture holds every metric value."""
+        return bool(self.is_keyframe or self.metrics)
 
     def to_dict(self):
         return {
             "id": self.id,
             "epic_id": self.epic_id,
             "captured_at": (self.captured_at.isoformat() if self.captured_at else None),
+            "is_keyframe": self.is_full_snapshot,
             "metrics": self.metrics,
         }
+
+
+class EpicMetricValue(Base):
+    """One changed metric value of an EpicMetricHistory capture."""
+
+    __tablename__ = "epic_metric_values"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    history_id = Column(
+        Integer,
+        ForeignKey("epic_metric_history.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    epic_id = Column(Integer, nullable=False)
+    metric_key = Column(String(120), nullable=False)
+    # int, float, bool, null, json or deleted
+    value_type = Column(String(8), nullable=False)
+    value_num = Column(Float, nullable=True)
+    value_text = Column(Text, nullable=True)
+
+    history = relationship("EpicMetricHistory", back_populates="values")
+
+    __table_args__ = (Index("idx_epic_metric_values_trend", "epic_id", "metric_key", "history_id"),)
+
+    @property
+    def encoded(self) -> EncodedValue:
+        return (self.value_type, self.value_num, self.value_text)
+
+
+def flatten_metrics(metrics: Dict, prefix: str = "") -> Dict[str, object]:
+    """Flatten nested metric dicts into ``{"family.metric": value}``."""
+    flat = {}
+    for key, value in metrics.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten_metrics(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten_metrics(flat: Dict[str, object]) -> Dict:
+    """Rebuild nested metric dicts from flattened keys."""
+    metrics: Dict = {}
+    for path, value in flat.items():
+        node = metrics
+        *parents, leaf = path.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return metrics
+
+
+def encode_metric_value(value) -> EncodedValue:
+    """Encode a metric value into typed columns."""
+    if isinstance(value, bool):
+        return ("bool", float(value), None)
+    if isinstance(value, int):
+        return ("int", float(value), None)
+    if isinstance(value, float):
+        return ("float", value, None)
+    if value is None:
+        return ("null", None, None)
+    return ("json", None, json.dumps(value))
+
+
+def decode_metric_value(encoded: EncodedValue):
+    """Decode typed columns back into the original metric value."""
+    value_type, value_num, value_text = encoded
+    if value_type == "bool":
+        return bool(value_num)
+    if value_type == "int":
+        return int(value_num)
+    if value_type == "float":
+        return value_num
+    if value_type == "json":
+        return json.loads(value_text)
+    return None
+
+
+def _encode_snapshot(metrics: Dict) -> Dict[str, EncodedValue]:
+    return {key: encode_metric_value(value) for key, value in flatten_metrics(metrics).items()}
+
+
+def _decode_snapshot(state: Dict[str, EncodedValue]) -> Dict:
+    return unflatten_metrics({key: decode_metric_value(encoded) for key, encoded in state.items()})
+
+
+def _apply(state: Dict[str, EncodedValue], entry, values) -> None:
+    """Fold one capture (full snapshot or delta) into ``state`` in place."""
+    if entry.metrics:
+        state.clear()
+        try:
+            state.update(_encode_snapshot(json.loads(entry.metrics)))
+        except json.JSONDecodeError:
+            pass
+        return
+    if entry.is_keyframe:
+        state.clear()
+    for value in values:
+        if value.value_type == _DELETED[0]:
+            state.pop(value.metric_key, None)
+        else:
+            state[value.metric_key] = value.encoded
+
+
+def _values_by_history(session, history_ids: List[int]) -> Dict[int, list]:
+    grouped = defaultdict(list)
+    for start in range(0, len(history_ids), _IN_CHUNK_SIZE):
+        chunk = history_ids[start : start + _IN_CHUNK_SIZE]
+        for value in (
+            session.query(EpicMetricValue)
+            .filter(EpicMetricValue.history_id.in_(chunk))
+            .order_by(EpicMetricValue.id)
+            .all()
+        ):
+            grouped[value.history_id].append(value)
+    return grouped
+
+
+def _entries_from_keyframe(session, epic_id: int, up_to_id: Optional[int] = None):
+    """Return captures of ``epic_id`` from the keyframe preceding ``up_to_id``."""
+    keyframe_query = session.query(EpicMetricHistory.id).filter(
+        EpicMetricHistory.epic_id == epic_id,
+        (EpicMetricHistory.is_keyframe.is_(True)) | (EpicMetricHistory.metrics.isnot(None)),
+    )
+    if up_to_id is not None:
+        keyframe_query = keyframe_query.filter(EpicMetricHistory.id <= up_to_id)
+    keyframe = keyframe_query.order_by(EpicMetricHistory.id.desc()).first()
+
+    query = session.query(EpicMetricHistory).filter(EpicMetricHistory.epic_id == epic_id)
+    if keyframe is not None:
+        query = query.filter(EpicMetricHistory.id >= keyframe[0])
+    return query.order_by(EpicMetricHistory.id).all()
+
+
+def record_metric_snapshot(
+    session, epic_id: int, metrics: Dict, captured_at: Optional[datetime] = None
+) -> Optional[EpicMetricHistory]:
+    """Record ``metrics`` as a delta against the latest stored snapshot.
+
+    Returns the new capture, or None when no metric value changed.
+    """
+    session.flush()
+    entries = _entries_from_keyframe(session, epic_id)
+    values = _values_by_history(session, [entry.id for entry in entries])
+    previous: Dict[str, EncodedValue] = {}
+    for entry in entries:
+        _apply(previous, entry, values.get(entry.id, ()))
+
+    current = _encode_snapshot(metrics)
+    is_keyframe = not entries or len(entries) >= KEYFRAME_INTERVAL
+    if is_keyframe:
+        changes = current
+    else:
+        changes = {key: encoded for key, encoded in current.items() if previous.get(key) != encoded}
+        changes.update({key: _DELETED for key in previous.keys() - current.keys()})
+        if not changes:
+            return None
+
+    entry = EpicMetricHistory(
+        epic_id=epic_id,
+        captured_at=captured_at,
+        is_keyframe=is_keyframe,
+    )
+    entry.values = [
+        EpicMetricValue(
+            epic_id=epic_id,
+            metric_key=key,
+            value_type=encoded[0],
+            value_num=encoded[1],
+            value_text=encoded[2],
+        )
+        for key, encoded in sorted(changes.items())
+    ]
+    session.add(entry)
+    return entry
+
+
+def load_metric_history(session, epic_id: int, limit: int = 10) -> List[Dict]:
+    """Return the ``limit`` most recent snapshots of an epic, newest first."""
+    latest = (
+        session.query(EpicMetricHistory.id)
+        .filter(EpicMetricHistory.epic_id == epic_id)
+        .order_by(EpicMetricHistory.id.desc())
+        .limit(limit)
+        .all()
+    )
+    if not latest:
+        return []
+
+    wanted = {row[0] for row in latest}
+    entries = _entries_from_keyframe(session, epic_id, up_to_id=min(wanted))
+    values = _values_by_history(session, [entry.id for entry in entries])
+
+    state: Dict[str, EncodedValue] = {}
+    snapshots = []
+    for entry in entries:
+        _apply(state, entry, values.get(entry.id, ()))
+        if entry.id in wanted:
+            snapshots.append(
+                {
+                    "captured_at": entry.captured_at.isoformat(),
+                    "metrics": _decode_snapshot(state),
+                }
+            )
+    snapshots.reverse()
+    return snapshots
+
+
+def load_metric_trend(
+    session,
+    epic_id: int,
+    metric_key: str,
+    since: Optional[datetime] = None,
+) -> List[Dict]:
+    """Return the change points of one metric, oldest first.
+
+    ``metric_key`` uses the flattened ``family.metric`` form, for example
+    ``"velocity_metrics.velocity_points_per_sprint"``. Reads only the typed
+    value rows of that metric; captures stored as legacy JSON snapshots are
+    not included.
+    """
+    query = (
+        session.query(EpicMetricHistory.captured_at, EpicMetricValue)
+        .join(EpicMetricValue, EpicMetricValue.history_id == EpicMetricHistory.id)
+        .filter(
+            EpicMetricValue.epic_id == epic_id,
+            EpicMetricValue.metric_key == metric_key,
+        )
+    )
+    if since is not None:
+        query = query.filter(EpicMetricHistory.captured_at >= since)
+
+    trend = []
+    for captured_at, value in query.order_by(EpicMetricValue.history_id).all():
+        trend.append(
+            {
+                "captured_at": captured_at.isoformat(),
+                "value": decode_metric_value(value.encoded),
+                "deleted": value.value_type == _DELETED[0],
+            }
+        )
+    return trend
+
+
+def downsample_metric_history(session, older_than: datetime, bucket_seconds: int = 86400) -> int:
+    """Keep one capture per epic and time bucket for captures before a cutoff.
+
+    The captures of a bucket are merged into its last capture, so every
+    snapshot after the bucket reconstructs exactly as before. Returns the
+    number of captures removed.
+    """
+    entries = (
+        session.query(EpicMetricHistory)
+        .filter(EpicMetricHistory.captured_at < older_than)
+        .order_by(EpicMetricHistory.epic_id, EpicMetricHistory.id)
+        .all()
+    )
+
+    buckets = defaultdict(list)
+    for entry in entries:
+        bucket = int(entry.captured_at.timestamp()) // bucket_seconds
+        buckets[(entry.epic_id, bucket)].append(entry)
+
+    groups = [group for group in buckets.values() if len(group) > 1]
+    if not groups:
+        return 0
+
+    values = _values_by_history(session, [entry.id for group in groups for entry in group])
+
+    removed = 0
+    for group in groups:
+        merged: Dict[str, EncodedValue] = {}
+        is_keyframe = False
+        for entry in group:
+            if entry.is_full_snapshot:
+                merged.clear()
+                is_keyframe = True
+            if entry.metrics:
+                _apply(merged, entry, ())
+            else:
+                for value in values.get(entry.id, ()):
+                    merged[value.metric_key] = value.encoded
+
+        keep, dropped = group[-1], group[:-1]
+        for entry in group:
+            for value in values.get(entry.id, ()):
+                session.expunge(value)
+        session.query(EpicMetricValue).filter(EpicMetricValue.history_id.in_([entry.id for entry in group])).delete(
+            synchronize_session=False
+        )
+        for entry in dropped:
+            session.expunge(entry)
+        session.query(EpicMetricHistory).filter(EpicMetricHistory.id.in_([entry.id for entry in dropped])).delete(
+            synchronize_session=False
+        )
+        removed += len(dropped)
+
+        keep.metrics = None
+        keep.is_keyframe = is_keyframe
+        session.add_all(
+            EpicMetricValue(
+                history_id=keep.id,
+                epic_id=keep.epic_id,
+                metric_key=key,
+                value_type=encoded[0],
+                value_num=encoded[1],
+                value_text=encoded[2],
+            )
+            for key, encoded in sorted(merged.items())
+            if not (is_keyframe and encoded == _DELETED)
+        )
+
+    return removed
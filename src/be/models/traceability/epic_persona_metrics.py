@@ -0,0 +1,81 @@
+"""
+Epic Persona Metrics Model
+
+Materialized PM / PO / QA projections of an Epic's cached metrics, including
+threshold status, so the multi-persona dashboard can be served from a single
+query. The JSON payload is the exact ``metrics`` object returned by the
+dashboard API; the numeric inputs of the dashboard summary are also stored
+in typed columns so summaries need no JSON parsing.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from .base import Base
+
+# Personas with a dedicated projection in Epic.build_persona_metrics
+PERSONAS = ("pm", "po", "qa")
+
+# Typed summary columns per persona: column -> (projection section, metric)
+PERSONA_SUMMARY_FIELDS = {
+    "pm": {
+        "risk_score": ("risk", "overall_risk_score"),
+        "success_probability": ("risk", "success_probability"),
+        "velocity": ("velocity", "velocity_points_per_sprint"),
+        "velocity_per_member": ("team_productivity", "velocity_per_team_member"),
+        "schedule_variance_days": ("timeline", "schedule_variance_days"),
+    },
+    "po": {
+        "satisfaction_score": ("stakeholder", "satisfaction_score"),
+        "scope_creep_percentage": ("scope", "scope_creep_percentage"),
+        "roi_percentage": ("business_value", "roi_percentage"),
+        "adoption_rate": ("adoption", "user_adoption_rate"),
+    },
+    "qa": {
+        "test_coverage": ("testing", "test_coverage"),
+        "defect_density": ("defects", "defect_density"),
+        "technical_debt_hours": ("technical_debt", "debt_hours"),
+    },
+}
+
+
+class EpicPersonaMetrics(Base):
+    """Dashboard projection of one Epic for one persona."""
+
+    __tablename__ = "epic_persona_metrics"
+
+    epic_id = Column(
+        Integer,
+        ForeignKey("epics.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    persona = Column(String(8), primary_key=True)
+    payload = Column(Text, nullable=False)
+    # Epic.metrics_cache_updated_at the projection was built from
+    metrics_cached_at = Column(DateTime, nullable=True)
+    materialized_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    # PM summary inputs
+    risk_score = Column(Float, nullable=True)
+    success_probability = Column(Float, nullable=True)
+    velocity = Column(Float, nullable=True)
+    velocity_per_member = Column(Float, nullable=True)
+    schedule_variance_days = Column(Float, nullable=True)
+
+    # PO summary inputs
+    satisfaction_score = Column(Float, nullable=True)
+    scope_creep_percentage = Column(Float, nullable=True)
+    roi_percentage = Column(Float, nullable=True)
+    adoption_rate = Column(Float, nullable=True)
+
+    # QA summary inputs
+    test_coverage = Column(Float, nullable=True)
+    defect_density = Column(Float, nullable=True)
+    technical_debt_hours = Column(Float, nullable=True)
+
+    epic = relationship("Epic", back_populates="persona_metrics")
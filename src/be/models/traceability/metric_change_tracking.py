@@ -0,0 +1,129 @@
+"""
+Metric Change Tracking
+
+Session flush hook that turns inserts, updates and deletes of traceability
+entities into Epic metric dirty marks. Only the epics a change touches are
+marked, and only for the metric families that read the changed data.
+
+Bulk ``Query.update()`` / ``Query.delete()`` statements bypass ORM flush
+events; code using them should call ``mark_epic_metrics_dirty`` itself.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+from typing import Dict, Iterable, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from .defect import Defect
+from .epic import Epic
+from .epic_dependency import EpicDependency
+from .epic_metric_dirty import METRIC_FAMILIES, mark_epic_metrics_dirty
+from .test import Test
+from .user_story import UserStory
+
+# Metric families that read data of each child entity
+CHILD_METRIC_FAMILIES = {
+    UserStory: (
+        "timeline_metrics",
+        "velocity_metrics",
+        "business_metrics",
+        "predictive_metrics",
+    ),
+    Test: ("quality_metrics",),
+    Defect: ("quality_metrics", "predictive_metrics"),
+    EpicDependency: ("predictive_metrics",),
+}
+
+# Epic columns written by the metrics calculation itself or by auditing;
+# changing only these must not mark the epic dirty again.
+EPIC_UNTRACKED_COLUMNS = frozenset(
+    {
+        "scope_creep_percentage",
+        "defect_density",
+        "last_metrics_update",
+        "metrics_cache",
+        "metrics_cache_updated_at",
+        "updated_at",
+        "last_github_sync",
+    }
+)
+
+
+# Foreign keys to epics on child entities. Loading their previous value on
+# assignment (active history) lets a re-parented child mark its old epic too,
+# even when the attribute was expired by a commit before the change.
+EPIC_FOREIGN_KEYS = (
+    UserStory.epic_id,
+    Test.epic_id,
+    Defect.epic_id,
+    EpicDependency.parent_epic_id,
+    EpicDependency.dependent_epic_id,
+)
+
+
+def _keep_previous_value(target, value, oldvalue, initiator):
+    return value
+
+
+for _foreign_key in EPIC_FOREIGN_KEYS:
+    event.listen(_foreign_key, "set", _keep_previous_value, retval=True, active_history=True)
+
+
+def _epic_ids(instance, attribute: str) -> Set[int]:
+    """Return current and previous values of a foreign key attribute."""
+    history = inspect(instance).attrs[attribute].history
+    values = set(history.added) | set(history.unchanged) | set(history.deleted)
+    return {value for value in values if value is not None}
+
+
+def _child_epic_ids(instance) -> Set[int]:
+    """Return the ids of epics a child entity belongs to (before and after)."""
+    if isinstance(instance, EpicDependency):
+        return _epic_ids(instance, "parent_epic_id") | _epic_ids(instance, "dependent_epic_id")
+    return _epic_ids(instance, "epic_id")
+
+
+def _epic_fields_changed(epic: Epic) -> bool:
+    """Return True if a tracked (metric input) column of ``epic`` changed."""
+    state = inspect(epic)
+    return any(
+        state.attrs[column.key].history.has_changes()
+        for column in state.mapper.column_attrs
+        if column.key not in EPIC_UNTRACKED_COLUMNS
+    )
+
+
+def collect_dirty_epics(new: Iterable, dirty: Iterable, deleted: Iterable) -> Dict[int, Set[str]]:
+    """Map changed session objects to ``{epic id: dirty metric families}``."""
+    marks: Dict[int, Set[str]] = {}
+
+    def mark(epic_ids: Iterable[int], families: Iterable[str]) -> None:
+        for epic_id in epic_ids:
+            marks.setdefault(epic_id, set()).update(families)
+
+    for instance in list(new) + list(deleted):
+        families = CHILD_METRIC_FAMILIES.get(type(instance))
+        if families:
+            mark(_child_epic_ids(instance), families)
+
+    for instance in dirty:
+        families = CHILD_METRIC_FAMILIES.get(type(instance))
+        if families:
+            mark(_child_epic_ids(instance), families)
+        elif isinstance(instance, Epic) and instance.id is not None:
+            if _epic_fields_changed(instance):
+                mark([instance.id], METRIC_FAMILIES)
+
+    return marks
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_epic_metrics_on_flush(session, flush_context) -> None:
+    """Record dirty metric families for epics touched by this flush."""
+    dirty = [instance for instance in session.dirty if session.is_modified(instance, include_collections=False)]
+    marks = collect_dirty_epics(session.new, dirty, session.deleted)
+    if marks:
+        mark_epic_metrics_dirty(session.connection(), marks)
@@ -10,6 +10,8 @@ Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 Architecture Decision: ADR-003 - Hybrid GitHub + Database RTM Architecture
 """
 
+from typing import Optional
+
 from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
@@ -182,12 +184,20 @@ class UserStory(TraceabilityBase):
     def calculate_test_coverage(self) -> dict:
         """Calculate test coverage metrics."""
         if not self.tests:
-            return {"total_tests": 0, "passed_tests": 0, "coverage_percentage": 0.0}
+            return self.coverage_from_counts(0, 0)
 
         total_tests = len(self.tests)
         passed_tests = sum(
             1 for test in self.tests if test.last_execution_status == "passed"
         )
+        return self.coverage_from_counts(total_tests, passed_tests)
+
+    @staticmethod
+    def coverage_from_counts(total_tests: int, passed_tests: int) -> dict:
+        """Build the test coverage metrics from test counts."""
+        if not total_tests:
+            return {"total_tests": 0, "passed_tests": 0, "coverage_percentage": 0.0}
+
         coverage_percentage = (
             (passed_tests / total_tests * 100.0) if total_tests > 0 else 0.0
         )
@@ -198,8 +208,22 @@ class UserStory(TraceabilityBase):
             "coverage_percentage": coverage_percentage,
         }
 
-    def to_dict(self):
-        """Convert to dictionary with User Story specific fields."""
+    def get_relationship_fields(self) -> dict:
+        """Fields of to_dict() that are derived from linked tests and defects."""
+        return {
+            "test_coverage": self.calculate_test_coverage(),
+            "defect_count": len(self.defects) if self.defects else 0,
+        }
+
+    def to_dict(self, related: Optional[dict] = None):
+        """Convert to dictionary with User Story specific fields.
+
+        Args:
+            related: Precomputed get_relationship_fields() values; when
+                omitted they are read through the relationships
+        """
+        if related is None:
+            related = self.get_relationship_fields()
         base_dict = super().to_dict()
         base_dict.update(
             {
@@ -219,8 +243,8 @@ class UserStory(TraceabilityBase):
                 "affects_gdpr": self.affects_gdpr,
                 "gdpr_considerations": self.gdpr_considerations,
                 "component": self.component,
-                "test_coverage": self.calculate_test_coverage(),
-                "defect_count": len(self.defects) if self.defects else 0,
+                "test_coverage": related["test_coverage"],
+                "defect_count": related["defect_count"],
             }
         )
         return base_dict
@@ -14,8 +14,8 @@ import logging
 import smtplib
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from email.mime.multipart import MimeMultipart
-from email.mime.text import MimeText
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -462,7 +462,7 @@ class BackupMonitor:
         """Send email alert to administrators."""
         try:
             # Create email message
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg["From"] = self.smtp_config.get(
                 "smtp_username", "backup-monitor@gonogo.local"
             )
@@ -498,7 +498,7 @@ GoNoGo Backup Monitor
 US-00036: Comprehensive Database Backup Strategy
 """
 
-            msg.attach(MimeText(body, "plain"))
+            msg.attach(MIMEText(body, "plain"))
 
             # Send email
             server = smtplib.SMTP(
@@ -0,0 +1,54 @@
+"""
+Bounded Executor for Blocking Work
+
+Async route handlers must not call blocking code (synchronous SQLAlchemy,
+SQLite backup and integrity checks, file checksums) on the event loop.
+run_blocking() hands such work to one process-wide thread pool whose size
+bounds how many of these jobs run at once, so a slow backup validation
+occupies a worker thread instead of stalling every request.
+
+Configuration (environment):
+    BLOCKING_IO_WORKERS - threads available to blocking work (default 4)
+
+Related Issue: US-00036 - Comprehensive Database Backup Strategy
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for blocking work."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("BLOCKING_IO_WORKERS", "4")),
+                thread_name_prefix="blocking-io",
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run ``func(*args, **kwargs)`` on the blocking executor and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_blocking_executor() -> None:
+    """Stop the executor after its queued work finishes (application shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
@@ -0,0 +1,517 @@
+"""
+Epic Dependency Graph Service
+
+Process-wide, adjacency-indexed in-memory graph of active Epic dependencies.
+The graph is loaded once per database and then kept current by
+applying dependency create / update / resolve / delete events from committed
+sessions, so cycle, critical-path and impact queries no longer reload the
+dependency table on every request.
+
+All queries run in linear time in the size of the graph: cycles via
+strongly connected components, the critical path via a topological
+longest-path pass with predecessor links, impact via adjacency lookups and
+a single breadth-first walk. Results of the whole-graph queries are cached
+until the next change; adding an edge to a graph known to be acyclic only
+checks whether the new edge closes a cycle.
+
+Every transaction that changes dependencies also advances the
+"epic_dependencies" data generation in the database. The graph remembers
+the generation and table fingerprint it reflects; a commit from this
+process is applied incrementally only when it is the next generation, and
+changes made anywhere else (other workers, CLI tools, raw SQL) make the
+next read reload the graph.
+
+Related Issue: US-00070 - Modèle dépendances fonctionnelles Epic
+Parent Epic: EP-00010 - Dashboard de Traçabilité Multi-Persona
+"""
+
+import logging
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from ..models.traceability.data_generation import (
+    advance_data_generation,
+    get_data_generation,
+)
+from ..models.traceability.epic_dependency import DependencyType, EpicDependency
+
+logger = logging.getLogger(__name__)
+
+# Dependency types that constrain scheduling (critical path)
+SCHEDULING_TYPES = frozenset((DependencyType.BLOCKING.value, DependencyType.PREREQUISITE.value))
+
+# DataGeneration scope advanced by every transaction that changes dependencies
+GENERATION_SCOPE = "epic_dependencies"
+
+_PENDING_KEY = "epic_dependency_graph_changes"
+_STATE_KEY = "epic_dependency_graph_state"
+
+
+@dataclass(frozen=True)
+class DependencyEdge:
+    """Snapshot of one active EpicDependency."""
+
+    id: int
+    parent_epic_id: int
+    dependent_epic_id: int
+    dependency_type: str
+    priority: str
+    is_resolved: bool
+    is_blocking: bool
+    weight: int
+
+    @classmethod
+    def from_dependency(cls, dependency: EpicDependency) -> "DependencyEdge":
+        return cls(
+            id=dependency.id,
+            parent_epic_id=dependency.parent_epic_id,
+            dependent_epic_id=dependency.dependent_epic_id,
+            dependency_type=dependency.dependency_type,
+            priority=dependency.priority,
+            is_resolved=bool(dependency.is_resolved),
+            is_blocking=dependency.is_blocking(),
+            weight=dependency.estimated_impact_days or dependency.get_criticality_score(),
+        )
+
+
+class EpicDependencyGraph:
+    """Adjacency-indexed graph of active Epic dependencies."""
+
+    def __init__(self, edges: Iterable[DependencyEdge] = ()):
+        self._lock = threading.RLock()
+        self._edges: Dict[int, DependencyEdge] = {}
+        # node -> {edge id: edge}
+        self._outgoing: Dict[int, Dict[int, DependencyEdge]] = {}
+        self._incoming: Dict[int, Dict[int, DependencyEdge]] = {}
+        self.version = 0
+        # None = unknown, [] = known acyclic
+        self._cycles: Optional[List[List[int]]] = []
+        self._critical_path_cache: Optional[Tuple[int, Tuple, Dict]] = None
+        # (generation, fingerprint) of the database state this graph reflects
+        self.state: Optional[Tuple] = None
+        for edge in edges:
+            self._index(edge)
+        if self._edges:
+            self._cycles = None
+
+    @classmethod
+    def from_dependencies(cls, dependencies: Iterable[EpicDependency]) -> "EpicDependencyGraph":
+        """Build a graph from the active dependencies among ``dependencies``."""
+        return cls(DependencyEdge.from_dependency(dependency) for dependency in dependencies if dependency.is_active)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    # -- incremental updates --------------------------------------------
+
+    def upsert(self, edge: DependencyEdge) -> None:
+        """Add ``edge`` or replace the stored edge with the same id."""
+        with self._lock:
+            previous = self._edges.get(edge.id)
+            if previous == edge:
+                return
+            if previous is not None:
+                self._unindex(previous)
+            closes_cycle = self._cycles == [] and self.find_path(edge.dependent_epic_id, edge.parent_epic_id)
+            self._index(edge)
+            if previous is not None or closes_cycle:
+                self._cycles = None
+            self._changed()
+
+    def discard(self, edge_id: int) -> None:
+        """Remove the edge with id ``edge_id`` if present."""
+        with self._lock:
+            edge = self._edges.get(edge_id)
+            if edge is None:
+                return
+            self._unindex(edge)
+            if self._cycles:
+                self._cycles = None
+            self._changed()
+
+    def apply(self, dependency: EpicDependency) -> None:
+        """Apply the current state of an ORM dependency."""
+        if dependency.id is None:
+            return
+        if dependency.is_active:
+            self.upsert(DependencyEdge.from_dependency(dependency))
+        else:
+            self.discard(dependency.id)
+
+    def _index(self, edge: DependencyEdge) -> None:
+        self._edges[edge.id] = edge
+        self._outgoing.setdefault(edge.parent_epic_id, {})[edge.id] = edge
+        self._incoming.setdefault(edge.dependent_epic_id, {})[edge.id] = edge
+
+    def _unindex(self, edge: DependencyEdge) -> None:
+        del self._edges[edge.id]
+        for index, node in (
+            (self._outgoing, edge.parent_epic_id),
+            (self._incoming, edge.dependent_epic_id),
+        ):
+            bucket = index[node]
+            del bucket[edge.id]
+            if not bucket:
+                del index[node]
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._critical_path_cache = None
+
+    # -- queries --------------------------------------------------------
+
+    def successors(self, node: int) -> Set[int]:
+        return {edge.dependent_epic_id for edge in self._outgoing.get(node, {}).values()}
+
+    def find_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Return a dependency path from ``source`` to ``target``, if any."""
+        with self._lock:
+            if source == target:
+                return [source]
+            previous = {source: None}
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for successor in self.successors(node):
+                    if successor in previous:
+                        continue
+                    previous[successor] = node
+                    if successor == target:
+                        path = [successor]
+                        while previous[path[-1]] is not None:
+                            path.append(previous[path[-1]])
+                        return path[::-1]
+                    queue.append(successor)
+            return None
+
+    def cycle_if_added(self, parent_id: int, dependent_id: int) -> List[int]:
+        """Return the cycle a new ``parent -> dependent`` edge would close."""
+        path = self.find_path(dependent_id, parent_id)
+        return [parent_id] + path if path else []
+
+    def detect_cycles(self) -> List[List[int]]:
+        """Return one cycle per strongly connected dependency cluster."""
+        with self._lock:
+            if self._cycles is None:
+                self._cycles = self._find_cycles()
+            return [list(cycle) for cycle in self._cycles]
+
+    def _find_cycles(self) -> List[List[int]]:
+        cycles = []
+        for component in self._strongly_connected_components():
+            if len(component) < 2:
+                continue
+            # Every node of the component has a successor inside it, so a
+            # walk restricted to the component must revisit a node.
+            order: Dict[int, int] = {}
+            walk = []
+            node = min(component)
+            while node not in order:
+                order[node] = len(walk)
+                walk.append(node)
+                node = min(self.successors(node) & component)
+            cycles.append(walk[order[node] :] + [node])
+        return cycles
+
+    def _strongly_connected_components(self) -> List[Set[int]]:
+        """Iterative Tarjan algorithm."""
+        index: Dict[int, int] = {}
+        lowlink: Dict[int, int] = {}
+        on_stack: Set[int] = set()
+        stack: List[int] = []
+        components = []
+
+        for root in sorted(self._outgoing):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.successors(root))))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(sorted(self.successors(successor)))))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def critical_path(self, epic_ids: Iterable[int]) -> Dict[str, object]:
+        """Longest weighted path over scheduling dependencies among ``epic_ids``.
+
+        Epics on a dependency cycle are never released and keep distance 0.
+        """
+        nodes = tuple(dict.fromkeys(epic_ids))
+        with self._lock:
+            cached = self._critical_path_cache
+            if cached and cached[0] == self.version and cached[1] == nodes:
+                return _copy_critical_path(cached[2])
+            result = self._critical_path(nodes)
+            self._critical_path_cache = (self.version, nodes, result)
+            return _copy_critical_path(result)
+
+    def _critical_path(self, nodes: Tuple[int, ...]) -> Dict[str, object]:
+        members = set(nodes)
+        # Collapse parallel edges to the heaviest one
+        weights: Dict[int, Dict[int, int]] = {}
+        in_degree = dict.fromkeys(nodes, 0)
+        for node in nodes:
+            for edge in self._outgoing.get(node, {}).values():
+                dependent = edge.dependent_epic_id
+                if edge.dependency_type not in SCHEDULING_TYPES:
+                    continue
+                if dependent not in members:
+                    continue
+                successors = weights.setdefault(node, {})
+                if dependent not in successors:
+                    in_degree[dependent] += 1
+                    successors[dependent] = edge.weight
+                else:
+                    successors[dependent] = max(successors[dependent], edge.weight)
+
+        distances = dict.fromkeys(nodes, 0)
+        previous: Dict[int, int] = {}
+        max_distance = 0
+        critical_end = None
+        queue = deque(node for node in nodes if in_degree[node] == 0)
+        while queue:
+            current = queue.popleft()
+            for neighbor, weight in weights.get(current, {}).items():
+                new_distance = distances[current] + weight
+                if new_distance > distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = current
+                    if new_distance > max_distance:
+                        max_distance = new_distance
+                        critical_end = neighbor
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        critical_path = []
+        if critical_end is not None:
+            node = critical_end
+            critical_path.append(node)
+            while node in previous:
+                node = previous[node]
+                critical_path.append(node)
+            critical_path.reverse()
+
+        return {
+            "critical_path": critical_path,
+            "total_duration": max_distance,
+            "distances": distances,
+            "bottlenecks": [epic_id for epic_id, dist in distances.items() if dist == max_distance],
+        }
+
+    def edge_weight(self, parent_id: int, dependent_id: int) -> int:
+        """Heaviest scheduling weight between two epics (0 if none)."""
+        return max(
+            (
+                edge.weight
+                for edge in self._outgoing.get(parent_id, {}).values()
+                if edge.dependent_epic_id == dependent_id and edge.dependency_type in SCHEDULING_TYPES
+            ),
+            default=0,
+        )
+
+    def impact(self, epic_id: int) -> Dict[str, object]:
+        """Direct and transitive dependency impact of one epic."""
+        with self._lock:
+            blocking = list(self._outgoing.get(epic_id, {}).values())
+            blocked_by = list(self._incoming.get(epic_id, {}).values())
+
+            downstream = []
+            seen = {epic_id}
+            queue = deque([epic_id])
+            while queue:
+                for successor in sorted(self.successors(queue.popleft())):
+                    if successor not in seen:
+                        seen.add(successor)
+                        downstream.append(successor)
+                        queue.append(successor)
+
+        return {
+            "epic_id": epic_id,
+            "blocks_count": len(blocking),
+            "blocked_by_count": len(blocked_by),
+            "blocking_epics": [e.dependent_epic_id for e in blocking if e.is_blocking],
+            "blocked_by_epics": [e.parent_epic_id for e in blocked_by if e.is_blocking],
+            "critical_dependency_ids": [
+                e.id for e in blocked_by if e.priority in ("critical", "high") and not e.is_resolved
+            ],
+            "downstream_epics": downstream,
+            "risk_score": (
+                len([e for e in blocked_by if e.is_blocking]) * 2
+                + len([e for e in blocked_by if e.priority == "critical"])
+            ),
+        }
+
+
+def _copy_critical_path(result: Dict) -> Dict:
+    return {
+        "critical_path": list(result["critical_path"]),
+        "total_duration": result["total_duration"],
+        "distances": dict(result["distances"]),
+        "bottlenecks": list(result["bottlenecks"]),
+    }
+
+
+# -- process-wide registry ---------------------------------------------------
+
+# Graphs are keyed by database URL, so the sync engine and the async engine
+# (AsyncSession writes) of one database share a graph. In-memory SQLite
+# databases are private to their engine and keyed by it instead.
+_graphs: Dict[str, EpicDependencyGraph] = {}
+_engine_graphs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_graphs_lock = threading.Lock()
+
+
+def _engine_of(session: Session):
+    bind = session.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _registry_entry(session: Session) -> Tuple[dict, object]:
+    """Return the registry holding the session database's graph and its key."""
+    engine = _engine_of(session)
+    url = engine.url
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database in (None, "", ":memory:"):
+        return _engine_graphs, engine
+    return _graphs, url.set(drivername=backend).render_as_string(hide_password=False)
+
+
+def _fingerprint(connection) -> Tuple:
+    return tuple(
+        connection.execute(
+            select(
+                func.count(EpicDependency.id),
+                func.max(EpicDependency.id),
+                func.max(EpicDependency.updated_at),
+            )
+        ).one()
+    )
+
+
+def _database_state(session: Session) -> Tuple:
+    return (get_data_generation(session, GENERATION_SCOPE), _fingerprint(session))
+
+
+def get_dependency_graph(session: Session) -> EpicDependencyGraph:
+    """Return the shared dependency graph of the session's database."""
+    registry, key = _registry_entry(session)
+    state = _database_state(session)
+    with _graphs_lock:
+        graph = registry.get(key)
+        if graph is not None:
+            if graph.state == state:
+                return graph
+            logger.info("Epic dependencies changed externally; reloading graph")
+
+        dependencies = (session.query(EpicDependency).filter(EpicDependency.is_active == True)).all()  # noqa: E712
+        graph = EpicDependencyGraph.from_dependencies(dependencies)
+        graph.state = state
+        registry[key] = graph
+        return graph
+
+
+def reset_dependency_graphs() -> None:
+    """Drop all cached graphs (they are rebuilt on next use)."""
+    with _graphs_lock:
+        _graphs.clear()
+        _engine_graphs.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_dependency_changes(session, flush_context):
+    changes = session.info.setdefault(_PENDING_KEY, [])
+    count = len(changes)
+    for obj in session.new | session.dirty:
+        if isinstance(obj, EpicDependency) and obj.id is not None:
+            edge = DependencyEdge.from_dependency(obj) if obj.is_active else None
+            changes.append((obj.id, edge))
+    for obj in session.deleted:
+        if isinstance(obj, EpicDependency) and obj.id is not None:
+            changes.append((obj.id, None))
+    if len(changes) == count:
+        return
+
+    # Record the state our commit will leave behind while this transaction
+    # still holds the write lock, so no other writer can slip in between
+    connection = session.connection()
+    state = session.info.get(_STATE_KEY)
+    if state is None:
+        advance_data_generation(connection, GENERATION_SCOPE)
+        generation = get_data_generation(connection, GENERATION_SCOPE)
+    else:
+        generation = state[0]
+    session.info[_STATE_KEY] = (generation, _fingerprint(connection))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_dependency_changes(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    state = session.info.pop(_STATE_KEY, None)
+    if not changes or state is None:
+        return
+    try:
+        registry, key = _registry_entry(session)
+    except Exception:
+        return
+    with _graphs_lock:
+        graph = registry.get(key)
+        if graph is None:
+            return
+        generation = state[0]
+        if generation is not None and graph.state[0] != generation - 1:
+            # Dependencies were also changed elsewhere; reload on next read
+            del registry[key]
+            return
+        for edge_id, edge in changes:
+            if edge is None:
+                graph.discard(edge_id)
+            else:
+                graph.upsert(edge)
+        graph.state = state
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_dependency_changes(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_STATE_KEY, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _end_dependency_changes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_STATE_KEY, None)
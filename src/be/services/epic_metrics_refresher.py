@@ -4,57 +4,395 @@ Utility helpers for refreshing Epic metrics in batch.
 Provides both a synchronous refresh helper (used by CLI tools) and an async
 loop that can be scheduled by the FastAPI app for background updates.
 
+The async loop never runs ORM work on the event loop: every refresh pass is
+handed to a dedicated worker thread, epics are processed in bounded batches
+that are committed one at a time, and progress/timing is published through
+``get_refresh_stats()``.
+
+Only epics whose metrics were marked dirty by related changes (see
+``models.traceability.metric_change_tracking``) or that were never cached are
+recalculated, and only for the dirty metric families. A short poll picks up
+dirty marks within seconds; the full pass additionally refreshes caches older
+than ``METRIC_REFRESH_MAX_AGE_MINUTES`` for time-dependent values such as days
+until deadline, and downsamples metric history older than
+``METRIC_HISTORY_DOWNSAMPLE_AFTER_DAYS`` to one point per day.
+
 Related Issue: US-00071 - Extend Epic model for metrics
 Parent Epic: EP-00010 - Multi-persona dashboard
 """
 
 import asyncio
+import logging
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Dict, Optional, Set
 
+from ...shared.metrics.thresholds import get_threshold_service
 from ..database import get_db_session
 from ..models.traceability.epic import Epic
+from ..models.traceability.epic_metric_dirty import (
+    clear_epic_metrics_dirty,
+    get_dirty_metric_families,
+)
+from ..models.traceability.epic_metric_history import downsample_metric_history
+from .persona_metrics_projector import PersonaMetricsProjector
 
+logger = logging.getLogger(__name__)
 
-def refresh_all_epic_metrics(
-    session=None, force: bool = False, record_history: bool = True
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_WORKERS = 1
+DEFAULT_DIRTY_POLL_SECONDS = 5
+# Timeline metrics are day-granular, so a daily recompute keeps them current
+DEFAULT_MAX_AGE_MINUTES = 24 * 60
+DEFAULT_HISTORY_DOWNSAMPLE_AFTER_DAYS = 7
+
+# Families to recalculate per epic id; None means every family
+RefreshPlan = Dict[int, Optional[Set[str]]]
+
+
+class RefreshStats:
+    """Thread-safe progress and timing statistics for metric refresh runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = False
+        self.runs = 0
+        self.epics_total = 0
+        self.epics_processed = 0
+        self.epics_refreshed = 0
+        self.last_started_at: Optional[datetime] = None
+        self.last_finished_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_refreshed = 0
+        self.last_error: Optional[str] = None
+        self._started_monotonic = 0.0
+
+    def start(self, epics_total: int) -> None:
+        """Record the beginning of a refresh pass."""
+        with self._lock:
+            self.running = True
+            self.epics_total = epics_total
+            self.epics_processed = 0
+            self.epics_refreshed = 0
+            self.last_started_at = datetime.now()
+            self._started_monotonic = time.monotonic()
+
+    def advance(self, processed: int, refreshed: int) -> None:
+        """Record a committed batch."""
+        with self._lock:
+            self.epics_processed += processed
+            self.epics_refreshed += refreshed
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Record the end of a refresh pass."""
+        with self._lock:
+            self.running = False
+            self.runs += 1
+            self.last_finished_at = datetime.now()
+            self.last_duration_seconds = round(
+                time.monotonic() - self._started_monotonic, 3
+            )
+            self.last_refreshed = self.epics_refreshed
+            self.last_error = repr(error) if error else None
+
+    def snapshot(self) -> Dict:
+        """Return a JSON-serializable copy of the current statistics."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "runs": self.runs,
+                "progress": {
+                    "epics_total": self.epics_total,
+                    "epics_processed": self.epics_processed,
+                    "epics_refreshed": self.epics_refreshed,
+                },
+                "last_started_at": (
+                    self.last_started_at.isoformat() if self.last_started_at else None
+                ),
+                "last_finished_at": (
+                    self.last_finished_at.isoformat()
+                    if self.last_finished_at
+                    else None
+                ),
+                "last_duration_seconds": self.last_duration_seconds,
+                "last_refreshed": self.last_refreshed,
+                "last_error": self.last_error,
+            }
+
+
+refresh_stats = RefreshStats()
+
+
+def get_refresh_stats() -> Dict:
+    """Return progress and last-run statistics of the metrics refresher."""
+    return refresh_stats.snapshot()
+
+
+def _select_refresh_plan(session, force: bool, dirty_only: bool) -> RefreshPlan:
+    """Return the epics (and metric families) a refresh pass must update."""
+    if force:
+        return {epic_id: None for (epic_id,) in session.query(Epic.id).all()}
+
+    stale = Epic.metrics_cache_updated_at.is_(None)
+    if not dirty_only:
+        cutoff = datetime.now() - timedelta(minutes=get_refresh_max_age())
+        stale = stale | (Epic.metrics_cache_updated_at < cutoff)
+
+    plan: RefreshPlan = {
+        epic_id: None for (epic_id,) in session.query(Epic.id).filter(stale).all()
+    }
+    for epic_id, families in get_dirty_metric_families(session).items():
+        plan.setdefault(epic_id, families)
+    return plan
+
+
+def _batches(plan: RefreshPlan, batch_size: int) -> list:
+    """Split a refresh plan into id-ordered sub-plans of ``batch_size``."""
+    epic_ids = sorted(plan)
+    return [
+        {epic_id: plan[epic_id] for epic_id in epic_ids[start : start + batch_size]}
+        for start in range(0, len(epic_ids), batch_size)
+    ]
+
+
+def _refresh_epics(
+    session, batch: RefreshPlan, record_history: bool, marked_before: datetime
 ) -> int:
-    """Recalculate metrics for every Epic and return the number refreshed."""
-    created_session = False
-    if session is None:
-        session = get_db_session()
-        created_session = True
+    """Recalculate metrics and persona projections for one batch.
 
+    Dirty marks of the batch recorded before ``marked_before`` are cleared;
+    marks added by changes made during the refresh survive for the next pass.
+    """
+    projector = PersonaMetricsProjector(session, thresholds=get_threshold_service())
     refreshed = 0
+    for epic in session.query(Epic).filter(Epic.id.in_(list(batch))).all():
+        metrics = epic.update_metrics(
+            force_recalculate=True,
+            session=session,
+            record_history=record_history,
+            families=batch[epic.id],
+        )
+        projector.materialize(epic, metrics)
+        refreshed += 1
+    clear_epic_metrics_dirty(session, list(batch), marked_before)
+    return refreshed
+
+
+def _refresh_batch_in_own_session(
+    batch: RefreshPlan,
+    record_history: bool,
+    marked_before: datetime,
+    stats: RefreshStats,
+    stop_event: Optional[threading.Event],
+) -> int:
+    """Refresh one batch in a dedicated session and commit it."""
+    if stop_event is not None and stop_event.is_set():
+        return 0
+
+    session = get_db_session()
     try:
-        for epic in session.query(Epic).yield_per(50):
-            if force or epic.is_metrics_cache_stale():
-                epic.update_metrics(
-                    force_recalculate=True,
-                    session=session,
-                    record_history=record_history,
-                )
-                refreshed += 1
-        if created_session:
-            session.commit()
+        refreshed = _refresh_epics(session, batch, record_history, marked_before)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
     finally:
-        if created_session:
-            session.close()
+        session.close()
+
+    stats.advance(len(batch), refreshed)
     return refreshed
 
 
-async def metrics_refresh_loop(interval_seconds: int = 900) -> None:
-    """Background loop that periodically refreshes Epic metrics."""
-    while True:
-        session = get_db_session()
+def refresh_all_epic_metrics(
+    session=None,
+    force: bool = False,
+    record_history: bool = True,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    stats: Optional[RefreshStats] = None,
+    dirty_only: bool = False,
+) -> int:
+    """Recalculate metrics for epics needing it and return the number refreshed.
+
+    Epics marked dirty by related changes are recalculated for their dirty
+    metric families only; epics never cached (and, unless ``dirty_only``,
+    caches older than the configured maximum age) are fully recalculated.
+    ``force`` recalculates every epic.
+
+    When ``session`` is provided the caller owns the transaction: epics are
+    refreshed in that session and nothing is committed. Otherwise epics are
+    processed in batches of ``batch_size``, each in its own session and
+    committed on completion, using up to ``max_workers`` worker threads.
+    Setting ``stop_event`` stops the pass before the next batch starts.
+    """
+    stats = stats or refresh_stats
+    batch_size = max(1, batch_size or get_refresh_batch_size())
+    max_workers = max(1, max_workers or get_refresh_workers())
+    marked_before = datetime.now()
+
+    if session is not None:
+        plan = _select_refresh_plan(session, force, dirty_only)
+        if dirty_only and not plan:
+            return 0
+        stats.start(len(plan))
+        refreshed = 0
+        error = None
         try:
-            refresh_all_epic_metrics(session=session, force=False, record_history=True)
-            session.commit()
-        except Exception:
-            session.rollback()
+            for batch in _batches(plan, batch_size):
+                if stop_event is not None and stop_event.is_set():
+                    break
+                batch_refreshed = _refresh_epics(
+                    session, batch, record_history, marked_before
+                )
+                stats.advance(len(batch), batch_refreshed)
+                refreshed += batch_refreshed
+        except Exception as exc:
+            error = exc
             raise
         finally:
+            stats.finish(error)
+        return refreshed
+
+    plan_session = get_db_session()
+    try:
+        plan = _select_refresh_plan(plan_session, force, dirty_only)
+    finally:
+        plan_session.close()
+
+    if dirty_only and not plan:
+        return 0
+
+    batches = _batches(plan, batch_size)
+    run_batch = partial(
+        _refresh_batch_in_own_session,
+        record_history=record_history,
+        marked_before=marked_before,
+        stats=stats,
+        stop_event=stop_event,
+    )
+
+    stats.start(len(plan))
+    error = None
+    try:
+        if max_workers == 1 or len(batches) <= 1:
+            return sum(run_batch(batch) for batch in batches)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="epic-metrics-batch"
+        ) as pool:
+            return sum(pool.map(run_batch, batches))
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        stats.finish(error)
+
+
+def downsample_epic_metric_history(session=None) -> int:
+    """Merge metric history older than the configured age into daily points.
+
+    Returns the number of history captures removed. Commits only when it
+    created the session itself.
+    """
+    after_days = get_history_downsample_after_days()
+    if after_days <= 0:
+        return 0
+
+    owns_session = session is None
+    session = session or get_db_session()
+    try:
+        removed = downsample_metric_history(
+            session, older_than=datetime.now() - timedelta(days=after_days)
+        )
+        if owns_session:
+            session.commit()
+    except Exception:
+        if owns_session:
+            session.rollback()
+        raise
+    finally:
+        if owns_session:
             session.close()
-        await asyncio.sleep(interval_seconds)
+
+    if removed:
+        logger.info("Downsampled %d epic metric history captures", removed)
+    return removed
+
+
+def next_refresh_delay(interval_seconds: float, jitter_seconds: float) -> float:
+    """Return the delay before the next refresh pass, with random jitter."""
+    if jitter_seconds <= 0:
+        return interval_seconds
+    return interval_seconds + random.uniform(0, jitter_seconds)
+
+
+async def metrics_refresh_loop(
+    interval_seconds: int = 900,
+    jitter_seconds: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    dirty_poll_seconds: Optional[float] = None,
+) -> None:
+    """Background loop that keeps Epic metrics up to date.
+
+    Every ``dirty_poll_seconds`` it recalculates epics marked dirty by
+    related changes; every ``interval_seconds`` (plus jitter) it also runs a
+    full pass that refreshes caches past their maximum age. Each pass runs
+    in a dedicated worker thread so the event loop keeps serving requests.
+    A failing pass is logged and retried on the next tick.
+    """
+    if jitter_seconds is None:
+        jitter_seconds = get_refresh_jitter()
+    if dirty_poll_seconds is None:
+        dirty_poll_seconds = get_dirty_poll_interval()
+
+    loop = asyncio.get_running_loop()
+    stop_event = threading.Event()
+    executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="epic-metrics-refresh"
+    )
+
+    def run_pass(dirty_only: bool) -> int:
+        refreshed = refresh_all_epic_metrics(
+            force=False,
+            record_history=True,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            stop_event=stop_event,
+            dirty_only=dirty_only,
+        )
+        if not dirty_only:
+            downsample_epic_metric_history()
+        return refreshed
+
+    try:
+        # Spread the first pass of several app workers started together
+        next_full_pass = loop.time() + next_refresh_delay(0, jitter_seconds)
+        while True:
+            full_pass = loop.time() >= next_full_pass
+            try:
+                await loop.run_in_executor(
+                    executor, partial(run_pass, dirty_only=not full_pass)
+                )
+            except Exception:
+                logger.exception("Background epic metrics refresh failed")
+            if full_pass:
+                next_full_pass = loop.time() + next_refresh_delay(
+                    interval_seconds, jitter_seconds
+                )
+
+            delay = max(0.0, next_full_pass - loop.time())
+            if dirty_poll_seconds > 0:
+                delay = min(delay, dirty_poll_seconds)
+            await asyncio.sleep(delay)
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def should_enable_background_refresh() -> bool:
@@ -74,3 +412,75 @@ def get_refresh_interval() -> int:
         return int(os.getenv("METRIC_REFRESH_INTERVAL_SECONDS", "900"))
     except ValueError:
         return 900
+
+
+def get_refresh_jitter() -> float:
+    """Return the maximum random delay added to each refresh (default 0)."""
+    try:
+        return max(0.0, float(os.getenv("METRIC_REFRESH_JITTER_SECONDS", "0")))
+    except ValueError:
+        return 0.0
+
+
+def get_dirty_poll_interval() -> float:
+    """Return how often dirty epics are refreshed in seconds (0 disables)."""
+    try:
+        return max(
+            0.0,
+            float(
+                os.getenv(
+                    "METRIC_REFRESH_DIRTY_POLL_SECONDS", DEFAULT_DIRTY_POLL_SECONDS
+                )
+            ),
+        )
+    except ValueError:
+        return float(DEFAULT_DIRTY_POLL_SECONDS)
+
+
+def get_refresh_max_age() -> int:
+    """Return the maximum age of cached metrics in minutes (default 1 day)."""
+    try:
+        return max(
+            1,
+            int(os.getenv("METRIC_REFRESH_MAX_AGE_MINUTES", DEFAULT_MAX_AGE_MINUTES)),
+        )
+    except ValueError:
+        return DEFAULT_MAX_AGE_MINUTES
+
+
+def get_history_downsample_after_days() -> int:
+    """Return the age in days after which metric history is kept daily only
+    (0 disables downsampling).
+    """
+    try:
+        return max(
+            0,
+            int(
+                os.getenv(
+                    "METRIC_HISTORY_DOWNSAMPLE_AFTER_DAYS",
+                    DEFAULT_HISTORY_DOWNSAMPLE_AFTER_DAYS,
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_HISTORY_DOWNSAMPLE_AFTER_DAYS
+
+
+def get_refresh_batch_size() -> int:
+    """Return how many epics are refreshed per committed batch."""
+    try:
+        return max(1, int(os.getenv("METRIC_REFRESH_BATCH_SIZE", DEFAULT_BATCH_SIZE)))
+    except ValueError:
+        return DEFAULT_BATCH_SIZE
+
+
+def get_refresh_workers() -> int:
+    """Return the number of worker threads used for a refresh pass.
+
+    Values above 1 only help on databases that allow concurrent writers
+    (PostgreSQL); SQLite serializes the batches anyway.
+    """
+    try:
+        return max(1, int(os.getenv("METRIC_REFRESH_WORKERS", DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
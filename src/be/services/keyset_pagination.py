@@ -0,0 +1,110 @@
+"""
+Keyset Pagination
+
+Cursor-based paging for the RTM list endpoints. Pages are read in the order
+of a unique, indexed sort key and each page continues with ``key > last``
+instead of an OFFSET, so every page costs the same however deep it is.
+
+The continuation token is opaque to clients: it carries the last key of
+the page and a fingerprint of the filters it was issued for, so a token
+cannot silently be replayed against a different filter set.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Query, Session
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation token is malformed or was issued for other filters."""
+
+
+def _filters_fingerprint(filters: Dict[str, Any]) -> str:
+    payload = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(last_key: Any, filters: Dict[str, Any]) -> str:
+    """Opaque token continuing after ``last_key`` under ``filters``."""
+    payload = json.dumps({"k": last_key, "f": _filters_fingerprint(filters)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token: str, filters: Dict[str, Any]) -> Any:
+    """Return the last key carried by ``token``."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        last_key, fingerprint = payload["k"], payload["f"]
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+    if fingerprint != _filters_fingerprint(filters):
+        raise InvalidCursorError("Pagination cursor was issued for other filters")
+    return last_key
+
+
+@dataclass
+class Page:
+    """One page of rows and the token for the next one, if any."""
+
+    rows: List[Any]
+    next_cursor: Optional[str]
+
+
+class KeysetPaginator:
+    """Page a query by a unique sort key.
+
+    ``key_of`` extracts the sort key value from a result row.
+    """
+
+    def __init__(self, key_column, key_of: Callable[[Any], Any]):
+        self.key_column = key_column
+        self.key_of = key_of
+
+    def page(
+        self,
+        query: Query,
+        limit: int,
+        filters: Dict[str, Any],
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Page:
+        """Return the page after ``cursor`` (or at ``offset`` without one)."""
+        query = query.order_by(self.key_column)
+        if cursor:
+            query = query.filter(self.key_column > decode_cursor(cursor, filters))
+        elif offset:
+            query = query.offset(offset)
+
+        # One extra row tells whether a further page exists
+        rows = query.limit(limit + 1).all()
+        if len(rows) <= limit:
+            return Page(rows=rows, next_cursor=None)
+        rows = rows[:limit]
+        return Page(rows=rows, next_cursor=encode_cursor(self.key_of(rows[-1]), filters))
+
+
+def count_rows(db: Session, model, criteria: Sequence[Any], estimate: bool = False) -> Tuple[int, bool]:
+    """Count ``model`` rows matching ``criteria``.
+
+    With ``estimate`` on PostgreSQL the planner's row estimate is returned
+    instead of scanning. Returns ``(count, is_estimate)``; other databases
+    always get an exact count.
+    """
+    if estimate and db.get_bind().dialect.name == "postgresql":
+        statement = select(literal_column("1")).select_from(model).where(*criteria)
+        compiled = statement.compile(dialect=db.get_bind().dialect)
+        plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"]), True
+
+    count = db.execute(select(func.count()).select_from(model).where(*criteria))
+    return count.scalar_one(), False
@@ -0,0 +1,229 @@
+"""
+Persona Metrics Projector
+
+Materializes the PM / PO / QA dashboard projections of Epic metrics when the
+metrics are refreshed, and serves the multi-persona dashboard from those
+projections with one query: each epic's threshold-evaluated ``metrics``
+object is stored as ready-to-send JSON and the summary inputs as typed
+columns, so no per-epic JSON parsing or threshold evaluation happens per
+request.
+
+Epics whose projection is missing or older than their metrics cache (for
+example after a manual metrics update) are projected on the fly, as are all
+epics of a database whose projection table has not been migrated yet.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+import json
+import logging
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, delete, insert, inspect
+from sqlalchemy.orm import Session
+
+from ..models.traceability import Epic
+from ..models.traceability.epic_persona_metrics import (
+    PERSONA_SUMMARY_FIELDS,
+    PERSONAS,
+    EpicPersonaMetrics,
+)
+
+logger = logging.getLogger(__name__)
+
+# Engines known to have the projection table, and engines already warned
+# about missing it (databases created before the table was introduced)
+_engines_with_table = weakref.WeakSet()
+_engines_warned = weakref.WeakSet()
+
+
+@dataclass
+class PersonaProjection:
+    """One epic's dashboard entry for a persona."""
+
+    epic_id: str
+    title: str
+    status: str
+    completion_percentage: float
+    priority: str
+    # Serialized, threshold-evaluated ``metrics`` object
+    payload: str
+    # Raw summary inputs, nested like the projection: {section: {metric: value}}
+    summary_metrics: Dict[str, Dict[str, float]]
+
+    def to_json(self) -> str:
+        """Return the dashboard entry as JSON without re-parsing the payload."""
+        header = json.dumps(
+            {
+                "epic_id": self.epic_id,
+                "title": self.title,
+                "status": self.status,
+                "completion_percentage": self.completion_percentage,
+                "priority": self.priority,
+            }
+        )
+        return f'{header[:-1]}, "metrics": {self.payload}}}'
+
+
+def _numeric(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _has_projection_table(connection) -> bool:
+    """Return True if the bound database has the persona projection table."""
+    engine = connection.engine
+    if engine in _engines_with_table:
+        return True
+    if inspect(connection).has_table(EpicPersonaMetrics.__tablename__):
+        _engines_with_table.add(engine)
+        return True
+    if engine not in _engines_warned:
+        _engines_warned.add(engine)
+        logger.warning(
+            "Table %s is missing; persona dashboards are projected per epic "
+            "on every request until migrations are applied",
+            EpicPersonaMetrics.__tablename__,
+        )
+    return False
+
+
+def _summary_metrics(persona: str, values: Dict[str, Optional[float]]) -> Dict:
+    """Nest typed summary column values like the projection they came from."""
+    nested: Dict[str, Dict[str, float]] = {}
+    for column, (section, metric) in PERSONA_SUMMARY_FIELDS[persona].items():
+        value = values.get(column)
+        if value is not None:
+            nested.setdefault(section, {})[metric] = value
+    return nested
+
+
+class PersonaMetricsProjector:
+    """Builds, stores and reads materialized persona dashboard projections."""
+
+    def __init__(self, db_session: Session, thresholds=None):
+        self.db = db_session
+        self.thresholds = thresholds
+
+    def build(self, epic: Epic, persona: str, all_metrics: Dict) -> Dict:
+        """Return the projection row values of ``epic`` for ``persona``."""
+        raw = epic.build_persona_metrics(persona, all_metrics)
+        evaluated = epic._apply_threshold_evaluation(raw, persona, self.thresholds) if self.thresholds else raw
+
+        row = {
+            "epic_id": epic.id,
+            "persona": persona,
+            "payload": json.dumps(evaluated),
+            "metrics_cached_at": epic.metrics_cache_updated_at,
+            "materialized_at": datetime.now(),
+        }
+        for column, (section, metric) in PERSONA_SUMMARY_FIELDS[persona].items():
+            row[column] = _numeric(raw.get(section, {}).get(metric))
+        return row
+
+    def materialize(self, epic: Epic, all_metrics: Optional[Dict] = None) -> None:
+        """Replace the stored projections of ``epic`` for every persona."""
+        if epic.id is None or not _has_projection_table(self.db.connection()):
+            return
+        if all_metrics is None:
+            all_metrics = epic.get_cached_metrics_only() or {}
+
+        rows = [self.build(epic, persona, all_metrics) for persona in PERSONAS]
+        self.db.execute(delete(EpicPersonaMetrics).where(EpicPersonaMetrics.epic_id == epic.id))
+        self.db.execute(insert(EpicPersonaMetrics), rows)
+
+    def load(
+        self,
+        persona: str,
+        epic_filter: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        component_filter: Optional[str] = None,
+    ) -> List[PersonaProjection]:
+        """Return dashboard entries for ``persona`` (one of PERSONAS)."""
+        persona = persona.lower()
+        if not _has_projection_table(self.db.connection()):
+            epics = self._filter(self.db.query(Epic), epic_filter, status_filter, component_filter)
+            return [self._project_on_the_fly(epic, persona) for epic in epics.order_by(Epic.id).all()]
+
+        summary_columns = list(PERSONA_SUMMARY_FIELDS[persona])
+        query = self.db.query(
+            Epic.id,
+            Epic.epic_id,
+            Epic.title,
+            Epic.status,
+            Epic.completion_percentage,
+            Epic.priority,
+            Epic.metrics_cache_updated_at,
+            EpicPersonaMetrics.payload,
+            EpicPersonaMetrics.metrics_cached_at,
+            *(getattr(EpicPersonaMetrics, column) for column in summary_columns),
+        ).outerjoin(
+            EpicPersonaMetrics,
+            and_(
+                EpicPersonaMetrics.epic_id == Epic.id,
+                EpicPersonaMetrics.persona == persona,
+            ),
+        )
+        query = self._filter(query, epic_filter, status_filter, component_filter)
+
+        projections: List[Optional[PersonaProjection]] = []
+        stale: Dict[int, int] = {}
+        for row in query.order_by(Epic.id).all():
+            fresh = (
+                row.payload is not None
+                and row.metrics_cache_updated_at is not None
+                and row.metrics_cached_at == row.metrics_cache_updated_at
+            )
+            if not fresh:
+                stale[row.id] = len(projections)
+                projections.append(None)
+                continue
+            projections.append(
+                PersonaProjection(
+                    epic_id=row.epic_id,
+                    title=row.title,
+                    status=row.status,
+                    completion_percentage=row.completion_percentage,
+                    priority=row.priority,
+                    payload=row.payload,
+                    summary_metrics=_summary_metrics(
+                        persona,
+                        {column: getattr(row, column) for column in summary_columns},
+                    ),
+                )
+            )
+
+        if stale:
+            logger.debug("Projecting %d epic(s) without fresh %s projection", len(stale), persona)
+            for epic in self.db.query(Epic).filter(Epic.id.in_(list(stale))).all():
+                projections[stale[epic.id]] = self._project_on_the_fly(epic, persona)
+
+        return projections
+
+    @staticmethod
+    def _filter(query, epic_filter, status_filter, component_filter):
+        if epic_filter:
+            query = query.filter(Epic.epic_id == epic_filter)
+        if status_filter:
+            query = query.filter(Epic.status == status_filter)
+        if component_filter:
+            query = query.filter(Epic.component == component_filter)
+        return query
+
+    def _project_on_the_fly(self, epic: Epic, persona: str) -> PersonaProjection:
+        all_metrics = epic.get_cached_metrics(session=self.db, refresh=False, record_history=False)
+        row = self.build(epic, persona, all_metrics)
+        return PersonaProjection(
+            epic_id=epic.epic_id,
+            title=epic.title,
+            status=epic.status,
+            completion_percentage=epic.completion_percentage,
+            priority=epic.priority,
+            payload=row["payload"],
+            summary_metrics=_summary_metrics(persona, row),
+        )
@@ -0,0 +1,317 @@
+"""
+Render Cache Service
+
+Content-addressed cache for rendered dependency SVGs and RTM HTML reports.
+Entries are keyed by a SHA-256 hash of everything that determines the
+output - the report kind, the generator version, the filters and either the
+input data itself or a fingerprint of the tables it is built from - so a
+cached body is valid for as long as its key can be produced, and the key
+doubles as the HTTP ETag.
+
+Entries live in a size-bounded LRU memory tier and, when a cache directory
+is configured, in an on-disk tier shared by worker processes and restarts.
+Every transaction that changes epics, user stories, tests, defects,
+dependencies or capabilities also advances the "rendered" data generation
+stored in the database (see DataGeneration). Report keys include that
+generation along with the table fingerprints, so every worker process
+builds the same key for the same data, keys stay valid across restarts,
+and stale reports are never served even when table fingerprints do not
+move.
+
+Configuration (environment):
+    RENDER_CACHE_MAX_ENTRIES  - memory tier entry limit (default 128)
+    RENDER_CACHE_MAX_BYTES    - memory tier size limit (default 64 MiB)
+    RENDER_CACHE_DIR          - enables the disk tier in this directory
+    RENDER_CACHE_DISK_MAX_BYTES - disk tier size limit (default 256 MiB)
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from ..models.traceability import (
+    Capability,
+    Defect,
+    Epic,
+    EpicDependency,
+    Test,
+    UserStory,
+)
+from ..models.traceability.data_generation import (
+    advance_data_generation,
+    get_data_generation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Models whose rows feed the cached renders
+RENDERED_MODELS = (Epic, UserStory, Test, Defect, EpicDependency, Capability)
+_RENDERED_TABLES = frozenset(model.__tablename__ for model in RENDERED_MODELS)
+
+# DataGeneration scope advanced by changes to the rendered models
+GENERATION_SCOPE = "rendered"
+
+_PENDING_KEY = "render_cache_data_changed"
+
+
+def render_key(kind: str, version: str, *inputs: Any) -> str:
+    """Return the content address of a render from its inputs."""
+    digest = hashlib.sha256()
+    digest.update(f"{kind}\0{version}\0".encode())
+    digest.update(json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """LRU memory cache of rendered bodies with an optional disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key``, promoting disk hits to memory."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return body
+
+        body = self._read_disk(key)
+        with self._lock:
+            if body is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, body)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store ``body`` under ``key`` in memory and on disk."""
+        with self._lock:
+            self._store(key, body)
+        self._write_disk(key, body)
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> Tuple[bytes, bool]:
+        """Return ``(body, hit)``, rendering and storing the body on a miss."""
+        body = self.get(key)
+        if body is not None:
+            return body, True
+        body = render().encode("utf-8")
+        self.put(key, body)
+        return body, False
+
+    def tee(self, key: str, chunks: Iterable[str]) -> Iterator[bytes]:
+        """Yield encoded ``chunks`` and store the whole body once complete.
+
+        Chunks are only retained while the body still fits in the memory
+        tier, so streaming an oversized render keeps memory flat. Nothing
+        is stored if the consumer stops early.
+        """
+        parts: Optional[List[bytes]] = []
+        size = 0
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if parts is not None:
+                size += len(data)
+                if size > self.max_bytes:
+                    parts = None
+                else:
+                    parts.append(data)
+            yield data
+        if parts is not None:
+            self.put(key, b"".join(parts))
+
+    def invalidate(self) -> None:
+        """Drop all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        for path in self._disk_entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk": str(self.disk_dir) if self.disk_dir else None,
+            }
+
+    def _store(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = body
+        self._size += len(body)
+        while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    # -- disk tier ------------------------------------------------------
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.render"
+
+    def _disk_entries(self) -> Iterable[Path]:
+        if not self.disk_dir:
+            return []
+        return list(self.disk_dir.glob("*.render"))
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            body = path.read_bytes()
+            os.utime(path)
+            return body
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("Could not read render cache entry %s: %s", path, exc)
+            return None
+
+    def _write_disk(self, key: str, body: bytes) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+            self._trim_disk()
+        except OSError as exc:
+            logger.warning("Could not write render cache entry %s: %s", path, exc)
+            tmp.unlink(missing_ok=True)
+
+    def _trim_disk(self) -> None:
+        """Evict least recently used disk entries above the size limit."""
+        entries = []
+        total = 0
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+# -- data fingerprint and generation -----------------------------------------
+
+
+def data_generation(session: Session) -> Optional[int]:
+    """Committed generation of the rendered data, shared by all processes."""
+    return get_data_generation(session, GENERATION_SCOPE)
+
+
+def data_fingerprint(session: Session) -> list:
+    """Row count and last update of every rendered table, in one query."""
+    statement = union_all(
+        *(
+            select(
+                literal(model.__tablename__).label("table_name"),
+                func.count(model.id),
+                func.max(model.id),
+                func.max(model.updated_at),
+            )
+            for model in RENDERED_MODELS
+        )
+    )
+    return sorted(tuple(row) for row in session.execute(statement))
+
+
+def _mark_data_changed(session: Session) -> None:
+    """Advance the generation once per transaction, inside that transaction."""
+    if session.info.get(_PENDING_KEY):
+        return
+    session.info[_PENDING_KEY] = True
+    advance_data_generation(session, GENERATION_SCOPE)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_render_changes(session, flush_context):
+    if session.info.get(_PENDING_KEY):
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, RENDERED_MODELS):
+            _mark_data_changed(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_render_changes(orm_execute_state):
+    """Bulk INSERT / UPDATE / DELETE statements bypass flush events."""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in _RENDERED_TABLES:
+        _mark_data_changed(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _end_render_changes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_render_changes(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+
+
+# -- shared instance ---------------------------------------------------------
+
+_render_cache: Optional[RenderCache] = None
+_render_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """Return the process-wide render cache configured from the environment."""
+    global _render_cache
+    with _render_cache_lock:
+        if _render_cache is None:
+            _render_cache = RenderCache(
+                max_entries=int(os.getenv("RENDER_CACHE_MAX_ENTRIES", "128")),
+                max_bytes=int(os.getenv("RENDER_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+                disk_dir=os.getenv("RENDER_CACHE_DIR") or None,
+                disk_max_bytes=int(os.getenv("RENDER_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))),
+            )
+        return _render_cache
@@ -0,0 +1,175 @@
+"""
+RTM Aggregation Service
+
+SQL-side rollups for the RTM analytics endpoints. Counts and sums are computed
+by the database with GROUP BY / CASE expressions so that memory use and
+latency stay flat as the traceability tables grow, instead of loading every
+Epic, UserStory, Test and Defect row into Python.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from ..models.traceability import Defect, Epic, Test, UserStory
+
+COMPLETED_US_STATUSES = ("done", "completed")
+
+
+def _count_if(condition):
+    """Return a SUM(CASE WHEN condition THEN 1 ELSE 0 END) expression."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _percentage(part: float, whole: float) -> float:
+    """Return ``part`` as a percentage of ``whole`` (0 when whole is 0)."""
+    return (part / whole * 100) if whole > 0 else 0
+
+
+class RTMAggregator:
+    """Computes RTM analytics rollups with set-based SQL aggregates."""
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def overview(self) -> Dict:
+        """
+        Return the payload of ``/api/rtm/analytics/overview``.
+
+        Runs one aggregate query per entity table regardless of row count.
+        """
+        total_epics, completed_epics = self.db.query(func.count(Epic.id), _count_if(Epic.status == "completed")).one()
+
+        total_us, total_points, completed_points = self.db.query(
+            func.count(UserStory.id),
+            func.coalesce(func.sum(UserStory.story_points), 0),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (
+                            UserStory.implementation_status.in_(COMPLETED_US_STATUSES),
+                            UserStory.story_points,
+                        ),
+                        else_=0,
+                    )
+                ),
+                0,
+            ),
+        ).one()
+
+        total_tests, passed_tests = self.db.query(
+            func.count(Test.id), _count_if(Test.last_execution_status == "passed")
+        ).one()
+
+        total_defects, critical_defects, security_issues = self.db.query(
+            func.count(Defect.id),
+            _count_if(Defect.severity == "critical"),
+            _count_if(Defect.is_security_issue.is_(True)),
+        ).one()
+
+        return {
+            "summary": {
+                "epics": {
+                    "total": total_epics,
+                    "completed": completed_epics,
+                    "completion_rate": _percentage(completed_epics, total_epics),
+                },
+                "user_stories": {
+                    "total": total_us,
+                    "story_points": {
+                        "total": total_points,
+                        "completed": completed_points,
+                        "completion_rate": _percentage(completed_points, total_points),
+                    },
+                },
+                "tests": {
+                    "total": total_tests,
+                    "passed": passed_tests,
+                    "pass_rate": _percentage(passed_tests, total_tests),
+                },
+                "defects": {
+                    "total": total_defects,
+                    "critical": critical_defects,
+                    "security_issues": security_issues,
+                },
+            }
+        }
+
+    def component_statistics(self) -> Dict:
+        """
+        Return the payload of ``/api/rtm/components/statistics``.
+
+        Uses four grouped queries (one per entity table) in total instead of
+        several COUNT queries per component. Epic components are stored as
+        comma-separated strings and are matched by case-insensitive
+        substring, like the former ``LIKE '%component%'`` filter on SQLite,
+        but against the handful of distinct component strings rather than
+        every epic row.
+        """
+        epic_groups = self._grouped(Epic.component, func.count(Epic.id))
+        us_groups = self._grouped(UserStory.component, func.count(UserStory.id))
+        test_groups = self._grouped(
+            Test.component,
+            func.count(Test.id),
+            _count_if(Test.last_execution_status == "passed"),
+        )
+        defect_groups = self._grouped(
+            Defect.component,
+            func.count(Defect.id),
+            _count_if(Defect.severity == "critical"),
+        )
+
+        components = self._component_names(epic_groups, us_groups, test_groups, defect_groups)
+
+        stats = {}
+        for component in components:
+            epic_count = sum(
+                count for epic_component, (count,) in epic_groups.items() if component.lower() in epic_component.lower()
+            )
+            us_count = us_groups.get(component, (0,))[0]
+            test_count, passed_tests = test_groups.get(component, (0, 0))
+            defect_count, critical_defects = defect_groups.get(component, (0, 0))
+            pass_rate = _percentage(passed_tests, test_count)
+
+            stats[component] = {
+                "epic_count": epic_count,
+                "user_story_count": us_count,
+                "test_count": test_count,
+                "defect_count": defect_count,
+                "test_pass_rate": round(pass_rate, 2),
+                "critical_defects": critical_defects,
+                "total_items": (epic_count + us_count + test_count + defect_count),
+            }
+
+        return {
+            "components": stats,
+            "summary": {
+                "total_components": len(components),
+                "total_epics": sum(stat["epic_count"] for stat in stats.values()),
+                "total_user_stories": sum(stat["user_story_count"] for stat in stats.values()),
+                "total_tests": sum(stat["test_count"] for stat in stats.values()),
+                "total_defects": sum(stat["defect_count"] for stat in stats.values()),
+            },
+        }
+
+    def _grouped(self, column, *aggregates) -> Dict[str, Tuple]:
+        """Group non-null ``column`` values and return {value: aggregates}."""
+        rows = self.db.query(column, *aggregates).filter(column.isnot(None)).group_by(column).all()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    @staticmethod
+    def _component_names(epic_groups, *single_value_groups) -> List[str]:
+        """Return the sorted set of component names across all entities."""
+        names = set()
+        for epic_component in epic_groups:
+            if epic_component:
+                names.update(c.strip() for c in epic_component.split(","))
+        for groups in single_value_groups:
+            for component in groups:
+                if component:
+                    names.add(component.strip())
+        return sorted(names)
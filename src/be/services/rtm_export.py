@@ -0,0 +1,309 @@
+"""
+RTM Matrix Export
+
+Streams the full traceability matrix (epics, user stories, tests and
+defects) as downloadable files. Every sheet is a single column-only query
+read with ``yield_per``, so rows are fetched from a server-side cursor in
+fixed-size batches and no ORM objects are built.
+
+- CSV: the epics sheet as a single CSV file, with the columns the export
+  has always had, written to the response batch by batch.
+- CSV-ZIP: a ZIP archive with one CSV file per sheet, written to the
+  response as each batch of rows is compressed.
+- XLSX: one worksheet per sheet, written with openpyxl's write-only
+  workbook (rows go straight to temporary files) and then streamed from
+  disk in chunks. Requires the optional ``export`` extra.
+
+Memory stays bounded by one batch of rows whatever the size of the matrix.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import csv
+import io
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from ..models.traceability import Defect, Epic, Test, UserStory
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # pragma: no cover - exercised when openpyxl is absent
+    Workbook = None
+
+# Rows fetched from the cursor (and written out) per batch
+EXPORT_BATCH_SIZE = 1000
+
+# Size of the chunks a finished XLSX file is streamed in
+XLSX_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportSheet:
+    """One sheet (or CSV file) of the matrix export."""
+
+    name: str
+    headers: Tuple[str, ...]
+    statement: Callable[[], Any]
+
+
+def _not_demo(epic_id_column):
+    return ~epic_id_column.like("EP-DEMO-%")
+
+
+def _count_by(column, alias: str, value=None):
+    """Subquery of row counts (or sums of ``value``) grouped by ``column``."""
+    aggregate = func.count() if value is None else func.sum(value)
+    return select(column.label("key"), aggregate.label(alias)).where(column.isnot(None)).group_by(column).subquery()
+
+
+def _epics_statement():
+    stories = _count_by(UserStory.epic_id, "user_stories")
+    points = _count_by(UserStory.epic_id, "story_points", UserStory.story_points)
+    tests = _count_by(Test.epic_id, "tests")
+    defects = _count_by(Defect.epic_id, "defects")
+    return (
+        select(
+            Epic.epic_id,
+            Epic.title,
+            Epic.status,
+            func.coalesce(stories.c.user_stories, 0),
+            func.coalesce(points.c.story_points, 0),
+            func.coalesce(tests.c.tests, 0),
+            func.coalesce(defects.c.defects, 0),
+        )
+        .outerjoin(stories, stories.c.key == Epic.id)
+        .outerjoin(points, points.c.key == Epic.id)
+        .outerjoin(tests, tests.c.key == Epic.id)
+        .outerjoin(defects, defects.c.key == Epic.id)
+        .where(_not_demo(Epic.epic_id))
+        .order_by(Epic.epic_id)
+    )
+
+
+def _user_stories_statement():
+    return (
+        select(
+            UserStory.user_story_id,
+            Epic.epic_id,
+            UserStory.github_issue_number,
+            UserStory.title,
+            UserStory.github_issue_state,
+            UserStory.implementation_status,
+            UserStory.story_points,
+            UserStory.priority,
+            UserStory.component,
+            UserStory.sprint,
+        )
+        .join(Epic, Epic.id == UserStory.epic_id)
+        .where(_not_demo(Epic.epic_id))
+        .order_by(UserStory.id)
+    )
+
+
+def _tests_statement():
+    return (
+        select(
+            Test.id,
+            Epic.epic_id,
+            Test.github_user_story_number,
+            Test.test_type,
+            Test.test_file_path,
+            Test.test_function_name,
+            Test.title,
+            Test.last_execution_status,
+            Test.last_execution_time,
+            Test.component,
+        )
+        .outerjoin(Epic, Epic.id == Test.epic_id)
+        .where(or_(Epic.epic_id.is_(None), _not_demo(Epic.epic_id)))
+        .order_by(Test.id)
+    )
+
+
+def _defects_statement():
+    return (
+        select(
+            Defect.defect_id,
+            Epic.epic_id,
+            Defect.github_issue_number,
+            Defect.github_user_story_number,
+            Defect.title,
+            Defect.status,
+            Defect.severity,
+            Defect.priority,
+            Defect.component,
+        )
+        .outerjoin(Epic, Epic.id == Defect.epic_id)
+        .where(or_(Epic.epic_id.is_(None), _not_demo(Epic.epic_id)))
+        .order_by(Defect.id)
+    )
+
+
+MATRIX_SHEETS: Tuple[ExportSheet, ...] = (
+    ExportSheet(
+        "epics",
+        (
+            "Epic ID",
+            "Epic Title",
+            "Status",
+            "User Stories",
+            "Story Points",
+            "Tests",
+            "Defects",
+        ),
+        _epics_statement,
+    ),
+    ExportSheet(
+        "user_stories",
+        (
+            "User Story ID",
+            "Epic ID",
+            "GitHub Issue",
+            "Title",
+            "GitHub State",
+            "Implementation Status",
+            "Story Points",
+            "Priority",
+            "Component",
+            "Sprint",
+        ),
+        _user_stories_statement,
+    ),
+    ExportSheet(
+        "tests",
+        (
+            "Test ID",
+            "Epic ID",
+            "User Story Issue",
+            "Test Type",
+            "File Path",
+            "Function",
+            "Title",
+            "Last Status",
+            "Last Executed",
+            "Component",
+        ),
+        _tests_statement,
+    ),
+    ExportSheet(
+        "defects",
+        (
+            "Defect ID",
+            "Epic ID",
+            "GitHub Issue",
+            "User Story Issue",
+            "Title",
+            "Status",
+            "Severity",
+            "Priority",
+            "Component",
+        ),
+        _defects_statement,
+    ),
+)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink that collects what ZipFile writes."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class RTMMatrixExporter:
+    """Stream the full RTM matrix as CSV, a CSV archive or an XLSX workbook."""
+
+    def __init__(
+        self,
+        db_session: Session,
+        sheets: Sequence[ExportSheet] = MATRIX_SHEETS,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        self.db = db_session
+        self.sheets = sheets
+        self.batch_size = batch_size
+
+    def iter_batches(self, sheet: ExportSheet) -> Iterator[Sequence[tuple]]:
+        """Yield the rows of ``sheet`` in batches read from a streaming cursor."""
+        result = self.db.execute(sheet.statement().execution_options(yield_per=self.batch_size))
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
+    def iter_csv_rows(self, sheet: ExportSheet) -> Iterator[bytes]:
+        """Yield ``sheet`` as UTF-8 CSV, one chunk per batch of rows."""
+        text = io.StringIO()
+        writer = csv.writer(text)
+        writer.writerow(sheet.headers)
+        for rows in self.iter_batches(sheet):
+            writer.writerows(rows)
+            yield text.getvalue().encode("utf-8")
+            text.seek(0)
+            text.truncate()
+        if text.tell():
+            yield text.getvalue().encode("utf-8")
+
+    def iter_csv(self) -> Iterator[bytes]:
+        """Yield the first sheet (epics) as a single CSV file."""
+        return self.iter_csv_rows(self.sheets[0])
+
+    def iter_csv_zip(self) -> Iterator[bytes]:
+        """Yield a ZIP archive holding one CSV file per sheet."""
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for sheet in self.sheets:
+                with archive.open(f"{sheet.name}.csv", "w", force_zip64=True) as entry:
+                    for chunk in self.iter_csv_rows(sheet):
+                        entry.write(chunk)
+                        if sink.chunks:
+                            yield sink.drain()
+        yield sink.drain()
+
+    def iter_xlsx(self) -> Iterator[bytes]:
+        """Yield an XLSX workbook with one worksheet per sheet.
+
+        Raises RuntimeError immediately (not on first iteration) when
+        openpyxl is not installed.
+        """
+        if Workbook is None:
+            raise RuntimeError("XLSX export requires openpyxl (pip install 'gonogo[export]')")
+        return self._iter_xlsx()
+
+    def _iter_xlsx(self) -> Iterator[bytes]:
+        workbook = Workbook(write_only=True)
+        for sheet in self.sheets:
+            worksheet = workbook.create_sheet(title=sheet.name)
+            worksheet.append(sheet.headers)
+            for rows in self.iter_batches(sheet):
+                for row in rows:
+                    worksheet.append(tuple(row))
+
+        with tempfile.TemporaryFile(suffix=".xlsx") as output:
+            workbook.save(output)
+            output.seek(0)
+            while True:
+                chunk = output.read(XLSX_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
@@ -0,0 +1,121 @@
+"""
+RTM Matrix Loader
+
+Set-based loading of Epic children (user stories, tests, defects) for RTM
+reports. Replaces the per-epic child queries of the report generator with a
+fixed number of IN-list queries whose rows are grouped in memory, so the
+query count no longer grows with the number of epics in the matrix.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..models.traceability import Defect, Epic, EpicDependency, Test, UserStory
+
+# Maximum number of keys bound into a single IN (...) clause. Keeps large
+# matrices below SQLite's host parameter limit while staying one query per
+# few hundred epics.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+@dataclass
+class EpicChildren:
+    """Children of a single Epic as loaded by RTMMatrixLoader."""
+
+    user_stories: List[UserStory] = field(default_factory=list)
+    tests: List[Test] = field(default_factory=list)
+    defects: List[Defect] = field(default_factory=list)
+
+
+def epic_eager_options() -> list:
+    """Loader options that pre-fetch the relationships Epic.to_dict() reads.
+
+    Dependencies (and the epics on both sides of them) and the capability are
+    fetched with one SELECT ... IN query each instead of one lazy load per
+    epic.
+    """
+    return [
+        selectinload(Epic.dependencies_as_parent).selectinload(EpicDependency.dependent_epic),
+        selectinload(Epic.dependencies_as_dependent),
+        selectinload(Epic.capability),
+    ]
+
+
+class RTMMatrixLoader:
+    """Bulk loader that fetches all children of a set of epics at once."""
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def load(self, epics: Sequence[Epic], include_story_links: bool = True) -> Dict[int, EpicChildren]:
+        """
+        Load user stories, tests and defects for every epic in ``epics``.
+
+        Args:
+            epics: Epics whose children should be loaded
+            include_story_links: Also pre-load the tests/defects linked to
+                each user story through its GitHub issue number, which
+                ``UserStory.to_dict()`` reads
+
+        Returns:
+            Mapping of ``Epic.id`` to its EpicChildren. The loaded lists are
+            also attached to the epics' ``user_stories``, ``tests`` and
+            ``defects`` collections so later attribute access does not hit
+            the database again.
+        """
+        children = {epic.id: EpicChildren() for epic in epics}
+        if not children:
+            return children
+
+        epic_ids = list(children)
+        for user_story in self._fetch_in_chunks(UserStory, UserStory.epic_id, epic_ids):
+            children[user_story.epic_id].user_stories.append(user_story)
+        for test in self._fetch_in_chunks(Test, Test.epic_id, epic_ids):
+            children[test.epic_id].tests.append(test)
+        for defect in self._fetch_in_chunks(Defect, Defect.epic_id, epic_ids):
+            children[defect.epic_id].defects.append(defect)
+
+        for epic in epics:
+            loaded = children[epic.id]
+            set_committed_value(epic, "user_stories", loaded.user_stories)
+            set_committed_value(epic, "tests", loaded.tests)
+            set_committed_value(epic, "defects", loaded.defects)
+
+        if include_story_links:
+            self._attach_story_links(user_story for loaded in children.values() for user_story in loaded.user_stories)
+
+        return children
+
+    def _attach_story_links(self, user_stories: Iterable[UserStory]) -> None:
+        """Populate UserStory.tests/defects from two set-based queries."""
+        stories_by_issue = {us.github_issue_number: us for us in user_stories}
+        if not stories_by_issue:
+            return
+
+        issue_numbers = list(stories_by_issue)
+        tests_by_issue = defaultdict(list)
+        for test in self._fetch_in_chunks(Test, Test.github_user_story_number, issue_numbers):
+            tests_by_issue[test.github_user_story_number].append(test)
+
+        defects_by_issue = defaultdict(list)
+        for defect in self._fetch_in_chunks(Defect, Defect.github_user_story_number, issue_numbers):
+            defects_by_issue[defect.github_user_story_number].append(defect)
+
+        for issue_number, user_story in stories_by_issue.items():
+            set_committed_value(user_story, "tests", tests_by_issue[issue_number])
+            set_committed_value(user_story, "defects", defects_by_issue[issue_number])
+
+    def _fetch_in_chunks(self, model, column, keys: List[int]) -> list:
+        """Return all ``model`` rows whose ``column`` is in ``keys``."""
+        rows = []
+        for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+            chunk = keys[start : start + IN_CLAUSE_CHUNK_SIZE]
+            rows.extend(self.db.query(model).filter(column.in_(chunk)).order_by(model.id).all())
+        return rows
@@ -9,15 +9,45 @@ Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 """
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..database import get_db_session
 from ..models.traceability import Defect, Epic, Test, UserStory
+from ..models.traceability.base import insert_values
+from ..models.traceability.epic_metric_dirty import mark_epic_metrics_dirty
+from ..models.traceability.metric_change_tracking import CHILD_METRIC_FAMILIES
+
+
+@dataclass
+class RTMIndex:
+    """Line index of an RTM document, built in one pass by tokenize().
+
+    Each entity map is keyed by ID in order of first appearance and points
+    at the first line mentioning it; every later mention is a duplicate.
+    """
+
+    lines: List[str]
+    epics: Dict[str, int] = field(default_factory=dict)
+    # user story ID -> (first line, parent epic ID)
+    user_stories: Dict[str, Tuple[int, Optional[str]]] = field(default_factory=dict)
+    defects: Dict[str, int] = field(default_factory=dict)
+    # test path -> (full path, every line the path appears on)
+    tests: Dict[str, Tuple[str, List[int]]] = field(default_factory=dict)
 
 
 class RTMMarkdownParser:
-    """Parser for converting RTM markdown files to database entities."""
+    """Parser for converting RTM markdown files to database entities.
+
+    The document is tokenized once into an RTMIndex (ID -> line, section
+    hierarchy) and every entity type is extracted from that index, so
+    parsing is linear in the size of the file.
+    """
 
     def __init__(self):
         self.epic_pattern = r"(EP-\d{5})"
@@ -25,6 +55,14 @@ class RTMMarkdownParser:
         self.defect_pattern = r"(DEF-\d{5})"
         self.test_pattern = r"test[_\s]+([a-zA-Z0-9_]+)"
         self.github_issue_pattern = r"#(\d+)"
+        self.test_file_pattern = r"tests?[/\\]([a-zA-Z0-9_/\\]+\.py)"
+
+        self._epic_re = re.compile(self.epic_pattern)
+        self._user_story_re = re.compile(self.user_story_pattern)
+        self._defect_re = re.compile(self.defect_pattern)
+        self._test_re = re.compile(self.test_pattern)
+        self._github_issue_re = re.compile(self.github_issue_pattern)
+        self._test_file_re = re.compile(self.test_file_pattern)
 
     def parse_rtm_file(self, file_path: str) -> Dict[str, List[Dict]]:
         """
@@ -36,110 +74,118 @@ class RTMMarkdownParser:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
+        return self.parse_content(content)
+
+    def parse_content(self, content: str) -> Dict[str, List[Dict]]:
+        """Extract entities from RTM markdown content; each ID appears once."""
+        index = self.tokenize(content)
         return {
-            "epics": self._extract_epics(content),
-            "user_stories": self._extract_user_stories(content),
-            "defects": self._extract_defects(content),
-            "tests": self._extract_tests(content),
+            "epics": self._extract_epics(index),
+            "user_stories": self._extract_user_stories(index),
+            "defects": self._extract_defects(index),
+            "tests": self._extract_tests(index),
         }
 
-    def _extract_epics(self, content: str) -> List[Dict]:
-        """Extract Epic information from markdown content."""
+    def tokenize(self, content: str) -> RTMIndex:
+        """Index entity IDs, parent epics and test paths in a single pass."""
+        index = RTMIndex(lines=content.split("\n"))
+        current_epic = None
+
+        for i, line in enumerate(index.lines):
+            epic_ids = self._epic_re.findall(line) if "EP-" in line else []
+            for epic_id in epic_ids:
+                index.epics.setdefault(epic_id, i)
+
+            if "US-" in line:
+                # Parent is the first epic on this line, else the latest above
+                parent = epic_ids[0] if epic_ids else current_epic
+                for us_id in self._user_story_re.findall(line):
+                    index.user_stories.setdefault(us_id, (i, parent))
+
+            if "DEF-" in line:
+                for def_id in self._defect_re.findall(line):
+                    index.defects.setdefault(def_id, i)
+
+            if ".py" in line:
+                for match in self._test_file_re.finditer(line):
+                    test_path = match.group(0)
+                    entry = index.tests.setdefault(test_path, (match.group(1), []))
+                    if not entry[1] or entry[1][-1] != i:
+                        entry[1].append(i)
+
+            if epic_ids:
+                current_epic = epic_ids[0]
+
+        return index
+
+    def _extract_epics(self, index: RTMIndex) -> List[Dict]:
+        """Extract Epic information from the document index."""
+        lines = index.lines
         epics = []
-        epic_matches = re.finditer(self.epic_pattern, content)
-
-        for match in epic_matches:
-            epic_id = match.group(1)
-            # Find the line containing this epic
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                if epic_id in line:
-                    title = self._extract_title_from_line(line, epic_id)
-                    description = self._extract_description(lines, i)
-
-                    epic_data = {
-                        "epic_id": epic_id,
-                        "title": title or f"Epic {epic_id}",
-                        "description": description,
-                        "status": self._extract_status_from_context(lines, i),
-                        "priority": self._extract_priority_from_context(lines, i),
-                        "business_value": self._extract_business_value(lines, i),
-                    }
-                    epics.append(epic_data)
-                    break
-
+        for epic_id, i in index.epics.items():
+            title = self._extract_title_from_line(lines[i], epic_id)
+            epics.append(
+                {
+                    "epic_id": epic_id,
+                    "title": title or f"Epic {epic_id}",
+                    "description": self._extract_description(lines, i),
+                    "status": self._extract_status_from_context(lines, i),
+                    "priority": self._extract_priority_from_context(lines, i),
+                    "business_value": self._extract_business_value(lines, i),
+                }
+            )
         return epics
 
-    def _extract_user_stories(self, content: str) -> List[Dict]:
-        """Extract User Story information from markdown content."""
+    def _extract_user_stories(self, index: RTMIndex) -> List[Dict]:
+        """Extract User Story information from the document index."""
+        lines = index.lines
         user_stories = []
-        us_matches = re.finditer(self.user_story_pattern, content)
-
-        for match in us_matches:
-            us_id = match.group(1)
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                if us_id in line:
-                    title = self._extract_title_from_line(line, us_id)
-                    github_issue = self._extract_github_issue_from_context(lines, i)
-                    epic_id = self._find_parent_epic(lines, i)
-
-                    us_data = {
-                        "user_story_id": us_id,
-                        "title": title or f"User Story {us_id}",
-                        "description": self._extract_description(lines, i),
-                        "github_issue_number": github_issue,
-                        "epic_reference": epic_id,  # Will be resolved to DB ID later
-                        "story_points": self._extract_story_points(lines, i),
-                        "priority": self._extract_priority_from_context(lines, i),
-                        "implementation_status": self._extract_implementation_status(
-                            lines, i
-                        ),
-                    }
-                    user_stories.append(us_data)
-                    break
-
+        for us_id, (i, epic_id) in index.user_stories.items():
+            title = self._extract_title_from_line(lines[i], us_id)
+            user_stories.append(
+                {
+                    "user_story_id": us_id,
+                    "title": title or f"User Story {us_id}",
+                    "description": self._extract_description(lines, i),
+                    "github_issue_number": self._extract_github_issue_from_context(
+                        lines, i
+                    ),
+                    "epic_reference": epic_id,  # Will be resolved to DB ID later
+                    "story_points": self._extract_story_points(lines, i),
+                    "priority": self._extract_priority_from_context(lines, i),
+                    "implementation_status": self._extract_implementation_status(
+                        lines, i
+                    ),
+                }
+            )
         return user_stories
 
-    def _extract_defects(self, content: str) -> List[Dict]:
-        """Extract Defect information from markdown content."""
+    def _extract_defects(self, index: RTMIndex) -> List[Dict]:
+        """Extract Defect information from the document index."""
+        lines = index.lines
         defects = []
-        def_matches = re.finditer(self.defect_pattern, content)
-
-        for match in def_matches:
-            def_id = match.group(1)
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                if def_id in line:
-                    title = self._extract_title_from_line(line, def_id)
-                    github_issue = self._extract_github_issue_from_context(lines, i)
-
-                    def_data = {
-                        "defect_id": def_id,
-                        "title": title or f"Defect {def_id}",
-                        "description": self._extract_description(lines, i),
-                        "github_issue_number": github_issue,
-                        "severity": self._extract_severity(lines, i),
-                        "priority": self._extract_priority_from_context(lines, i),
-                        "status": self._extract_status_from_context(lines, i),
-                        "defect_type": self._extract_defect_type(lines, i),
-                    }
-                    defects.append(def_data)
-                    break
-
+        for def_id, i in index.defects.items():
+            title = self._extract_title_from_line(lines[i], def_id)
+            defects.append(
+                {
+                    "defect_id": def_id,
+                    "title": title or f"Defect {def_id}",
+                    "description": self._extract_description(lines, i),
+                    "github_issue_number": self._extract_github_issue_from_context(
+                        lines, i
+                    ),
+                    "severity": self._extract_severity(lines, i),
+                    "priority": self._extract_priority_from_context(lines, i),
+                    "status": self._extract_status_from_context(lines, i),
+                    "defect_type": self._extract_defect_type(lines, i),
+                }
+            )
         return defects
 
-    def _extract_tests(self, content: str) -> List[Dict]:
-        """Extract Test information from markdown content."""
+    def _extract_tests(self, index: RTMIndex) -> List[Dict]:
+        """Extract Test information from the document index."""
         tests = []
-        # Look for test file patterns and test function patterns
-        test_file_pattern = r"tests?[/\\]([a-zA-Z0-9_/\\]+\.py)"
-        test_files = re.finditer(test_file_pattern, content)
-
-        for match in test_files:
-            test_path = match.group(0)
-            full_path = match.group(1)
-
+        for test_path, (full_path, line_numbers) in index.tests.items():
             # Extract test type from path
             test_type = "unit"
             if "integration" in test_path.lower():
@@ -151,17 +197,17 @@ class RTMMarkdownParser:
             elif "bdd" in test_path.lower() or "feature" in test_path.lower():
                 test_type = "bdd"
 
-            test_data = {
-                "test_type": test_type,
-                "test_file_path": test_path,
-                "title": f"Test: {Path(full_path).stem}",
-                "description": f"Test file: {test_path}",
-                "test_function_name": self._extract_test_function_from_context(
-                    content, test_path
-                ),
-            }
-            tests.append(test_data)
-
+            tests.append(
+                {
+                    "test_type": test_type,
+                    "test_file_path": test_path,
+                    "title": f"Test: {Path(full_path).stem}",
+                    "description": f"Test file: {test_path}",
+                    "test_function_name": self._extract_test_function_from_context(
+                        index.lines, line_numbers
+                    ),
+                }
+            )
         return tests
 
     def _extract_title_from_line(self, line: str, entity_id: str) -> Optional[str]:
@@ -193,19 +239,11 @@ class RTMMarkdownParser:
     ) -> Optional[int]:
         """Extract GitHub issue number from surrounding context."""
         for i in range(max(0, start_index - 2), min(start_index + 3, len(lines))):
-            github_match = re.search(self.github_issue_pattern, lines[i])
+            github_match = self._github_issue_re.search(lines[i])
             if github_match:
                 return int(github_match.group(1))
         return None
 
-    def _find_parent_epic(self, lines: List[str], start_index: int) -> Optional[str]:
-        """Find the parent Epic by looking backwards in the file."""
-        for i in range(start_index, -1, -1):
-            epic_match = re.search(self.epic_pattern, lines[i])
-            if epic_match:
-                return epic_match.group(1)
-        return None
-
     def _extract_status_from_context(self, lines: List[str], start_index: int) -> str:
         """Extract status from context."""
         context = " ".join(lines[max(0, start_index - 1) : start_index + 3]).lower()
@@ -289,27 +327,40 @@ class RTMMarkdownParser:
             return "bug"
 
     def _extract_test_function_from_context(
-        self, content: str, test_path: str
+        self, lines: List[str], line_numbers: List[int]
     ) -> Optional[str]:
-        """Extract test function name from context."""
-        # Find lines near the test path
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if test_path in line:
-                # Look for test function patterns in nearby lines
-                for j in range(max(0, i - 2), min(i + 3, len(lines))):
-                    func_match = re.search(r"test[_\s]+([a-zA-Z0-9_]+)", lines[j])
-                    if func_match:
-                        return func_match.group(1)
+        """Extract test function name from lines near the test path."""
+        for i in line_numbers:
+            # Look for test function patterns in nearby lines
+            for j in range(max(0, i - 2), min(i + 3, len(lines))):
+                func_match = self._test_re.search(lines[j])
+                if func_match:
+                    return func_match.group(1)
         return None
 
 
-class RTMDataMigrator:
-    """Migrates parsed RTM data to the database."""
+# Called as progress_callback(entity type, rows processed, total rows)
+ProgressCallback = Callable[[str, int, int], None]
 
-    def __init__(self):
+
+class RTMDataMigrator:
+    """Migrates parsed RTM data to the database.
+
+    Existing keys are prefetched with one query per entity type, new rows
+    are inserted in chunks of ``chunk_size`` with executemany (``ON CONFLICT
+    DO NOTHING`` on SQLite and PostgreSQL) and each chunk is committed, so
+    re-importing a large RTM costs a handful of statements per chunk.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
         self.parser = RTMMarkdownParser()
         self.epic_id_mapping = {}  # Maps epic_id strings to database IDs
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
 
     def migrate_from_file(self, file_path: str) -> Dict[str, int]:
         """
@@ -345,117 +396,158 @@ class RTMDataMigrator:
 
     def _migrate_epics(self, db, epic_data: List[Dict]) -> int:
         """Migrate Epic data to database."""
-        count = 0
-        for data in epic_data:
-            # Check if epic already exists
-            existing = db.query(Epic).filter(Epic.epic_id == data["epic_id"]).first()
-            if existing:
-                continue
+        # Existing epics resolve user story references too
+        self.epic_id_mapping.update(db.execute(select(Epic.epic_id, Epic.id)).all())
 
-            epic = Epic(
-                epic_id=data["epic_id"],
-                title=data["title"],
-                description=data.get("description"),
-                business_value=data.get("business_value"),
-                status=data.get("status", "planned"),
-                priority=data.get("priority", "medium"),
+        rows = [
+            insert_values(
+                Epic(
+                    epic_id=data["epic_id"],
+                    title=data["title"],
+                    description=data.get("description"),
+                    business_value=data.get("business_value"),
+                    status=data.get("status", "planned"),
+                    priority=data.get("priority", "medium"),
+                )
             )
-            db.add(epic)
-            db.flush()  # Get the ID without committing
-            self.epic_id_mapping[data["epic_id"]] = epic.id
-            count += 1
-
-        return count
+            for data in epic_data
+            if data["epic_id"] not in self.epic_id_mapping
+        ]
+        return self._bulk_insert(db, Epic, "epics", rows, returning=Epic.epic_id)
 
     def _migrate_user_stories(self, db, us_data: List[Dict]) -> int:
         """Migrate User Story data to database."""
-        count = 0
+        existing = set(db.scalars(select(UserStory.user_story_id)))
+        issues = set(db.scalars(select(UserStory.github_issue_number)))
+
+        rows = []
         for data in us_data:
             # Skip if no GitHub issue number
             if not data.get("github_issue_number"):
                 continue
-
-            # Check if user story already exists
-            existing = (
-                db.query(UserStory)
-                .filter(UserStory.user_story_id == data["user_story_id"])
-                .first()
-            )
-            if existing:
+            if (
+                data["user_story_id"] in existing
+                or data["github_issue_number"] in issues
+            ):
                 continue
 
-            # Resolve epic reference
-            epic_db_id = None
-            if data.get("epic_reference"):
-                epic_db_id = self.epic_id_mapping.get(data["epic_reference"])
+            # Only create if we have a valid epic reference
+            epic_db_id = self.epic_id_mapping.get(data.get("epic_reference"))
+            if not epic_db_id:
+                continue
 
-            if epic_db_id:  # Only create if we have a valid epic reference
-                us = UserStory(
-                    user_story_id=data["user_story_id"],
-                    epic_id=epic_db_id,
-                    github_issue_number=data["github_issue_number"],
-                    title=data["title"],
-                    description=data.get("description"),
-                    story_points=data.get("story_points", 0),
-                    priority=data.get("priority", "medium"),
-                    implementation_status=data.get("implementation_status", "todo"),
+            issues.add(data["github_issue_number"])
+            rows.append(
+                insert_values(
+                    UserStory(
+                        user_story_id=data["user_story_id"],
+                        epic_id=epic_db_id,
+                        github_issue_number=data["github_issue_number"],
+                        title=data["title"],
+                        description=data.get("description"),
+                        story_points=data.get("story_points", 0),
+                        priority=data.get("priority", "medium"),
+                        implementation_status=data.get(
+                            "implementation_status", "todo"
+                        ),
+                    )
                 )
-                db.add(us)
-                count += 1
+            )
 
+        count = self._bulk_insert(db, UserStory, "user_stories", rows)
+        # Core inserts bypass the flush hook that marks epic metrics stale
+        marks = {row["epic_id"]: CHILD_METRIC_FAMILIES[UserStory] for row in rows}
+        if marks:
+            mark_epic_metrics_dirty(db, marks)
         return count
 
     def _migrate_tests(self, db, test_data: List[Dict]) -> int:
         """Migrate Test data to database."""
-        count = 0
+        existing = set(db.scalars(select(Test.test_file_path)))
+
+        rows = []
         for data in test_data:
-            # Check if test already exists
-            existing = (
-                db.query(Test)
-                .filter(Test.test_file_path == data["test_file_path"])
-                .first()
-            )
-            if existing:
+            if data["test_file_path"] in existing:
                 continue
-
-            test = Test(
-                test_type=data["test_type"],
-                test_file_path=data["test_file_path"],
-                title=data["title"],
-                description=data.get("description"),
-                test_function_name=data.get("test_function_name"),
+            existing.add(data["test_file_path"])
+            rows.append(
+                insert_values(
+                    Test(
+                        test_type=data["test_type"],
+                        test_file_path=data["test_file_path"],
+                        title=data["title"],
+                        description=data.get("description"),
+                        test_function_name=data.get("test_function_name"),
+                    )
+                )
             )
-            db.add(test)
-            count += 1
-
-        return count
+        return self._bulk_insert(db, Test, "tests", rows)
 
     def _migrate_defects(self, db, defect_data: List[Dict]) -> int:
         """Migrate Defect data to database."""
-        count = 0
+        existing = set(db.scalars(select(Defect.defect_id)))
+        issues = set(db.scalars(select(Defect.github_issue_number)))
+
+        rows = []
         for data in defect_data:
             # Skip if no GitHub issue number
             if not data.get("github_issue_number"):
                 continue
-
-            # Check if defect already exists
-            existing = (
-                db.query(Defect).filter(Defect.defect_id == data["defect_id"]).first()
-            )
-            if existing:
+            if data["defect_id"] in existing or data["github_issue_number"] in issues:
                 continue
 
-            defect = Defect(
-                defect_id=data["defect_id"],
-                github_issue_number=data["github_issue_number"],
-                title=data["title"],
-                description=data.get("description"),
-                severity=data.get("severity", "medium"),
-                priority=data.get("priority", "medium"),
-                status=data.get("status", "planned"),
-                defect_type=data.get("defect_type", "bug"),
+            issues.add(data["github_issue_number"])
+            rows.append(
+                insert_values(
+                    Defect(
+                        defect_id=data["defect_id"],
+                        github_issue_number=data["github_issue_number"],
+                        title=data["title"],
+                        description=data.get("description"),
+                        severity=data.get("severity", "medium"),
+                        priority=data.get("priority", "medium"),
+                        status=data.get("status", "planned"),
+                        defect_type=data.get("defect_type", "bug"),
+                    )
+                )
             )
-            db.add(defect)
-            count += 1
+        return self._bulk_insert(db, Defect, "defects", rows)
 
-        return count
+    def _bulk_insert(
+        self, db, model, entity: str, rows: List[Dict], returning=None
+    ) -> int:
+        """Insert ``rows`` chunk by chunk, committing after each chunk.
+
+        With ``returning`` (a unique key column) the new database IDs are
+        recorded in ``epic_id_mapping`` keyed by that column.
+        """
+        dialect = db.get_bind().dialect
+        if dialect.name == "sqlite":
+            statement = sqlite_insert(model).on_conflict_do_nothing()
+        elif dialect.name == "postgresql":
+            statement = postgresql_insert(model).on_conflict_do_nothing()
+        else:
+            # Rows were filtered against the prefetched keys
+            statement = insert(model)
+        # Without render_nulls a None value would start a new executemany batch
+        statement = statement.execution_options(render_nulls=True)
+
+        inserted = 0
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start : start + self.chunk_size]
+            if returning is None:
+                db.execute(statement, chunk)
+            elif dialect.insert_executemany_returning:
+                result = db.execute(statement.returning(returning, model.id), chunk)
+                self.epic_id_mapping.update(result.all())
+            else:
+                db.execute(statement, chunk)
+                keys = [row[returning.key] for row in chunk]
+                self.epic_id_mapping.update(
+                    db.execute(select(returning, model.id).where(returning.in_(keys)))
+                )
+            db.commit()
+            inserted += len(chunk)
+            if self.progress_callback:
+                self.progress_callback(entity, inserted, len(rows))
+        return inserted
@@ -0,0 +1,167 @@
+"""
+RTM List Projections
+
+Serializes pages of Epics and User Stories without touching their
+relationships. The counts, dependency flags and capability fields that
+``to_dict()`` would lazy-load per row are selected by the list query itself,
+the aggregates as correlated subqueries over indexed foreign keys. They are
+evaluated only for the rows of the page being read, so a page costs the same
+whatever the size of the child tables, and a page of any size is serialized
+in a fixed number of queries: one for the rows and, for epics, one for
+inherited components.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Query, Session
+
+from ..models.traceability import (
+    Capability,
+    Defect,
+    Epic,
+    EpicDependency,
+    Test,
+    UserStory,
+)
+from ..models.traceability.epic_dependency import DependencyType
+from .rtm_matrix_loader import IN_CLAUSE_CHUNK_SIZE
+
+
+def _count_of(column, key):
+    """Correlated count of the rows whose ``column`` equals ``key``."""
+    return select(func.count()).where(column == key).scalar_subquery()
+
+
+def _sum_if(condition, value=1):
+    return func.coalesce(func.sum(case((condition, value), else_=0)), 0)
+
+
+class EpicProjection:
+    """Epic list query with the aggregates Epic.to_dict() needs."""
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def query(self) -> Query:
+        """Return a query of ``(Epic, *aggregates)`` rows.
+
+        Filter on Epic columns, paginate, and pass the result to
+        serialize().
+        """
+        blocking = and_(
+            EpicDependency.dependency_type == DependencyType.BLOCKING.value,
+            EpicDependency.is_active.is_(True),
+            EpicDependency.is_resolved.is_(False),
+        )
+
+        def blocked_by(condition, value=1):
+            return (
+                select(_sum_if(condition, value)).where(EpicDependency.dependent_epic_id == Epic.id).scalar_subquery()
+            )
+
+        return self.db.query(
+            Epic,
+            _count_of(Test.epic_id, Epic.id),
+            _count_of(UserStory.epic_id, Epic.id),
+            _count_of(Defect.epic_id, Epic.id),
+            blocked_by(blocking),
+            blocked_by(and_(blocking, EpicDependency.priority == "critical")),
+            blocked_by(and_(blocking, EpicDependency.priority == "high")),
+            blocked_by(
+                EpicDependency.estimated_impact_days > 5,
+                EpicDependency.estimated_impact_days,
+            ),
+            select(_sum_if(blocking)).where(EpicDependency.parent_epic_id == Epic.id).scalar_subquery(),
+            Capability.name,
+            Capability.capability_id,
+            Capability.strategic_priority,
+        ).outerjoin(Capability, Capability.id == Epic.capability_id)
+
+    def serialize(self, rows: Sequence[tuple]) -> List[Dict[str, Any]]:
+        """Serialize rows returned by query() into Epic.to_dict() output."""
+        components = self._inherited_components([row[0].id for row in rows])
+        return [row[0].to_dict(related=self._related(row, components[row[0].id])) for row in rows]
+
+    @staticmethod
+    def _related(row: tuple, inherited_components: List[str]) -> Dict[str, Any]:
+        (
+            _,
+            test_count,
+            user_story_count,
+            defect_count,
+            blocking_count,
+            critical_count,
+            high_count,
+            impact_days,
+            blocked_epics_count,
+            capability_name,
+            capability_capability_id,
+            capability_strategic_priority,
+        ) = row
+        # Same weights as Epic.get_dependency_risk_score()
+        risk_score = blocking_count * 5 + critical_count * 10 + high_count * 5 + impact_days
+        return {
+            "inherited_components": inherited_components,
+            "test_count": test_count,
+            "user_story_count": user_story_count,
+            "defect_count": defect_count,
+            "is_blocked": blocking_count > 0,
+            "can_start": blocking_count == 0,
+            "dependency_risk_score": risk_score,
+            "blocking_dependencies_count": blocking_count,
+            "blocked_epics_count": blocked_epics_count,
+            "capability_name": capability_name,
+            "capability_capability_id": capability_capability_id,
+            "capability_strategic_priority": capability_strategic_priority,
+        }
+
+    def _inherited_components(self, epic_ids: Iterable[int]) -> Dict[int, List[str]]:
+        """Distinct user story components per epic, sorted."""
+        epic_ids = list(epic_ids)
+        components = defaultdict(set)
+        for start in range(0, len(epic_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = epic_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+            for epic_id, component in (
+                self.db.query(UserStory.epic_id, UserStory.component)
+                .filter(UserStory.epic_id.in_(chunk), UserStory.component.isnot(None))
+                .distinct()
+            ):
+                if component:
+                    components[epic_id].add(component)
+        return {epic_id: sorted(components[epic_id]) for epic_id in epic_ids}
+
+
+class UserStoryProjection:
+    """User story list query with linked test and defect aggregates."""
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def query(self) -> Query:
+        """Return a query of ``(UserStory, *aggregates)`` rows."""
+        story_number = UserStory.github_issue_number
+        return self.db.query(
+            UserStory,
+            _count_of(Test.github_user_story_number, story_number),
+            select(_sum_if(Test.last_execution_status == "passed"))
+            .where(Test.github_user_story_number == story_number)
+            .scalar_subquery(),
+            _count_of(Defect.github_user_story_number, story_number),
+        )
+
+    def serialize(self, rows: Sequence[tuple]) -> List[Dict[str, Any]]:
+        """Serialize rows returned by query() into UserStory.to_dict() output."""
+        return [
+            user_story.to_dict(
+                related={
+                    "test_coverage": UserStory.coverage_from_counts(total_tests, passed_tests),
+                    "defect_count": defect_count,
+                }
+            )
+            for user_story, total_tests, passed_tests, defect_count in rows
+        ]
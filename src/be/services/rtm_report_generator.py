@@ -4,36 +4,50 @@ RTM Report Generator Service
 Generates dynamic RTM reports in multiple formats from database data.
 Supports real-time reporting, filtering, and export capabilities.
 
+The HTML and Markdown matrices can also be produced incrementally
+(iter_html_matrix / iter_markdown_matrix): epics are read in keyset-ordered
+batches and each epic section is yielded as soon as it is rendered, so a
+streamed response starts immediately and memory stays bounded by one batch.
+
 Related Issue: US-00059 - Dynamic RTM generation and reporting
 Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..models.traceability import Defect, Epic, Test, UserStory
+from .rtm_export import RTMMatrixExporter
+from .rtm_matrix_loader import EpicChildren, RTMMatrixLoader, epic_eager_options
 
 # Import frontend services for proper separation of concerns
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from fe.services import TemplateService, ComponentService, AssetService
+from fe.services import ComponentService, get_asset_service, get_template_service
 
 
 class RTMReportGenerator:
     """Dynamic RTM report generator with multiple output formats."""
 
+    # Bump when rendered output changes so cached renders are not reused
+    RENDER_VERSION = "1"
+
+    # Epics loaded (with their children) per query by the streaming renderers
+    STREAM_BATCH_SIZE = 50
+
     def __init__(self, db_session: Session):
         self.db = db_session
+        self.matrix_loader = RTMMatrixLoader(db_session)
 
         # Use frontend services for template rendering
-        self.template_service = TemplateService()
+        self.template_service = get_template_service()
         self.component_service = ComponentService(self.template_service)
-        self.asset_service = AssetService()
+        self.asset_service = get_asset_service()
 
         # Legacy compatibility - maintain old interface
         self.jinja_env = self.template_service.jinja_env
@@ -101,6 +115,7 @@ class RTMReportGenerator:
         """Generate RTM matrix in JSON format."""
         # Apply filters to get relevant data
         epics = self._get_filtered_epics(filters)
+        children = self.matrix_loader.load(epics)
 
         matrix_data = {
             "metadata": {
@@ -112,30 +127,33 @@ class RTMReportGenerator:
         }
 
         for epic in epics:
-            epic_data = self._build_epic_data(epic, filters)
+            epic_data = self._build_epic_data(epic, filters, children[epic.id])
             matrix_data["epics"].append(epic_data)
 
         return matrix_data
 
     def generate_markdown_matrix(self, filters: Dict[str, Any]) -> str:
         """Generate RTM matrix in Markdown format."""
-        epics = self._get_filtered_epics(filters)
+        return "".join(self.iter_markdown_matrix(filters))
+
+    def iter_markdown_matrix(self, filters: Dict[str, Any]) -> Iterator[str]:
+        """Yield the Markdown RTM matrix one table row at a time."""
+        total_epics = self._count_filtered_epics(filters)
 
         markdown = "# Dynamic Requirements Traceability Matrix\n\n"
         markdown += (
             f"**Generated**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
         )
-        markdown += f"**Total Epics**: {len(epics)}\n\n"
+        markdown += f"**Total Epics**: {total_epics}\n\n"
 
         # Epic to User Story mapping table
         markdown += "## Epic to User Story Mapping\n\n"
         markdown += "| Epic ID | Epic Name | User Stories | Story Points | Status | Progress |\n"
         markdown += "|---------|-----------|--------------|--------------|--------|----------|\n"
+        yield markdown
 
-        for epic in epics:
-            user_stories = (
-                self.db.query(UserStory).filter(UserStory.epic_id == epic.id).all()
-            )
+        for epic, epic_children in self._iter_epics(filters, include_story_links=False):
+            user_stories = epic_children.user_stories
             us_list = ", ".join(
                 [f"[{us.user_story_id}](#{us.user_story_id})" for us in user_stories]
             )
@@ -151,24 +169,27 @@ class RTMReportGenerator:
                 else "0%"
             )
 
-            markdown += f"| **{epic.epic_id}** | {epic.title} | {us_list} | {total_points} | {epic.status} | {progress} |\n"
+            yield f"| **{epic.epic_id}** | {epic.title} | {us_list} | {total_points} | {epic.status} | {progress} |\n"
 
         # Test coverage section if requested
         if filters.get("include_tests", True):
-            markdown += "\n## Test Coverage Summary\n\n"
+            markdown = "\n## Test Coverage Summary\n\n"
             markdown += (
                 "| Epic ID | Total Tests | Unit | Integration | BDD | Pass Rate |\n"
             )
             markdown += (
                 "|---------|-------------|------|-------------|-----|-----------|\n"
             )
+            yield markdown
 
-            for epic in epics:
-                tests = self.db.query(Test).filter(Test.epic_id == epic.id).all()
+            for epic, epic_children in self._iter_epics(
+                filters, include_story_links=False
+            ):
+                tests = epic_children.tests
                 test_counts = self._get_test_counts(tests)
                 pass_rate = self._calculate_pass_rate(tests)
 
-                markdown += (
+                yield (
                     f"| {epic.epic_id} | {len(tests)} | "
                     f"{test_counts['unit']} | "
                     f"{test_counts['integration']} | {test_counts['bdd']} | "
@@ -177,19 +198,22 @@ class RTMReportGenerator:
 
         # Defect tracking section if requested
         if filters.get("include_defects", True):
-            markdown += "\n## Defect Tracking\n\n"
+            markdown = "\n## Defect Tracking\n\n"
             markdown += (
                 "| Epic ID | Total Defects | Critical | High | Open | Security |\n"
             )
             markdown += (
                 "|---------|---------------|----------|------|------|----------|\n"
             )
+            yield markdown
 
-            for epic in epics:
-                defects = self.db.query(Defect).filter(Defect.epic_id == epic.id).all()
+            for epic, epic_children in self._iter_epics(
+                filters, include_story_links=False
+            ):
+                defects = epic_children.defects
                 defect_summary = self._get_defect_summary(defects)
 
-                markdown += (
+                yield (
                     f"| {epic.epic_id} | {len(defects)} | "
                     f"{defect_summary['critical']} | "
                     f"{defect_summary['high']} | "
@@ -197,10 +221,12 @@ class RTMReportGenerator:
                     f"{defect_summary['security']} |\n"
                 )
 
-        return markdown
-
     def generate_html_matrix(self, filters: Dict[str, Any]) -> str:
         """Generate RTM matrix in HTML format with Python-based filtering."""
+        return "".join(self.iter_html_matrix(filters))
+
+    def iter_html_matrix(self, filters: Dict[str, Any]) -> Iterator[str]:
+        """Yield the HTML RTM matrix: the page head, then one epic at a time."""
         # Extract filter parameters
         epic_filter = filters.get("epic_filter", "all")
         us_status_filter = filters.get("us_status_filter", "all")
@@ -210,7 +236,7 @@ class RTMReportGenerator:
         defect_priority_filter = filters.get("defect_priority_filter", "all")
         defect_status_filter = filters.get("defect_status_filter", "all")
 
-        epics = self._get_filtered_epics(filters)
+        total_epics = self._count_filtered_epics(filters)
 
         # Get CSS files for RTM page from asset service
         css_files = self.asset_service.get_all_css_for_page("app")
@@ -283,7 +309,7 @@ project requirements tracking</p>
 {datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")}</span>
                 </div>
                 <div class="page-header__meta-item">
-                    <span>Total Epics: {len(epics)}</span>
+                    <span>Total Epics: {total_epics}</span>
                 </div>
             </div>
         </div>
@@ -399,9 +425,11 @@ role="status" aria-live="polite"></div>
             <span class="section-separator__content">Epic Progress Overview</span>
         </div>
 """
+        yield html
 
-        for epic in epics:
-            epic_data = self._build_epic_data(epic, filters)
+        for epic, epic_children in self._iter_epics(filters):
+            html = ""
+            epic_data = self._build_epic_data(epic, filters, epic_children)
             progress = epic_data["metrics"]["completion_percentage"]
 
             epic_title_link = self._render_epic_title_link(
@@ -1072,20 +1100,21 @@ title="Open {defect_id} in GitHub"><strong>{defect_id}</strong></a>'
         </div>
     </article>
 """
+            yield html
 
         # Close the main container and HTML after all epics
-        html += """
+        yield """
     </div>
 </body>
 </html>
 """
-        return html
 
     def generate_epic_progress_json(
         self, include_charts: bool = True
     ) -> Dict[str, Any]:
         """Generate epic progress report in JSON format."""
         epics = self._get_filtered_epics({"include_demo_data": False})
+        children = self.matrix_loader.load(epics)
 
         report = {
             "metadata": {
@@ -1098,7 +1127,9 @@ title="Open {defect_id} in GitHub"><strong>{defect_id}</strong></a>'
 
         for epic in epics:
             epic_data = self._build_epic_data(
-                epic, {"include_tests": True, "include_defects": True}
+                epic,
+                {"include_tests": True, "include_defects": True},
+                children[epic.id],
             )
 
             # Add time-series data for charts if requested
@@ -1108,8 +1139,14 @@ title="Open {defect_id} in GitHub"><strong>{defect_id}</strong></a>'
             report["epic_progress"].append(epic_data)
 
         # Overall summary
-        total_points = sum(self._get_epic_story_points(epic) for epic in epics)
-        completed_points = sum(self._get_epic_completed_points(epic) for epic in epics)
+        total_points = sum(
+            self._get_epic_story_points(children[epic.id].user_stories)
+            for epic in epics
+        )
+        completed_points = sum(
+            self._get_epic_completed_points(children[epic.id].user_stories)
+            for epic in epics
+        )
 
         report["summary"] = {
             "overall_completion": (
@@ -1279,31 +1316,88 @@ font-weight: bold; color: white; }
         )
         return html
 
-    def export_full_matrix(self, format: str) -> Tuple[bytes, str, str]:
-        """Export full RTM matrix in specified format."""
+    def export_full_matrix(self, format: str) -> Tuple[Iterator[bytes], str, str]:
+        """Export full RTM matrix in specified format.
+
+        Returns an iterator of body chunks, the media type and a filename.
+        CSV is the epics sheet as one file; CSV-ZIP is a ZIP archive with one
+        CSV file per sheet (epics, user stories, tests, defects); XLSX has
+        one worksheet per sheet.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        exporter = RTMMatrixExporter(self.db)
         if format == "csv":
             return (
-                self._export_csv(),
+                exporter.iter_csv(),
                 "text/csv",
-                f"rtm_matrix_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                f"rtm_matrix_{timestamp}.csv",
+            )
+        elif format == "csv-zip":
+            return (
+                exporter.iter_csv_zip(),
+                "application/zip",
+                f"rtm_matrix_{timestamp}_csv.zip",
             )
         elif format == "xlsx":
             return (
-                self._export_xlsx(),
+                exporter.iter_xlsx(),
                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                f"rtm_matrix_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                f"rtm_matrix_{timestamp}.xlsx",
             )
         elif format == "pdf":
             return (
-                self._export_pdf(),
+                iter([self._export_pdf()]),
                 "application/pdf",
-                f"rtm_matrix_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                f"rtm_matrix_{timestamp}.pdf",
             )
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
     def _get_filtered_epics(self, filters: Dict[str, Any]) -> List[Epic]:
         """Get epics based on applied filters."""
+        return (
+            self._filtered_epic_query(filters)
+            .options(*epic_eager_options())
+            .order_by(Epic.epic_id)
+            .all()
+        )
+
+    def _iter_epics(
+        self, filters: Dict[str, Any], include_story_links: bool = True
+    ) -> Iterator[Tuple[Epic, EpicChildren]]:
+        """Yield filtered epics with their children, loaded in batches.
+
+        Batches are read in ``epic_id`` order with a keyset condition, so
+        only one batch of epics and children is held at a time.
+        """
+        query = (
+            self._filtered_epic_query(filters)
+            .options(*epic_eager_options())
+            .order_by(Epic.epic_id)
+        )
+        last_epic_id = None
+        while True:
+            batch_query = query
+            if last_epic_id is not None:
+                batch_query = query.filter(Epic.epic_id > last_epic_id)
+            epics = batch_query.limit(self.STREAM_BATCH_SIZE).all()
+            if not epics:
+                return
+            children = self.matrix_loader.load(epics, include_story_links)
+            for epic in epics:
+                yield epic, children[epic.id]
+            last_epic_id = epics[-1].epic_id
+
+    def _count_filtered_epics(self, filters: Dict[str, Any]) -> int:
+        """Number of epics matching the report filters."""
+        return (
+            self._filtered_epic_query(filters)
+            .with_entities(func.count(Epic.id))
+            .scalar()
+        )
+
+    def _filtered_epic_query(self, filters: Dict[str, Any]):
+        """Epic query with the report filters applied."""
         query = self.db.query(Epic)
 
         # Filter out demo data unless explicitly requested
@@ -1317,15 +1411,25 @@ font-weight: bold; color: white; }
         if filters.get("priority"):
             query = query.filter(Epic.priority == filters["priority"])
 
-        return query.order_by(Epic.epic_id).all()
+        return query
 
-    def _build_epic_data(self, epic: Epic, filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Build comprehensive epic data including metrics."""
-        user_stories = (
-            self.db.query(UserStory).filter(UserStory.epic_id == epic.id).all()
-        )
-        tests = self.db.query(Test).filter(Test.epic_id == epic.id).all()
-        defects = self.db.query(Defect).filter(Defect.epic_id == epic.id).all()
+    def _build_epic_data(
+        self,
+        epic: Epic,
+        filters: Dict[str, Any],
+        children: Optional[EpicChildren] = None,
+    ) -> Dict[str, Any]:
+        """Build comprehensive epic data including metrics.
+
+        ``children`` should come from ``self.matrix_loader.load()`` so a whole
+        matrix is built from one set of bulk queries; when omitted, the
+        children of this single epic are loaded on demand.
+        """
+        if children is None:
+            children = self.matrix_loader.load([epic])[epic.id]
+        user_stories = children.user_stories
+        tests = children.tests
+        defects = children.defects
 
         # Calculate metrics - Progress based on GitHub-derived status for user stories and defects
         total_story_points = sum(us.story_points for us in user_stories)
@@ -1712,20 +1816,12 @@ class="epic-title-link" title="Click to open {epic_id} in GitHub">\
             "defect_trend": [0, 2, 5, 3, 2],  # Mock data
         }
 
-    def _get_epic_story_points(self, epic: Epic) -> int:
-        """Get total story points for an epic."""
-        return sum(
-            us.story_points
-            for us in self.db.query(UserStory)
-            .filter(UserStory.epic_id == epic.id)
-            .all()
-        )
+    def _get_epic_story_points(self, user_stories: List[UserStory]) -> int:
+        """Get total story points for an epic's user stories."""
+        return sum(us.story_points for us in user_stories)
 
-    def _get_epic_completed_points(self, epic: Epic) -> int:
-        """Get completed story points for an epic."""
-        user_stories = (
-            self.db.query(UserStory).filter(UserStory.epic_id == epic.id).all()
-        )
+    def _get_epic_completed_points(self, user_stories: List[UserStory]) -> int:
+        """Get completed story points for an epic's user stories."""
         return sum(
             us.story_points
             for us in user_stories
@@ -1742,56 +1838,6 @@ class="epic-title-link" title="Click to open {epic_id} in GitHub">\
 
         return {status: count for status, count in status_query}
 
-    def _export_csv(self) -> bytes:
-        """Export RTM data as CSV."""
-        # Simplified CSV export - would implement full CSV generation
-        import csv
-        import io
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Epic ID",
-                "Epic Title",
-                "Status",
-                "User Stories",
-                "Story Points",
-                "Tests",
-                "Defects",
-            ]
-        )
-
-        # Data
-        epics = self._get_filtered_epics({"include_demo_data": False})
-        for epic in epics:
-            user_stories = (
-                self.db.query(UserStory).filter(UserStory.epic_id == epic.id).all()
-            )
-            tests = self.db.query(Test).filter(Test.epic_id == epic.id).all()
-            defects = self.db.query(Defect).filter(Defect.epic_id == epic.id).all()
-
-            writer.writerow(
-                [
-                    epic.epic_id,
-                    epic.title,
-                    epic.status,
-                    len(user_stories),
-                    sum(us.story_points for us in user_stories),
-                    len(tests),
-                    len(defects),
-                ]
-            )
-
-        return output.getvalue().encode("utf-8")
-
-    def _export_xlsx(self) -> bytes:
-        """Export RTM data as Excel file."""
-        # Would implement Excel export using openpyxl
-        return b"Excel export not yet implemented"
-
     def _export_pdf(self) -> bytes:
         """Export RTM data as PDF."""
         # Would implement PDF export using reportlab
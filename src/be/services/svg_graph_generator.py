@@ -3,7 +3,9 @@ Pure Python SVG Graph Generator for Epic Dependencies Visualization.
 
 Generates dependency graphs as pure SVG with zero JavaScript dependencies.
 Implements force-directed layout algorithm and interactive features
-server-side.
+server-side. When NumPy is installed, larger graphs are laid out with a
+vectorized Barnes-Hut engine (quadtree approximation for node repulsion,
+spatial grid for collisions); the pure-Python engine remains the fallback.
 
 Related Issue: US-00030 - Visual Filtering Enhancement for Epic
 Dependencies Graph
@@ -16,6 +18,11 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from xml.sax.saxutils import escape
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
 
 @dataclass
 class Node:
@@ -58,6 +65,13 @@ class GraphLayout:
     charge_strength: float = -1200
     center_strength: float = 0.05
     collision_radius: int = 80
+    # "auto" (NumPy Barnes-Hut when available), "numpy" or "python"
+    engine: str = "auto"
+    # Below this node count the pure-Python engine is as fast
+    vectorize_min_nodes: int = 40
+    # Barnes-Hut opening angle: cell size / distance below which a quadtree
+    # cell is approximated by its center of mass (0 = exact)
+    barnes_hut_theta: float = 0.8
 
 
 class ForceDirectedLayout:
@@ -183,9 +197,235 @@ class ForceDirectedLayout:
             node.y = max(margin, min(self.layout.height - margin, node.y))
 
 
+class BarnesHutLayout(ForceDirectedLayout):
+    """NumPy force-directed layout with Barnes-Hut repulsion.
+
+    Runs the same forces and cooling schedule as ForceDirectedLayout on
+    position/velocity arrays. Repulsion walks a quadtree level by level for
+    all nodes at once, approximating distant cells by their center of mass;
+    collisions only compare nodes in neighbouring grid cells. Collision
+    corrections are applied simultaneously rather than pair by pair.
+    """
+
+    def __init__(self, layout: GraphLayout):
+        if np is None:
+            raise RuntimeError("BarnesHutLayout requires NumPy")
+        super().__init__(layout)
+
+    def apply_forces(self, nodes: Dict[str, Node], links: List[Link]) -> None:
+        """Apply force-directed layout algorithm."""
+        node_list = list(nodes.values())
+        if not node_list:
+            return
+        index = {key: i for i, key in enumerate(nodes)}
+        pos = np.array([(node.x, node.y) for node in node_list], dtype=float)
+        vel = np.array([(node.vx, node.vy) for node in node_list], dtype=float)
+        sources = np.array([index[link.source] for link in links], dtype=np.intp)
+        targets = np.array([index[link.target] for link in links], dtype=np.intp)
+
+        center = np.array([self.layout.width / 2, self.layout.height / 2])
+        margin = self.layout.node_radius
+        upper = np.array([self.layout.width - margin, self.layout.height - margin])
+
+        for _ in range(300):
+            if self.alpha < self.alpha_min:
+                break
+
+            vel += (center - pos) * (self.layout.center_strength * self.alpha)
+            vel += self._charge(pos, -self.layout.charge_strength * self.alpha)
+            self._link(pos, vel, sources, targets)
+            pos += self._collision(pos)
+
+            vel *= self.velocity_decay
+            pos += vel
+            np.clip(pos, margin, upper, out=pos)
+
+            self.alpha *= 1 - self.alpha_decay
+
+        for node, (x, y), (vx, vy) in zip(node_list, pos.tolist(), vel.tolist()):
+            node.x, node.y, node.vx, node.vy = x, y, vx, vy
+
+    def _link(self, pos, vel, sources, targets) -> None:
+        """Spring force along links (same formula as the Python engine)."""
+        if not len(sources):
+            return
+        delta = pos[targets] - pos[sources]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        valid = distance > 0
+        force = np.zeros_like(distance)
+        force[valid] = (
+            (distance[valid] - self.layout.link_distance)
+            / distance[valid]
+            * self.alpha
+        )
+        push = delta * (force * 0.5)[:, None]
+        np.add.at(vel, sources, push)
+        np.add.at(vel, targets, -push)
+
+    def _charge(self, pos, strength: float):
+        """Velocity change of every node from all others, via Barnes-Hut.
+
+        Each node moves by ``strength * (other - node) / distance**2`` per
+        other node, as in ForceDirectedLayout._apply_charge_force.
+        """
+        n = len(pos)
+        dv = np.zeros_like(pos)
+        if n < 2:
+            return dv
+
+        lower = pos.min(axis=0)
+        span = max(float((pos.max(axis=0) - lower).max()), 1e-9)
+        # About one node per leaf cell on average
+        depth = min(max(1, math.ceil(math.log(n, 4))), 12)
+        leaf = np.minimum(
+            ((pos - lower) / span * (1 << depth)).astype(np.int64), (1 << depth) - 1
+        )
+
+        # Per level: sorted cell keys, mass and center of mass, node -> cell
+        levels = []
+        for level in range(depth + 1):
+            cells = leaf >> (depth - level)
+            keys = (cells[:, 0] << level) | cells[:, 1]
+            unique, owner = np.unique(keys, return_inverse=True)
+            mass = np.bincount(owner, minlength=len(unique)).astype(float)
+            com = np.stack(
+                [
+                    np.bincount(owner, weights=pos[:, 0], minlength=len(unique)),
+                    np.bincount(owner, weights=pos[:, 1], minlength=len(unique)),
+                ],
+                axis=1,
+            ) / mass[:, None]
+            levels.append((unique, owner, mass, com))
+
+        theta2 = self.layout.barnes_hut_theta ** 2
+        # Frontier of (node, cell) pairs still to resolve, starting at the root
+        frontier_nodes = np.arange(n)
+        frontier_cells = np.zeros(n, dtype=np.intp)
+        for level, (unique, owner, mass, com) in enumerate(levels):
+            if not len(frontier_nodes):
+                break
+            delta = com[frontier_cells] - pos[frontier_nodes]
+            dist2 = np.einsum("ij,ij->i", delta, delta)
+            size2 = (span / (1 << level)) ** 2
+            far = (owner[frontier_nodes] != frontier_cells) & (size2 < theta2 * dist2)
+            if far.any():
+                weight = strength * mass[frontier_cells[far]] / dist2[far]
+                self._accumulate(dv, frontier_nodes[far], delta[far] * weight[:, None])
+
+            near_nodes = frontier_nodes[~far]
+            near_cells = frontier_cells[~far]
+            if level == depth:
+                self._charge_exact(dv, pos, owner, near_nodes, near_cells, strength)
+                break
+
+            # Open the remaining cells: pair each node with the non-empty children
+            child_keys = levels[level + 1][0]
+            parents = unique[near_cells]
+            parent_x = parents >> level
+            parent_y = parents & ((1 << level) - 1)
+            next_nodes, next_cells = [], []
+            for dx in (0, 1):
+                for dy in (0, 1):
+                    keys = ((2 * parent_x + dx) << (level + 1)) | (2 * parent_y + dy)
+                    found = np.searchsorted(child_keys, keys)
+                    found = np.minimum(found, len(child_keys) - 1)
+                    exists = child_keys[found] == keys
+                    next_nodes.append(near_nodes[exists])
+                    next_cells.append(found[exists])
+            frontier_nodes = np.concatenate(next_nodes)
+            frontier_cells = np.concatenate(next_cells)
+
+        return dv
+
+    def _charge_exact(self, dv, pos, owner, nodes, cells, strength: float) -> None:
+        """Exact interactions between nodes and the members of leaf cells."""
+        if not len(nodes):
+            return
+        order = np.argsort(owner, kind="stable")
+        counts = np.bincount(owner)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        pair_nodes, members = _expand_ranges(nodes, starts[cells], counts[cells])
+        others = order[members]
+        keep = others != pair_nodes
+        pair_nodes, others = pair_nodes[keep], others[keep]
+        delta = pos[others] - pos[pair_nodes]
+        dist2 = np.einsum("ij,ij->i", delta, delta)
+        keep = dist2 > 0
+        self._accumulate(
+            dv,
+            pair_nodes[keep],
+            delta[keep] * (strength / dist2[keep])[:, None],
+        )
+
+    def _collision(self, pos):
+        """Position corrections separating nodes closer than collision_radius."""
+        radius = float(self.layout.collision_radius)
+        correction = np.zeros_like(pos)
+        if len(pos) < 2 or radius <= 0:
+            return correction
+
+        cells = np.floor((pos - pos.min(axis=0)) / radius).astype(np.int64)
+        columns = int(cells[:, 1].max()) + 3
+        keys = (cells[:, 0] + 1) * columns + (cells[:, 1] + 1)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        nodes = np.arange(len(pos))
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbour = keys + dx * columns + dy
+                starts = np.searchsorted(sorted_keys, neighbour, side="left")
+                ends = np.searchsorted(sorted_keys, neighbour, side="right")
+                pair_nodes, members = _expand_ranges(nodes, starts, ends - starts)
+                others = order[members]
+                # Each unordered pair once
+                keep = pair_nodes < others
+                a, b = pair_nodes[keep], others[keep]
+                delta = pos[b] - pos[a]
+                distance = np.hypot(delta[:, 0], delta[:, 1])
+                close = (distance < radius) & (distance > 0)
+                if not close.any():
+                    continue
+                push = delta[close] * (
+                    (radius - distance[close]) / distance[close] * 0.5
+                )[:, None]
+                self._accumulate(correction, a[close], -push)
+                self._accumulate(correction, b[close], push)
+        return correction
+
+    @staticmethod
+    def _accumulate(target, indices, values) -> None:
+        """target[indices] += values, summing repeated indices."""
+        size = len(target)
+        target[:, 0] += np.bincount(indices, weights=values[:, 0], minlength=size)
+        target[:, 1] += np.bincount(indices, weights=values[:, 1], minlength=size)
+
+
+def _expand_ranges(owners, starts, counts):
+    """Expand per-owner ``[start, start + count)`` ranges into flat pairs."""
+    counts = counts.astype(np.intp)
+    total = int(counts.sum())
+    pair_owners = np.repeat(owners, counts)
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    members = np.repeat(starts, counts) + (np.arange(total) - run_starts)
+    return pair_owners, members
+
+
+def create_force_layout(layout: GraphLayout, node_count: int) -> ForceDirectedLayout:
+    """Pick the layout engine for a graph of ``node_count`` nodes."""
+    if layout.engine == "python" or np is None:
+        return ForceDirectedLayout(layout)
+    if layout.engine == "numpy" or node_count >= layout.vectorize_min_nodes:
+        return BarnesHutLayout(layout)
+    return ForceDirectedLayout(layout)
+
+
 class SVGGraphGenerator:
     """Generates pure SVG dependency graphs with zero JavaScript."""
 
+    # Bump when rendered output changes so cached renders are not reused
+    RENDER_VERSION = "1"
+
     def __init__(self):
         self.layout = GraphLayout()
         self.colors = {
@@ -236,7 +476,7 @@ class SVGGraphGenerator:
         self._initialize_positions(nodes)
 
         # Apply force-directed layout
-        layout_engine = ForceDirectedLayout(self.layout)
+        layout_engine = create_force_layout(self.layout, len(nodes))
         layout_engine.apply_forces(nodes, links)
 
         # Generate SVG
@@ -10,8 +10,14 @@ Contains frontend-specific services for:
 These services handle presentation logic separately from backend business logic.
 """
 
-from .template_service import TemplateService
-from .asset_service import AssetService
+from .template_service import TemplateService, get_template_service
+from .asset_service import AssetService, get_asset_service
 from .component_service import ComponentService
 
-__all__ = ["TemplateService", "AssetService", "ComponentService"]
+__all__ = [
+    "TemplateService",
+    "AssetService",
+    "ComponentService",
+    "get_template_service",
+    "get_asset_service",
+]
@@ -3,9 +3,15 @@ Frontend Asset Service
 
 Manages static assets including CSS, JavaScript, and other resources.
 Provides asset bundling, optimization, and URL generation.
+
+The asset manifest is re-read only when its modification time changes, so
+the shared instance from get_asset_service() serves every request from
+memory.
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -20,11 +26,29 @@ class AssetService:
             asset_config_path = current_dir / "static" / "assets.json"
 
         self.config_path = Path(asset_config_path)
-        self.config = self._load_config()
+        self._config_mtime: Optional[int] = None
+        self._config_lock = threading.Lock()
+        self._config = self._load_config()
+
+    @property
+    def config(self) -> Dict:
+        """Asset configuration, reloaded when the manifest file changes."""
+        if self._manifest_mtime() != self._config_mtime:
+            with self._config_lock:
+                if self._manifest_mtime() != self._config_mtime:
+                    self._config = self._load_config()
+        return self._config
+
+    def _manifest_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
 
     def _load_config(self) -> Dict:
         """Load asset configuration."""
-        if self.config_path.exists():
+        self._config_mtime = self._manifest_mtime()
+        if self._config_mtime is not None:
             with open(self.config_path, "r") as f:
                 return json.load(f)
         else:
@@ -97,3 +121,16 @@ class AssetService:
             js_files.extend(self.get_js_bundle(page_type))
 
         return list(dict.fromkeys(js_files))  # Remove duplicates while preserving order
+
+
+_shared_service: Optional[AssetService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_asset_service() -> AssetService:
+    """Return the process-wide asset service for the default manifest."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = AssetService()
+        return _shared_service
@@ -6,24 +6,50 @@ Provides a clean interface between backend data and frontend presentation.
 
 This service replaces embedded template logic in backend services,
 creating a proper separation of concerns.
+
+Report generators share one process-wide service (get_template_service())
+so compiled templates are reused across requests. Compiled bytecode is
+also persisted in a FileSystemBytecodeCache, and templates are recompiled
+only when their source file changes.
+
+Configuration (environment):
+    TEMPLATE_BYTECODE_CACHE_DIR - bytecode cache directory
+                                  (default: <tmp>/gonogo-jinja-cache)
 """
 
 import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+def _default_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Bytecode cache in TEMPLATE_BYTECODE_CACHE_DIR or the temp directory."""
+    cache_dir = Path(os.getenv("TEMPLATE_BYTECODE_CACHE_DIR") or Path(tempfile.gettempdir()) / "gonogo-jinja-cache")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
 
 
 class TemplateService:
     """Frontend template rendering service with organized template management."""
 
-    def __init__(self, template_base_path: Optional[str] = None):
+    def __init__(
+        self,
+        template_base_path: Optional[str] = None,
+        bytecode_cache: Optional[FileSystemBytecodeCache] = None,
+    ):
         """Initialize template service with proper frontend paths."""
         if template_base_path is None:
             # Default to frontend template directory
             current_dir = Path(__file__).parent.parent
             template_base_path = current_dir / "templates"
+        template_base_path = Path(template_base_path)
 
         # Frontend-oriented template directory structure
         template_dirs = [
@@ -45,6 +71,9 @@ class TemplateService:
             autoescape=True,
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=True,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
         )
 
         # Add custom filters and functions
@@ -102,6 +131,18 @@ class TemplateService:
         """Render a reusable component with props."""
         return self.render_template(f"{component_name}.html", **props)
 
+    def warm_up(self) -> int:
+        """Compile every available template and return how many were loaded."""
+        loaded = 0
+        for template_name in self.get_template_list():
+            try:
+                self.jinja_env.get_template(template_name)
+                loaded += 1
+            except Exception:
+                # Partial templates may not compile standalone
+                continue
+        return loaded
+
     def get_template_list(self) -> List[str]:
         """Get list of available templates."""
         return self.jinja_env.list_templates()
@@ -113,3 +154,16 @@ class TemplateService:
             return True
         except:
             return False
+
+
+_shared_service: Optional[TemplateService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_template_service() -> TemplateService:
+    """Return the process-wide template service with a bytecode cache."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = TemplateService(bytecode_cache=_default_bytecode_cache())
+        return _shared_service
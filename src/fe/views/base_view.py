@@ -8,7 +8,7 @@ Establishes the contract between backend data and frontend presentation.
 from typing import Any, Dict, List
 from abc import ABC, abstractmethod
 
-from ..services import TemplateService, ComponentService, AssetService
+from ..services import ComponentService, get_asset_service, get_template_service
 
 
 class BaseView(ABC):
@@ -16,9 +16,9 @@ class BaseView(ABC):
 
     def __init__(self):
         """Initialize view with frontend services."""
-        self.template_service = TemplateService()
+        self.template_service = get_template_service()
         self.component_service = ComponentService(self.template_service)
-        self.asset_service = AssetService()
+        self.asset_service = get_asset_service()
 
     def render_page(self, template_name: str, page_type: str = "app", **context) -> str:
         """Render a complete page with assets and layout."""
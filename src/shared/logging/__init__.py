@@ -8,6 +8,7 @@ Related to: EP-00006 Test Logging and Reporting
 User Story: US-00022 Structured logging system for test execution
 """
 
+from .async_writer import AsyncLogWriter
 from .config import EnvironmentMode, LoggingConfig
 from .formatters import (
     JSONFormatter,
@@ -15,6 +16,7 @@ from .formatters import (
     TableFormatter,
     TestFormatter,
 )
+from .log_store import LogRingBuffer
 from .logger import (
     LogEntry,
     LogLevel,
@@ -29,6 +31,8 @@ __all__ = [
     "StructuredLogger",
     "LogLevel",
     "LogEntry",
+    "LogRingBuffer",
+    "AsyncLogWriter",
     "get_logger",
     "setup_logging",
     "LoggingConfig",
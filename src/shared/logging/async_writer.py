@@ -0,0 +1,150 @@
+"""
+Background Log Writer for GoNoGo Test System
+
+Moves log file I/O off the logging thread. Callers enqueue finished JSON
+lines; a worker thread drains the queue in batches and writes each batch
+with a single write and flush through the logger's rotating file handler,
+so rotation behaves as with synchronous writes.
+
+The queue is bounded. When it is full, new lines are dropped and counted
+rather than blocking the caller.
+
+Related to: EP-00006 Test Logging and Reporting
+User Story: US-00022 Structured logging system for test execution
+"""
+
+import atexit
+import queue
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+# Largest number of lines written per batch
+MAX_BATCH_LINES = 1000
+
+# How long the worker waits for more lines before writing a batch
+BATCH_LINGER_SECONDS = 0.05
+
+_STOP = object()
+
+
+class AsyncLogWriter:
+    """Queue-backed writer that batches JSON lines into a rotating log file."""
+
+    def __init__(
+        self,
+        handler: RotatingFileHandler,
+        queue_size: int = 10000,
+    ):
+        self._handler = handler
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._lock = threading.Lock()
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="gonogo-log-writer", daemon=True)
+        self._thread.start()
+        # The worker is a daemon thread, so write out what is queued at exit
+        atexit.register(self.close)
+
+    def submit(self, line: str) -> bool:
+        """Queue ``line`` for writing; return False if it was dropped."""
+        if not self._closed:
+            try:
+                self._queue.put_nowait(line)
+                return True
+            except queue.Full:
+                pass
+        with self._lock:
+            self.dropped += 1
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every line queued before this call is written.
+
+        Returns False if ``timeout`` expired or the writer is closed.
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        written = threading.Event()
+        # Blocks while the queue is full, unlike submit()
+        self._queue.put(written)
+        return written.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write out queued lines and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for written, dropped and pending lines."""
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "errors": self.errors,
+            "pending": self._queue.qsize(),
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            lines: List[str] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            # Give a burst of lines a moment to arrive and share the write
+            deadline = time.monotonic() + BATCH_LINGER_SECONDS
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+                if stop or waiters or len(lines) >= MAX_BATCH_LINES:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._write_batch(lines)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write_batch(self, lines: List[str]) -> None:
+        data = "\n".join(lines) + "\n"
+        handler = self._handler
+        handler.acquire()
+        try:
+            if handler.stream is None:
+                handler.stream = handler._open()
+            # Same size check as RotatingFileHandler.shouldRollover, per batch
+            if handler.maxBytes > 0:
+                handler.stream.seek(0, 2)
+                size = handler.stream.tell()
+                if size and size + len(data) >= handler.maxBytes:
+                    handler.doRollover()
+            handler.stream.write(data)
+            handler.stream.flush()
+        except Exception:
+            self.errors += 1
+            return
+        finally:
+            handler.release()
+        self.written += len(lines)
+        self.batches += 1
@@ -58,6 +58,10 @@ class LoggingConfig:
     anonymize_ips: bool
     exclude_user_data: bool
 
+    # Background file writes (opt-in)
+    async_writes: bool = False
+    write_queue_size: int = 10000
+
     @classmethod
     def from_environment(cls, env: Optional[str] = None) -> "LoggingConfig":
         """Create configuration based on environment."""
@@ -84,6 +88,7 @@ class LoggingConfig:
             "buffer_size": 1000,
             "flush_interval_seconds": 5.0,
             "data_retention_days": 30,
+            "async_writes": os.getenv("LOG_ASYNC_WRITES", "false").lower() in ("1", "true", "yes"),
         }
 
         # Environment-specific configurations
@@ -144,6 +149,8 @@ class LoggingConfig:
             "data_retention_days": self.data_retention_days,
             "anonymize_ips": self.anonymize_ips,
             "exclude_user_data": self.exclude_user_data,
+            "async_writes": self.async_writes,
+            "write_queue_size": self.write_queue_size,
         }
 
     def get_log_file_path(self) -> Path:
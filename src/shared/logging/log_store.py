@@ -0,0 +1,174 @@
+"""
+Ring Buffer Log Store for GoNoGo Test System
+
+Fixed-capacity in-memory store for structured log entries. Appending and
+evicting are O(1), and entries are indexed by test_id, test_status and
+timestamp, so per-test, per-status and time-window queries only touch
+matching entries.
+
+Writers serialize on a lock. Readers take no lock: every slot holds an
+immutable (sequence, entry, time) tuple, and readers skip slots that were
+overwritten after their snapshot of the sequence range.
+
+Related to: EP-00006 Test Logging and Reporting
+User Story: US-00022 Structured logging system for test execution
+"""
+
+from collections import deque
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .logger import LogEntry
+
+# (sequence number, entry, timestamp key)
+_Slot = Tuple[int, "LogEntry", float]
+
+
+def _timestamp_key(entry: "LogEntry") -> float:
+    """Seconds since the epoch of an entry's ISO timestamp."""
+    try:
+        return datetime.fromisoformat(entry.timestamp).timestamp()
+    except (TypeError, ValueError):
+        return float("-inf")
+
+
+class LogRingBuffer:
+    """Fixed-capacity log entry store with secondary indexes."""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._slots: List[Optional[_Slot]] = [None] * capacity
+        self._lock = Lock()
+        # Sequence numbers of the oldest stored and of the next entry
+        self._start = 0
+        self._end = 0
+        # Timestamp keys never decrease along the sequence, so time windows
+        # can be found by bisection
+        self._last_key = float("-inf")
+        self._by_test: Dict[str, Deque[int]] = {}
+        self._by_status: Dict[str, Deque[int]] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, entry: "LogEntry") -> None:
+        """Store ``entry``, evicting the oldest one when full."""
+        key = _timestamp_key(entry)
+        with self._lock:
+            if self._end - self._start == self._capacity:
+                self._evict_oldest()
+
+            seq = self._end
+            # Entries created concurrently may arrive slightly out of order
+            self._last_key = max(self._last_key, key)
+            self._slots[seq % self._capacity] = (seq, entry, self._last_key)
+            if entry.test_id is not None:
+                self._by_test.setdefault(entry.test_id, deque()).append(seq)
+            if entry.test_status is not None:
+                self._by_status.setdefault(entry.test_status, deque()).append(seq)
+            self._end = seq + 1
+
+    def _evict_oldest(self) -> None:
+        seq, entry, _ = self._slots[self._start % self._capacity]
+        # The oldest entry is also the oldest in each of its index lists
+        self._unindex(self._by_test, entry.test_id)
+        self._unindex(self._by_status, entry.test_status)
+        self._start = seq + 1
+
+    @staticmethod
+    def _unindex(index: Dict[str, Deque[int]], value: Optional[str]) -> None:
+        if value is None:
+            return
+        seqs = index[value]
+        seqs.popleft()
+        if not seqs:
+            del index[value]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._slots = [None] * self._capacity
+            self._by_test = {}
+            self._by_status = {}
+            self._start = self._end
+            self._last_key = float("-inf")
+
+    # -- lock-free reads ------------------------------------------------------
+
+    def _entries(self, seqs: Iterable[int]) -> List["LogEntry"]:
+        """Entries still stored under ``seqs``, skipping overwritten slots."""
+        slots = self._slots
+        capacity = self._capacity
+        entries = []
+        for seq in seqs:
+            slot = slots[seq % capacity]
+            if slot is not None and slot[0] == seq:
+                entries.append(slot[1])
+        return entries
+
+    def snapshot(self) -> List["LogEntry"]:
+        """All stored entries, oldest first."""
+        end = self._end
+        return self._entries(range(max(self._start, end - self._capacity), end))
+
+    def recent(self, count: int) -> List["LogEntry"]:
+        """The ``count`` most recent entries, oldest first."""
+        end = self._end
+        start = max(self._start, end - self._capacity, end - max(count, 0))
+        return self._entries(range(start, end))
+
+    def for_test(self, test_id: str) -> List["LogEntry"]:
+        """Entries logged for ``test_id``, oldest first."""
+        seqs = self._by_test.get(test_id)
+        # deque.copy() runs without releasing the GIL, so it cannot observe
+        # a half-applied append or eviction
+        return self._entries(seqs.copy()) if seqs else []
+
+    def with_status(self, test_status: str) -> List["LogEntry"]:
+        """Entries with ``test_status``, oldest first."""
+        seqs = self._by_status.get(test_status)
+        return self._entries(seqs.copy()) if seqs else []
+
+    def between(self, start: datetime, end: datetime) -> List["LogEntry"]:
+        """Entries logged within ``[start, end]``, oldest first.
+
+        An entry that arrived after a newer one is placed at that newer
+        entry's time. Naive datetimes are taken as local time, as
+        datetime.timestamp() does.
+        """
+        low_key, high_key = start.timestamp(), end.timestamp()
+        last = self._end
+        first = max(self._start, last - self._capacity)
+        slots = self._slots
+        capacity = self._capacity
+        entries = []
+        for seq in range(self._bisect(first, last, low_key), last):
+            slot = slots[seq % capacity]
+            if slot is None or slot[0] != seq:
+                continue
+            if slot[2] > high_key:
+                # Index keys never decrease, so the window ends here
+                break
+            entries.append(slot[1])
+        return entries
+
+    def _bisect(self, low: int, high: int, key: float) -> int:
+        """First sequence in ``[low, high)`` whose index key is >= ``key``."""
+        slots = self._slots
+        capacity = self._capacity
+        while low < high:
+            middle = (low + high) // 2
+            slot = slots[middle % capacity]
+            if slot is not None and slot[0] == middle and slot[2] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -9,12 +9,13 @@ import json
 import logging
 import logging.handlers
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from threading import Lock
 from typing import Any, Dict, List, Optional
 
+from .async_writer import AsyncLogWriter
 from .config import EnvironmentMode, LoggingConfig, LogLevel
+from .log_store import LogRingBuffer
 from .sanitizer import LogSanitizer, SanitizationLevel
 
 
@@ -80,15 +81,13 @@ class StructuredLogger:
         """Initialize the structured logger."""
         self.config = config or LoggingConfig.from_environment()
         self.sanitizer = self._create_sanitizer()
-        self._lock = Lock()
         self._session_id = str(uuid.uuid4())
 
         # Set up file logging
         self._setup_file_logging()
 
         # Set up in-memory buffer for testing
-        self._log_buffer: List[LogEntry] = []
-        self._max_buffer_size = self.config.buffer_size
+        self._log_store = LogRingBuffer(self.config.buffer_size)
 
     def _create_sanitizer(self) -> LogSanitizer:
         """Create sanitizer based on configuration."""
@@ -127,6 +126,13 @@ class StructuredLogger:
         self._file_logger.addHandler(self._file_handler)
         self._file_logger.propagate = False
 
+        # Optionally hand file writes to a background thread
+        self._writer: Optional[AsyncLogWriter] = None
+        if self.config.async_writes:
+            self._writer = AsyncLogWriter(
+                self._file_handler, queue_size=self.config.write_queue_size
+            )
+
     def log(
         self,
         level: LogLevel,
@@ -155,44 +161,41 @@ class StructuredLogger:
             tags=tags,
         )
 
-        # Convert to dictionary
-        entry_dict = asdict(entry)
-
-        # Remove None values for cleaner JSON
-        entry_dict = {k: v for k, v in entry_dict.items() if v is not None}
+        # Convert to dictionary, removing None values for cleaner JSON. A
+        # shallow copy is enough: the JSON line is encoded before returning.
+        entry_dict = {k: v for k, v in vars(entry).items() if v is not None}
 
         # Apply sanitization
         entry_dict = self.sanitizer.sanitize_log_entry(entry_dict)
 
-        # Create sanitized entry for buffer (GDPR compliance)
+        # Create sanitized entry for buffer (GDPR compliance), reusing the
+        # sanitized message and metadata of the file entry
         sanitized_entry = LogEntry(
             timestamp=entry.timestamp,
             level=entry.level,
-            message=self.sanitizer.sanitize_text(entry.message),
+            message=entry_dict["message"],
             test_id=entry.test_id,
             test_name=entry.test_name,
             test_status=entry.test_status,
             duration_ms=entry.duration_ms,
             environment=entry.environment,
             session_id=entry.session_id,
-            metadata=(
-                self.sanitizer.sanitize_log_entry(entry.metadata or {})
-                if entry.metadata
-                else None
-            ),
+            metadata=entry_dict.get("metadata") or None,
             stack_trace=entry.stack_trace,
             tags=entry.tags,
         )
 
         # Add sanitized entry to buffer
-        with self._lock:
-            self._log_buffer.append(sanitized_entry)
-            if len(self._log_buffer) > self._max_buffer_size:
-                self._log_buffer.pop(0)  # Remove oldest entry
+        self._log_store.append(sanitized_entry)
 
         # Write to file
-        json_line = json.dumps(entry_dict, separators=(",", ":"))
-        self._file_logger.log(getattr(logging, level.value.upper()), json_line)
+        levelno = getattr(logging, level.value.upper())
+        if self._file_logger.isEnabledFor(levelno):
+            json_line = json.dumps(entry_dict, separators=(",", ":"))
+            if self._writer is not None:
+                self._writer.submit(json_line)
+            else:
+                self._file_logger.log(levelno, json_line)
 
         return entry
 
@@ -280,37 +283,35 @@ class StructuredLogger:
     # Buffer and query methods
     def get_recent_logs(self, count: int = 100) -> List[LogEntry]:
         """Get recent log entries from buffer."""
-        with self._lock:
-            return (
-                self._log_buffer[-count:]
-                if count < len(self._log_buffer)
-                else self._log_buffer.copy()
-            )
+        return self._log_store.recent(count)
 
     def get_logs_for_test(self, test_id: str) -> List[LogEntry]:
         """Get all log entries for a specific test."""
-        with self._lock:
-            return [entry for entry in self._log_buffer if entry.test_id == test_id]
+        return self._log_store.for_test(test_id)
 
     def get_failed_test_logs(self) -> List[LogEntry]:
         """Get log entries for failed tests."""
-        with self._lock:
-            return [
-                entry for entry in self._log_buffer if entry.test_status == "failed"
-            ]
+        return self._log_store.with_status("failed")
+
+    def get_logs_between(self, start: datetime, end: datetime) -> List[LogEntry]:
+        """Get log entries logged between two points in time."""
+        return self._log_store.between(start, end)
 
     def clear_buffer(self) -> None:
         """Clear the in-memory log buffer."""
-        with self._lock:
-            self._log_buffer.clear()
+        self._log_store.clear()
 
-    def flush(self) -> None:
+    def flush(self, timeout: Optional[float] = None) -> None:
         """Flush any pending log entries to file."""
+        if self._writer is not None:
+            self._writer.flush(timeout)
         if hasattr(self._file_handler, "flush"):
             self._file_handler.flush()
 
     def close(self) -> None:
         """Close the logger and clean up resources."""
+        if self._writer is not None:
+            self._writer.close()
         self.flush()
         if self._file_handler:
             self._file_handler.close()
@@ -322,8 +323,9 @@ class StructuredLogger:
             "config": self.config.to_dict(),
             "sanitizer": self.sanitizer.get_sanitization_info(),
             "session_id": self._session_id,
-            "buffer_size": len(self._log_buffer),
+            "buffer_size": len(self._log_store),
             "log_file": str(self.config.get_log_file_path()),
+            "writer": self._writer.get_stats() if self._writer else None,
         }
 
 
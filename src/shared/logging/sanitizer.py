@@ -3,12 +3,44 @@ GDPR-Compliant Log Sanitization for GoNoGo
 
 Provides sanitization patterns and utilities for removing or anonymizing
 personal data from log entries in compliance with GDPR requirements.
+
+Most logged strings contain no personal data. Such strings are recognized
+with one scan of a regex combining every active pattern and returned as is;
+only strings with a match go through the ordered per-pattern substitutions,
+skipping patterns whose required characters are absent. Results for short
+strings are memoized, since test names and messages repeat a lot.
 """
 
 import hashlib
 import re
 from enum import Enum
-from typing import Any, Dict, Pattern
+from functools import lru_cache
+from typing import Any, Callable, Dict, Pattern, Tuple
+
+# Memoized sanitize_text() results per sanitizer, for strings up to
+# MEMO_MAX_LENGTH characters
+MEMO_SIZE = 4096
+MEMO_MAX_LENGTH = 512
+
+# Phone, SSN and card numbers all contain 3 digits, at most a closing
+# parenthesis and a separator, then 2 more digits
+_has_number = re.compile(r"\d{3}[-.\s)]{0,2}\d{2}").search
+_has_dotted_digits = re.compile(r"\d\.\d").search
+
+# Cheap necessary conditions for a pattern to match
+_PREFILTERS: Dict[str, Callable[[str], Any]] = {
+    "email": lambda text: "@" in text,
+    "ipv4": _has_dotted_digits,
+    "ipv6": lambda text: text.count(":") >= 7,
+    "phone": _has_number,
+    "ssn": _has_number,
+    "credit_card": _has_number,
+    "user_path": lambda text: "/" in text,
+    # "names" needs an ASCII capital, which a lowercase-only string lacks
+    "names": lambda text: not text.islower(),
+    "tokens": lambda text: len(text) >= 20,
+    "sensitive_urls": lambda text: "://" in text,
+}
 
 
 class SanitizationLevel(Enum):
@@ -28,6 +60,8 @@ class LogSanitizer:
         self.level = level
         self._patterns = self._compile_patterns()
         self._replacements = self._get_replacements()
+        self._combined: Dict[Tuple[str, ...], Pattern[str]] = {}
+        self._memo = lru_cache(maxsize=MEMO_SIZE)(self._sanitize_text)
 
     def _compile_patterns(self) -> Dict[str, Pattern[str]]:
         """Compile regex patterns for different types of personal data."""
@@ -100,13 +134,47 @@ class LogSanitizer:
             "sensitive_urls": "[SENSITIVE_URL_REDACTED]",
         }
 
+    def _combine_patterns(self, names: Tuple[str, ...]) -> Pattern[str]:
+        """Compile one alternation matching wherever any named pattern does."""
+        combined = self._combined.get(names)
+        if combined is None:
+            alternatives = []
+            for name in names:
+                pattern = self._patterns[name]
+                # Keep each pattern's own case sensitivity
+                flags = "i" if pattern.flags & re.IGNORECASE else ""
+                alternatives.append(f"(?{flags}:{pattern.pattern})")
+            combined = re.compile("|".join(alternatives))
+            self._combined[names] = combined
+        return combined
+
     def sanitize_text(self, text: str) -> str:
         """Sanitize a text string according to the configured level."""
-        if self.level == SanitizationLevel.NONE:
+        if not self._patterns:
+            return text
+        if len(text) <= MEMO_MAX_LENGTH:
+            return self._memo(text)
+        return self._sanitize_text(text)
+
+    def _sanitize_text(self, text: str) -> str:
+        candidates = tuple(
+            name
+            for name in self._patterns
+            if name not in _PREFILTERS or _PREFILTERS[name](text)
+        )
+        if not candidates:
+            return text
+        # The alternation finds a match if and only if some candidate does,
+        # and without a match no substitution below changes the text
+        if not self._combine_patterns(candidates).search(text):
             return text
 
+        # Patterns apply in order, each to the previous one's output
         sanitized = text
         for pattern_name, pattern in self._patterns.items():
+            prefilter = _PREFILTERS.get(pattern_name)
+            if prefilter is not None and not prefilter(sanitized):
+                continue
             replacement = self._replacements.get(pattern_name, "[REDACTED]")
             sanitized = pattern.sub(replacement, sanitized)
 
@@ -6,6 +6,7 @@ for the GoNoGo project testing ecosystem.
 
 Components:
 - FailureTracker: Test failure tracking and pattern analysis
+- FailureRecorder: Batched failure writes for the pytest plugin
 - FailureCategory: Categorization of different failure types
 - FailureSeverity: Severity classification for failures
 """
@@ -13,6 +14,7 @@ Components:
 from .failure_tracker import (
     FailureCategory,
     FailurePattern,
+    FailureRecorder,
     FailureSeverity,
     FailureStatistics,
     FailureTracker,
@@ -21,6 +23,7 @@ from .failure_tracker import (
 
 __all__ = [
     "FailureTracker",
+    "FailureRecorder",
     "FailureCategory",
     "FailureSeverity",
     "TestFailure",
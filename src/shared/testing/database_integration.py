@@ -9,20 +9,127 @@ Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 """
 
 import ast
+import functools
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from pickle import PicklingError
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Boolean, Text, bindparam, case, func, insert, select, update
 
 from be.database import get_db_session
 from be.models.traceability import Defect, Epic, Test, UserStory
+from be.models.traceability.base import insert_values
+from be.models.traceability.epic_metric_dirty import mark_epic_metrics_dirty
+from be.models.traceability.metric_change_tracking import CHILD_METRIC_FAMILIES
+
+# Persistent discovery cache, relative to the discovery root
+DISCOVERY_CACHE_PATH = Path(".pytest_cache") / "gonogo" / "test_discovery.json"
+DISCOVERY_CACHE_VERSION = 1
+
+# Rows per executemany statement when syncing tests and execution results
+SYNC_CHUNK_SIZE = 1000
+
+# Test columns written by TestDatabaseSync (besides the epic link)
+SYNCED_COLUMNS = (
+    "test_type",
+    "test_file_path",
+    "test_function_name",
+    "title",
+    "bdd_scenario_name",
+    "component",
+    "test_priority",
+    "test_category",
+    "epic_id",
+)
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Metadata that is the same for every test of a file, cached once per file
+FILE_LEVEL_KEYS = (
+    "test_file_path",
+    "test_type",
+    "epic_references",
+    "user_story_references",
+    "defect_references",
+    "component",
+    "priority",
+    "test_category",
+)
+
+
+def _pack_tests(tests: List[Dict]) -> Dict:
+    """Split a file's test metadata into shared and per-function parts."""
+    shared = {key: tests[0][key] for key in FILE_LEVEL_KEYS} if tests else {}
+    functions = [
+        {key: value for key, value in test.items() if key not in shared}
+        for test in tests
+    ]
+    return {"shared": shared, "functions": functions}
+
+
+def _unpack_tests(entry: Dict) -> List[Dict]:
+    """Rebuild per-test metadata from a cache entry."""
+    shared = entry["shared"]
+    return [
+        {
+            **function,
+            **{
+                key: list(value) if isinstance(value, list) else value
+                for key, value in shared.items()
+            },
+        }
+        for function in entry["functions"]
+    ]
+
+
+def _scan_test_file(
+    discovery: "TestDiscovery",
+    test_file: Path,
+    test_type: str,
+    known_hash: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[List[Dict]]]:
+    """Hash a test file and analyze it unless its content hash is ``known_hash``.
+
+    Module-level so it can run in a worker process. Returns ``(hash, tests)``;
+    tests is None when the content is unchanged and the hash None when the
+    file could not be read.
+    """
+    try:
+        data = test_file.read_bytes()
+    except OSError as e:
+        print(f"Warning: Could not analyze {test_file}: {e}")
+        return None, []
+
+    content_hash = hashlib.sha256(data).hexdigest()
+    if content_hash == known_hash:
+        return content_hash, None
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        print(f"Warning: Could not analyze {test_file}: {e}")
+        return None, []
+    return content_hash, discovery._analyze_test_file(test_file, test_type, content)
 
 
 class TestDiscovery:
-    """Discovers and analyzes test files for database integration."""
+    """Discovers and analyzes test files for database integration.
+
+    Results are kept in an on-disk cache keyed by path, mtime/size and
+    content hash, so only new or changed files are read and parsed; a
+    large batch of changed files is parsed in a process pool.
+    """
 
     __test__ = False  # Tell pytest this is not a test class
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, max_workers: Optional[int] = None):
         self.test_patterns = {
             "unit": ["tests/unit/**/*.py"],
             "integration": ["tests/integration/**/*.py"],
@@ -30,6 +137,10 @@ class TestDiscovery:
             "security": ["tests/security/**/*.py"],
             "bdd": ["tests/bdd/**/*.py"],
         }
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        # Files seen, parsed and served from the cache by the last discovery
+        self.last_stats = {"files": 0, "parsed": 0, "cached": 0}
 
         self.epic_pattern = re.compile(r"EP-(\d{5})")
         self.user_story_pattern = re.compile(r"US-(\d{5})")
@@ -56,56 +167,180 @@ class TestDiscovery:
         if root_dir is None:
             root_dir = Path.cwd()
 
-        discovered_tests = []
+        test_files = [
+            (test_file, test_type)
+            for test_type, patterns in self.test_patterns.items()
+            for pattern in patterns
+            for test_file in root_dir.glob(pattern)
+            if test_file.is_file() and test_file.name.startswith("test_")
+        ]
+
+        cache_file = root_dir / DISCOVERY_CACHE_PATH
+        cached = self._load_cache(cache_file) if self.use_cache else {}
+        entries: Dict[str, Dict] = {}
+        results: Dict[str, List[Dict]] = {}
+        stale = []
+
+        for test_file, test_type in test_files:
+            if not self.use_cache:
+                stale.append((test_file, test_type, None))
+                continue
+            key = str(test_file)
+            entry = cached.get(key)
+            try:
+                stat = test_file.stat()
+            except OSError:
+                continue
+            if (
+                entry
+                and entry["test_type"] == test_type
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                entries[key] = entry
+                results[key] = _unpack_tests(entry)
+                continue
+            entries[key] = {
+                "test_type": test_type,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": entry["sha256"] if entry else None,
+                "shared": entry["shared"] if entry else {},
+                "functions": entry["functions"] if entry else [],
+            }
+            stale.append((test_file, test_type, entries[key]["sha256"]))
+
+        for (test_file, _, _), scanned in zip(stale, self._scan_files(stale)):
+            key = str(test_file)
+            if not self.use_cache:
+                results[key] = scanned
+                continue
+            content_hash, tests = scanned
+            if content_hash is None:
+                # Unreadable; retry on the next run
+                entries.pop(key, None)
+                results[key] = tests
+                continue
+            entries[key]["sha256"] = content_hash
+            if tests is None:
+                results[key] = _unpack_tests(entries[key])
+            else:
+                entries[key].update(_pack_tests(tests))
+                results[key] = tests
 
-        for test_type, patterns in self.test_patterns.items():
-            for pattern in patterns:
-                test_files = list(root_dir.glob(pattern))
-                for test_file in test_files:
-                    if test_file.is_file() and test_file.name.startswith("test_"):
-                        test_metadata = self._analyze_test_file(test_file, test_type)
-                        if test_metadata:
-                            discovered_tests.extend(test_metadata)
+        if self.use_cache and (stale or len(entries) != len(cached)):
+            self._save_cache(cache_file, entries)
 
-        return discovered_tests
+        self.last_stats = {
+            "files": len(test_files),
+            "parsed": len(stale),
+            "cached": len(test_files) - len(stale),
+        }
+        return [
+            test
+            for test_file, _ in test_files
+            for test in results.get(str(test_file), [])
+        ]
+
+    def _scan_files(self, jobs: List[Tuple[Path, str, Optional[str]]]) -> List:
+        """Analyze ``(file, type, known hash)`` jobs, in a process pool if many."""
+        if self.use_cache:
+            worker = functools.partial(_scan_test_file, self)
+        else:
+            worker = self._analyze_test_file
 
-    def _analyze_test_file(self, test_file: Path, test_type: str) -> List[Dict]:
+        workers = self.max_workers or os.cpu_count() or 1
+        if len(jobs) >= PARALLEL_MIN_FILES and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    columns = list(zip(*jobs))[: 3 if self.use_cache else 2]
+                    return list(pool.map(worker, *columns, chunksize=16))
+            except (OSError, BrokenProcessPool, PicklingError) as e:
+                print(f"Warning: Parallel test discovery unavailable ({e})")
+
+        if self.use_cache:
+            return [worker(*job) for job in jobs]
+        return [worker(test_file, test_type) for test_file, test_type, _ in jobs]
+
+    def _load_cache(self, cache_file: Path) -> Dict[str, Dict]:
+        """Return cached entries, or nothing if the cache is missing or stale."""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Test file paths are stored relative to the working directory
+        if cache.get("version") != DISCOVERY_CACHE_VERSION or cache.get(
+            "cwd"
+        ) != str(Path.cwd()):
+            return {}
+        return cache.get("files", {})
+
+    def _save_cache(self, cache_file: Path, entries: Dict[str, Dict]) -> None:
+        """Atomically replace the cache file; failures only cost a re-parse."""
+        cache = {
+            "version": DISCOVERY_CACHE_VERSION,
+            "cwd": str(Path.cwd()),
+            "files": entries,
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(json.dumps(cache, separators=(",", ":")))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write test discovery cache: {e}")
+
+    def _analyze_test_file(
+        self, test_file: Path, test_type: str, content: Optional[str] = None
+    ) -> List[Dict]:
         """Analyze a single test file and extract test functions."""
         try:
-            with open(test_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(test_file, "r", encoding="utf-8") as f:
+                    content = f.read()
 
             # Parse AST to find test functions
             tree = ast.parse(content)
-            test_functions = []
 
+            # Handle file path - for temp files, use absolute path
+            try:
+                file_path = str(test_file.relative_to(Path.cwd()))
+            except ValueError:
+                # File is not in current directory (e.g., temp file)
+                file_path = str(test_file)
+
+            # File-level references and markers, shared by every function
+            file_metadata = {
+                "epic_references": self._extract_epic_references(content),
+                "user_story_references": self._extract_user_story_references(content),
+                "defect_references": self._extract_defect_references(content),
+                "component": self._extract_component(content),
+                "priority": self._extract_priority(content),
+                "test_category": self._extract_test_category(content),
+            }
+
+            test_functions = []
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-                    # Handle file path - for temp files, use absolute path
-                    try:
-                        file_path = str(test_file.relative_to(Path.cwd()))
-                    except ValueError:
-                        # File is not in current directory (e.g., temp file)
-                        file_path = str(test_file)
-
                     test_metadata = {
                         "test_file_path": file_path,
                         "test_function_name": node.name,
                         "test_type": test_type,
                         "title": self._generate_test_title(node.name),
                         "line_number": node.lineno,
-                        "epic_references": self._extract_epic_references(content),
-                        "user_story_references": (
-                            self._extract_user_story_references(content)
-                        ),
-                        "defect_references": self._extract_defect_references(content),
                         "bdd_scenario_name": self._extract_bdd_scenario_name(
                             node, content
                         ),
-                        "component": self._extract_component(content),
-                        "priority": self._extract_priority(content),
-                        "test_category": self._extract_test_category(content),
+                        **file_metadata,
                     }
+                    for key in (
+                        "epic_references",
+                        "user_story_references",
+                        "defect_references",
+                    ):
+                        test_metadata[key] = list(file_metadata[key])
                     test_functions.append(test_metadata)
 
             return test_functions
@@ -173,6 +408,10 @@ class TestDatabaseSync:
         """
         Sync discovered tests to database.
 
+        Existing tests and epics are preloaded with one query each; new
+        tests are inserted and changed tests updated with one executemany
+        statement per chunk.
+
         Returns:
             Dictionary with sync statistics
         """
@@ -188,23 +427,69 @@ class TestDatabaseSync:
                 "errors": 0,
             }
 
+            existing = {
+                (row.test_file_path, row.test_function_name): row
+                for row in db.execute(
+                    select(Test.id, *(Test.__table__.c[key] for key in SYNCED_COLUMNS))
+                )
+            }
+            epic_ids = dict(db.execute(select(Epic.epic_id, Epic.id)).all())
+
+            creates, updates = [], []
+            dirty_epics: Dict[int, Iterable[str]] = {}
             for test_data in discovered_tests:
                 try:
-                    result = self._create_or_update_test(db, test_data)
-                    if result == "created":
+                    key = (test_data["test_file_path"], test_data["test_function_name"])
+                    values = self._synced_values(test_data)
+
+                    # Link to Epic (first reference) if it exists
+                    epic_id = None
+                    if test_data["epic_references"]:
+                        epic_id = epic_ids.get(test_data["epic_references"][0])
+                    if epic_id:
+                        values["epic_id"] = epic_id
+                        stats["linked_to_epics"] += 1
+
+                    row = existing.get(key)
+                    if row is None:
+                        test = Test(
+                            description=(
+                                f"Auto-discovered test from {test_data['test_file_path']}:{test_data['line_number']}"
+                            ),
+                            **values,
+                        )
+                        creates.append(insert_values(test))
+                        existing[key] = test  # later duplicates update nothing
                         stats["created"] += 1
-                    elif result == "updated":
+                    else:
+                        changed = {
+                            column: value
+                            for column, value in values.items()
+                            if getattr(row, column) != value
+                        }
+                        if changed and row.id is not None:
+                            updates.append({"id": row.id, **changed})
+                            for epic in {row.epic_id, values.get("epic_id")} - {None}:
+                                dirty_epics[epic] = CHILD_METRIC_FAMILIES[Test]
                         stats["updated"] += 1
 
-                    # Link to Epic if references found
-                    if test_data["epic_references"]:
-                        if self._link_test_to_epic(db, test_data):
-                            stats["linked_to_epics"] += 1
+                    if epic_id and row is None:
+                        dirty_epics[epic_id] = CHILD_METRIC_FAMILIES[Test]
 
                 except Exception as e:
                     print(f"Error syncing test {test_data['test_function_name']}: {e}")
                     stats["errors"] += 1
 
+            # render_nulls keeps rows with and without an epic in one batch
+            statement = insert(Test).execution_options(render_nulls=True)
+            for start in range(0, len(creates), SYNC_CHUNK_SIZE):
+                db.execute(statement, creates[start : start + SYNC_CHUNK_SIZE])
+            for start in range(0, len(updates), SYNC_CHUNK_SIZE):
+                db.execute(update(Test), updates[start : start + SYNC_CHUNK_SIZE])
+            # Bulk statements bypass the flush hook that marks epic metrics stale
+            if dirty_epics:
+                mark_epic_metrics_dirty(db, dirty_epics)
+
             db.commit()
             return stats
 
@@ -214,87 +499,45 @@ class TestDatabaseSync:
         finally:
             db.close()
 
-    def _create_or_update_test(self, db, test_data: Dict) -> str:
-        """Create or update a test record in the database."""
-        existing_test = (
-            db.query(Test)
-            .filter(
-                Test.test_file_path == test_data["test_file_path"],
-                Test.test_function_name == test_data["test_function_name"],
-            )
-            .first()
-        )
-
-        if existing_test:
-            # Update existing test
-            existing_test.title = test_data["title"]
-            existing_test.test_type = test_data["test_type"]
-            existing_test.bdd_scenario_name = test_data["bdd_scenario_name"]
-            existing_test.component = test_data.get("component")
-            existing_test.test_priority = test_data.get("priority") or "medium"
-            existing_test.test_category = test_data.get("test_category")
-            return "updated"
-        else:
-            # Create new test
-            test = Test(
-                test_type=test_data["test_type"],
-                test_file_path=test_data["test_file_path"],
-                title=test_data["title"],
-                test_function_name=test_data["test_function_name"],
-                bdd_scenario_name=test_data["bdd_scenario_name"],
-                component=test_data.get("component"),
-                test_priority=test_data.get("priority") or "medium",
-                test_category=test_data.get("test_category"),
-                description=(
-                    f"Auto-discovered test from {test_data['test_file_path']}:{test_data['line_number']}"
-                ),
-            )
-            db.add(test)
-            return "created"
-
-    def _link_test_to_epic(self, db, test_data: Dict) -> bool:
-        """Link test to Epic based on references found in test code."""
-        if not test_data["epic_references"]:
-            return False
-
-        # Use the first Epic reference found
-        epic_id = test_data["epic_references"][0]
-        epic = db.query(Epic).filter(Epic.epic_id == epic_id).first()
-
-        if epic:
-            # Update the test with Epic link
-            test = (
-                db.query(Test)
-                .filter(
-                    Test.test_file_path == test_data["test_file_path"],
-                    Test.test_function_name == test_data["test_function_name"],
-                )
-                .first()
-            )
-
-            if test:
-                test.epic_id = epic.id
-                return True
-
-        return False
+    def _synced_values(self, test_data: Dict) -> Dict:
+        """Test columns written by a sync, from discovered test metadata."""
+        return {
+            "test_type": test_data["test_type"],
+            "test_file_path": test_data["test_file_path"],
+            "test_function_name": test_data["test_function_name"],
+            "title": test_data["title"],
+            "bdd_scenario_name": test_data["bdd_scenario_name"],
+            "component": test_data.get("component"),
+            "test_priority": test_data.get("priority") or "medium",
+            "test_category": test_data.get("test_category"),
+        }
 
 
 class TestExecutionTracker:
-    """Tracks test execution results and updates database."""
+    """Tracks test execution results and updates database.
+
+    Results are buffered per test during the session and written with one
+    batched UPDATE when the session ends.
+    """
 
     __test__ = False  # Tell pytest this is not a test class
 
     def __init__(self):
         self.db_session = None
+        self._test_index: Optional[Dict[Tuple[str, str], Tuple[int, Any]]] = None
+        self._pending_results: Dict[int, Dict] = {}
 
     def start_test_session(self):
         """Initialize database session for test execution tracking."""
         self.db_session = get_db_session()
+        self._test_index = None
+        self._pending_results = {}
 
     def end_test_session(self):
-        """Close database session and commit changes."""
+        """Write buffered results, then close database session and commit."""
         if self.db_session:
             try:
+                self.flush_results()
                 self.db_session.commit()
             except Exception as e:
                 self.db_session.rollback()
@@ -302,6 +545,8 @@ class TestExecutionTracker:
             finally:
                 self.db_session.close()
                 self.db_session = None
+                self._test_index = None
+                self._pending_results = {}
 
     def record_test_result(
         self,
@@ -313,6 +558,9 @@ class TestExecutionTracker:
         """
         Record test execution result in database.
 
+        The result is buffered and written by flush_results() (called by
+        end_test_session), with the same effect as Test.update_execution_result.
+
         Args:
             test_id: Test identifier (file::function format)
             status: Test status (passed, failed, skipped)
@@ -333,25 +581,102 @@ class TestExecutionTracker:
             test_file = parts[0]
             test_function = parts[-1]
 
-            # Find test in database
-            test = (
-                self.db_session.query(Test)
-                .filter(
-                    Test.test_file_path == test_file,
-                    Test.test_function_name == test_function,
-                )
-                .first()
-            )
+            # Find test in the index loaded once per session
+            if self._test_index is None:
+                self._test_index = {
+                    (path, function): (id_, epic_id)
+                    for id_, path, function, epic_id in self.db_session.execute(
+                        select(
+                            Test.id,
+                            Test.test_file_path,
+                            Test.test_function_name,
+                            Test.epic_id,
+                        )
+                    )
+                }
+            found = self._test_index.get((test_file, test_function))
+            if not found:
+                return False
 
-            if test:
-                test.update_execution_result(status, duration_ms, error_message)
-                return True
+            pending = self._pending_results.setdefault(
+                found[0],
+                {
+                    "b_id": found[0],
+                    "b_epic_id": found[1],
+                    "b_runs": 0,
+                    "b_failures": 0,
+                    "b_duration": None,
+                    "b_error": None,
+                    "b_cleared": False,
+                },
+            )
+            pending["b_runs"] += 1
+            pending["b_status"] = status
+            pending["b_time"] = datetime.now()
+            if duration_ms is not None:
+                pending["b_duration"] = duration_ms
+            if status == "failed":
+                pending["b_failures"] += 1
+                if error_message:
+                    pending["b_error"] = error_message
+            else:
+                # Clear error on successful run
+                pending["b_error"] = None
+                pending["b_cleared"] = True
+            return True
 
         except Exception as e:
             print(f"Error recording test result for {test_id}: {e}")
 
         return False
 
+    def flush_results(self) -> int:
+        """Apply buffered execution results with one executemany UPDATE."""
+        if not self.db_session or not self._pending_results:
+            return 0
+
+        rows = list(self._pending_results.values())
+        table = Test.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                execution_count=table.c.execution_count + bindparam("b_runs"),
+                failure_count=table.c.failure_count + bindparam("b_failures"),
+                last_execution_status=bindparam("b_status"),
+                last_execution_time=bindparam(
+                    "b_time", type_=table.c.last_execution_time.type
+                ),
+                execution_duration_ms=func.coalesce(
+                    bindparam("b_duration", type_=table.c.execution_duration_ms.type),
+                    table.c.execution_duration_ms,
+                ),
+                last_error_message=case(
+                    (bindparam("b_error", type_=Text).is_not(None), bindparam("b_error")),
+                    (bindparam("b_cleared", type_=Boolean), None),
+                    else_=table.c.last_error_message,
+                ),
+                last_error_traceback=case(
+                    (bindparam("b_cleared", type_=Boolean), None),
+                    else_=table.c.last_error_traceback,
+                ),
+            )
+        )
+        for start in range(0, len(rows), SYNC_CHUNK_SIZE):
+            self.db_session.execute(statement, rows[start : start + SYNC_CHUNK_SIZE])
+
+        # Bulk statements bypass the flush hook that marks epic metrics stale
+        dirty_epics = {
+            row["b_epic_id"]: CHILD_METRIC_FAMILIES[Test]
+            for row in rows
+            if row["b_epic_id"] is not None
+        }
+        if dirty_epics:
+            mark_epic_metrics_dirty(self.db_session, dirty_epics)
+
+        self._pending_results = {}
+        return len(rows)
+
     def create_defect_from_failure(
         self, test_id: str, failure_message: str, stack_trace: str
     ) -> Optional[str]:
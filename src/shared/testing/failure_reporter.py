@@ -20,7 +20,7 @@ import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from fe.services import TemplateService, AssetService
+from fe.services import get_asset_service, get_template_service
 
 
 class FailureReporter:
@@ -31,8 +31,8 @@ class FailureReporter:
         self.tracker = failure_tracker
 
         # Use frontend services for template rendering
-        self.template_service = TemplateService()
-        self.asset_service = AssetService()
+        self.template_service = get_template_service()
+        self.asset_service = get_asset_service()
 
         # Legacy compatibility - maintain old interface
         self.template_env = self.template_service.jinja_env
@@ -10,14 +10,22 @@ Parent Epic: EP-00006 Test Logging and Reporting
 
 import hashlib
 import json
+import logging
+import os
 import re
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, UTC
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
+
+# Batches of failures kept pending while the database cannot be written
+MAX_PENDING_BATCHES = 5
+
 
 class FailureCategory(Enum):
     """Categories for test failure classification."""
@@ -121,6 +129,27 @@ class FailureStatistics:
     trend_analysis: Dict[str, Any]
 
 
+_UPSERT_FAILURE_SQL = """
+    INSERT INTO test_failures (
+        test_id, test_name, test_file, failure_message, stack_trace,
+        category, severity, error_hash, first_seen, last_seen,
+        occurrence_count, environment_info, coverage_info,
+        execution_mode, session_id, metadata
+    ) VALUES (
+        :test_id, :test_name, :test_file, :failure_message, :stack_trace,
+        :category, :severity, :error_hash, :first_seen, :last_seen,
+        :occurrence_count, :environment_info, :coverage_info,
+        :execution_mode, :session_id, :metadata
+    )
+    ON CONFLICT(error_hash) DO UPDATE SET
+        occurrence_count = occurrence_count + :hits,
+        last_seen = excluded.last_seen,
+        session_id = excluded.session_id,
+        execution_mode = excluded.execution_mode,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
 class FailureTracker:
     """Main class for tracking and analyzing test failures."""
 
@@ -133,9 +162,24 @@ class FailureTracker:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
 
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for concurrent writers (WAL, busy timeout)."""
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_database(self):
         """Initialize SQLite database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self.connect()
+        try:
+            self._create_schema(conn)
+        finally:
+            conn.close()
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create tables and indexes, merging duplicate error hashes once."""
+        with conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS test_failures (
@@ -186,66 +230,110 @@ class FailureTracker:
             """
             )
 
-    def record_failure(self, failure: TestFailure) -> int:
-        """Record a test failure in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Check if this error pattern already exists
-            existing = conn.execute(
-                "SELECT id, occurrence_count FROM test_failures WHERE error_hash = ?",
-                (failure.error_hash,),
+            has_unique_hash = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' "
+                "AND name = 'idx_error_hash_unique'"
             ).fetchone()
+            if has_unique_hash:
+                return
 
-            if existing:
-                # Update existing failure record
-                failure_id, count = existing
-                new_count = count + 1
-                conn.execute(
-                    """
-                    UPDATE test_failures
-                    SET occurrence_count = ?, last_seen = ?, session_id = ?,
-                        execution_mode = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (
-                        new_count,
-                        failure.last_seen.isoformat(),
-                        failure.session_id,
-                        failure.execution_mode,
-                        failure_id,
+            # Databases written before upserts may hold one row per recording
+            conn.executescript(
+                """
+                UPDATE test_failures
+                SET occurrence_count = (
+                        SELECT SUM(t.occurrence_count) FROM test_failures t
+                        WHERE t.error_hash = test_failures.error_hash
                     ),
-                )
-                return failure_id
+                    last_seen = (
+                        SELECT MAX(t.last_seen) FROM test_failures t
+                        WHERE t.error_hash = test_failures.error_hash
+                    )
+                WHERE id IN (
+                    SELECT MIN(id) FROM test_failures
+                    GROUP BY error_hash HAVING COUNT(*) > 1
+                );
+
+                DELETE FROM test_failures
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM test_failures GROUP BY error_hash
+                );
+
+                CREATE UNIQUE INDEX idx_error_hash_unique
+                    ON test_failures(error_hash);
+            """
+            )
+
+    def record_failure(self, failure: TestFailure) -> int:
+        """Record a test failure in the database."""
+        return self.record_failures([failure])[failure.error_hash]
+
+    def record_failures(
+        self,
+        failures: List[TestFailure],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Dict[str, int]:
+        """Record failures in one transaction and return ids by error hash.
+
+        Failures sharing an error hash are merged before writing, so each
+        distinct failure costs a single upsert however often it occurred.
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for failure in failures:
+            row = merged.get(failure.error_hash)
+            if row is None:
+                merged[failure.error_hash] = {
+                    "test_id": failure.test_id,
+                    "test_name": failure.test_name,
+                    "test_file": failure.test_file,
+                    "failure_message": failure.failure_message,
+                    "stack_trace": failure.stack_trace,
+                    "category": failure.category.value,
+                    "severity": failure.severity.value,
+                    "error_hash": failure.error_hash,
+                    "first_seen": failure.first_seen.isoformat(),
+                    "last_seen": failure.last_seen.isoformat(),
+                    "occurrence_count": failure.occurrence_count,
+                    "environment_info": failure.environment_info,
+                    "coverage_info": failure.coverage_info,
+                    "execution_mode": failure.execution_mode,
+                    "session_id": failure.session_id,
+                    "metadata": json.dumps(failure.metadata),
+                    "hits": 1,
+                }
             else:
-                # Insert new failure record
-                result = conn.execute(
-                    """
-                    INSERT INTO test_failures (
-                        test_id, test_name, test_file, failure_message, stack_trace,
-                        category, severity, error_hash, first_seen, last_seen,
-                        occurrence_count, environment_info, coverage_info,
-                        execution_mode, session_id, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        failure.test_id,
-                        failure.test_name,
-                        failure.test_file,
-                        failure.failure_message,
-                        failure.stack_trace,
-                        failure.category.value,
-                        failure.severity.value,
-                        failure.error_hash,
-                        failure.first_seen.isoformat(),
-                        failure.last_seen.isoformat(),
-                        failure.occurrence_count,
-                        failure.environment_info,
-                        failure.coverage_info,
-                        failure.execution_mode,
-                        failure.session_id,
-                        json.dumps(failure.metadata),
-                    ),
-                )
-                return result.lastrowid
+                row["occurrence_count"] += 1
+                row["hits"] += 1
+                row["last_seen"] = failure.last_seen.isoformat()
+                row["session_id"] = failure.session_id
+                row["execution_mode"] = failure.execution_mode
+
+        if not merged:
+            return {}
+
+        owns_connection = conn is None
+        if owns_connection:
+            conn = self.connect()
+        try:
+            with conn:
+                conn.executemany(_UPSERT_FAILURE_SQL, merged.values())
+                ids: Dict[str, int] = {}
+                hashes = list(merged)
+                # Stay well below SQLite's bound parameter limit
+                for start in range(0, len(hashes), 500):
+                    chunk = hashes[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    ids.update(
+                        conn.execute(
+                            "SELECT error_hash, id FROM test_failures "
+                            f"WHERE error_hash IN ({placeholders})",
+                            chunk,
+                        ).fetchall()
+                    )
+            return ids
+        finally:
+            if owns_connection:
+                conn.close()
 
     def categorize_failure(
         self, error_message: str, stack_trace: str
@@ -544,3 +632,90 @@ class FailureTracker:
             )
 
         return deleted_count
+
+
+class FailureRecorder:
+    """Buffers failures and writes them to a FailureTracker in batches.
+
+    Keeps one connection per process, so pytest-xdist workers each write
+    through their own WAL connection and wait on the busy timeout rather
+    than failing when another worker holds the write lock.
+
+    Failures whose write failed stay pending, up to ``max_pending`` (five
+    batches by default); past that the oldest are dropped and counted in
+    ``dropped_count``.
+    """
+
+    def __init__(
+        self,
+        tracker: FailureTracker,
+        batch_size: int = 200,
+        max_pending: Optional[int] = None,
+    ):
+        self.tracker = tracker
+        self.batch_size = batch_size
+        self.max_pending = max_pending or batch_size * MAX_PENDING_BATCHES
+        self.recorded_count = 0
+        self.dropped_count = 0
+        self._dropping = False
+        self._pending: List[TestFailure] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def record(self, failure: TestFailure) -> None:
+        """Queue a failure, flushing once a full batch is pending."""
+        with self._lock:
+            self._pending.append(failure)
+            self._drop_oldest_locked()
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> Dict[str, int]:
+        """Write all pending failures and return their ids by error hash."""
+        with self._lock:
+            return self._flush_locked()
+
+    def close(self) -> None:
+        """Flush pending failures and close the connection."""
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+    def _flush_locked(self) -> Dict[str, int]:
+        if not self._pending:
+            return {}
+        # Failures stay pending until written, so a failed write is retried
+        # with the next batch instead of dropping the whole batch
+        ids = self.tracker.record_failures(self._pending, self._connection())
+        self.recorded_count += len(self._pending)
+        self._pending = []
+        self._dropping = False
+        return ids
+
+    def _drop_oldest_locked(self) -> None:
+        overflow = len(self._pending) - self.max_pending
+        if overflow <= 0:
+            return
+        del self._pending[:overflow]
+        self.dropped_count += overflow
+        # Warn once per run of failed writes rather than on every failure
+        if not self._dropping:
+            self._dropping = True
+            logger.warning(
+                "Failure database unavailable; dropping the oldest pending "
+                "failures beyond %d (%d dropped so far)",
+                self.max_pending,
+                self.dropped_count,
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection inherited across fork must not be reused
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = self.tracker.connect()
+            self._conn_pid = os.getpid()
+        return self._conn
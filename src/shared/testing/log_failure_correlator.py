@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ..logging.logger import LogEntry, StructuredLogger, get_logger
 from .failure_tracker import FailureTracker
+from .log_index import LogIndex, timestamp_seconds
 
 
 @dataclass
@@ -64,10 +65,16 @@ class LogFailureCorrelator:
         self,
         failure_tracker: Optional[FailureTracker] = None,
         logger: Optional[StructuredLogger] = None,
+        log_index: Optional[LogIndex] = None,
     ):
         """Initialize the log-failure correlator."""
         self.failure_tracker = failure_tracker or FailureTracker()
         self.logger = logger or get_logger()
+        # Log history beyond the logger's buffer, next to the failure database
+        self.log_index = log_index or LogIndex(
+            self.failure_tracker.db_path.with_name("log_index.db"),
+            log_file=self.logger.config.get_log_file_path(),
+        )
 
     def correlate_failure_with_logs(
         self, failure_id: int, time_window_minutes: int = 10
@@ -87,6 +94,13 @@ class LogFailureCorrelator:
         if not failure:
             return None
 
+        self._sync_log_index()
+        return self._build_failure_context(failure, time_window_minutes)
+
+    def _build_failure_context(
+        self, failure: Dict[str, Any], time_window_minutes: int = 10
+    ) -> FailureContext:
+        """Correlate a failure row with logs from the synced log index."""
         # Get correlated logs
         logs = self._get_logs_for_failure(failure, time_window_minutes)
 
@@ -106,7 +120,7 @@ class LogFailureCorrelator:
         related_failures = self._find_related_failures(failure)
 
         return FailureContext(
-            failure_id=failure_id,
+            failure_id=failure["id"],
             test_id=failure["test_id"],
             test_name=failure["test_name"],
             failure_message=failure["failure_message"],
@@ -140,8 +154,10 @@ class LogFailureCorrelator:
         failure_patterns = {}
         debugging_insights = []
 
+        # One incremental index update covers every failure below
+        self._sync_log_index()
         for failure in recent_failures:
-            context = self.correlate_failure_with_logs(failure["id"])
+            context = self._build_failure_context(failure)
             if context and (
                 context.setup_logs or context.execution_logs or context.teardown_logs
             ):
@@ -317,34 +333,35 @@ class LogFailureCorrelator:
         start_time = failure_time - timedelta(minutes=time_window_minutes)
         end_time = failure_time + timedelta(minutes=5)  # Small buffer after failure
 
-        # Get logs from the structured logger
-        all_logs = self.logger.get_recent_logs(
-            10000
-        )  # Large number to get enough context
-
-        # Filter by time and test correlation
-        related_logs = []
-        for log in all_logs:
-            log_time = datetime.fromisoformat(log.timestamp)
-            if start_time <= log_time <= end_time:
-                # Check if log is related to this test
-                if (
-                    (
-                        hasattr(log, "test_id")
-                        and log.test_id
-                        and log.test_id == failure.get("test_id")
-                    )
-                    or (
-                        hasattr(log, "test_name")
-                        and log.test_name
-                        and log.test_name == failure["test_name"]
-                    )
-                    or (failure["test_name"] in str(log.message))
-                ):
-                    related_logs.append(log)
+        # Logs already written to file, via the time-ordered index
+        related_logs = self.log_index.query(
+            start_time, end_time, failure.get("test_id"), failure["test_name"]
+        )
+        seen = {(log.timestamp, log.session_id, log.message) for log in related_logs}
+
+        # Buffered logs not in the files (below the file log level)
+        buffered = False
+        for log in self.logger.get_logs_between(start_time, end_time):
+            if (log.timestamp, log.session_id, log.message) in seen:
+                continue
+            # Check if log is related to this test
+            if (
+                (log.test_id and log.test_id == failure.get("test_id"))
+                or (log.test_name and log.test_name == failure["test_name"])
+                or (failure["test_name"] in str(log.message))
+            ):
+                related_logs.append(log)
+                buffered = True
 
+        if buffered:
+            related_logs.sort(key=lambda log: timestamp_seconds(log.timestamp) or 0)
         return related_logs
 
+    def _sync_log_index(self) -> None:
+        """Write out pending log lines, then index what is new in the files."""
+        self.logger.flush()
+        self.log_index.sync()
+
     def _organize_logs_by_phase(
         self, logs: List[LogEntry]
     ) -> Tuple[List[LogEntry], List[LogEntry], List[LogEntry]]:
@@ -0,0 +1,275 @@
+"""
+Persistent Time-Ordered Log Index
+
+Indexes the JSON lines written by StructuredLogger into a SQLite table keyed
+by timestamp, test_id and test_name, so failure correlation can look up the
+logs of a time window with an index range scan, including history that has
+left the logger's in-memory buffer.
+
+Indexing is incremental. Each log file is identified by a hash of its first
+line and the index remembers how far it has read it, so a file renamed by
+log rotation is not read again and only new lines are parsed.
+
+Related to: US-00026 Log-failure association and context preservation
+Parent Epic: EP-00006 Test Logging and Reporting
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..logging.logger import LogEntry
+
+_INSERT_ENTRY_SQL = """
+    INSERT INTO log_entries (
+        ts, timestamp, level, message, test_id, test_name, test_status,
+        duration_ms, environment, session_id, metadata, stack_trace, tags
+    ) VALUES (
+        :ts, :timestamp, :level, :message, :test_id, :test_name, :test_status,
+        :duration_ms, :environment, :session_id, :metadata, :stack_trace, :tags
+    )
+"""
+
+_ENTRY_COLUMNS = (
+    "timestamp, level, message, test_id, test_name, test_status, duration_ms, "
+    "environment, session_id, metadata, stack_trace, tags"
+)
+
+
+def timestamp_seconds(value: str) -> Optional[float]:
+    """Seconds since the epoch of an ISO timestamp (naive means local time)."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class LogIndex:
+    """SQLite index of structured log entries ordered by time."""
+
+    def __init__(self, db_path: Optional[Path] = None, log_file: Optional[Path] = None):
+        """Initialize the index database; ``log_file`` is what sync() reads."""
+        if db_path is None:
+            db_path = Path("quality/logs/log_index.db")
+
+        self.db_path = db_path
+        self.log_file = log_file
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_database()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for concurrent writers (WAL, busy timeout)."""
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_database(self):
+        """Initialize SQLite database with required tables."""
+        conn = self.connect()
+        try:
+            with conn:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS log_entries (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        ts REAL NOT NULL,
+                        timestamp TEXT NOT NULL,
+                        level TEXT NOT NULL,
+                        message TEXT NOT NULL,
+                        test_id TEXT,
+                        test_name TEXT,
+                        test_status TEXT,
+                        duration_ms REAL,
+                        environment TEXT,
+                        session_id TEXT,
+                        metadata TEXT,
+                        stack_trace TEXT,
+                        tags TEXT
+                    );
+
+                    CREATE INDEX IF NOT EXISTS idx_log_ts ON log_entries(ts);
+                    CREATE INDEX IF NOT EXISTS idx_log_test_id
+                        ON log_entries(test_id, ts);
+                    CREATE INDEX IF NOT EXISTS idx_log_test_name
+                        ON log_entries(test_name, ts);
+
+                    CREATE TABLE IF NOT EXISTS indexed_log_files (
+                        file_key TEXT PRIMARY KEY,
+                        path TEXT NOT NULL,
+                        offset INTEGER NOT NULL,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    );
+                """)
+        finally:
+            conn.close()
+
+    def log_files(self) -> List[Path]:
+        """The log file and its rotated backups, oldest first."""
+        if self.log_file is None:
+            return []
+        backups = []
+        for path in self.log_file.parent.glob(f"{self.log_file.name}.*"):
+            suffix = path.name[len(self.log_file.name) + 1 :]
+            if suffix.isdigit():
+                backups.append((int(suffix), path))
+        files = [path for _, path in sorted(backups, reverse=True)]
+        if self.log_file.exists():
+            files.append(self.log_file)
+        return files
+
+    def sync(self, paths: Optional[Iterable[Path]] = None) -> int:
+        """Index lines added to the log files since the last sync.
+
+        Returns the number of entries added.
+        """
+        added = 0
+        conn = self.connect()
+        try:
+            for path in self.log_files() if paths is None else paths:
+                added += self._index_file(conn, Path(path))
+        finally:
+            conn.close()
+        return added
+
+    def _index_file(self, conn: sqlite3.Connection, path: Path) -> int:
+        try:
+            handle = open(path, "rb")
+        except OSError:
+            return 0
+        with handle:
+            first_line = handle.readline()
+            if not first_line.endswith(b"\n"):
+                return 0  # Empty, or the first line is still being written
+            file_key = hashlib.sha256(first_line).hexdigest()
+            row = conn.execute(
+                "SELECT offset FROM indexed_log_files WHERE file_key = ?",
+                (file_key,),
+            ).fetchone()
+            offset = row[0] if row else 0
+            handle.seek(offset)
+            data = handle.read()
+
+        # Leave a partly written last line for the next sync
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+        rows = []
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            entry = self._parse_line(line)
+            if entry is not None:
+                rows.append(entry)
+
+        with conn:
+            conn.executemany(_INSERT_ENTRY_SQL, rows)
+            conn.execute(
+                """
+                INSERT INTO indexed_log_files (file_key, path, offset)
+                VALUES (?, ?, ?)
+                ON CONFLICT(file_key) DO UPDATE SET
+                    path = excluded.path,
+                    offset = excluded.offset,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (file_key, str(path), offset + end),
+            )
+        return len(rows)
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Dict[str, Any]]:
+        """Row values for one JSON log line, or None if it is not an entry."""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(record, dict):
+            return None
+        ts = timestamp_seconds(record.get("timestamp"))
+        if ts is None or "message" not in record:
+            return None
+        metadata, tags = record.get("metadata"), record.get("tags")
+        return {
+            "ts": ts,
+            "timestamp": record["timestamp"],
+            "level": record.get("level", ""),
+            "message": str(record["message"]),
+            "test_id": record.get("test_id"),
+            "test_name": record.get("test_name"),
+            "test_status": record.get("test_status"),
+            "duration_ms": record.get("duration_ms"),
+            "environment": record.get("environment"),
+            "session_id": record.get("session_id"),
+            "metadata": json.dumps(metadata) if metadata is not None else None,
+            "stack_trace": record.get("stack_trace"),
+            "tags": json.dumps(tags) if tags is not None else None,
+        }
+
+    def query(
+        self,
+        start: datetime,
+        end: datetime,
+        test_id: Optional[str] = None,
+        test_name: Optional[str] = None,
+    ) -> List[LogEntry]:
+        """Entries logged within ``[start, end]`` for a test, oldest first.
+
+        An entry belongs to the test if its test_id or test_name matches, or
+        if its message mentions ``test_name``.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_ENTRY_COLUMNS} FROM log_entries
+                WHERE ts BETWEEN ? AND ?
+                AND (test_id = ? OR test_name = ? OR instr(message, ?) > 0)
+                ORDER BY ts, id
+            """,
+                (start.timestamp(), end.timestamp(), test_id, test_name, test_name),
+            ).fetchall()
+
+        return [self._to_entry(row) for row in rows]
+
+    def count(self) -> int:
+        """Number of indexed entries."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM log_entries").fetchone()[0]
+
+    def cleanup_old_entries(self, days: int) -> int:
+        """Delete entries older than ``days`` days; returns how many."""
+        cutoff = datetime.now().timestamp() - days * 86400
+
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("DELETE FROM log_entries WHERE ts < ?", (cutoff,)).rowcount
+
+    @staticmethod
+    def _to_entry(row) -> LogEntry:
+        (
+            timestamp,
+            level,
+            message,
+            test_id,
+            test_name,
+            test_status,
+            duration_ms,
+            environment,
+            session_id,
+            metadata,
+            stack_trace,
+            tags,
+        ) = row
+        return LogEntry(
+            timestamp=timestamp,
+            level=level,
+            message=message,
+            test_id=test_id,
+            test_name=test_name,
+            test_status=test_status,
+            duration_ms=duration_ms,
+            environment=environment,
+            session_id=session_id,
+            metadata=json.loads(metadata) if metadata is not None else None,
+            stack_trace=stack_trace,
+            tags=json.loads(tags) if tags is not None else None,
+        )
@@ -15,6 +15,7 @@ from pathlib import Path
 import pytest
 
 from .failure_tracker import (
+    FailureRecorder,
     FailureTracker,
     TestFailure,
 )
@@ -26,9 +27,15 @@ class FailureTrackingPlugin:
     def __init__(self):
         """Initialize the failure tracking plugin."""
         self.failure_tracker = FailureTracker()
+        self.recorder = FailureRecorder(self.failure_tracker)
         self.session_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         self.execution_mode = "standard"
-        self.current_session_failures = []
+        self.environment_info = self._get_environment_info()
+        self.python_version = (
+            f"{sys.version_info.major}.{sys.version_info.minor}."
+            f"{sys.version_info.micro}"
+        )
+        self.platform = platform.platform()
 
     def pytest_configure(self, config):
         """Configure plugin with pytest session details."""
@@ -67,15 +74,15 @@ class FailureTrackingPlugin:
             stack_trace=stack_trace,
             session_id=self.session_id,
             execution_mode=self.execution_mode,
-            environment_info=self._get_environment_info(),
+            environment_info=self.environment_info,
             metadata={
                 "duration": getattr(report, "duration", 0),
                 "keywords": (
                     list(report.keywords.keys()) if hasattr(report, "keywords") else []
                 ),
                 "markers": [m.name for m in getattr(report, "markers", [])],
-                "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                "platform": platform.platform(),
+                "python_version": self.python_version,
+                "platform": self.platform,
             },
         )
 
@@ -85,10 +92,9 @@ class FailureTrackingPlugin:
         )
         failure.severity = self.failure_tracker.determine_severity(failure)
 
-        # Record the failure
+        # Queue the failure; it is written with the next batch
         try:
-            failure_id = self.failure_tracker.record_failure(failure)
-            self.current_session_failures.append(failure_id)
+            self.recorder.record(failure)
         except Exception as e:
             # Don't let failure tracking break the test run
             print(f"Warning: Failed to record test failure: {e}")
@@ -106,10 +112,21 @@ class FailureTrackingPlugin:
 
     def pytest_sessionfinish(self, session, exitstatus):
         """Generate failure summary at end of test session."""
-        if self.current_session_failures:
+        try:
+            self.recorder.close()
+        except Exception as e:
+            print(f"Warning: Failed to record test failures: {e}")
+        if self.recorder.dropped_count:
+            print(
+                "Warning: Dropped "
+                f"{self.recorder.dropped_count} failures while the failure "
+                "database was unavailable"
+            )
+
+        if self.recorder.recorded_count:
             print("\n📊 Failure Tracking Summary:")
             print(f"   Session ID: {self.session_id}")
-            print(f"   New failures recorded: {len(self.current_session_failures)}")
+            print(f"   New failures recorded: {self.recorder.recorded_count}")
             print(f"   Execution mode: {self.execution_mode}")
 
             # Get recent statistics
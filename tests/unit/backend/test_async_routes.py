@@ -0,0 +1,219 @@
+"""
+Unit tests for the async database path of the async route handlers.
+
+Verifies that the Epic dependency routes work end to end on an AsyncSession,
+that slow graph analysis runs on the blocking executor without stalling
+other requests, and that the async URL mapping picks the async drivers.
+
+Related Issue: US-00070 - Modèle dépendances fonctionnelles Epic
+Parent Epic: EP-00010 - Dashboard de Traçabilité Multi-Persona
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from src.be.api import epic_dependencies
+from src.be.database import async_database_url, create_async_db_engine, get_async_db
+from src.be.models.traceability import Epic
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_dependency import DependencyGraph
+from src.be.services.blocking_io import run_blocking
+from src.be.services.dependency_graph_service import (
+    EpicDependencyGraph,
+    get_dependency_graph,
+    reset_dependency_graphs,
+)
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App with the dependency router on a file-backed SQLite database."""
+    url = f"sqlite:///{tmp_path / 'deps.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(sync_engine)
+    session = sessionmaker(bind=sync_engine)()
+    session.add_all(
+        [Epic(epic_id=f"EP-{index:05d}", title=f"Epic {index}") for index in (1, 2, 3)]
+    )
+    session.commit()
+    session.close()
+
+    async_engine = create_async_db_engine(url)
+    factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with factory() as db:
+            yield db
+
+    monkeypatch.setattr(
+        epic_dependencies, "get_db_session", sessionmaker(bind=sync_engine)
+    )
+    reset_dependency_graphs()
+
+    app = FastAPI()
+    app.include_router(epic_dependencies.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield app
+
+    reset_dependency_graphs()
+    asyncio.run(async_engine.dispose())
+    sync_engine.dispose()
+
+
+def _run(app, scenario):
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await scenario(client)
+
+    return asyncio.run(main())
+
+
+def test_dependency_crud_on_async_session(app):
+    async def scenario(client):
+        created = await client.post(
+            "/api/epic-dependencies/",
+            json={
+                "parent_epic_id": 1,
+                "dependent_epic_id": 2,
+                "dependency_type": "blocking",
+                "priority": "critical",
+            },
+        )
+        assert created.status_code == 201
+        dependency = created.json()
+        assert dependency["is_blocking"] is True
+
+        duplicate = await client.post(
+            "/api/epic-dependencies/",
+            json={
+                "parent_epic_id": 1,
+                "dependent_epic_id": 2,
+                "dependency_type": "blocking",
+            },
+        )
+        assert duplicate.status_code == 409
+
+        cycle = await client.post(
+            "/api/epic-dependencies/",
+            json={
+                "parent_epic_id": 2,
+                "dependent_epic_id": 1,
+                "dependency_type": "technical",
+            },
+        )
+        assert cycle.status_code == 400
+
+        resolved = await client.post(
+            f"/api/epic-dependencies/{dependency['id']}/resolve",
+            params={"notes": "done"},
+        )
+        assert resolved.status_code == 200
+
+        fetched = await client.get(f"/api/epic-dependencies/{dependency['id']}")
+        assert fetched.json()["is_resolved"] is True
+        assert fetched.json()["resolution_notes"] == "done"
+
+        listed = await client.get(
+            "/api/epic-dependencies/", params={"is_resolved": True}
+        )
+        assert [item["id"] for item in listed.json()] == [dependency["id"]]
+
+        stats = await client.get("/api/epic-dependencies/statistics/summary")
+        assert stats.json()["total_dependencies"] == 1
+        assert stats.json()["resolved_dependencies"] == 1
+        assert stats.json()["type_distribution"]["blocking"] == 1
+        assert stats.json()["priority_distribution"]["critical"] == 1
+
+        deleted = await client.delete(f"/api/epic-dependencies/{dependency['id']}")
+        assert deleted.status_code == 204
+        missing = await client.get(f"/api/epic-dependencies/{dependency['id']}")
+        assert missing.status_code == 404
+
+    _run(app, scenario)
+
+
+def test_async_writes_update_the_shared_graph_incrementally(app, monkeypatch):
+    loads = []
+    load = EpicDependencyGraph.from_dependencies
+    monkeypatch.setattr(
+        EpicDependencyGraph,
+        "from_dependencies",
+        lambda dependencies: loads.append(1) or load(dependencies),
+    )
+
+    async def scenario(client):
+        for parent, dependent in ((1, 2), (2, 3)):
+            created = await client.post(
+                "/api/epic-dependencies/",
+                json={
+                    "parent_epic_id": parent,
+                    "dependent_epic_id": dependent,
+                    "dependency_type": "blocking",
+                },
+            )
+            assert created.status_code == 201
+
+    _run(app, scenario)
+
+    session = epic_dependencies.get_db_session()
+    try:
+        graph = get_dependency_graph(session)
+    finally:
+        session.close()
+    assert graph.successors(1) == {2}
+    assert graph.successors(2) == {3}
+    # Loaded by the first cycle check, then kept current by the async commits
+    assert len(loads) == 1
+
+
+def test_slow_graph_analysis_does_not_stall_other_requests(app, monkeypatch):
+    original = DependencyGraph.detect_cycles
+
+    def slow_detect_cycles(self, dependencies=None):
+        time.sleep(0.5)
+        return original(self, dependencies)
+
+    monkeypatch.setattr(DependencyGraph, "detect_cycles", slow_detect_cycles)
+
+    async def scenario(client):
+        finished = []
+
+        async def request(name, path):
+            response = await client.get(path)
+            assert response.status_code == 200
+            finished.append(name)
+
+        await asyncio.gather(
+            request("slow", "/api/epic-dependencies/analysis/cycles"),
+            request("fast", "/api/epic-dependencies/"),
+        )
+        return finished
+
+    assert _run(app, scenario) == ["fast", "slow"]
+
+
+def test_run_blocking_returns_result():
+    assert asyncio.run(run_blocking(sum, [1, 2, 3])) == 6
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./gonogo.db", "sqlite+aiosqlite:///./gonogo.db"),
+        ("postgresql://u:p@db/gonogo", "postgresql+asyncpg://u:p@db/gonogo"),
+        ("postgresql+psycopg2://u:p@db/x", "postgresql+asyncpg://u:p@db/x"),
+        ("mysql://u:p@db/x", "mysql://u:p@db/x"),
+    ],
+)
+def test_async_database_url(url, expected):
+    assert async_database_url(url) == expected
@@ -0,0 +1,88 @@
+"""
+Unit tests for the database engine factory.
+
+Verifies pool selection and sizing from the environment, the WAL tuning
+applied to file-backed SQLite connections, concurrent reads during a write,
+and the pool statistics reported by /health.
+
+Related Issue: US-00052 - Database schema design for traceability relationships
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from src.be.database import create_db_engine, get_pool_stats
+
+
+def test_memory_sqlite_keeps_static_pool():
+    engine = create_db_engine("sqlite:///:memory:")
+
+    assert isinstance(engine.pool, StaticPool)
+    assert get_pool_stats(engine) == {"pool_class": "StaticPool"}
+
+
+def test_file_sqlite_uses_sized_queue_pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "2")
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._pre_ping is True
+    engine.dispose()
+
+
+def test_file_sqlite_connections_are_tuned(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_CACHE_SIZE_KB", "2048")
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -2048
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
+
+
+def test_readers_proceed_while_a_write_is_open(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE metrics (value INTEGER)"))
+        conn.execute(text("INSERT INTO metrics VALUES (1)"))
+
+    writer = engine.connect()
+    writer.begin()
+    writer.execute(text("INSERT INTO metrics VALUES (2)"))
+
+    results = []
+
+    def read():
+        with engine.connect() as conn:
+            results.append(conn.execute(text("SELECT count(*) FROM metrics")).scalar())
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(timeout=5)
+
+    # Uncommitted write is invisible, and readers were not blocked by it
+    assert results == [1, 1, 1]
+    writer.commit()
+    writer.close()
+    engine.dispose()
+
+
+def test_pool_stats_track_checked_out_connections(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+    with engine.connect():
+        stats = get_pool_stats(engine)
+        assert stats["pool_class"] == "QueuePool"
+        assert stats["checked_out"] == 1
+
+    assert get_pool_stats(engine)["checked_out"] == 0
+    engine.dispose()
@@ -0,0 +1,246 @@
+"""
+Unit tests for the shared Epic dependency graph.
+
+Tests cycle, critical-path and impact queries, incremental updates from
+committed sessions, reloads after external changes, and the RTM analysis
+routes that previously returned empty results.
+
+Related Issue: US-00070 - Modèle dépendances fonctionnelles Epic
+Parent Epic: EP-00010 - Dashboard de Traçabilité Multi-Persona
+"""
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.be.api.rtm import detect_cycles, get_critical_path
+from src.be.models.traceability import Epic
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.data_generation import advance_data_generation
+from src.be.models.traceability.epic_dependency import DependencyGraph, EpicDependency
+from src.be.services.dependency_graph_service import (
+    DependencyEdge,
+    GENERATION_SCOPE,
+    EpicDependencyGraph,
+    get_dependency_graph,
+)
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the traceability schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session with five epics (ids 1-5) and no dependencies."""
+    session = sessionmaker(bind=engine)()
+    for index in range(1, 6):
+        session.add(Epic(epic_id=f"EP-{index:05d}", title=f"Epic {index}"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _edge(edge_id, parent, dependent, weight=1, dependency_type="blocking"):
+    return DependencyEdge(
+        id=edge_id,
+        parent_epic_id=parent,
+        dependent_epic_id=dependent,
+        dependency_type=dependency_type,
+        priority="medium",
+        is_resolved=False,
+        is_blocking=dependency_type == "blocking",
+        weight=weight,
+    )
+
+
+def _depend(session, parent, dependent, **fields):
+    dependency = EpicDependency(
+        parent_epic_id=parent,
+        dependent_epic_id=dependent,
+        dependency_type=fields.pop("dependency_type", "blocking"),
+        priority=fields.pop("priority", "medium"),
+        title=f"{parent} -> {dependent}",
+        **fields,
+    )
+    session.add(dependency)
+    session.commit()
+    return dependency
+
+
+def _insert_external(connection, parent, dependent):
+    """Insert a dependency the way another process would, bypassing the ORM."""
+    connection.execute(
+        insert(EpicDependency.__table__).values(
+            parent_epic_id=parent,
+            dependent_epic_id=dependent,
+            dependency_type="blocking",
+            priority="high",
+            is_active=True,
+            is_resolved=False,
+            created_by_system=False,
+            validation_status="pending",
+            title=f"{parent} -> {dependent}",
+            status="planned",
+        )
+    )
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00070")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestEpicDependencyGraph:
+    """Test in-memory graph queries."""
+
+    def test_detects_one_cycle_per_cluster(self):
+        """Each strongly connected cluster yields one closed cycle."""
+        graph = EpicDependencyGraph(
+            [
+                _edge(1, 1, 2),
+                _edge(2, 2, 3),
+                _edge(3, 3, 1),
+                _edge(4, 3, 4),
+                _edge(5, 5, 6),
+                _edge(6, 6, 5),
+            ]
+        )
+
+        cycles = graph.detect_cycles()
+
+        assert cycles and len(cycles) == 2
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+            for parent, dependent in zip(cycle, cycle[1:]):
+                assert dependent in graph.successors(parent)
+
+    def test_adding_edge_to_acyclic_graph_checks_only_new_edge(self):
+        """Acyclic state survives unrelated additions and removals."""
+        graph = EpicDependencyGraph()
+        graph.upsert(_edge(1, 1, 2))
+        graph.upsert(_edge(2, 2, 3))
+        assert graph.detect_cycles() == []
+        assert graph.cycle_if_added(3, 1) == [3, 1, 2, 3]
+
+        graph.upsert(_edge(3, 3, 1))
+        assert graph.detect_cycles() == [[1, 2, 3, 1]]
+
+        graph.discard(3)
+        assert graph.detect_cycles() == []
+
+    def test_critical_path_follows_heaviest_scheduling_edges(self):
+        """Longest weighted path ignores non-scheduling dependency types."""
+        graph = EpicDependencyGraph(
+            [
+                _edge(1, 1, 2, weight=3),
+                _edge(2, 2, 4, weight=3),
+                _edge(3, 1, 3, weight=2),
+                _edge(4, 3, 4, weight=1),
+                _edge(5, 1, 3, weight=9, dependency_type="prerequisite"),
+                _edge(6, 4, 5, weight=50, dependency_type="informational"),
+            ]
+        )
+
+        result = graph.critical_path([1, 2, 3, 4, 5])
+
+        assert result["critical_path"] == [1, 3, 4]
+        assert result["total_duration"] == 10
+        assert result["distances"] == {1: 0, 2: 3, 3: 9, 4: 10, 5: 0}
+        assert result["bottlenecks"] == [4]
+
+    def test_impact_reports_direct_and_downstream_epics(self):
+        """Impact lists direct blockers and every transitively affected epic."""
+        graph = EpicDependencyGraph(
+            [_edge(1, 1, 2), _edge(2, 2, 3), _edge(3, 4, 2), _edge(4, 3, 5)]
+        )
+
+        impact = graph.impact(2)
+
+        assert impact["blocked_by_epics"] == [1, 4]
+        assert impact["blocking_epics"] == [3]
+        assert impact["downstream_epics"] == [3, 5]
+        assert impact["risk_score"] == 4
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00070")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestSharedDependencyGraph:
+    """Test the process-wide graph kept current by session events."""
+
+    def test_commits_update_loaded_graph_incrementally(self, db_session):
+        """Create, resolve and delete events are applied without a reload."""
+        graph = get_dependency_graph(db_session)
+        first = _depend(db_session, 1, 2, estimated_impact_days=4)
+        second = _depend(db_session, 2, 3, estimated_impact_days=6)
+
+        assert get_dependency_graph(db_session) is graph
+        assert len(graph) == 2
+        assert graph.critical_path([1, 2, 3])["critical_path"] == [1, 2, 3]
+
+        second.mark_resolved("done")
+        db_session.commit()
+        assert graph.impact(3)["blocked_by_epics"] == []
+
+        db_session.delete(first)
+        db_session.commit()
+        assert get_dependency_graph(db_session) is graph
+        assert len(graph) == 1
+
+    def test_rolled_back_changes_are_not_applied(self, db_session):
+        """Flushed but rolled back dependencies never reach the graph."""
+        graph = get_dependency_graph(db_session)
+        db_session.add(
+            EpicDependency(
+                parent_epic_id=1,
+                dependent_epic_id=2,
+                dependency_type="blocking",
+                title="1 -> 2",
+            )
+        )
+        db_session.flush()
+        db_session.rollback()
+
+        assert len(graph) == 0
+
+    def test_external_changes_trigger_reload(self, engine, db_session):
+        """Rows written outside the ORM session are picked up."""
+        get_dependency_graph(db_session)
+        with engine.begin() as connection:
+            _insert_external(connection, 4, 5)
+
+        assert get_dependency_graph(db_session).successors(4) == {5}
+
+    def test_commit_after_external_change_reloads(self, engine, db_session):
+        """Our next commit does not mask a change committed by another worker."""
+        graph = get_dependency_graph(db_session)
+        with engine.begin() as connection:
+            _insert_external(connection, 4, 5)
+            advance_data_generation(connection, GENERATION_SCOPE)
+        _depend(db_session, 1, 2)
+
+        current = get_dependency_graph(db_session)
+        assert current is not graph
+        assert current.successors(4) == {5}
+        assert current.successors(1) == {2}
+
+    def test_facade_and_rtm_routes_share_the_graph(self, db_session):
+        """Both routers answer from the same graph instead of empty results."""
+        _depend(db_session, 1, 2, estimated_impact_days=5)
+        _depend(db_session, 2, 3, estimated_impact_days=2)
+        _depend(db_session, 3, 1, dependency_type="informational")
+
+        rtm_path = get_critical_path(db=db_session)
+        facade = DependencyGraph(db_session).calculate_critical_path()
+
+        assert [step["id"] for step in rtm_path["critical_path"]] == [1, 2, 3]
+        assert rtm_path["critical_path"][1]["epic_id"] == "EP-00002"
+        assert rtm_path["total_impact"] == facade["total_duration"] == 7
+        assert detect_cycles(db=db_session)["cycles"] == [[1, 2, 3, 1]]
+        assert DependencyGraph(db_session).find_cycle_with(3, 1) == [3, 1, 2, 3]
@@ -0,0 +1,194 @@
+"""
+Unit tests for the background Epic metrics refresher.
+
+Verifies batched refresh passes, progress statistics and that the async
+refresh loop runs its work off the event loop.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona dashboard
+"""
+
+import asyncio
+import threading
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Epic
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_metric_dirty import get_dirty_metric_families
+from src.be.services import epic_metrics_refresher
+from src.be.services.epic_metrics_refresher import (
+    RefreshStats,
+    metrics_refresh_loop,
+    next_refresh_delay,
+    refresh_all_epic_metrics,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """File-backed SQLite database shared by refresher worker sessions."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(epic_metrics_refresher, "get_db_session", factory)
+
+    session = factory()
+    session.add_all(
+        [Epic(epic_id=f"EP-{index:05d}", title=f"Epic {index}") for index in range(5)]
+    )
+    session.commit()
+    session.close()
+
+    yield factory
+    engine.dispose()
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00071")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestEpicMetricsRefresher:
+    """Test batched, non-blocking metric refreshes."""
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_refresh_commits_every_batch(self, session_factory, max_workers):
+        """All stale epics are refreshed and committed in batches."""
+        stats = RefreshStats()
+
+        refreshed = refresh_all_epic_metrics(
+            batch_size=2, max_workers=max_workers, stats=stats
+        )
+
+        assert refreshed == 5
+        session = session_factory()
+        try:
+            assert (
+                session.query(Epic)
+                .filter(Epic.metrics_cache_updated_at.is_(None))
+                .count()
+                == 0
+            )
+        finally:
+            session.close()
+
+        snapshot = stats.snapshot()
+        assert snapshot["running"] is False
+        assert snapshot["runs"] == 1
+        assert snapshot["progress"]["epics_processed"] == 5
+        assert snapshot["last_refreshed"] == 5
+        assert snapshot["last_duration_seconds"] >= 0
+        assert snapshot["last_error"] is None
+
+    def test_fresh_epics_are_skipped(self, session_factory):
+        """Epics with a clean, recent cache are filtered out unless forced."""
+        session = session_factory()
+        session.query(Epic).filter(Epic.epic_id == "EP-00000").update(
+            {"metrics_cache_updated_at": datetime.now() - timedelta(hours=1)}
+        )
+        session.query(Epic).filter(Epic.epic_id == "EP-00001").update(
+            {"metrics_cache_updated_at": datetime.now() - timedelta(days=2)}
+        )
+        session.commit()
+        session.close()
+
+        assert refresh_all_epic_metrics(stats=RefreshStats()) == 4
+        assert refresh_all_epic_metrics(stats=RefreshStats()) == 0
+        assert refresh_all_epic_metrics(force=True, stats=RefreshStats()) == 5
+
+    def test_dirty_pass_refreshes_only_marked_epics(self, session_factory):
+        """A dirty-only pass recalculates marked epics and clears the marks."""
+        refresh_all_epic_metrics(stats=RefreshStats())
+        session = session_factory()
+        epic = session.query(Epic).filter_by(epic_id="EP-00003").one()
+        epic.business_impact_score = 7.5
+        session.commit()
+        session.close()
+
+        stats = RefreshStats()
+        assert refresh_all_epic_metrics(dirty_only=True, stats=stats) == 1
+        assert stats.snapshot()["progress"]["epics_total"] == 1
+
+        session = session_factory()
+        try:
+            epic = session.query(Epic).filter_by(epic_id="EP-00003").one()
+            cached = epic.get_cached_metrics_only()
+            assert cached["business_metrics"]["business_impact_score"] == 7.5
+            assert get_dirty_metric_families(session) == {}
+        finally:
+            session.close()
+
+        idle = RefreshStats()
+        assert refresh_all_epic_metrics(dirty_only=True, stats=idle) == 0
+        assert idle.snapshot()["runs"] == 0
+
+    def test_caller_session_is_not_committed(self, session_factory):
+        """A caller-provided session keeps ownership of the transaction."""
+        session = session_factory()
+        try:
+            refreshed = refresh_all_epic_metrics(
+                session=session, batch_size=2, stats=RefreshStats()
+            )
+            assert refreshed == 5
+            session.rollback()
+            assert (
+                session.query(Epic)
+                .filter(Epic.metrics_cache_updated_at.isnot(None))
+                .count()
+                == 0
+            )
+        finally:
+            session.close()
+
+    def test_stop_event_halts_before_next_batch(self, session_factory):
+        """A set stop event prevents further batches from running."""
+        stop_event = threading.Event()
+        stop_event.set()
+
+        assert (
+            refresh_all_epic_metrics(
+                batch_size=2, stop_event=stop_event, stats=RefreshStats()
+            )
+            == 0
+        )
+
+    def test_next_refresh_delay_jitter(self):
+        """Jitter only ever extends the interval."""
+        assert next_refresh_delay(60, 0) == 60
+        for _ in range(20):
+            assert 60 <= next_refresh_delay(60, 5) <= 65
+
+    def test_loop_runs_refresh_off_event_loop(self, monkeypatch):
+        """The refresh pass runs in a worker thread and failures are logged."""
+        calls = []
+        main_thread = threading.get_ident()
+
+        def fake_refresh(**kwargs):
+            calls.append(threading.get_ident())
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(
+            epic_metrics_refresher, "refresh_all_epic_metrics", fake_refresh
+        )
+
+        async def run_loop():
+            task = asyncio.create_task(
+                metrics_refresh_loop(interval_seconds=0.01, jitter_seconds=0)
+            )
+            while len(calls) < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        asyncio.run(asyncio.wait_for(run_loop(), timeout=5))
+
+        assert len(calls) >= 2
+        assert main_thread not in calls
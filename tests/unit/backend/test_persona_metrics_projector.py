@@ -0,0 +1,167 @@
+"""
+Unit tests for materialized persona dashboard projections.
+
+Verifies that PM / PO / QA projections match the per-epic persona metrics,
+are served with a single query, and fall back to on-the-fly projection when
+an epic's metrics changed after materialization or the projection table has
+not been migrated.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Defect, Epic, Test
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_persona_metrics import EpicPersonaMetrics
+from src.be.services.persona_metrics_projector import PersonaMetricsProjector
+from src.shared.metrics.thresholds import get_threshold_service
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the traceability schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session with three epics whose metrics and projections are cached."""
+    session = sessionmaker(bind=engine)()
+    for index in range(3):
+        epic = Epic(
+            epic_id=f"EP-{index:05d}",
+            title=f"Epic {index}",
+            total_story_points=10,
+            completed_story_points=4 + index,
+            velocity_points_per_sprint=3.0 + index,
+            team_size=2,
+            test_coverage_percentage=60 + index * 10,
+            technical_debt_hours=5 * index,
+            status="active" if index < 2 else "completed",
+        )
+        session.add(epic)
+        session.flush()
+        session.add(
+            Test(
+                test_type="unit",
+                test_file_path=f"tests/unit/test_{index}.py",
+                title=f"Test {index}",
+                epic_id=epic.id,
+            )
+        )
+        session.add(
+            Defect(
+                defect_id=f"DEF-{index:05d}",
+                github_issue_number=index + 1,
+                title=f"Defect {index}",
+                epic_id=epic.id,
+            )
+        )
+    session.commit()
+
+    projector = PersonaMetricsProjector(session, thresholds=get_threshold_service())
+    for epic in session.query(Epic).all():
+        projector.materialize(
+            epic, epic.update_metrics(force_recalculate=True, session=session)
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00071")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestPersonaMetricsProjector:
+    """Test materialized persona projections."""
+
+    @pytest.mark.parametrize("persona", ["PM", "PO", "QA"])
+    def test_projection_matches_persona_metrics(self, db_session, persona):
+        """Stored payloads equal the per-epic threshold-evaluated metrics."""
+        thresholds = get_threshold_service()
+        projections = PersonaMetricsProjector(db_session, thresholds).load(persona)
+
+        epics = db_session.query(Epic).order_by(Epic.id).all()
+        assert [p.epic_id for p in projections] == [e.epic_id for e in epics]
+        for projection, epic in zip(projections, epics):
+            expected = epic.get_persona_specific_metrics(
+                persona, session=db_session, thresholds=thresholds
+            )
+            assert json.loads(projection.payload) == expected
+            assert json.loads(projection.to_json())["metrics"] == expected
+
+    def test_load_uses_single_query(self, engine, db_session):
+        """Fresh projections are read with exactly one query."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db_session.expire_all()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            projections = PersonaMetricsProjector(db_session).load(
+                "qa", status_filter="active"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert len(statements) == 1
+        assert len(projections) == 2
+        assert projections[1].summary_metrics["testing"]["test_coverage"] == 70
+
+    def test_stale_projection_is_rebuilt_on_the_fly(self, db_session):
+        """A projection older than the metrics cache is not served."""
+        epic = db_session.query(Epic).filter_by(epic_id="EP-00001").one()
+        epic.velocity_points_per_sprint = 9.0
+        epic.update_metrics(force_recalculate=True, session=db_session)
+        db_session.commit()
+
+        projections = PersonaMetricsProjector(db_session).load(
+            "pm", epic_filter="EP-00001"
+        )
+
+        assert projections[0].summary_metrics["velocity"] == {
+            "velocity_points_per_sprint": 9.0
+        }
+        assert json.loads(projections[0].payload)["velocity"][
+            "velocity_points_per_sprint"
+        ] == 9.0
+
+    def test_missing_table_projects_every_epic_on_the_fly(self):
+        """Databases without the projection table still serve dashboards."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        EpicPersonaMetrics.__table__.drop(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            session.add(Epic(epic_id="EP-00001", title="Epic", status="active"))
+            session.commit()
+            epic = session.query(Epic).one()
+            projector = PersonaMetricsProjector(session, get_threshold_service())
+
+            projector.materialize(
+                epic, epic.update_metrics(force_recalculate=True, session=session)
+            )
+            session.commit()
+            projections = projector.load("po", status_filter="active")
+
+            assert [p.epic_id for p in projections] == ["EP-00001"]
+            assert json.loads(projections[0].payload) == (
+                epic.get_persona_specific_metrics(
+                    "PO", session=session, thresholds=get_threshold_service()
+                )
+            )
+        finally:
+            session.close()
+            engine.dispose()
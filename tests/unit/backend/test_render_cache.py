@@ -0,0 +1,210 @@
+"""
+Unit tests for the render cache.
+
+Tests LRU and size-bounded eviction, the on-disk tier, the persistent data
+generation advanced by committed changes, and ETag handling in the cached
+dependency SVG route.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from src.be.api.rtm import get_dependency_graph_svg
+from src.be.models.traceability import Epic
+from src.be.models.traceability.base import Base
+from src.be.services import render_cache
+from src.be.services.render_cache import (
+    RenderCache,
+    data_fingerprint,
+    data_generation,
+    render_key,
+)
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with two epics."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            Epic(epic_id="EP-00001", title="First"),
+            Epic(epic_id="EP-00002", title="Second"),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Replace the process-wide cache with an empty one."""
+    cache = RenderCache()
+    monkeypatch.setattr(render_cache, "_render_cache", cache)
+    return cache
+
+
+def _request(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_render_key_depends_on_every_input():
+    base = render_key("kind", "1", {"a": 1}, [1, 2])
+    assert base == render_key("kind", "1", {"a": 1}, [1, 2])
+    assert base != render_key("kind", "2", {"a": 1}, [1, 2])
+    assert base != render_key("other", "1", {"a": 1}, [1, 2])
+    assert base != render_key("kind", "1", {"a": 2}, [1, 2])
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = RenderCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"  # a is now most recently used
+    cache.put("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+
+    cache.put("d", b"12345678")
+    assert cache.stats()["bytes"] <= 10
+    assert cache.get("d") == b"12345678"
+
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+
+
+def test_get_or_render_renders_once():
+    cache = RenderCache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "<svg/>"
+
+    assert cache.get_or_render("k", render) == (b"<svg/>", False)
+    assert cache.get_or_render("k", render) == (b"<svg/>", True)
+    assert len(calls) == 1
+
+
+def test_tee_stores_only_complete_bodies_that_fit():
+    cache = RenderCache(max_bytes=8)
+
+    assert b"".join(cache.tee("k", iter(["ab", "cd"]))) == b"abcd"
+    assert cache.get("k") == b"abcd"
+
+    assert b"".join(cache.tee("big", iter(["12345", "67890"]))) == b"1234567890"
+    assert cache.get("big") is None
+
+    stream = cache.tee("partial", iter(["ab", "cd"]))
+    next(stream)
+    stream.close()
+    assert cache.get("partial") is None
+
+
+def test_disk_tier_survives_new_instance_and_trims(tmp_path):
+    RenderCache(disk_dir=str(tmp_path)).put("k", b"body")
+    assert RenderCache(disk_dir=str(tmp_path)).get("k") == b"body"
+
+    small = RenderCache(disk_dir=str(tmp_path), disk_max_bytes=8)
+    small.put("other", b"12345678")
+    assert len(list(tmp_path.glob("*.render"))) == 1
+
+    small.invalidate()
+    assert list(tmp_path.glob("*.render")) == []
+
+
+def test_committed_changes_advance_generation(db_session):
+    before = data_generation(db_session)
+    db_session.query(Epic).all()
+    db_session.commit()
+    assert data_generation(db_session) == before
+
+    db_session.add(Epic(epic_id="EP-00003", title="Third"))
+    db_session.flush()
+    db_session.rollback()
+    assert data_generation(db_session) == before
+
+    epic = db_session.query(Epic).first()
+    epic.title = "Renamed"
+    db_session.flush()
+    epic.description = "Twice in one transaction"
+    db_session.commit()
+    assert data_generation(db_session) == before + 1
+
+    db_session.query(Epic).filter(Epic.epic_id == "EP-00002").delete()
+    db_session.commit()
+    assert data_generation(db_session) == before + 2
+
+
+def test_generation_is_shared_across_engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'rtm.db'}"
+    writer_engine, reader_engine = create_engine(url), create_engine(url)
+    Base.metadata.create_all(writer_engine)
+    writer = sessionmaker(bind=writer_engine)()
+    reader = sessionmaker(bind=reader_engine)()
+    try:
+        assert data_generation(reader) == 0
+        reader.rollback()
+
+        writer.add(Epic(epic_id="EP-00001", title="First"))
+        writer.commit()
+
+        assert data_generation(reader) == 1
+    finally:
+        writer.close()
+        reader.close()
+        writer_engine.dispose()
+        reader_engine.dispose()
+
+
+def test_fingerprint_tracks_row_changes(db_session):
+    before = data_fingerprint(db_session)
+    db_session.add(Epic(epic_id="EP-00003", title="Third"))
+    db_session.commit()
+    assert data_fingerprint(db_session) != before
+
+
+def test_dependency_svg_route_uses_cache_and_etag(db_session, fresh_cache):
+    first = get_dependency_graph_svg(
+        _request(), status=None, component=None, capability=None, db=db_session
+    )
+    assert first.status_code == 200
+    assert first.headers["X-Render-Cache"] == "miss"
+    assert first.body.startswith(b"<svg")
+
+    second = get_dependency_graph_svg(
+        _request(), status=None, component=None, capability=None, db=db_session
+    )
+    assert second.headers["X-Render-Cache"] == "hit"
+    assert second.body == first.body
+
+    etag = first.headers["ETag"]
+    not_modified = get_dependency_graph_svg(
+        _request({"If-None-Match": etag}),
+        status=None,
+        component=None,
+        capability=None,
+        db=db_session,
+    )
+    assert not_modified.status_code == 304
+
+    db_session.add(Epic(epic_id="EP-00003", title="Third"))
+    db_session.commit()
+    changed = get_dependency_graph_svg(
+        _request({"If-None-Match": etag}),
+        status=None,
+        component=None,
+        capability=None,
+        db=db_session,
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
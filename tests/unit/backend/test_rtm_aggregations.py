@@ -0,0 +1,162 @@
+"""
+Unit tests for SQL-side RTM aggregations.
+
+Verifies that the GROUP BY / CASE based rollups behind
+/api/rtm/analytics/overview and /api/rtm/components/statistics return the
+same figures the former row-by-row Python implementation produced.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Defect, Epic, Test, UserStory
+from src.be.models.traceability.base import Base
+from src.be.services.rtm_aggregations import RTMAggregator
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database with sample RTM data."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    backend = Epic(epic_id="EP-00001", title="Backend", component="backend")
+    mixed = Epic(
+        epic_id="EP-00002",
+        title="Mixed",
+        component="frontend,backend",
+        status="completed",
+    )
+    session.add_all([backend, mixed])
+    session.flush()
+
+    session.add_all(
+        [
+            UserStory(
+                user_story_id="US-00001",
+                epic_id=backend.id,
+                github_issue_number=1,
+                title="Done story",
+                story_points=5,
+                implementation_status="done",
+                component="backend",
+            ),
+            UserStory(
+                user_story_id="US-00002",
+                epic_id=mixed.id,
+                github_issue_number=2,
+                title="Open story",
+                story_points=3,
+                component="frontend",
+            ),
+            Test(
+                test_type="unit",
+                test_file_path="tests/unit/test_a.py",
+                title="Passing",
+                component="backend",
+                last_execution_status="passed",
+            ),
+            Test(
+                test_type="unit",
+                test_file_path="tests/unit/test_b.py",
+                title="Failing",
+                component="backend",
+                last_execution_status="failed",
+            ),
+            Test(
+                test_type="e2e",
+                test_file_path="tests/e2e/test_c.py",
+                title="No component",
+            ),
+            Defect(
+                defect_id="DEF-00001",
+                github_issue_number=101,
+                title="Critical",
+                severity="critical",
+                is_security_issue=True,
+                component="frontend",
+            ),
+            Defect(
+                defect_id="DEF-00002",
+                github_issue_number=102,
+                title="Minor",
+                severity="low",
+                component="frontend",
+            ),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.epic("EP-00005")
+@pytest.mark.user_story("US-00059")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestRTMAggregator:
+    """Test SQL-side RTM rollups."""
+
+    def test_overview_counts(self, db_session):
+        """Overview totals match the traceability data."""
+        summary = RTMAggregator(db_session).overview()["summary"]
+
+        assert summary["epics"] == {
+            "total": 2,
+            "completed": 1,
+            "completion_rate": 50.0,
+        }
+        assert summary["user_stories"]["total"] == 2
+        assert summary["user_stories"]["story_points"] == {
+            "total": 8,
+            "completed": 5,
+            "completion_rate": 62.5,
+        }
+        assert summary["tests"]["total"] == 3
+        assert summary["tests"]["passed"] == 1
+        assert summary["defects"] == {
+            "total": 2,
+            "critical": 1,
+            "security_issues": 1,
+        }
+
+    def test_overview_empty_database(self):
+        """Empty tables produce zero totals instead of NULL sums."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            summary = RTMAggregator(session).overview()["summary"]
+        finally:
+            session.close()
+
+        assert summary["user_stories"]["story_points"]["total"] == 0
+        assert summary["tests"]["pass_rate"] == 0
+        assert summary["epics"]["completion_rate"] == 0
+
+    def test_component_statistics(self, db_session):
+        """Per-component rollups include comma-separated epic components."""
+        data = RTMAggregator(db_session).component_statistics()
+        components = data["components"]
+
+        assert sorted(components) == ["backend", "frontend"]
+        assert components["backend"] == {
+            "epic_count": 2,
+            "user_story_count": 1,
+            "test_count": 2,
+            "defect_count": 0,
+            "test_pass_rate": 50.0,
+            "critical_defects": 0,
+            "total_items": 5,
+        }
+        assert components["frontend"]["epic_count"] == 1
+        assert components["frontend"]["defect_count"] == 2
+        assert components["frontend"]["critical_defects"] == 1
+        assert data["summary"]["total_components"] == 2
+        assert data["summary"]["total_tests"] == 2
@@ -0,0 +1,191 @@
+"""
+Unit tests for the streaming RTM matrix export.
+
+Verifies that the plain CSV keeps the epic columns of the original
+export, that the CSV archive and XLSX workbook contain one sheet per
+entity type, that demo epics are left out, that rows are read in batches
+from a single query per sheet, and that the export route streams the body.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import asyncio
+import csv
+import io
+import zipfile
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.responses import StreamingResponse
+
+from src.be.api.rtm import export_report
+from src.be.models.traceability import Defect, Epic, Test, UserStory
+from src.be.models.traceability.base import Base
+from src.be.services import rtm_export
+from src.be.services.rtm_export import RTMMatrixExporter
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine shared with the thread that streams the body."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session with three epics (one demo), each with stories, tests, defects."""
+    session = sessionmaker(bind=engine)()
+    for index, epic_id in enumerate(["EP-00001", "EP-00002", "EP-DEMO-001"]):
+        epic = Epic(epic_id=epic_id, title=f"Epic {index}")
+        session.add(epic)
+        session.flush()
+        for story in range(3):
+            number = index * 10 + story
+            session.add(
+                UserStory(
+                    user_story_id=f"US-{number:05d}",
+                    epic_id=epic.id,
+                    github_issue_number=number,
+                    title=f"Story {number}",
+                    story_points=2,
+                )
+            )
+            session.add(
+                Test(
+                    test_type="unit",
+                    test_file_path=f"tests/unit/test_{number}.py",
+                    title=f"Test {number}",
+                    epic_id=epic.id,
+                    github_user_story_number=number,
+                )
+            )
+        session.add(
+            Defect(
+                defect_id=f"DEF-{index:05d}",
+                github_issue_number=100 + index,
+                title=f"Defect {index}",
+                epic_id=epic.id,
+            )
+        )
+    session.add(Test(test_type="e2e", test_file_path="tests/e2e/x.py", title="Loose"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _read_csv_archive(data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {
+            name: list(csv.reader(io.StringIO(archive.read(name).decode("utf-8"))))
+            for name in archive.namelist()
+        }
+
+
+def test_csv_archive_has_one_file_per_sheet(db_session):
+    chunks = list(RTMMatrixExporter(db_session, batch_size=2).iter_csv_zip())
+    sheets = _read_csv_archive(b"".join(chunks))
+
+    assert list(sheets) == [
+        "epics.csv",
+        "user_stories.csv",
+        "tests.csv",
+        "defects.csv",
+    ]
+    epics = sheets["epics.csv"]
+    assert epics[0][:3] == ["Epic ID", "Epic Title", "Status"]
+    assert [row[0] for row in epics[1:]] == ["EP-00001", "EP-00002"]
+    assert epics[1][3:] == ["3", "6", "3", "1"]
+    assert len(sheets["user_stories.csv"]) == 1 + 6
+    assert len(sheets["tests.csv"]) == 1 + 6 + 1
+    assert len(sheets["defects.csv"]) == 1 + 2
+    assert len(chunks) > 1
+
+
+def test_csv_is_the_epics_sheet_with_the_original_columns(db_session):
+    chunks = list(RTMMatrixExporter(db_session, batch_size=1).iter_csv())
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+    assert rows[0] == [
+        "Epic ID",
+        "Epic Title",
+        "Status",
+        "User Stories",
+        "Story Points",
+        "Tests",
+        "Defects",
+    ]
+    assert [row[0] for row in rows[1:]] == ["EP-00001", "EP-00002"]
+    assert len(chunks) == 2
+
+
+def test_each_sheet_is_one_streamed_query(engine, db_session):
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    for _ in RTMMatrixExporter(db_session, batch_size=2).iter_csv_zip():
+        pass
+
+    assert len(statements) == 4
+
+
+def test_xlsx_workbook_has_one_worksheet_per_sheet(db_session):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    data = b"".join(RTMMatrixExporter(db_session, batch_size=2).iter_xlsx())
+    workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+
+    assert workbook.sheetnames == ["epics", "user_stories", "tests", "defects"]
+    rows = list(workbook["epics"].iter_rows(values_only=True))
+    assert rows[0][0] == "Epic ID"
+    assert rows[1][:2] == ("EP-00001", "Epic 0")
+    assert len(list(workbook["tests"].iter_rows())) == 1 + 6 + 1
+
+
+def test_xlsx_without_openpyxl_fails_before_streaming(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_export, "Workbook", None)
+
+    with pytest.raises(RuntimeError, match="openpyxl"):
+        RTMMatrixExporter(db_session).iter_xlsx()
+
+
+def _consume(response) -> bytes:
+    async def consume():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(consume())
+
+
+def test_export_route_streams_full_matrix_csv(db_session):
+    response = export_report(report_type="full-matrix", format="csv", db=db_session)
+
+    assert isinstance(response, StreamingResponse)
+    assert response.media_type == "text/csv"
+    assert response.headers["Content-Disposition"].endswith(".csv")
+
+    rows = list(csv.reader(io.StringIO(_consume(response).decode("utf-8"))))
+    assert len(rows) == 3
+
+
+def test_export_route_streams_full_matrix_csv_archive(db_session):
+    response = export_report(
+        report_type="full-matrix", format="csv-zip", db=db_session
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert response.media_type == "application/zip"
+    assert "_csv.zip" in response.headers["Content-Disposition"]
+
+    sheets = _read_csv_archive(_consume(response))
+    assert len(sheets["epics.csv"]) == 3
@@ -0,0 +1,183 @@
+"""
+Unit tests for the set-based RTM matrix loader.
+
+Verifies that RTM reports load epic children with a fixed number of queries
+regardless of how many epics are in the matrix, and that the bulk-loaded
+data produces the same per-epic metrics.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Defect, Epic, Test, UserStory
+from src.be.models.traceability.base import Base
+from src.be.services.rtm_matrix_loader import RTMMatrixLoader
+from src.be.services.rtm_report_generator import RTMReportGenerator
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the traceability schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Database session bound to the in-memory engine."""
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _populate(session, epic_count: int) -> None:
+    """Create ``epic_count`` epics with two stories, tests and defects each."""
+    issue_number = 1
+    for index in range(epic_count):
+        epic = Epic(epic_id=f"EP-{index:05d}", title=f"Epic {index}")
+        session.add(epic)
+        session.flush()
+        for story_index in range(2):
+            session.add(
+                UserStory(
+                    user_story_id=f"US-{issue_number:05d}",
+                    epic_id=epic.id,
+                    github_issue_number=issue_number,
+                    title=f"Story {issue_number}",
+                    story_points=3,
+                    github_issue_state="closed" if story_index == 0 else "open",
+                )
+            )
+            session.add(
+                Test(
+                    test_type="unit",
+                    test_file_path=f"tests/unit/test_{issue_number}.py",
+                    title=f"Test {issue_number}",
+                    epic_id=epic.id,
+                    github_user_story_number=issue_number,
+                    last_execution_status="passed" if story_index == 0 else "failed",
+                )
+            )
+            session.add(
+                Defect(
+                    defect_id=f"DEF-{issue_number:05d}",
+                    github_issue_number=10000 + issue_number,
+                    title=f"Defect {issue_number}",
+                    epic_id=epic.id,
+                    github_user_story_number=issue_number,
+                    severity="critical" if story_index == 0 else "low",
+                )
+            )
+            issue_number += 1
+    session.commit()
+
+
+def _count_queries(engine, callback) -> int:
+    """Run ``callback`` and return the number of SQL statements executed."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        callback()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+@pytest.mark.epic("EP-00005")
+@pytest.mark.user_story("US-00059")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestRTMMatrixLoader:
+    """Test set-based loading of epic children for RTM reports."""
+
+    def test_load_groups_children_by_epic(self, db_session):
+        """Children are grouped under the epic they belong to."""
+        _populate(db_session, 3)
+        epics = db_session.query(Epic).order_by(Epic.epic_id).all()
+
+        children = RTMMatrixLoader(db_session).load(epics)
+
+        assert set(children) == {epic.id for epic in epics}
+        for epic in epics:
+            loaded = children[epic.id]
+            assert len(loaded.user_stories) == 2
+            assert len(loaded.tests) == 2
+            assert len(loaded.defects) == 2
+            assert all(us.epic_id == epic.id for us in loaded.user_stories)
+            assert all(test.epic_id == epic.id for test in loaded.tests)
+
+    def test_load_empty_epic_list(self, db_session):
+        """Loading no epics issues no queries and returns an empty mapping."""
+        assert RTMMatrixLoader(db_session).load([]) == {}
+
+    def test_json_matrix_metrics_unchanged(self, db_session):
+        """Bulk-loaded data yields the same per-epic metrics as before."""
+        _populate(db_session, 2)
+        generator = RTMReportGenerator(db_session)
+
+        matrix = generator.generate_json_matrix({"include_demo_data": True})
+
+        assert matrix["metadata"]["total_epics"] == 2
+        epic_data = matrix["epics"][0]
+        metrics = epic_data["metrics"]
+        assert metrics["user_stories_count"] == 2
+        assert metrics["tests_count"] == 2
+        assert metrics["tests_passed"] == 1
+        assert metrics["tests_failed"] == 1
+        assert metrics["defects_count"] == 2
+        assert metrics["critical_defects"] == 1
+        assert metrics["completed_user_stories"] == 1
+        assert epic_data["epic"]["user_story_count"] == 2
+        assert epic_data["user_stories"][0]["test_coverage"]["total_tests"] == 1
+        assert epic_data["user_stories"][0]["defect_count"] == 1
+
+    @pytest.mark.parametrize(
+        "method", ["generate_json_matrix", "generate_markdown_matrix"]
+    )
+    def test_query_count_flat_in_epic_count(self, engine, method):
+        """Query count does not grow with the number of epics."""
+        counts = []
+        for epic_count in (2, 12):
+            Base.metadata.drop_all(engine)
+            Base.metadata.create_all(engine)
+            session = sessionmaker(bind=engine)()
+            try:
+                _populate(session, epic_count)
+                session.expire_all()
+                generator = RTMReportGenerator(session)
+                render = getattr(generator, method)
+                counts.append(
+                    _count_queries(
+                        engine, lambda: render({"include_demo_data": True})
+                    )
+                )
+            finally:
+                session.close()
+
+        assert counts[0] == counts[1]
+
+    def test_markdown_stream_matches_across_batch_sizes(self, db_session, monkeypatch):
+        """Streaming in small keyset batches yields the same document."""
+        _populate(db_session, 5)
+        generator = RTMReportGenerator(db_session)
+        filters = {"include_demo_data": True}
+
+        whole = generator.generate_markdown_matrix(filters)
+        monkeypatch.setattr(RTMReportGenerator, "STREAM_BATCH_SIZE", 2)
+        chunks = list(generator.iter_markdown_matrix(filters))
+
+        assert chunks[0].startswith("# Dynamic Requirements Traceability Matrix")
+        assert len(chunks) > 3
+        assert "".join(chunks) == whole
+        for index in range(5):
+            assert whole.count(f"EP-{index:05d}") == 3
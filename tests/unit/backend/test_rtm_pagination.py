@@ -0,0 +1,168 @@
+"""
+Unit tests for keyset pagination of the RTM list endpoints.
+
+Verifies that following X-Next-Cursor visits every row exactly once in key
+order, that filters and totals are respected, that cursors cannot be reused
+with other filters, and that offset paging keeps working.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.be.api.rtm import router
+from src.be.database import get_db
+from src.be.models.traceability import Defect, Epic, Test, UserStory
+from src.be.models.traceability.base import Base
+from src.be.services.keyset_pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.fixture
+def db_session():
+    """Session with 7 epics, 14 stories, 21 tests and 7 defects."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for index in range(7):
+        # Insert out of key order so ordering is not an accident of rowids
+        epic = Epic(epic_id=f"EP-{(index * 3) % 7:05d}", title=f"Epic {index}")
+        session.add(epic)
+        session.flush()
+        for story in range(2):
+            number = index * 2 + story
+            session.add(
+                UserStory(
+                    user_story_id=f"US-{(number * 5) % 14:05d}",
+                    epic_id=epic.id,
+                    github_issue_number=number,
+                    title=f"Story {number}",
+                )
+            )
+        for test in range(3):
+            session.add(
+                Test(
+                    test_type="unit" if test else "e2e",
+                    test_file_path=f"tests/test_{index}_{test}.py",
+                    title=f"Test {index}.{test}",
+                    epic_id=epic.id,
+                )
+            )
+        session.add(
+            Defect(
+                defect_id=f"DEF-{index:05d}",
+                github_issue_number=100 + index,
+                title=f"Defect {index}",
+                severity="critical" if index % 2 else "low",
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(db_session):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    return TestClient(app)
+
+
+def _walk(client, path, params):
+    """Follow X-Next-Cursor from the first page to the last."""
+    pages = []
+    response = client.get(path, params=params)
+    while True:
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        response = client.get(path, params={**params, "cursor": cursor})
+
+
+@pytest.mark.parametrize(
+    "path, key, count",
+    [
+        ("/api/rtm/epics/", "epic_id", 7),
+        ("/api/rtm/user-stories/", "user_story_id", 14),
+        ("/api/rtm/tests/", "id", 21),
+        ("/api/rtm/defects/", "id", 7),
+    ],
+)
+def test_cursor_walk_visits_every_row_once(client, path, key, count):
+    pages = _walk(client, path, {"limit": 3})
+
+    keys = [item[key] for page in pages for item in page]
+    assert keys == sorted(keys)
+    assert len(keys) == len(set(keys)) == count
+    assert all(len(page) == 3 for page in pages[:-1])
+
+
+def test_cursor_walk_respects_filters_and_totals(client):
+    params = {"test_type": "unit", "limit": 4, "total": "exact"}
+    first = client.get("/api/rtm/tests/", params=params)
+
+    assert first.headers["X-Total-Count"] == "14"
+    assert first.headers["X-Total-Count-Estimated"] == "false"
+    pages = _walk(client, "/api/rtm/tests/", params)
+    tests = [test for page in pages for test in page]
+    assert len(tests) == 14
+    assert {test["test_type"] for test in tests} == {"unit"}
+
+
+def test_last_page_has_no_cursor(client):
+    response = client.get("/api/rtm/defects/", params={"limit": 7})
+
+    assert len(response.json()) == 7
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_cursor_rejected_for_other_filters(client):
+    cursor = client.get("/api/rtm/defects/", params={"limit": 2}).headers[
+        "X-Next-Cursor"
+    ]
+
+    response = client.get(
+        "/api/rtm/defects/",
+        params={"limit": 2, "severity": "critical", "cursor": cursor},
+    )
+    assert response.status_code == 400
+
+    both = client.get("/api/rtm/defects/", params={"cursor": cursor, "offset": 2})
+    assert both.status_code == 400
+
+
+def test_offset_paging_still_supported(client):
+    first = client.get("/api/rtm/epics/", params={"limit": 3}).json()
+    second = client.get("/api/rtm/epics/", params={"limit": 3, "offset": 3}).json()
+
+    assert [epic["epic_id"] for epic in first + second] == [
+        f"EP-{index:05d}" for index in range(6)
+    ]
+
+
+def test_cursor_round_trip_and_tampering():
+    filters = {"status": "planned"}
+    token = encode_cursor("EP-00003", filters)
+
+    assert decode_cursor(token, filters) == "EP-00003"
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token, {"status": "done"})
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", filters)
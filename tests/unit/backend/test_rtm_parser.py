@@ -0,0 +1,189 @@
+"""
+Unit tests for the single-pass RTM markdown parser.
+
+Verifies that one tokenizing pass resolves each entity's line, parent epic
+and context, that repeated IDs produce a single record, and that the test
+function name is found near any occurrence of a test path. Also covers the
+chunked bulk migration of parsed entities and cheap re-imports.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Epic, UserStory
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_metric_dirty import get_dirty_metric_families
+from src.be.services import rtm_parser
+from src.be.services.rtm_parser import RTMDataMigrator, RTMMarkdownParser
+
+RTM = """# Requirements Traceability Matrix
+
+## EP-00001: Traceability Dashboard
+Priority: high
+Business value: faster release decisions
+
+### US-00001: Render the matrix (#12)
+Status: in progress - 5 points
+- tests/unit/backend/test_matrix.py
+- test_render_matrix
+
+### US-00002 Export the matrix
+Done, 3 points
+
+## EP-00002: Defect Tracking
+- DEF-00001: Crash on export (#40) critical bug
+- tests/integration/test_export.py covers DEF-00001 and US-00001
+- US-00003: Story under EP-00001 inline EP-00001
+
+See EP-00001 and tests/unit/backend/test_matrix.py again.
+"""
+
+
+def test_tokenize_indexes_first_lines_and_parents():
+    index = RTMMarkdownParser().tokenize(RTM)
+
+    assert index.epics == {"EP-00001": 2, "EP-00002": 14}
+    assert index.user_stories == {
+        "US-00001": (6, "EP-00001"),
+        "US-00002": (11, "EP-00001"),
+        "US-00003": (17, "EP-00001"),
+    }
+    assert index.defects == {"DEF-00001": 15}
+    assert index.tests["tests/unit/backend/test_matrix.py"][1] == [8, 19]
+
+
+def test_parse_content_extracts_each_entity_once():
+    result = RTMMarkdownParser().parse_content(RTM)
+
+    assert [e["epic_id"] for e in result["epics"]] == ["EP-00001", "EP-00002"]
+    assert [s["user_story_id"] for s in result["user_stories"]] == [
+        "US-00001",
+        "US-00002",
+        "US-00003",
+    ]
+    assert [d["defect_id"] for d in result["defects"]] == ["DEF-00001"]
+    assert [t["test_file_path"] for t in result["tests"]] == [
+        "tests/unit/backend/test_matrix.py",
+        "tests/integration/test_export.py",
+    ]
+
+
+def test_records_carry_context_fields():
+    result = RTMMarkdownParser().parse_content(RTM)
+
+    epic = result["epics"][0]
+    assert epic["title"] == "Traceability Dashboard"
+    assert epic["priority"] == "high"
+    assert epic["business_value"] == "Business value: faster release decisions"
+
+    story = result["user_stories"][0]
+    assert story["title"] == "Render the matrix (#12)"
+    assert story["github_issue_number"] == 12
+    assert story["story_points"] == 5
+    assert story["epic_reference"] == "EP-00001"
+
+    defect = result["defects"][0]
+    assert defect["github_issue_number"] == 40
+    assert defect["severity"] == "critical"
+    assert defect["defect_type"] == "bug"
+
+    unit_test, integration_test = result["tests"]
+    assert unit_test["test_type"] == "unit"
+    assert unit_test["test_function_name"] == "matrix"
+    assert integration_test["test_type"] == "integration"
+
+
+def test_parse_rtm_file_reads_file(tmp_path):
+    path = tmp_path / "rtm.md"
+    path.write_text(RTM, encoding="utf-8")
+
+    result = RTMMarkdownParser().parse_rtm_file(str(path))
+
+    assert result == RTMMarkdownParser().parse_content(RTM)
+
+
+def _rtm(epic_count: int) -> str:
+    sections = []
+    for epic in range(1, epic_count + 1):
+        sections.append(f"## EP-{epic:05d}: Epic {epic}\n")
+        for story in range(epic * 3 - 2, epic * 3 + 1):
+            sections.append(
+                f"### US-{story:05d}: Story {story} (#{story})\n"
+                f"- tests/unit/test_story_{story}.py\n"
+            )
+        sections.append(f"- DEF-{epic:05d}: Defect {epic} (#{1000 + epic})\n")
+    return "\n".join(sections)
+
+
+@pytest.fixture
+def migration_db(tmp_path, monkeypatch):
+    """File-backed database the migrator opens its session on."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'rtm.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(rtm_parser, "get_db_session", factory)
+    yield engine
+    engine.dispose()
+
+
+def test_bulk_migration_inserts_in_chunks(tmp_path, migration_db):
+    path = tmp_path / "rtm.md"
+    path.write_text(_rtm(5), encoding="utf-8")
+    progress = []
+
+    counts = RTMDataMigrator(
+        chunk_size=4, progress_callback=lambda *args: progress.append(args)
+    ).migrate_from_file(str(path))
+
+    assert counts == {"epics": 5, "user_stories": 15, "tests": 15, "defects": 5}
+    assert progress[:2] == [("epics", 4, 5), ("epics", 5, 5)]
+    assert ("user_stories", 15, 15) in progress
+
+    session = sessionmaker(bind=migration_db)()
+    story = session.query(UserStory).filter_by(user_story_id="US-00004").one()
+    assert story.epic.epic_id == "EP-00002"
+    assert story.implementation_status == "todo"
+    epic = session.query(Epic).filter_by(epic_id="EP-00001").one()
+    assert epic.team_size == 1
+    assert epic.initial_scope_estimate == 0
+    assert get_dirty_metric_families(session)[story.epic_id] >= {"velocity_metrics"}
+    session.close()
+
+
+def test_reimport_uses_constant_statements(tmp_path, migration_db):
+    small, large = tmp_path / "small.md", tmp_path / "large.md"
+    small.write_text(_rtm(2), encoding="utf-8")
+    large.write_text(_rtm(40), encoding="utf-8")
+    RTMDataMigrator().migrate_from_file(str(large))
+
+    statements = []
+    event.listen(
+        migration_db,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    for path in (small, large):
+        statements.clear()
+        counts = RTMDataMigrator().migrate_from_file(str(path))
+        assert counts == {"epics": 0, "user_stories": 0, "tests": 0, "defects": 0}
+        # One key prefetch per entity type (two for unique issue numbers)
+        assert len(statements) == 6
+
+
+def test_new_stories_resolve_existing_epics(tmp_path, migration_db):
+    path = tmp_path / "rtm.md"
+    path.write_text(_rtm(1), encoding="utf-8")
+    RTMDataMigrator().migrate_from_file(str(path))
+
+    path.write_text(_rtm(1) + "\n### US-00009: Late story (#9)\n", encoding="utf-8")
+    counts = RTMDataMigrator().migrate_from_file(str(path))
+
+    assert counts["user_stories"] == 1
+    session = sessionmaker(bind=migration_db)()
+    story = session.query(UserStory).filter_by(user_story_id="US-00009").one()
+    assert story.epic.epic_id == "EP-00001"
+    session.close()
@@ -0,0 +1,212 @@
+"""
+Unit tests for the Epic and User Story list projections.
+
+Verifies that projected serialization matches to_dict() field for field,
+that a page is serialized in a fixed number of queries, whatever its size,
+and that a page reads child rows by index instead of scanning child tables.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from src.be.api.rtm import list_epics, list_user_stories
+from src.be.models.traceability import (
+    Capability,
+    Defect,
+    Epic,
+    EpicDependency,
+    Test,
+    UserStory,
+)
+from src.be.models.traceability.base import Base
+from src.be.services.rtm_projections import EpicProjection, UserStoryProjection
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the traceability schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session with epics, stories, tests, defects and dependencies."""
+    session = sessionmaker(bind=engine)()
+    capability = Capability(capability_id="CAP-00001", name="Traceability")
+    session.add(capability)
+    session.flush()
+
+    epics = [
+        Epic(
+            epic_id=f"EP-{index:05d}",
+            title=f"Epic {index}",
+            capability_id=capability.id if index % 2 else None,
+        )
+        for index in range(1, 6)
+    ]
+    session.add_all(epics)
+    session.flush()
+
+    for index, epic in enumerate(epics):
+        for story in range(index):
+            number = index * 10 + story
+            session.add(
+                UserStory(
+                    user_story_id=f"US-{number:05d}",
+                    epic_id=epic.id,
+                    github_issue_number=number,
+                    title=f"Story {number}",
+                    component=("backend", "frontend", None)[story % 3],
+                )
+            )
+            session.add(
+                Test(
+                    test_type="unit",
+                    test_file_path=f"tests/unit/test_{number}.py",
+                    title=f"Test {number}",
+                    epic_id=epic.id,
+                    github_user_story_number=number,
+                    last_execution_status=("passed", "failed")[story % 2],
+                )
+            )
+        if index % 2:
+            session.add(
+                Defect(
+                    defect_id=f"DEF-{index:05d}",
+                    github_issue_number=100 + index,
+                    title=f"Defect {index}",
+                    epic_id=epic.id,
+                    github_user_story_number=index * 10,
+                )
+            )
+
+    session.add_all(
+        [
+            EpicDependency(
+                title="Dependency",
+                parent_epic_id=epics[0].id,
+                dependent_epic_id=epics[1].id,
+                dependency_type="blocking",
+                priority="critical",
+                estimated_impact_days=8,
+            ),
+            EpicDependency(
+                title="Dependency",
+                parent_epic_id=epics[2].id,
+                dependent_epic_id=epics[1].id,
+                dependency_type="blocking",
+                priority="high",
+            ),
+            EpicDependency(
+                title="Dependency",
+                parent_epic_id=epics[3].id,
+                dependent_epic_id=epics[2].id,
+                dependency_type="blocking",
+                is_resolved=True,
+                estimated_impact_days=3,
+            ),
+            EpicDependency(
+                title="Dependency",
+                parent_epic_id=epics[4].id,
+                dependent_epic_id=epics[0].id,
+                dependency_type="prerequisite",
+                estimated_impact_days=6,
+            ),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _count_queries(engine):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+def test_epic_projection_matches_to_dict(db_session):
+    expected = [
+        epic.to_dict() for epic in db_session.query(Epic).order_by(Epic.id).all()
+    ]
+    db_session.expire_all()
+
+    projection = EpicProjection(db_session)
+    projected = projection.serialize(projection.query().order_by(Epic.id).all())
+
+    assert projected == expected
+    assert projected[1]["is_blocked"] is True
+    assert projected[1]["dependency_risk_score"] == 33
+
+
+def test_user_story_projection_matches_to_dict(db_session):
+    expected = [
+        story.to_dict()
+        for story in db_session.query(UserStory).order_by(UserStory.id).all()
+    ]
+    db_session.expire_all()
+
+    projection = UserStoryProjection(db_session)
+    projected = projection.serialize(projection.query().order_by(UserStory.id).all())
+
+    assert projected == expected
+
+
+def test_list_endpoints_use_fixed_query_count(engine, db_session):
+    db_session.expire_all()
+    statements = _count_queries(engine)
+
+    epics = list_epics(
+        status=None,
+        priority=None,
+        component=None,
+        exclude_component=None,
+        limit=100,
+        offset=0,
+        cursor=None,
+        total=None,
+        db=db_session,
+    )
+    stories = list_user_stories(
+        epic_id=None,
+        status=None,
+        component=None,
+        exclude_component=None,
+        limit=100,
+        offset=0,
+        cursor=None,
+        total=None,
+        db=db_session,
+    )
+
+    assert len(epics) == 5
+    assert len(stories) == 10
+    assert len(statements) == 3
+
+
+@pytest.mark.parametrize(
+    "projection_class, key",
+    [(EpicProjection, Epic.epic_id), (UserStoryProjection, UserStory.user_story_id)],
+)
+def test_page_aggregates_only_read_the_page_children(
+    engine, db_session, projection_class, key
+):
+    query = projection_class(db_session).query().order_by(key).limit(2)
+    sql = str(query.statement.compile(engine, compile_kwargs={"literal_binds": True}))
+
+    plan = [row[3] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+    child_steps = [step for step in plan if "SUBQUERY" not in step][1:]
+    assert child_steps
+    assert all(step.startswith("SEARCH") for step in child_steps), plan
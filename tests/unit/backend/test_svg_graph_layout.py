@@ -0,0 +1,139 @@
+"""
+Unit tests for the dependency graph layout engines.
+
+Tests that the NumPy Barnes-Hut engine reproduces the pure-Python forces,
+that the approximation stays close to the exact repulsion, and that the
+generator falls back to the pure-Python engine without NumPy.
+
+Related Issue: US-00030 - Visual Filtering Enhancement for Epic
+Dependencies Graph
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import random
+
+import pytest
+
+from src.be.services import svg_graph_generator
+from src.be.services.svg_graph_generator import (
+    ForceDirectedLayout,
+    GraphLayout,
+    Link,
+    Node,
+    SVGGraphGenerator,
+    create_force_layout,
+)
+
+
+def _nodes(count, seed=7, size=800):
+    rng = random.Random(seed)
+    return {
+        str(i): Node(
+            id=str(i),
+            epic_id=f"EP-{i:05d}",
+            title=f"Epic {i}",
+            status="planned",
+            capability_id=None,
+            capability_name=None,
+            component="backend",
+            completion_percentage=0,
+            priority="medium",
+            x=rng.uniform(0, size),
+            y=rng.uniform(0, size),
+        )
+        for i in range(count)
+    }
+
+
+@pytest.mark.epic("EP-00005")
+@pytest.mark.user_story("US-00030")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestBarnesHutLayout:
+    """Test the vectorized layout engine against the pure-Python one."""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_exact_charge_matches_python_engine(self, numpy):
+        """With theta 0 the quadtree walk equals the pairwise loop."""
+        nodes = _nodes(120)
+        pos = numpy.array([(node.x, node.y) for node in nodes.values()])
+        python_engine = ForceDirectedLayout(GraphLayout())
+        python_engine._apply_charge_force(nodes)
+        expected = numpy.array([(node.vx, node.vy) for node in nodes.values()])
+
+        engine = svg_graph_generator.BarnesHutLayout(
+            GraphLayout(barnes_hut_theta=0.0)
+        )
+        charge = engine._charge(pos, -engine.layout.charge_strength)
+
+        assert numpy.allclose(charge, expected)
+
+    def test_approximate_charge_stays_close(self, numpy):
+        """The default opening angle keeps repulsion within a few percent."""
+        pos = numpy.array(
+            [(node.x, node.y) for node in _nodes(500, size=2000).values()]
+        )
+        exact = svg_graph_generator.BarnesHutLayout(
+            GraphLayout(barnes_hut_theta=0.0)
+        )._charge(pos, 1.0)
+        approx = svg_graph_generator.BarnesHutLayout(GraphLayout())._charge(pos, 1.0)
+
+        error = numpy.linalg.norm(approx - exact, axis=1).mean()
+        assert error / numpy.linalg.norm(exact, axis=1).mean() < 0.05
+
+    def test_collision_grid_finds_every_overlap(self, numpy):
+        """Grid-based collision equals the all-pairs correction."""
+        pos = numpy.array([(node.x, node.y) for node in _nodes(150).values()])
+        layout = GraphLayout()
+        correction = svg_graph_generator.BarnesHutLayout(layout)._collision(pos)
+
+        delta = pos[None, :, :] - pos[:, None, :]
+        distance = numpy.sqrt((delta**2).sum(axis=-1))
+        radius = layout.collision_radius
+        close = (distance < radius) & (distance > 0)
+        scale = numpy.where(close, (radius - distance) / (distance + ~close) * 0.5, 0)
+        expected = -(delta * scale[:, :, None]).sum(axis=1)
+
+        assert numpy.allclose(correction, expected)
+
+    def test_layout_keeps_nodes_inside_canvas(self):
+        """A full run leaves every node within the drawing margins."""
+        nodes = _nodes(200)
+        links = [Link(str(i - 1), str(i), "blocking", "high", "") for i in range(1, 200)]
+        layout = GraphLayout()
+
+        svg_graph_generator.BarnesHutLayout(layout).apply_forces(nodes, links)
+
+        for node in nodes.values():
+            assert layout.node_radius <= node.x <= layout.width - layout.node_radius
+            assert layout.node_radius <= node.y <= layout.height - layout.node_radius
+
+    def test_engine_selection(self):
+        """Large graphs use Barnes-Hut unless the Python engine is forced."""
+        layout = GraphLayout()
+        assert type(create_force_layout(layout, 10)) is ForceDirectedLayout
+        assert isinstance(
+            create_force_layout(layout, 400), svg_graph_generator.BarnesHutLayout
+        )
+        layout.engine = "python"
+        assert type(create_force_layout(layout, 400)) is ForceDirectedLayout
+
+
+@pytest.mark.epic("EP-00005")
+@pytest.mark.user_story("US-00030")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+def test_generator_falls_back_without_numpy(monkeypatch):
+    """Without NumPy the pure-Python engine renders the graph."""
+    monkeypatch.setattr(svg_graph_generator, "np", None)
+    layout = GraphLayout(engine="numpy")
+    assert type(create_force_layout(layout, 500)) is ForceDirectedLayout
+
+    epics = [{"id": i, "epic_id": f"EP-{i:05d}"} for i in range(1, 4)]
+    dependencies = [{"parent_epic_id": 1, "dependent_epic_id": 2}]
+    svg = SVGGraphGenerator().generate_svg(epics, dependencies)
+
+    assert svg.startswith("<svg") and "EP-00003" in svg
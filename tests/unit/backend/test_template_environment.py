@@ -0,0 +1,73 @@
+"""
+Unit tests for the shared report rendering environment.
+
+Verifies that report generators share one template service, that compiled
+templates are persisted to the bytecode cache and reloaded only when their
+source changes, and that the asset manifest follows file changes.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+"""
+
+import json
+import os
+
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability.base import Base
+from src.be.services.rtm_report_generator import RTMReportGenerator
+from src.fe.services import AssetService, TemplateService
+
+
+def _touch_later(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_report_generators_share_services():
+    session = sessionmaker(bind=create_engine("sqlite:///:memory:"))()
+    Base.metadata.create_all(session.get_bind())
+
+    first = RTMReportGenerator(session)
+    second = RTMReportGenerator(session)
+
+    assert first.template_service is second.template_service
+    assert first.asset_service is second.asset_service
+    assert first.template_service.jinja_env.bytecode_cache is not None
+
+
+def test_templates_use_bytecode_cache_and_reload_on_change(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    cache_dir = tmp_path / "bytecode"
+    cache_dir.mkdir()
+    greeting = templates / "greeting.html"
+    greeting.write_text("Hello {{ name }}")
+
+    service = TemplateService(templates, FileSystemBytecodeCache(str(cache_dir)))
+    assert service.warm_up() == 1
+    assert list(cache_dir.iterdir())
+
+    template = service.jinja_env.get_template("greeting.html")
+    assert service.jinja_env.get_template("greeting.html") is template
+    assert service.render_template("greeting.html", name="RTM") == "Hello RTM"
+
+    _touch_later(greeting, "Bye {{ name }}")
+    assert service.render_template("greeting.html", name="RTM") == "Bye RTM"
+
+
+def test_asset_manifest_reloads_when_file_changes(tmp_path):
+    manifest = tmp_path / "assets.json"
+    manifest.write_text(
+        json.dumps({"assets": {"css": {"core": ["a.css"]}}, "paths": {}})
+    )
+    service = AssetService(str(manifest))
+    assert service.get_core_css() == ["/static/a.css"]
+
+    _touch_later(
+        manifest, json.dumps({"assets": {"css": {"core": ["b.css"]}}, "paths": {}})
+    )
+    assert service.get_core_css() == ["/static/b.css"]
@@ -0,0 +1,193 @@
+"""
+Unit tests for Epic metric change tracking.
+
+Tests that changes to user stories, tests, defects, dependencies and epics
+mark only the affected epics and metric families dirty, and that partial
+recalculation refreshes just those families.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import (
+    Defect,
+    Epic,
+    EpicDependency,
+    EpicMetricDirty,
+    Test,
+    UserStory,
+)
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_metric_dirty import (
+    METRIC_FAMILIES,
+    clear_epic_metrics_dirty,
+    get_dirty_metric_families,
+)
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database with two cached epics."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add_all(
+        [
+            Epic(epic_id="EP-00001", title="First", completed_story_points=4),
+            Epic(epic_id="EP-00002", title="Second"),
+        ]
+    )
+    session.commit()
+    for epic in session.query(Epic).all():
+        epic.update_metrics(force_recalculate=True, session=session)
+    session.commit()
+    session.query(EpicMetricDirty).delete()
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _epics(session):
+    return (
+        session.query(Epic).filter_by(epic_id="EP-00001").one(),
+        session.query(Epic).filter_by(epic_id="EP-00002").one(),
+    )
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00071")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestEpicMetricChangeTracking:
+    """Test dirty marking of epic metric families."""
+
+    def test_metrics_refresh_does_not_mark_dirty(self, db_session):
+        """Writing the metrics cache itself leaves no dirty marks."""
+        first, _ = _epics(db_session)
+        first.update_metrics(force_recalculate=True, session=db_session)
+        db_session.commit()
+
+        assert get_dirty_metric_families(db_session) == {}
+
+    def test_defect_marks_quality_and_predictive(self, db_session):
+        """A new defect marks only its epic's defect-dependent families."""
+        first, second = _epics(db_session)
+        db_session.add(
+            Defect(
+                defect_id="DEF-00001",
+                github_issue_number=1,
+                title="Bug",
+                epic_id=first.id,
+            )
+        )
+        db_session.commit()
+
+        assert get_dirty_metric_families(db_session) == {
+            first.id: {"quality_metrics", "predictive_metrics"}
+        }
+
+    def test_moving_a_test_marks_both_epics(self, db_session):
+        """Re-parenting a test marks the old and the new epic."""
+        first, second = _epics(db_session)
+        test = Test(
+            test_type="unit",
+            test_file_path="tests/unit/test_x.py",
+            title="Test",
+            epic_id=first.id,
+        )
+        db_session.add(test)
+        db_session.commit()
+        db_session.query(EpicMetricDirty).delete()
+        db_session.commit()
+
+        test.epic_id = second.id
+        db_session.commit()
+
+        assert get_dirty_metric_families(db_session) == {
+            first.id: {"quality_metrics"},
+            second.id: {"quality_metrics"},
+        }
+
+    def test_user_story_and_dependency_changes(self, db_session):
+        """User stories and dependencies mark their epics' families."""
+        first, second = _epics(db_session)
+        db_session.add(
+            UserStory(
+                user_story_id="US-00001",
+                epic_id=first.id,
+                github_issue_number=10,
+                title="Story",
+            )
+        )
+        db_session.add(
+            EpicDependency(
+                parent_epic_id=first.id,
+                dependent_epic_id=second.id,
+                title="First before second",
+            )
+        )
+        db_session.commit()
+
+        dirty = get_dirty_metric_families(db_session)
+        assert "velocity_metrics" in dirty[first.id]
+        assert "quality_metrics" not in dirty[first.id]
+        assert dirty[second.id] == {"predictive_metrics"}
+
+    def test_epic_field_change_marks_all_families(self, db_session):
+        """Editing an epic's own planning fields marks every family."""
+        first, _ = _epics(db_session)
+        first.planned_end_date = datetime.now() + timedelta(days=3)
+        db_session.commit()
+
+        assert get_dirty_metric_families(db_session) == {
+            first.id: set(METRIC_FAMILIES)
+        }
+
+    def test_partial_update_merges_cached_families(self, db_session):
+        """Recalculating one family keeps the other cached families."""
+        first, _ = _epics(db_session)
+        cached = first.get_cached_metrics_only()
+        db_session.add(
+            Defect(
+                defect_id="DEF-00002",
+                github_issue_number=2,
+                title="Bug",
+                epic_id=first.id,
+            )
+        )
+        db_session.commit()
+
+        metrics = first.update_metrics(
+            force_recalculate=True,
+            session=db_session,
+            families=first.get_dirty_metric_families(db_session),
+        )
+
+        assert metrics["business_metrics"] == cached["business_metrics"]
+        assert metrics["quality_metrics"]["actual_defect_density"] == 0.25
+        assert first.defect_density == 0.25
+
+    def test_clear_keeps_marks_newer_than_cutoff(self, db_session):
+        """Clearing only removes marks recorded before the cutoff."""
+        first, _ = _epics(db_session)
+        first.planned_end_date = datetime.now()
+        db_session.commit()
+
+        cleared = clear_epic_metrics_dirty(
+            db_session, [first.id], datetime.now() - timedelta(minutes=1)
+        )
+        assert cleared == 0
+        assert first.is_metrics_cache_stale(session=db_session)
+
+        clear_epic_metrics_dirty(db_session, [first.id], datetime.now())
+        db_session.commit()
+        assert not first.is_metrics_cache_stale(session=db_session)
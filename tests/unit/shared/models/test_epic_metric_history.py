@@ -0,0 +1,195 @@
+"""
+Unit tests for delta-encoded Epic metric history.
+
+Tests that history captures store only changed values, reconstruct full
+snapshots, serve single-metric trends and survive downsampling.
+
+Related Issue: US-00071 - Extend Epic model for metrics
+Parent Epic: EP-00010 - Multi-persona traceability dashboard
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.be.models.traceability import Epic, EpicMetricHistory, EpicMetricValue
+from src.be.models.traceability.base import Base
+from src.be.models.traceability.epic_metric_history import (
+    KEYFRAME_INTERVAL,
+    downsample_metric_history,
+    record_metric_snapshot,
+)
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database with one epic."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Epic(epic_id="EP-00001", title="History"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _snapshot(velocity, grade="B", risks=None):
+    return {
+        "velocity_metrics": {"velocity_points_per_sprint": velocity, "team": 3},
+        "quality_metrics": {"quality_grade": grade, "is_at_risk": False},
+        "predictive_metrics": {"risk_factors": risks or []},
+    }
+
+
+@pytest.mark.epic("EP-00010")
+@pytest.mark.user_story("US-00071")
+@pytest.mark.test_type("unit")
+@pytest.mark.component("backend")
+class TestEpicMetricHistory:
+    """Test delta-encoded metric history storage."""
+
+    def test_only_changed_values_are_stored(self, db_session):
+        """Unchanged captures are skipped and deltas hold changed keys only."""
+        epic = db_session.query(Epic).one()
+        first = record_metric_snapshot(db_session, epic.id, _snapshot(5.0))
+        unchanged = record_metric_snapshot(db_session, epic.id, _snapshot(5.0))
+        delta = record_metric_snapshot(db_session, epic.id, _snapshot(6.5))
+        db_session.commit()
+
+        assert first.is_keyframe
+        assert len(first.values) == 5
+        assert unchanged is None
+        assert [value.metric_key for value in delta.values] == [
+            "velocity_metrics.velocity_points_per_sprint"
+        ]
+
+    def test_history_reconstructs_full_snapshots(self, db_session):
+        """get_metric_history returns complete snapshots, newest first."""
+        epic = db_session.query(Epic).one()
+        snapshots = [
+            _snapshot(5.0),
+            _snapshot(5.0, grade="A", risks=["scope_creep"]),
+            _snapshot(7, grade="A"),
+        ]
+        for snapshot in snapshots:
+            record_metric_snapshot(db_session, epic.id, snapshot)
+        db_session.commit()
+
+        history = epic.get_metric_history(session=db_session, limit=10)
+
+        assert [entry["metrics"] for entry in history] == snapshots[::-1]
+        assert isinstance(
+            history[0]["metrics"]["velocity_metrics"]["velocity_points_per_sprint"],
+            int,
+        )
+
+    def test_removed_metric_is_recorded_as_deleted(self, db_session):
+        """Metrics that disappear from a snapshot do not reappear."""
+        epic = db_session.query(Epic).one()
+        with_deadline = _snapshot(5.0)
+        with_deadline["velocity_metrics"]["days_until_deadline"] = 3
+        record_metric_snapshot(db_session, epic.id, with_deadline)
+        record_metric_snapshot(db_session, epic.id, _snapshot(5.0))
+        db_session.commit()
+
+        latest = epic.get_metric_history(session=db_session, limit=1)[0]
+        assert "days_until_deadline" not in latest["metrics"]["velocity_metrics"]
+
+        trend = epic.get_metric_trend(
+            "velocity_metrics.days_until_deadline", session=db_session
+        )
+        assert [point["deleted"] for point in trend] == [False, True]
+
+    def test_keyframes_bound_reconstruction(self, db_session):
+        """A full snapshot is written every KEYFRAME_INTERVAL captures."""
+        epic = db_session.query(Epic).one()
+        for velocity in range(KEYFRAME_INTERVAL + 2):
+            record_metric_snapshot(db_session, epic.id, _snapshot(float(velocity)))
+        db_session.commit()
+
+        keyframes = (
+            db_session.query(EpicMetricHistory)
+            .filter(EpicMetricHistory.is_keyframe.is_(True))
+            .count()
+        )
+        assert keyframes == 2
+        history = epic.get_metric_history(session=db_session, limit=3)
+        assert [
+            entry["metrics"]["velocity_metrics"]["velocity_points_per_sprint"]
+            for entry in history
+        ] == [21.0, 20.0, 19.0]
+
+    def test_trend_reads_single_metric(self, db_session):
+        """Trend queries return only change points of the requested metric."""
+        epic = db_session.query(Epic).one()
+        for velocity in (5.0, 5.0, 6.0, 8.0):
+            record_metric_snapshot(db_session, epic.id, _snapshot(velocity))
+        db_session.commit()
+
+        trend = epic.get_metric_trend(
+            "velocity_metrics.velocity_points_per_sprint", session=db_session
+        )
+        assert [point["value"] for point in trend] == [5.0, 6.0, 8.0]
+
+    def test_legacy_json_rows_are_keyframes(self, db_session):
+        """Rows written before delta encoding are still readable."""
+        epic = db_session.query(Epic).one()
+        db_session.add(
+            EpicMetricHistory(
+                epic_id=epic.id,
+                metrics=json.dumps(_snapshot(3.0)),
+                captured_at=datetime.now() - timedelta(hours=1),
+            )
+        )
+        db_session.commit()
+        delta = record_metric_snapshot(db_session, epic.id, _snapshot(4.0))
+        db_session.commit()
+
+        assert not delta.is_keyframe
+        history = epic.get_metric_history(session=db_session)
+        assert [entry["metrics"] for entry in history] == [
+            _snapshot(4.0),
+            _snapshot(3.0),
+        ]
+
+    def test_downsample_keeps_later_snapshots_identical(self, db_session):
+        """Old captures merge into one per day without changing later ones."""
+        epic = db_session.query(Epic).one()
+        day = datetime(2025, 1, 1, 8, 0)
+        for hour, velocity in enumerate((1.0, 2.0, 3.0)):
+            record_metric_snapshot(
+                db_session,
+                epic.id,
+                _snapshot(velocity, risks=["late"] if hour == 1 else None),
+                captured_at=day + timedelta(hours=hour),
+            )
+        record_metric_snapshot(
+            db_session, epic.id, _snapshot(4.0), captured_at=datetime.now()
+        )
+        db_session.commit()
+        before = epic.get_metric_history(session=db_session, limit=1)
+
+        removed = downsample_metric_history(
+            db_session, older_than=datetime.now() - timedelta(days=1)
+        )
+        db_session.commit()
+
+        assert removed == 2
+        assert db_session.query(EpicMetricHistory).count() == 2
+        history = epic.get_metric_history(session=db_session)
+        assert history[0] == before[0]
+        assert history[1]["metrics"] == _snapshot(3.0)
+        assert (
+            db_session.query(EpicMetricValue)
+            .filter(
+                ~EpicMetricValue.history_id.in_(
+                    db_session.query(EpicMetricHistory.id)
+                )
+            )
+            .count()
+            == 0
+        )
@@ -7,13 +7,19 @@ Related Issue: US-00057 - Test execution integration with database
 Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
 """
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.shared.testing import database_integration
 from src.shared.testing.database_integration import (
+    DISCOVERY_CACHE_PATH,
     BDDScenarioParser,
     TestDatabaseSync,
     TestDiscovery,
@@ -21,6 +27,21 @@ from src.shared.testing.database_integration import (
 )
 
 
+@pytest.fixture
+def integration_db(monkeypatch):
+    """In-memory database the sync and tracker open their sessions on."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    database_integration.Test.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(database_integration, "get_db_session", factory)
+    yield factory
+    engine.dispose()
+
+
 @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
 @pytest.mark.user_story("US-00057", "US-99999")
 @pytest.mark.component("shared")
@@ -281,7 +302,7 @@ def test_simple_function():
 
         mock_glob.return_value = [mock_test_file]
 
-        with patch.object(self.discovery, "_analyze_test_file") as mock_analyze:
+        with patch.object(TestDiscovery, "_analyze_test_file") as mock_analyze:
             mock_analyze.return_value = [
                 {
                     "test_file_path": "tests/unit/test_example.py",
@@ -291,12 +312,94 @@ def test_simple_function():
                 }
             ]
 
-            tests = self.discovery.discover_tests()
+            # Mock files cannot be fingerprinted, so bypass the cache
+            tests = TestDiscovery(use_cache=False).discover_tests()
 
             assert len(tests) == 5  # One for each test type pattern
             mock_analyze.assert_called()
 
 
+@pytest.mark.epic("EP-00005", "EP-00057")
+@pytest.mark.user_story("US-00057")
+@pytest.mark.component("shared")
+class TestTestDiscoveryCache:
+    """Test incremental discovery with the persistent fingerprint cache."""
+
+    def _write(self, root, name, body, test_type="unit"):
+        path = root / "tests" / test_type / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+        return path
+
+    def _names(self, tests):
+        return sorted(test["test_function_name"] for test in tests)
+
+    def test_unchanged_files_are_served_from_cache(self, tmp_path):
+        for index in range(3):
+            self._write(
+                tmp_path,
+                f"test_{index}.py",
+                f'"""EP-0000{index}"""\ndef test_a{index}():\n    pass\n',
+            )
+        discovery = TestDiscovery()
+
+        first = discovery.discover_tests(tmp_path)
+        assert discovery.last_stats == {"files": 3, "parsed": 3, "cached": 0}
+        assert (tmp_path / DISCOVERY_CACHE_PATH).exists()
+
+        with patch.object(TestDiscovery, "_analyze_test_file") as mock_analyze:
+            discovery = TestDiscovery()
+            assert discovery.discover_tests(tmp_path) == first
+            assert discovery.last_stats == {"files": 3, "parsed": 0, "cached": 3}
+            mock_analyze.assert_not_called()
+
+    def test_changed_and_deleted_files_are_refreshed(self, tmp_path):
+        kept = self._write(tmp_path, "test_kept.py", "def test_kept():\n    pass\n")
+        gone = self._write(tmp_path, "test_gone.py", "def test_gone():\n    pass\n")
+        TestDiscovery().discover_tests(tmp_path)
+
+        kept.write_text(
+            "def test_kept():\n    pass\n\ndef test_added():\n    pass\n",
+            encoding="utf-8",
+        )
+        gone.unlink()
+        discovery = TestDiscovery()
+
+        tests = discovery.discover_tests(tmp_path)
+
+        assert self._names(tests) == ["test_added", "test_kept"]
+        assert discovery.last_stats == {"files": 1, "parsed": 1, "cached": 0}
+
+    def test_touched_file_with_same_content_is_not_reparsed(self, tmp_path):
+        path = self._write(tmp_path, "test_touch.py", "def test_touch():\n    pass\n")
+        first = TestDiscovery().discover_tests(tmp_path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(TestDiscovery, "_analyze_test_file") as mock_analyze:
+            assert TestDiscovery().discover_tests(tmp_path) == first
+            mock_analyze.assert_not_called()
+
+    def test_parallel_discovery_matches_serial(self, tmp_path, monkeypatch):
+        for index in range(6):
+            self._write(
+                tmp_path,
+                f"test_{index}.py",
+                f"@pytest.mark.component('c{index}')\n"
+                f"def test_x{index}():\n    'US-0000{index}'\n",
+                test_type=("unit", "integration")[index % 2],
+            )
+        serial = TestDiscovery(use_cache=False).discover_tests(tmp_path)
+        monkeypatch.setattr(database_integration, "PARALLEL_MIN_FILES", 2)
+
+        parallel = TestDiscovery(max_workers=2).discover_tests(tmp_path)
+
+        assert parallel == serial
+        assert {test["component"] for test in parallel} == {
+            f"c{index}" for index in range(6)
+        }
+
+
 @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
 @pytest.mark.user_story("US-00057", "US-99999")
 @pytest.mark.component("shared")
@@ -306,97 +409,86 @@ class TestTestDatabaseSync:
     def setup_method(self):
         """Set up test fixtures."""
         self.sync = TestDatabaseSync()
-        self.mock_db = Mock()
-
-    @patch("src.shared.testing.database_integration.get_db_session")
-    @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
-    @pytest.mark.user_story("US-00057", "US-99999")
-    @pytest.mark.component("shared")
-    def test_create_or_update_test_new(self, mock_get_db):
-        """Test creating a new test record."""
-        mock_get_db.return_value = self.mock_db
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
 
-        test_data = {
+    def _sync(self, **test_data):
+        """Sync one discovered test and return the stats and its stored row."""
+        discovered = {
             "test_file_path": "tests/unit/test_example.py",
             "test_function_name": "test_example",
             "test_type": "unit",
             "title": "Test: Example",
             "line_number": 10,
+            "epic_references": [],
+            "user_story_references": [],
+            "defect_references": [],
             "bdd_scenario_name": None,
+            **test_data,
         }
+        with patch.object(
+            self.sync.discovery, "discover_tests", return_value=[discovered]
+        ):
+            stats = self.sync.sync_tests_to_database()
 
-        result = self.sync._create_or_update_test(self.mock_db, test_data)
-
-        assert result == "created"
-        self.mock_db.add.assert_called_once()
+        db = database_integration.get_db_session()
+        try:
+            return stats, db.query(database_integration.Test).one()
+        finally:
+            db.close()
 
-    @patch("src.shared.testing.database_integration.get_db_session")
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
     @pytest.mark.component("shared")
-    def test_create_or_update_test_existing(self, mock_get_db):
-        """Test updating an existing test record."""
-        mock_get_db.return_value = self.mock_db
-        mock_existing_test = Mock()
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_existing_test
+    def test_sync_creates_new_test(self, integration_db):
+        """Test creating a new test record."""
+        stats, test = self._sync()
+
+        assert stats["created"] == 1
+        assert stats["updated"] == 0
+        assert test.title == "Test: Example"
+        assert test.test_priority == "medium"
+        assert test.description == (
+            "Auto-discovered test from tests/unit/test_example.py:10"
         )
 
-        test_data = {
-            "test_file_path": "tests/unit/test_example.py",
-            "test_function_name": "test_example",
-            "test_type": "unit",
-            "title": "Test: Example Updated",
-            "bdd_scenario_name": None,
-        }
+    @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
+    @pytest.mark.user_story("US-00057", "US-99999")
+    @pytest.mark.component("shared")
+    def test_sync_updates_existing_test(self, integration_db):
+        """Test updating an existing test record."""
+        self._sync()
 
-        result = self.sync._create_or_update_test(self.mock_db, test_data)
+        stats, test = self._sync(title="Test: Example Updated")
 
-        assert result == "updated"
-        assert mock_existing_test.title == "Test: Example Updated"
-        self.mock_db.add.assert_not_called()
+        assert stats["created"] == 0
+        assert stats["updated"] == 1
+        assert test.title == "Test: Example Updated"
 
-    @patch("src.shared.testing.database_integration.get_db_session")
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
     @pytest.mark.component("shared")
-    def test_link_test_to_epic_success(self, mock_get_db):
+    def test_sync_links_test_to_epic(self, integration_db):
         """Test successfully linking test to Epic."""
-        mock_get_db.return_value = self.mock_db
-
-        # Mock Epic query
-        mock_epic = Mock()
-        mock_epic.id = 1
-        self.mock_db.query.return_value.filter.return_value.first.side_effect = [
-            mock_epic,  # Epic found
-            Mock(),  # Test found
-        ]
-
-        test_data = {
-            "test_file_path": "tests/unit/test_example.py",
-            "test_function_name": "test_example",
-            "epic_references": ["EP-00057"],
-        }
+        db = integration_db()
+        epic = database_integration.Epic(epic_id="EP-00057", title="Epic")
+        db.add(epic)
+        db.commit()
+        epic_id = epic.id
+        db.close()
 
-        result = self.sync._link_test_to_epic(self.mock_db, test_data)
+        stats, test = self._sync(epic_references=["EP-00057"])
 
-        assert result is True
+        assert stats["linked_to_epics"] == 1
+        assert test.epic_id == epic_id
 
-    @patch("src.shared.testing.database_integration.get_db_session")
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
     @pytest.mark.component("shared")
-    def test_link_test_to_epic_no_epic(self, mock_get_db):
+    def test_sync_with_unknown_epic_leaves_test_unlinked(self, integration_db):
         """Test linking test to Epic when Epic doesn't exist."""
-        mock_get_db.return_value = self.mock_db
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        stats, test = self._sync(epic_references=["EP-99999"])
 
-        test_data = {"epic_references": ["EP-99999"]}
-
-        result = self.sync._link_test_to_epic(self.mock_db, test_data)
-
-        assert result is False
+        assert stats["linked_to_epics"] == 0
+        assert test.epic_id is None
 
 
 @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
@@ -431,21 +523,31 @@ class TestTestExecutionTracker:
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
     @pytest.mark.component("shared")
-    def test_record_test_result_success(self):
+    def test_record_test_result_success(self, integration_db):
         """Test recording successful test result."""
-        self.tracker.db_session = self.mock_db
-
-        mock_test = Mock()
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_test
+        db = integration_db()
+        db.add(
+            database_integration.Test(
+                test_type="unit",
+                test_file_path="tests/unit/test_example.py",
+                test_function_name="test_function",
+                title="Test: Function",
+            )
         )
+        db.commit()
+        self.tracker.start_test_session()
 
         result = self.tracker.record_test_result(
             "tests/unit/test_example.py::test_function", "passed", 150.5
         )
+        self.tracker.end_test_session()
 
         assert result is True
-        mock_test.update_execution_result.assert_called_once_with("passed", 150.5, None)
+        test = db.query(database_integration.Test).one()
+        assert test.last_execution_status == "passed"
+        assert test.execution_duration_ms == 150.5
+        assert test.execution_count == 1
+        db.close()
 
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
@@ -525,6 +627,135 @@ class TestTestExecutionTracker:
         assert self.tracker._determine_failure_severity("Unknown error") == "low"
 
 
+@pytest.mark.epic("EP-00005", "EP-00057")
+@pytest.mark.user_story("US-00057")
+@pytest.mark.component("shared")
+class TestBulkSyncAndTracking:
+    """Test the batched sync and execution result paths."""
+
+    def _discovered(self, count, title="Test: Bulk"):
+        return [
+            {
+                "test_file_path": f"tests/unit/test_bulk_{index % 10}.py",
+                "test_function_name": f"test_case_{index}",
+                "test_type": "unit",
+                "title": title,
+                "line_number": index,
+                "epic_references": ["EP-00057"] if index % 2 else ["EP-99999"],
+                "user_story_references": [],
+                "defect_references": [],
+                "bdd_scenario_name": None,
+            }
+            for index in range(count)
+        ]
+
+    def _statements(self, factory):
+        statements = []
+        event.listen(
+            factory.kw["bind"],
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        return statements
+
+    def test_sync_uses_a_handful_of_statements(self, integration_db):
+        db = integration_db()
+        db.add(database_integration.Epic(epic_id="EP-00057", title="Epic"))
+        db.commit()
+        statements = self._statements(integration_db)
+        sync = TestDatabaseSync()
+
+        with patch.object(sync.discovery, "discover_tests") as mock_discover:
+            mock_discover.return_value = self._discovered(2500)
+            stats = sync.sync_tests_to_database()
+            assert stats["created"] == 2500
+            assert stats["linked_to_epics"] == 1250
+            assert len(statements) < 10
+
+            statements.clear()
+            assert sync.sync_tests_to_database()["updated"] == 2500
+            # Nothing changed: only the two preload queries
+            assert len(statements) == 2
+
+            statements.clear()
+            mock_discover.return_value = self._discovered(2500, "Test: Renamed")
+            sync.sync_tests_to_database()
+            assert len(statements) < 10
+
+        Test = database_integration.Test
+        assert db.query(Test).count() == 2500
+        assert {title for (title,) in db.query(Test.title)} == {"Test: Renamed"}
+        assert db.query(Test).filter(Test.epic_id.isnot(None)).count() == 1250
+        db.close()
+
+    def test_results_are_written_in_one_batch(self, integration_db):
+        db = integration_db()
+        Test = database_integration.Test
+        db.add_all(
+            Test(
+                test_type="unit",
+                test_file_path="tests/unit/test_batch.py",
+                test_function_name=f"test_{index}",
+                title=f"Test {index}",
+            )
+            for index in range(300)
+        )
+        db.commit()
+        statements = self._statements(integration_db)
+        tracker = TestExecutionTracker()
+        tracker.start_test_session()
+
+        for index in range(300):
+            assert tracker.record_test_result(
+                f"tests/unit/test_batch.py::test_{index}", "passed", float(index)
+            )
+        assert not tracker.record_test_result("tests/unit/test_batch.py::nope", "x")
+        tracker.end_test_session()
+
+        # One preload query and one executemany UPDATE, besides advancing the
+        # render data generation
+        assert len([sql for sql in statements if "data_generations" not in sql]) == 2
+        assert db.query(Test).filter(Test.execution_count == 1).count() == 300
+        assert db.query(Test).filter_by(test_function_name="test_7").one().execution_duration_ms == 7.0
+        db.close()
+
+    def test_buffered_results_match_sequential_updates(self, integration_db):
+        db = integration_db()
+        Test = database_integration.Test
+        for name in ("test_a", "test_b", "test_c"):
+            db.add(
+                Test(
+                    test_type="unit",
+                    test_file_path="tests/unit/test_seq.py",
+                    test_function_name=name,
+                    title=name,
+                    last_error_message="old",
+                    last_error_traceback="old trace",
+                )
+            )
+        db.commit()
+        tracker = TestExecutionTracker()
+        tracker.start_test_session()
+
+        record = tracker.record_test_result
+        record("tests/unit/test_seq.py::test_a", "failed", 5.0, "boom")
+        record("tests/unit/test_seq.py::test_a", "failed", None, None)
+        record("tests/unit/test_seq.py::test_b", "failed", None, None)
+        record("tests/unit/test_seq.py::test_c", "failed", 1.0, "first")
+        record("tests/unit/test_seq.py::test_c", "passed", None)
+        tracker.end_test_session()
+
+        a, b, c = db.query(Test).order_by(Test.test_function_name).all()
+        assert (a.execution_count, a.failure_count) == (2, 2)
+        assert (a.last_error_message, a.last_error_traceback) == ("boom", "old trace")
+        assert a.execution_duration_ms == 5.0
+        assert (b.last_error_message, b.last_execution_status) == ("old", "failed")
+        assert (c.execution_count, c.failure_count) == (2, 1)
+        assert c.last_error_message is None and c.last_error_traceback is None
+        assert c.last_execution_status == "passed"
+        db.close()
+
+
 @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
 @pytest.mark.user_story("US-00057", "US-99999")
 @pytest.mark.component("shared")
@@ -659,15 +890,15 @@ Feature: Test Integration
 class TestIntegrationWorkflow:
     """Test complete integration workflow."""
 
-    @patch("src.shared.testing.database_integration.get_db_session")
     @patch("src.shared.testing.database_integration.TestDiscovery.discover_tests")
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
     @pytest.mark.component("shared")
-    def test_full_sync_workflow(self, mock_discover, mock_get_db):
+    def test_full_sync_workflow(self, mock_discover, integration_db):
         """Test complete test discovery and sync workflow."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
+        db = integration_db()
+        db.add(database_integration.Epic(epic_id="EP-00057", title="Epic"))
+        db.commit()
 
         # Mock discovered tests
         mock_discover.return_value = [
@@ -684,13 +915,6 @@ class TestIntegrationWorkflow:
             }
         ]
 
-        # Mock database queries
-        mock_db.query.return_value.filter.return_value.first.side_effect = [
-            None,  # Test doesn't exist (create)
-            Mock(),  # Epic exists (link)
-            Mock(),  # Test exists for linking
-        ]
-
         sync = TestDatabaseSync()
         stats = sync.sync_tests_to_database()
 
@@ -698,6 +922,12 @@ class TestIntegrationWorkflow:
         assert stats["created"] == 1
         assert stats["linked_to_epics"] == 1
         assert stats["errors"] == 0
+        test = db.query(database_integration.Test).one()
+        assert test.epic.epic_id == "EP-00057"
+        assert test.description == (
+            "Auto-discovered test from tests/unit/test_example.py:10"
+        )
+        db.close()
 
     @pytest.mark.epic("EP-00005", "EP-00057", "EP-12345", "EP-99999")
     @pytest.mark.user_story("US-00057", "US-99999")
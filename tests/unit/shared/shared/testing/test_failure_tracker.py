@@ -31,6 +31,7 @@ FailureCategory = failure_tracker.FailureCategory
 FailureSeverity = failure_tracker.FailureSeverity
 FailurePattern = failure_tracker.FailurePattern
 FailureStatistics = failure_tracker.FailureStatistics
+FailureRecorder = failure_tracker.FailureRecorder
 
 
 @pytest.mark.epic("EP-00007")
@@ -495,3 +496,166 @@ class TestFailureTrackerIntegration:
         )
         failure_id = tracker.record_failure(failure)
         assert failure_id is not None
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00025")
+@pytest.mark.component("shared")
+class TestFailureRecorder:
+    """Test batched failure recording used by the pytest plugin."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create FailureTracker with a database in a temporary directory."""
+        return FailureTracker(db_path=tmp_path / "failures.db")
+
+    def _count(self, tracker, error_hash):
+        import sqlite3
+
+        with sqlite3.connect(tracker.db_path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*), SUM(occurrence_count) FROM test_failures "
+                "WHERE error_hash = ?",
+                (error_hash,),
+            ).fetchone()
+
+    @pytest.mark.user_story("US-00025")
+    @pytest.mark.component("shared")
+    def test_failures_are_buffered_until_batch_is_full(self, tracker):
+        """Test that nothing is written before a full batch or flush."""
+        recorder = FailureRecorder(tracker, batch_size=3)
+        failures = [
+            TestFailure(test_name=f"test_{name}", failure_message="boom")
+            for name in ("a", "b", "c", "d")
+        ]
+
+        recorder.record(failures[0])
+        recorder.record(failures[1])
+        assert self._count(tracker, failures[0].error_hash)[0] == 0
+
+        recorder.record(failures[2])
+        assert self._count(tracker, failures[0].error_hash)[0] == 1
+        assert recorder.recorded_count == 3
+
+        recorder.record(failures[3])
+        recorder.close()
+        assert self._count(tracker, failures[3].error_hash)[0] == 1
+        assert recorder.recorded_count == 4
+
+    @pytest.mark.user_story("US-00025")
+    @pytest.mark.component("shared")
+    def test_repeated_failures_upsert_one_row(self, tracker):
+        """Test that repeats within and across batches share one row."""
+        recorder = FailureRecorder(tracker, batch_size=100)
+        failure = TestFailure(test_name="test_repeat", failure_message="boom")
+
+        for _ in range(3):
+            recorder.record(failure)
+        ids = recorder.flush()
+        recorder.record(failure)
+        assert recorder.flush() == ids
+        recorder.close()
+
+        assert self._count(tracker, failure.error_hash) == (1, 4)
+        assert tracker.record_failure(failure) == ids[failure.error_hash]
+        assert self._count(tracker, failure.error_hash) == (1, 5)
+
+    @pytest.mark.user_story("US-00025")
+    @pytest.mark.component("shared")
+    def test_failed_write_keeps_pending_failures(self, tracker, monkeypatch):
+        """Test that a batch whose write fails is retried, not dropped."""
+        import sqlite3
+
+        recorder = FailureRecorder(tracker, batch_size=2)
+        failures = [
+            TestFailure(test_name=f"test_{name}", failure_message="boom")
+            for name in ("a", "b", "c")
+        ]
+        record_failures = tracker.record_failures
+
+        def locked(batch, conn=None):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(tracker, "record_failures", locked)
+        recorder.record(failures[0])
+        with pytest.raises(sqlite3.OperationalError):
+            recorder.record(failures[1])
+        assert recorder.recorded_count == 0
+
+        monkeypatch.setattr(tracker, "record_failures", record_failures)
+        recorder.record(failures[2])
+        recorder.close()
+
+        assert recorder.recorded_count == 3
+        for failure in failures:
+            assert self._count(tracker, failure.error_hash)[0] == 1
+
+    @pytest.mark.user_story("US-00025")
+    @pytest.mark.component("shared")
+    def test_pending_failures_are_capped_while_writes_fail(
+        self, tracker, monkeypatch, caplog
+    ):
+        """Test that the oldest pending failures are dropped past the cap."""
+        import sqlite3
+
+        recorder = FailureRecorder(tracker, batch_size=2, max_pending=3)
+        failures = [
+            TestFailure(test_name=f"test_{index}", failure_message="boom")
+            for index in range(6)
+        ]
+        record_failures = tracker.record_failures
+
+        def locked(batch, conn=None):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(tracker, "record_failures", locked)
+        recorder.record(failures[0])
+        for failure in failures[1:]:
+            with pytest.raises(sqlite3.OperationalError):
+                recorder.record(failure)
+
+        assert recorder.dropped_count == 3
+        warnings = [r for r in caplog.records if "dropping" in r.getMessage()]
+        assert len(warnings) == 1
+
+        monkeypatch.setattr(tracker, "record_failures", record_failures)
+        recorder.close()
+
+        assert recorder.recorded_count == 3
+        assert [self._count(tracker, f.error_hash)[0] for f in failures] == [
+            0,
+            0,
+            0,
+            1,
+            1,
+            1,
+        ]
+
+    @pytest.mark.user_story("US-00025")
+    @pytest.mark.component("shared")
+    def test_legacy_duplicate_rows_are_merged(self, tmp_path):
+        """Test that databases with duplicate hashes are merged on open."""
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        FailureTracker(db_path=db_path)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP INDEX idx_error_hash_unique")
+            for count, seen in ((2, "2025-01-01"), (3, "2025-02-01")):
+                conn.execute(
+                    "INSERT INTO test_failures (test_id, test_name, test_file, "
+                    "failure_message, category, severity, error_hash, "
+                    "first_seen, last_seen, occurrence_count) "
+                    "VALUES ('t', 't', 'f', 'm', 'unknown_error', 'medium', "
+                    "'dup', ?, ?, ?)",
+                    (seen, seen, count),
+                )
+
+        tracker = FailureTracker(db_path=db_path)
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT occurrence_count, last_seen FROM test_failures "
+                "WHERE error_hash = 'dup'"
+            ).fetchall()
+        assert rows == [(5, "2025-02-01")]
+        assert tracker.get_top_failing_tests()[0]["total_failures"] == 5
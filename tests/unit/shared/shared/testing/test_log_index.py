@@ -0,0 +1,198 @@
+"""
+Unit tests for the persistent log index and its use in failure correlation.
+
+Verifies that log files are indexed incrementally and across rotation, that
+window queries return a test's entries in time order, and that the
+correlator finds logs that have left the logger's in-memory buffer.
+
+Related to: US-00026 Log-failure association and context preservation
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.shared.logging import (
+    EnvironmentMode,
+    LoggingConfig,
+    LogLevel,
+    StructuredLogger,
+)
+from src.shared.testing.failure_tracker import FailureTracker, TestFailure
+from src.shared.testing.log_failure_correlator import LogFailureCorrelator
+from src.shared.testing.log_index import LogIndex
+
+START = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _line(minutes, message, **fields):
+    timestamp = (START + timedelta(minutes=minutes)).isoformat()
+    record = {"timestamp": timestamp, "level": "info", "message": message}
+    return json.dumps({**record, **fields})
+
+
+def _write(path, lines, mode="a"):
+    with open(path, mode, encoding="utf-8") as handle:
+        handle.write("".join(line + "\n" for line in lines))
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00026")
+@pytest.mark.component("shared")
+class TestLogIndex:
+    """Incremental indexing and window queries."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        return LogIndex(tmp_path / "index.db", log_file=tmp_path / "run.log")
+
+    def test_sync_is_incremental(self, index, tmp_path):
+        log = tmp_path / "run.log"
+        _write(log, [_line(0, "one", test_id="t1"), _line(1, "two", test_id="t1")])
+
+        assert index.sync() == 2
+        assert index.sync() == 0
+
+        _write(log, [_line(2, "three", test_id="t1")])
+        with open(log, "a", encoding="utf-8") as handle:
+            handle.write(_line(3, "partial")[:20])
+        assert index.sync() == 1
+        assert index.count() == 3
+
+    def test_rotated_files_are_not_indexed_twice(self, index, tmp_path):
+        log = tmp_path / "run.log"
+        _write(log, [_line(0, "before rotation", test_id="t1")])
+        index.sync()
+
+        _write(log, [_line(1, "after sync", test_id="t1")])
+        log.rename(tmp_path / "run.log.1")
+        _write(log, [_line(2, "new file", test_id="t1")], mode="w")
+
+        assert index.sync() == 2
+        entries = index.query(START, START + timedelta(minutes=5), test_id="t1")
+        assert [e.message for e in entries] == [
+            "before rotation",
+            "after sync",
+            "new file",
+        ]
+
+    def test_query_filters_window_and_test(self, index, tmp_path):
+        _write(
+            tmp_path / "run.log",
+            [
+                _line(0, "too early", test_id="t1"),
+                _line(5, "by id", test_id="t1", metadata={"k": 1}, tags=["a"]),
+                _line(6, "by name", test_name="test_login"),
+                _line(7, "mentions test_login in text"),
+                _line(8, "other test", test_id="t2"),
+                "not json",
+                _line(20, "too late", test_id="t1"),
+            ],
+        )
+        index.sync()
+
+        entries = index.query(
+            START + timedelta(minutes=4),
+            START + timedelta(minutes=10),
+            test_id="t1",
+            test_name="test_login",
+        )
+
+        assert [e.message for e in entries] == [
+            "by id",
+            "by name",
+            "mentions test_login in text",
+        ]
+        assert entries[0].metadata == {"k": 1}
+        assert entries[0].tags == ["a"]
+
+    def test_cleanup_old_entries(self, index, tmp_path):
+        now = datetime.now(UTC)
+        _write(
+            tmp_path / "run.log",
+            [
+                json.dumps({"timestamp": now.isoformat(), "message": "new"}),
+                json.dumps(
+                    {"timestamp": (now - timedelta(days=40)).isoformat(), "message": ""}
+                ),
+            ],
+        )
+        index.sync()
+
+        assert index.cleanup_old_entries(30) == 1
+        assert index.count() == 1
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00026")
+@pytest.mark.component("shared")
+class TestIndexedCorrelation:
+    """LogFailureCorrelator reading from the log index."""
+
+    @pytest.fixture
+    def correlator(self, tmp_path):
+        config = LoggingConfig(
+            environment=EnvironmentMode.TESTING,
+            log_level=LogLevel.INFO,
+            log_directory=tmp_path,
+            log_filename="test_execution.log",
+            max_file_size_mb=5,
+            max_files=3,
+            include_metadata=True,
+            include_stack_traces=True,
+            sanitize_personal_data=False,
+            buffer_size=5,
+            flush_interval_seconds=1.0,
+            data_retention_days=7,
+            anonymize_ips=False,
+            exclude_user_data=False,
+        )
+        logger = StructuredLogger(config)
+        tracker = FailureTracker(tmp_path / "failures.db")
+        yield LogFailureCorrelator(tracker, logger)
+        logger.close()
+
+    def test_correlates_logs_beyond_the_buffer(self, correlator, tmp_path):
+        logger = correlator.logger
+        logger.test_started("t1", "test_checkout")
+        for index in range(10):
+            logger.info(f"unrelated {index}", test_id="t2")
+        logger.debug("debug detail for test_checkout")
+        logger.test_failed("t1", "test_checkout", 12.0, "boom")
+        failure_id = correlator.failure_tracker.record_failure(
+            TestFailure(test_id="t1", test_name="test_checkout", failure_message="boom")
+        )
+
+        context = correlator.correlate_failure_with_logs(failure_id)
+
+        logs = context.setup_logs + context.execution_logs + context.teardown_logs
+        messages = sorted(log.message for log in logs)
+        # The start entry was evicted from the 5-entry buffer but is on file;
+        # the debug entry is below the file level and only in the buffer
+        assert messages == [
+            "Test failed: test_checkout - boom",
+            "Test started: test_checkout",
+            "debug detail for test_checkout",
+        ]
+        assert (tmp_path / "log_index.db").exists()
+
+    def test_correlate_all_recent_failures_syncs_once(self, correlator, monkeypatch):
+        for index in range(3):
+            correlator.logger.test_failed(f"t{index}", f"test_{index}", 1.0, "boom")
+            correlator.failure_tracker.record_failure(
+                TestFailure(
+                    test_id=f"t{index}", test_name=f"test_{index}", failure_message="x"
+                )
+            )
+        syncs = []
+        original = correlator.log_index.sync
+        monkeypatch.setattr(
+            correlator.log_index, "sync", lambda: syncs.append(1) or original()
+        )
+
+        summary = correlator.correlate_all_recent_failures()
+
+        assert summary.total_failures_processed == 3
+        assert summary.failures_with_logs == 3
+        assert len(syncs) == 1
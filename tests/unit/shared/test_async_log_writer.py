@@ -0,0 +1,165 @@
+"""
+Unit tests for background, batched structured log writes.
+
+Verifies that an async StructuredLogger writes the same JSON lines as the
+synchronous one, that lines are batched, that flush and close write out
+queued lines, and that a full queue drops and counts lines.
+
+Related to: US-00022 Structured logging system for test execution
+"""
+
+import json
+import time
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+from src.shared.logging import (
+    EnvironmentMode,
+    LoggingConfig,
+    LogLevel,
+    StructuredLogger,
+)
+from src.shared.logging import async_writer
+from src.shared.logging.async_writer import AsyncLogWriter
+
+
+def _config(tmp_path, async_writes, **overrides):
+    values = dict(
+        environment=EnvironmentMode.TESTING,
+        log_level=LogLevel.INFO,
+        log_directory=tmp_path,
+        log_filename="async.log" if async_writes else "sync.log",
+        max_file_size_mb=5,
+        max_files=3,
+        include_metadata=True,
+        include_stack_traces=True,
+        sanitize_personal_data=True,
+        buffer_size=100,
+        flush_interval_seconds=1.0,
+        data_retention_days=7,
+        anonymize_ips=True,
+        exclude_user_data=False,
+        async_writes=async_writes,
+    )
+    values.update(overrides)
+    return LoggingConfig(**values)
+
+
+def _log_session(logger):
+    logger.debug("filtered out by level")
+    logger.info("contact jane@example.com", metadata={"ip": "10.0.0.1"})
+    logger.test_failed("t1", "test_one", 3.0, "boom")
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def no_linger(monkeypatch):
+    """Write each batch as soon as the queue is empty."""
+    monkeypatch.setattr(async_writer, "BATCH_LINGER_SECONDS", 0)
+
+
+def _hold_worker(writer, handler):
+    """Leave the worker blocked on the handler lock with one line taken."""
+    handler.acquire()
+    writer.submit("{}")
+    while writer._queue.qsize():
+        time.sleep(0.001)
+
+
+def _drop_volatile(record):
+    return {k: v for k, v in record.items() if k not in ("timestamp", "session_id")}
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00022")
+@pytest.mark.component("shared")
+class TestAsyncLogWriter:
+    """Background writer behaviour through StructuredLogger."""
+
+    def test_async_output_matches_sync_output(self, tmp_path):
+        sync_logger = StructuredLogger(_config(tmp_path, False))
+        async_logger = StructuredLogger(_config(tmp_path, True))
+        for logger in (sync_logger, async_logger):
+            _log_session(logger)
+            logger.close()
+
+        sync_records = _records(tmp_path / "sync.log")
+        async_records = _records(tmp_path / "async.log")
+        assert len(async_records) == 2
+        assert [_drop_volatile(r) for r in async_records] == [
+            _drop_volatile(r) for r in sync_records
+        ]
+        assert async_records[0]["message"] == "contact [EMAIL_REDACTED]"
+
+    def test_buffer_shares_sanitized_fields(self, tmp_path):
+        logger = StructuredLogger(_config(tmp_path, True))
+        _log_session(logger)
+
+        entry = logger.get_recent_logs(3)[1]
+        assert entry.message == "contact [EMAIL_REDACTED]"
+        assert entry.metadata == {"ip": "[IP_REDACTED]"}
+        logger.close()
+
+    def test_flush_writes_queued_lines(self, tmp_path):
+        logger = StructuredLogger(_config(tmp_path, True))
+        for index in range(500):
+            logger.info(f"line {index}")
+        logger.flush()
+
+        assert len(_records(tmp_path / "async.log")) == 500
+        stats = logger.get_config_info()["writer"]
+        assert stats["written"] == 500
+        assert stats["dropped"] == 0
+        assert stats["batches"] <= 500
+        logger.close()
+
+    def test_lines_are_batched(self, tmp_path, no_linger):
+        handler = RotatingFileHandler(tmp_path / "batched.log", encoding="utf-8")
+        writer = AsyncLogWriter(handler)
+        _hold_worker(writer, handler)
+        try:
+            for index in range(50):
+                writer.submit(f'{{"n":{index}}}')
+        finally:
+            handler.release()
+        writer.close()
+        handler.close()
+
+        assert len(_records(tmp_path / "batched.log")) == 51
+        # The line the worker held, then everything queued behind it
+        assert writer.batches == 2
+
+    def test_full_queue_drops_and_counts(self, tmp_path, no_linger):
+        handler = RotatingFileHandler(tmp_path / "full.log", encoding="utf-8")
+        writer = AsyncLogWriter(handler, queue_size=2)
+        _hold_worker(writer, handler)
+        try:
+            results = [writer.submit("{}") for _ in range(5)]
+        finally:
+            handler.release()
+        writer.close()
+        handler.close()
+
+        assert results == [True, True, False, False, False]
+        assert writer.dropped == 3
+        assert writer.written == 3
+        assert writer.submit("{}") is False
+        assert writer.dropped == 4
+
+    def test_rotation_applies_to_batches(self, tmp_path):
+        handler = RotatingFileHandler(
+            tmp_path / "rotating.log", maxBytes=200, backupCount=2, encoding="utf-8"
+        )
+        writer = AsyncLogWriter(handler)
+        for index in range(20):
+            writer.submit(json.dumps({"message": "x" * 40, "n": index}))
+            writer.flush()
+        writer.close()
+        handler.close()
+
+        assert (tmp_path / "rotating.log.1").exists()
+        assert (tmp_path / "rotating.log").stat().st_size < 200
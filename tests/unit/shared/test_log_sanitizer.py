@@ -0,0 +1,106 @@
+"""
+Unit tests for the log sanitizer engine.
+
+Verifies that sanitize_text() returns exactly what applying every active
+pattern in order returns, including where one replacement changes what a
+later pattern matches, and that the memo cache stays bounded.
+
+Related to: US-00022 Structured logging system for test execution
+"""
+
+import random
+
+import pytest
+
+from src.shared.logging import LogSanitizer, SanitizationLevel
+from src.shared.logging import sanitizer as sanitizer_module
+
+FRAGMENTS = [
+    "jane.doe@example.com",
+    "192.168.10.24",
+    "fe80:0:0:0:202:b3ff:fe1e:8329",
+    "+1 (555) 123-4567",
+    "123-45-6789",
+    "4111 1111 1111 1111",
+    "/home/jdoe/project",
+    "John Smith",
+    "sk4f9a8b7c6d5e4f3a2b1c0d9e8",
+    "https://api.example.com/v1?token=abc123&x=1",
+    "test_user_story_sync",
+    "duration_ms=12.5",
+    "EP-00006",
+    "Ünïcode ٣٤٥-٦٧-٨٩٠١",
+]
+
+
+def _sequential(sanitizer, text):
+    """Reference: every active pattern in turn, as the sanitizer defines."""
+    for name, pattern in sanitizer._patterns.items():
+        text = pattern.sub(sanitizer._replacements.get(name, "[REDACTED]"), text)
+    return text
+
+
+def _mixes(count):
+    rng = random.Random(7)
+    glue = ["", " ", "/", ":", ".", "-", "=", "@", "\n"]
+    return [
+        "".join(
+            rng.choice(FRAGMENTS) + rng.choice(glue) for _ in range(rng.randint(1, 5))
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00022")
+@pytest.mark.component("shared")
+class TestLogSanitizerEngine:
+    """Output equivalence and caching of sanitize_text()."""
+
+    @pytest.mark.parametrize("level", list(SanitizationLevel))
+    def test_matches_sequential_substitution(self, level):
+        sanitizer = LogSanitizer(level)
+        for text in FRAGMENTS + _mixes(2000):
+            assert sanitizer.sanitize_text(text) == _sequential(sanitizer, text)
+
+    def test_later_pattern_sees_earlier_replacement(self):
+        sanitizer = LogSanitizer(SanitizationLevel.PARANOID)
+
+        # "John Smith" only becomes a separate word once the phone is replaced
+        assert (
+            sanitizer.sanitize_text("call 555-123-4567John Smith")
+            == "call [PHONE_REDACTED][NAME_REDACTED]"
+        )
+
+    def test_clean_text_is_returned_unchanged(self):
+        sanitizer = LogSanitizer(SanitizationLevel.PARANOID)
+        text = "test_user_story_sync passed in 12 ms"
+
+        assert sanitizer.sanitize_text(text) is text
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(sanitizer_module, "MEMO_SIZE", 8)
+        monkeypatch.setattr(sanitizer_module, "MEMO_MAX_LENGTH", 40)
+        sanitizer = LogSanitizer(SanitizationLevel.STRICT)
+
+        for index in range(20):
+            sanitizer.sanitize_text(f"user{index}@example.com")
+        sanitizer.sanitize_text("user19@example.com")
+        long_text = "x" * 41 + " jane@example.com"
+        assert sanitizer.sanitize_text(long_text).endswith("[EMAIL_REDACTED]")
+
+        info = sanitizer._memo.cache_info()
+        assert info.currsize == 8
+        assert info.hits == 1
+        assert info.misses == 20
+
+    def test_log_entry_values_are_sanitized(self):
+        sanitizer = LogSanitizer(SanitizationLevel.BASIC)
+
+        assert sanitizer.sanitize_log_entry(
+            {"message": "from 10.0.0.1", "metadata": {"to": ["a@b.io", 3]}, "n": 1}
+        ) == {
+            "message": "from [IP_REDACTED]",
+            "metadata": {"to": ["[EMAIL_REDACTED]", 3]},
+            "n": 1,
+        }
@@ -0,0 +1,140 @@
+"""
+Unit tests for the ring buffer log store.
+
+Verifies that the store keeps the most recent entries in order, that the
+test_id, test_status and time indexes follow insertions and evictions, and
+that readers see consistent results while another thread writes.
+
+Related to: US-00022 Structured logging system for test execution
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.shared.logging import LogEntry, LogLevel, LogRingBuffer
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(index, test_id=None, test_status=None, seconds=None):
+    timestamp = START + timedelta(seconds=index if seconds is None else seconds)
+    return LogEntry(
+        timestamp=timestamp.isoformat(),
+        level=LogLevel.INFO.value,
+        message=f"entry {index}",
+        test_id=test_id,
+        test_status=test_status,
+    )
+
+
+def _messages(entries):
+    return [int(entry.message.split()[1]) for entry in entries]
+
+
+@pytest.mark.epic("EP-00007")
+@pytest.mark.user_story("US-00022")
+@pytest.mark.component("shared")
+class TestLogRingBuffer:
+    """Ring buffer storage, eviction and index lookups."""
+
+    def test_keeps_most_recent_entries(self):
+        store = LogRingBuffer(3)
+        for index in range(5):
+            store.append(_entry(index))
+
+        assert len(store) == 3
+        assert _messages(store.snapshot()) == [2, 3, 4]
+        assert _messages(store.recent(2)) == [3, 4]
+        assert _messages(store.recent(10)) == [2, 3, 4]
+        assert store.recent(0) == []
+
+    def test_indexes_follow_eviction(self):
+        store = LogRingBuffer(4)
+        store.append(_entry(0, "t1", "passed"))
+        store.append(_entry(1, "t2", "failed"))
+        store.append(_entry(2, "t1", "failed"))
+        store.append(_entry(3, "t3"))
+
+        assert _messages(store.for_test("t1")) == [0, 2]
+        assert _messages(store.with_status("failed")) == [1, 2]
+
+        store.append(_entry(4, "t2", "failed"))
+        store.append(_entry(5))
+
+        assert _messages(store.for_test("t1")) == [2]
+        assert _messages(store.for_test("t2")) == [4]
+        assert store.with_status("passed") == []
+        assert _messages(store.with_status("failed")) == [2, 4]
+        assert store.for_test("missing") == []
+        # Keys whose entries were all evicted leave the index
+        assert "passed" not in store._by_status
+
+    def test_between_uses_time_index(self):
+        store = LogRingBuffer(10)
+        for index in range(15):
+            store.append(_entry(index))
+
+        window = store.between(
+            START + timedelta(seconds=7), START + timedelta(seconds=9)
+        )
+
+        assert _messages(window) == [7, 8, 9]
+        assert store.between(START, START + timedelta(seconds=4)) == []
+
+    def test_between_places_late_entries_at_arrival(self):
+        store = LogRingBuffer(10)
+        store.append(_entry(0, seconds=10))
+        store.append(_entry(1, seconds=5))
+        store.append(_entry(2, seconds=11))
+
+        window = store.between(
+            START + timedelta(seconds=10), START + timedelta(seconds=10)
+        )
+
+        assert _messages(window) == [0, 1]
+
+    def test_clear(self):
+        store = LogRingBuffer(2)
+        store.append(_entry(0, "t1", "failed"))
+        store.clear()
+
+        assert len(store) == 0
+        assert store.snapshot() == []
+        assert store.for_test("t1") == []
+
+        store.append(_entry(1, "t1"))
+        store.append(_entry(2))
+        store.append(_entry(3))
+        assert _messages(store.snapshot()) == [2, 3]
+        assert store.for_test("t1") == []
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            LogRingBuffer(0)
+
+    def test_reads_during_concurrent_writes(self):
+        store = LogRingBuffer(64)
+        done = threading.Event()
+
+        def write():
+            for index in range(20000):
+                store.append(_entry(index, f"t{index % 3}", "failed"))
+            done.set()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        while not done.is_set():
+            for entries in (
+                store.snapshot(),
+                store.for_test("t1"),
+                store.with_status("failed"),
+            ):
+                indexes = _messages(entries)
+                assert indexes == sorted(indexes)
+                assert len(indexes) <= 64
+            assert all(i % 3 == 1 for i in _messages(store.for_test("t1")))
+        writer.join()
+
+        assert _messages(store.snapshot()) == list(range(19936, 20000))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Dependency Graph Layout Benchmark
+
+Times the pure-Python force-directed layout against the NumPy Barnes-Hut
+layout used by SVGGraphGenerator for growing node counts, and reports how
+far the Barnes-Hut repulsion deviates from the exact pairwise sum.
+
+Related Issue: US-00030 - Visual Filtering Enhancement for Epic
+Dependencies Graph
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+
+Usage:
+    python tools/benchmark_graph_layout.py
+    python tools/benchmark_graph_layout.py --sizes 100 200 400 800 1600 \\
+        --python-max 400
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from be.services.svg_graph_generator import (  # noqa: E402
+    BarnesHutLayout,
+    ForceDirectedLayout,
+    GraphLayout,
+    Link,
+    Node,
+    np,
+)
+
+
+def build_graph(node_count: int, seed: int):
+    """Random epic graph with about 1.5 dependencies per epic."""
+    rng = random.Random(seed)
+    width = height = max(800, int(60 * node_count**0.5))
+    nodes = {
+        str(i): Node(
+            id=str(i),
+            epic_id=f"EP-{i:05d}",
+            title=f"Epic {i}",
+            status="planned",
+            capability_id=None,
+            capability_name=None,
+            component="backend",
+            completion_percentage=0,
+            priority="medium",
+            x=rng.uniform(0, width),
+            y=rng.uniform(0, height),
+        )
+        for i in range(node_count)
+    }
+    links = []
+    for i in range(1, node_count):
+        for _ in range(rng.choice((1, 1, 2))):
+            links.append(
+                Link(str(rng.randrange(i)), str(i), "prerequisite", "medium", "")
+            )
+    return GraphLayout(width=width, height=height), nodes, links
+
+
+def time_layout(engine_class, node_count: int, seed: int) -> float:
+    layout, nodes, links = build_graph(node_count, seed)
+    started = time.perf_counter()
+    engine_class(layout).apply_forces(nodes, links)
+    return time.perf_counter() - started
+
+
+def charge_error(node_count: int, seed: int) -> float:
+    """Mean relative error of Barnes-Hut repulsion vs the exact sum."""
+    layout, nodes, _ = build_graph(node_count, seed)
+    pos = np.array([(node.x, node.y) for node in nodes.values()])
+    approx = BarnesHutLayout(layout)._charge(pos, 1.0)
+    layout.barnes_hut_theta = 0.0
+    exact = BarnesHutLayout(layout)._charge(pos, 1.0)
+    return float(
+        np.linalg.norm(approx - exact, axis=1).mean()
+        / np.linalg.norm(exact, axis=1).mean()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[50, 100, 200, 400, 800, 1600]
+    )
+    parser.add_argument(
+        "--python-max",
+        type=int,
+        default=400,
+        help="largest node count to time with the pure-Python engine",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if np is None:
+        print("NumPy is not installed; only the pure-Python engine is available.")
+        return 1
+
+    print(f"{'nodes':>6} {'python (s)':>11} {'numpy (s)':>10} {'speedup':>8} {'BH err':>7}")
+    for size in args.sizes:
+        vectorized = time_layout(BarnesHutLayout, size, args.seed)
+        error = charge_error(size, args.seed)
+        if size <= args.python_max:
+            pure = time_layout(ForceDirectedLayout, size, args.seed)
+            print(
+                f"{size:>6} {pure:>11.3f} {vectorized:>10.3f} "
+                f"{pure / vectorized:>7.1f}x {error:>7.2%}"
+            )
+        else:
+            print(f"{size:>6} {'-':>11} {vectorized:>10.3f} {'-':>8} {error:>7.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
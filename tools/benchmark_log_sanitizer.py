@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Log Sanitizer Benchmark
+
+Times LogSanitizer against the previous implementation, which applied every
+active pattern in turn to every string, on a synthetic stream of log
+messages at each sanitization level. Also checks that both produce exactly
+the same output for every message, including adversarial mixes of personal
+data fragments.
+
+Related to: EP-00006 Test Logging and Reporting
+User Story: US-00022 Structured logging system for test execution
+
+Usage:
+    python tools/benchmark_log_sanitizer.py
+    python tools/benchmark_log_sanitizer.py --messages 100000 --pii-ratio 0.2
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.logging.sanitizer import LogSanitizer, SanitizationLevel  # noqa: E402
+
+
+class LegacyLogSanitizer(LogSanitizer):
+    """The previous sanitize_text(): every pattern, every string."""
+
+    def sanitize_text(self, text):
+        if self.level == SanitizationLevel.NONE:
+            return text
+
+        sanitized = text
+        for pattern_name, pattern in self._patterns.items():
+            replacement = self._replacements.get(pattern_name, "[REDACTED]")
+            sanitized = pattern.sub(replacement, sanitized)
+
+        return sanitized
+
+
+PII_FRAGMENTS = [
+    "jane.doe@example.com",
+    "192.168.10.24",
+    "fe80:0:0:0:202:b3ff:fe1e:8329",
+    "+1 (555) 123-4567",
+    "555.123.4567",
+    "123-45-6789",
+    "4111 1111 1111 1111",
+    "/home/jdoe/project",
+    "/Users/Jane Smith/src",
+    "John Smith",
+    "sk4f9a8b7c6d5e4f3a2b1c0d9e8",
+    "https://api.example.com/v1?token=abc123&x=1",
+    "http://u@example.com/auth=1",
+]
+
+PLAIN_FRAGMENTS = [
+    "test_user_story_sync",
+    "Test passed:",
+    "tests/unit/backend/test_rtm_parser.py::test_tokenize",
+    "duration_ms=12.5",
+    "status",
+    "EP-00006",
+    "retry 3 of 5",
+    "GET /api/rtm/epics 200",
+    "Collected 467 items",
+]
+
+
+def build_messages(count: int, pii_ratio: float, seed: int):
+    """Log-like messages; repeated test names exercise the memo cache."""
+    rng = random.Random(seed)
+    names = [f"test_case_{index}" for index in range(300)]
+    messages = []
+    for _ in range(count):
+        parts = [rng.choice(PLAIN_FRAGMENTS), rng.choice(names)]
+        if rng.random() < pii_ratio:
+            parts.insert(rng.randrange(3), rng.choice(PII_FRAGMENTS))
+        messages.append(" ".join(parts))
+    messages.extend(names)
+    return messages
+
+
+def build_mixes(count: int, seed: int):
+    """Fragments glued together in random ways, to compare outputs only."""
+    rng = random.Random(seed)
+    fragments = PII_FRAGMENTS + PLAIN_FRAGMENTS
+    glue = ["", " ", "/", ":", ".", "-", "=", "@", "\n"]
+    return [
+        "".join(
+            rng.choice(fragments) + rng.choice(glue)
+            for _ in range(rng.randint(1, 5))
+        )
+        for _ in range(count)
+    ]
+
+
+def time_sanitize(sanitizer, messages):
+    started = time.perf_counter()
+    result = [sanitizer.sanitize_text(message) for message in messages]
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument(
+        "--pii-ratio",
+        type=float,
+        default=0.1,
+        help="share of messages that contain personal data",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    messages = build_messages(args.messages, args.pii_ratio, args.seed)
+    mixes = build_mixes(5000, args.seed)
+
+    print(f"{'level':>9} {'legacy (s)':>11} {'engine (s)':>11} {'speedup':>8}")
+    for level in SanitizationLevel:
+        legacy, engine = LegacyLogSanitizer(level), LogSanitizer(level)
+        for text in mixes:
+            if engine.sanitize_text(text) != legacy.sanitize_text(text):
+                print(f"Mismatch at {level.value}: {text!r}")
+                return 1
+
+        legacy_time, expected = time_sanitize(legacy, messages)
+        engine_time, result = time_sanitize(LogSanitizer(level), messages)
+        if result != expected:
+            print(f"Mismatch at {level.value}")
+            return 1
+        print(
+            f"{level.value:>9} {legacy_time:>11.3f} {engine_time:>11.3f} "
+            f"{legacy_time / engine_time:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
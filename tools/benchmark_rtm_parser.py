@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+RTM Markdown Parser Benchmark
+
+Times the single-pass RTMMarkdownParser against the previous parser, which
+rescanned the whole document for every ID and test path it matched, on
+synthetic legacy RTM files of growing size. Also checks that both produce
+the same records once the previous parser's duplicate records are dropped.
+
+Related Issue: US-00059 - Dynamic RTM generation and reporting
+Parent Epic: EP-00005 - Requirements Traceability Matrix Automation
+
+Usage:
+    python tools/benchmark_rtm_parser.py
+    python tools/benchmark_rtm_parser.py --epics 10 50 200 800 --legacy-max 200
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from be.services.rtm_parser import RTMMarkdownParser  # noqa: E402
+
+
+class LegacyRTMMarkdownParser(RTMMarkdownParser):
+    """The previous extraction: one full line scan per regex match."""
+
+    def parse_content(self, content):
+        return {
+            "epics": self._legacy_entities(content, self.epic_pattern, self._epic),
+            "user_stories": self._legacy_entities(
+                content, self.user_story_pattern, self._user_story
+            ),
+            "defects": self._legacy_entities(
+                content, self.defect_pattern, self._defect
+            ),
+            "tests": self._legacy_tests(content),
+        }
+
+    def _legacy_entities(self, content, pattern, build):
+        records = []
+        for match in re.finditer(pattern, content):
+            entity_id = match.group(1)
+            lines = content.split("\n")
+            for i, line in enumerate(lines):
+                if entity_id in line:
+                    records.append(build(lines, i, entity_id))
+                    break
+        return records
+
+    def _epic(self, lines, i, epic_id):
+        index = self.tokenize("")
+        index.lines, index.epics = lines, {epic_id: i}
+        return self._extract_epics(index)[0]
+
+    def _user_story(self, lines, i, us_id):
+        parent = None
+        for j in range(i, -1, -1):
+            epic_match = re.search(self.epic_pattern, lines[j])
+            if epic_match:
+                parent = epic_match.group(1)
+                break
+        index = self.tokenize("")
+        index.lines, index.user_stories = lines, {us_id: (i, parent)}
+        return self._extract_user_stories(index)[0]
+
+    def _defect(self, lines, i, def_id):
+        index = self.tokenize("")
+        index.lines, index.defects = lines, {def_id: i}
+        return self._extract_defects(index)[0]
+
+    def _legacy_tests(self, content):
+        records = []
+        for match in re.finditer(self.test_file_pattern, content):
+            test_path = match.group(0)
+            lines = content.split("\n")
+            line_numbers = [i for i, line in enumerate(lines) if test_path in line]
+            index = self.tokenize("")
+            index.lines = lines
+            index.tests = {test_path: (match.group(1), line_numbers)}
+            records.extend(self._extract_tests(index))
+        return records
+
+
+def build_rtm(epic_count: int, seed: int) -> str:
+    """Legacy-style RTM document with 5 stories and 2 defects per epic."""
+    rng = random.Random(seed)
+    lines = ["# Requirements Traceability Matrix", ""]
+    story = defect = 0
+    for epic in range(1, epic_count + 1):
+        lines += [
+            f"## EP-{epic:05d}: Epic {epic}",
+            f"Priority: {rng.choice(['high', 'medium', 'low'])}",
+            "Business value: reduce release risk",
+            "",
+        ]
+        for _ in range(5):
+            story += 1
+            lines += [
+                f"### US-{story:05d}: Story {story} (#{story + 100})",
+                f"Status: {rng.choice(['planned', 'in progress', 'done'])} - "
+                f"{rng.choice([3, 5, 8])} points",
+                f"- tests/unit/backend/test_story_{story}.py::test_story_{story}",
+                "",
+            ]
+        for _ in range(2):
+            defect += 1
+            lines += [
+                f"- DEF-{defect:05d}: Defect {defect} (#{defect + 5000}) "
+                f"critical bug, see US-{rng.randint(1, story):05d}",
+                "",
+            ]
+        # Cross references make IDs appear more than once, as in real RTMs
+        lines += [f"Depends on EP-{rng.randint(1, epic):05d}", ""]
+    return "\n".join(lines)
+
+
+def dedupe(records, key):
+    seen = set()
+    return [r for r in records if not (r[key] in seen or seen.add(r[key]))]
+
+
+def time_parse(parser, content: str):
+    started = time.perf_counter()
+    result = parser.parse_content(content)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--epics", type=int, nargs="+", default=[10, 50, 100, 200, 400, 1600]
+    )
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=400,
+        help="largest epic count to time with the previous parser",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    keys = {
+        "epics": "epic_id",
+        "user_stories": "user_story_id",
+        "defects": "defect_id",
+        "tests": "test_file_path",
+    }
+
+    print(f"{'epics':>6} {'lines':>8} {'legacy (s)':>11} {'single (s)':>11} {'speedup':>8}")
+    for size in args.epics:
+        content = build_rtm(size, args.seed)
+        line_count = content.count("\n") + 1
+        single, result = time_parse(RTMMarkdownParser(), content)
+        if size > args.legacy_max:
+            print(f"{size:>6} {line_count:>8} {'-':>11} {single:>11.3f} {'-':>8}")
+            continue
+
+        legacy, expected = time_parse(LegacyRTMMarkdownParser(), content)
+        for kind, key in keys.items():
+            if dedupe(expected[kind], key) != result[kind]:
+                print(f"Mismatch in {kind} at {size} epics")
+                return 1
+        print(
+            f"{size:>6} {line_count:>8} {legacy:>11.3f} {single:>11.3f} "
+            f"{legacy / single:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -39,6 +39,16 @@ class MockStructuredLogger:
         """Get recent logs (mock implementation)."""
         return self.logs[-limit:] if self.logs else []
 
+    def get_logs_between(self, start: datetime, end: datetime) -> list[LogEntry]:
+        """Get logs within a time range (mock implementation)."""
+        return [
+            log
+            for log in self.logs
+            if start.timestamp()
+            <= datetime.fromisoformat(log.timestamp).timestamp()
+            <= end.timestamp()
+        ]
+
     def flush(self):
         """Flush logs (mock implementation)."""
         pass
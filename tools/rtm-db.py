@@ -423,8 +423,11 @@ def data():
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be imported without making changes"
 )
+@click.option(
+    "--chunk-size", default=500, help="Rows inserted and committed per batch"
+)
 @click.pass_context
-def import_rtm(ctx, file_path, dry_run):
+def import_rtm(ctx, file_path, dry_run, chunk_size):
     """Import RTM data from markdown file."""
     if not Path(file_path).exists():
         click.echo(f"File {file_path} not found")
@@ -436,9 +439,14 @@ def import_rtm(ctx, file_path, dry_run):
         return
 
     try:
-        migrator = RTMDataMigrator()
+        with console.status("[bold green]Importing RTM data...") as status:
 
-        with console.status("[bold green]Importing RTM data..."):
+            def show_progress(entity, done, total):
+                status.update(f"[bold green]Importing {entity}: {done}/{total}")
+
+            migrator = RTMDataMigrator(
+                chunk_size=chunk_size, progress_callback=show_progress
+            )
             results = migrator.migrate_from_file(file_path)
 
         console.print("[green]Import completed successfully![/green]")